@@ -0,0 +1,216 @@
+"""
+Headless batch run of the form analysis and prediction pipeline.
+
+Runs the same steps as the Form Analysis tab without a display: form analysis
+for every configured league, a prediction for each team's next fixture, a bulk
+save to the database and a JSON or CSV report. Suitable for a cron job, e.g.
+
+    python batch_predict.py --format csv --output predictions.csv
+    python batch_predict.py --all-leagues --workers 6 --no-save
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional
+
+# Add the current directory to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from modules.api_client import FootballAPI
+from modules.config import API_KEY, BASE_URL, ALL_LEAGUES
+from modules.db_manager import DatabaseManager
+from modules.form_analyzer import FormAnalyzer
+from modules.league_names import LEAGUE_NAMES
+from modules.settings_manager import SettingsManager
+from tabs.form.predictions import FormPredictions
+
+logger = logging.getLogger("batch_predict")
+
+# Report columns, in output order
+FIELDNAMES = [
+    'team_id', 'team_name', 'league_id', 'league_name', 'fixture_id',
+    'opponent_id', 'opponent_name', 'match_date', 'match_time', 'venue',
+    'form', 'current_ppg', 'form_ppg', 'performance_diff',
+    'prediction', 'prediction_level'
+]
+
+
+def resolve_leagues(args, settings_manager: SettingsManager) -> List[int]:
+    """Get the league IDs to process from the arguments or the settings file"""
+    if args.all_leagues:
+        return [lid for lid in LEAGUE_NAMES if isinstance(lid, int) and lid != ALL_LEAGUES]
+    if args.leagues:
+        return args.leagues
+
+    leagues = settings_manager.get_leagues() or []
+    if ALL_LEAGUES in leagues:
+        return [lid for lid in LEAGUE_NAMES if isinstance(lid, int) and lid != ALL_LEAGUES]
+    return leagues
+
+
+def predict_league(api: FootballAPI, predictions: FormPredictions, league_id: int,
+                   form_length: int) -> List[Dict[str, Any]]:
+    """
+    Run form analysis for one league and predict each flagged team's next match.
+
+    Args:
+        api: API client
+        predictions: Prediction generator shared with the Form Analysis tab
+        league_id: League to process
+        form_length: Number of recent matches used for form
+
+    Returns:
+        list: Prediction rows in the database save format, plus report fields
+    """
+    league_info = LEAGUE_NAMES.get(league_id, {})
+    league_name = f"{league_info.get('flag', '')} {league_info.get('name', '')}".strip()
+
+    # Fixtures are cached by the API client, so fetch_all_teams reuses them
+    fixtures = api.fetch_fixtures(league_id)
+    teams = api.fetch_all_teams({league_id: league_info}, form_length)
+
+    rows = []
+    for team in teams:
+        upcoming = FormAnalyzer.get_upcoming_opponents(fixtures, team['team_id'], top_n=1)
+        if not upcoming:
+            continue
+        match = upcoming[0]
+
+        prediction, prediction_level = predictions.generate_prediction(team['performance_diff'])
+        rows.append({
+            'team_id': team['team_id'],
+            'team_name': team['team'],
+            'league_id': league_id,
+            'league_name': league_name,
+            'fixture_id': match['fixture_id'],
+            'opponent_id': match['opponent_id'],
+            'opponent_name': match['opponent'],
+            'match_date': match['date'],
+            'match_time': match['time'],
+            'venue': match['venue'],
+            'form': team.get('form', ''),
+            'current_ppg': team.get('current_ppg'),
+            'form_ppg': team.get('form_ppg'),
+            'performance_diff': team['performance_diff'],
+            'prediction': prediction,
+            'prediction_level': prediction_level
+        })
+
+    logger.info(f"League {league_id}: {len(teams)} flagged teams, {len(rows)} predictions")
+    return rows
+
+
+def run_batch(api: FootballAPI, league_ids: List[int], form_length: int, workers: int) -> List[Dict[str, Any]]:
+    """
+    Process leagues concurrently; requests share the API client's rate limit.
+
+    Returns:
+        list: Prediction rows for all leagues, largest performance difference first
+    """
+    predictions = FormPredictions(None, None, None)
+    rows = []
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="League") as pool:
+        futures = {
+            pool.submit(predict_league, api, predictions, league_id, form_length): league_id
+            for league_id in league_ids
+        }
+        for future in as_completed(futures):
+            league_id = futures[future]
+            try:
+                rows.extend(future.result())
+            except Exception as e:
+                logger.error(f"Error processing league {league_id}: {str(e)}")
+
+    rows.sort(key=lambda row: abs(row['performance_diff']), reverse=True)
+    return rows
+
+
+def write_report(rows: List[Dict[str, Any]], output_format: str, output: Optional[str]):
+    """Write the prediction rows as JSON or CSV to a file or stdout"""
+    stream = open(output, 'w', encoding='utf-8', newline='') if output else sys.stdout
+    try:
+        if output_format == 'csv':
+            writer = csv.DictWriter(stream, fieldnames=FIELDNAMES, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, stream, ensure_ascii=False, indent=2)
+            stream.write("\n")
+    finally:
+        if output:
+            stream.close()
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Run form analysis and predictions without the GUI.")
+    league_group = parser.add_mutually_exclusive_group()
+    league_group.add_argument("--leagues", type=int, nargs="+", help="League IDs (default: leagues from settings)")
+    league_group.add_argument("--all-leagues", action="store_true", help="Process every known league")
+    parser.add_argument("--form-length", type=int, choices=[3, 5], help="Matches used for form (default: from settings)")
+    parser.add_argument("--workers", type=int, default=4, help="Leagues processed concurrently (default: 4)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json", help="Report format (default: json)")
+    parser.add_argument("--output", help="Report file (default: stdout)")
+    parser.add_argument("--db", default="football_stats.db", help="SQLite database path")
+    parser.add_argument("--settings", default="settings.json", help="Settings file path")
+    parser.add_argument("--cache-file", default="api_cache.json", help="API cache file for warm starts")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the API cache file")
+    parser.add_argument("--no-save", action="store_true", help="Do not save predictions to the database")
+    parser.add_argument("--verbose", action="store_true", help="Log debug output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the batch pipeline; returns the process exit code"""
+    args = parse_args(argv)
+
+    # Log to stderr so a report on stdout stays machine-readable
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+
+    start = time.perf_counter()
+    settings_manager = SettingsManager(args.settings)
+    league_ids = resolve_leagues(args, settings_manager)
+    form_length = args.form_length or settings_manager.get_form_length() or 5
+    if not league_ids:
+        logger.error("No leagues to process")
+        return 1
+
+    api = FootballAPI(API_KEY, BASE_URL, disable_auto_fetch=False)
+    if not args.no_cache:
+        loaded = api.load_cache(args.cache_file)
+        logger.info(f"Warm start: loaded {loaded} cached API responses from {args.cache_file}")
+
+    logger.info(f"Processing {len(league_ids)} leagues with form length {form_length}")
+    rows = run_batch(api, league_ids, form_length, args.workers)
+
+    if not args.no_save:
+        db_manager = DatabaseManager(args.db)
+        saved = db_manager.save_predictions(rows)
+        logger.info(f"Saved {saved} new predictions to {args.db}")
+
+    if not args.no_cache:
+        try:
+            written = api.save_cache(args.cache_file)
+            logger.info(f"Saved {written} API responses to {args.cache_file}")
+        except Exception as e:
+            logger.error(f"Error saving API cache: {str(e)}")
+
+    write_report(rows, args.format, args.output)
+    logger.info(f"Finished {len(rows)} predictions in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
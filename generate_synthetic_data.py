@@ -0,0 +1,103 @@
+"""
+Generate synthetic seasons for scale testing.
+
+Builds N leagues x M teams x K seasons of realistic, seed-deterministic data
+and writes any of: a database, a replay cassette for FootballAPI, and raw
+fixtures/standings JSON files. Examples:
+
+    python generate_synthetic_data.py --leagues 50 --teams 20 --seasons 3 --db synthetic.db
+    python generate_synthetic_data.py --leagues 10 --cassette synthetic_cassette.json
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add the current directory to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from modules.config import BASE_URL
+from modules.db_manager import DatabaseManager
+from modules.synthetic_data import SyntheticSeasonGenerator
+
+logger = logging.getLogger("generate_synthetic_data")
+
+
+def write_json_files(generator: SyntheticSeasonGenerator, output_dir: str) -> int:
+    """Write fixtures and standings per league and season; returns the file count"""
+    os.makedirs(output_dir, exist_ok=True)
+    written = 0
+    for league in generator.leagues:
+        for season in generator.seasons:
+            prefix = os.path.join(output_dir, f"{league['id']}_{season}")
+            with open(f"{prefix}_fixtures.json", 'w', encoding='utf-8') as f:
+                json.dump({"response": generator.fixtures(league['id'], season)}, f)
+            with open(f"{prefix}_standings.json", 'w', encoding='utf-8') as f:
+                json.dump(generator.standings_response(league['id'], season), f)
+            written += 2
+    return written
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Generate deterministic synthetic football data.")
+    parser.add_argument("--leagues", type=int, default=5, help="Number of leagues (default: 5)")
+    parser.add_argument("--teams", type=int, default=20, help="Teams per league (default: 20)")
+    parser.add_argument("--seasons", type=int, default=1, help="Seasons per league (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--season", type=int, default=2025, help="Current season year (default: 2025)")
+    parser.add_argument("--played", type=float, default=0.6, help="Share of the current season played (default: 0.6)")
+    parser.add_argument("--predictions-per-round", type=int, default=2, help="Predictions per league round (default: 2)")
+    parser.add_argument("--db", help="SQLite database to populate")
+    parser.add_argument("--cassette", help="Replay cassette file to write")
+    parser.add_argument("--base-url", default=BASE_URL, help="API base URL used in the cassette")
+    parser.add_argument("--json-dir", help="Directory for raw fixtures and standings JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Generate the requested outputs; returns the process exit code"""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    if not (args.db or args.cassette or args.json_dir):
+        logger.error("Nothing to do: pass --db, --cassette and/or --json-dir")
+        return 1
+
+    start = time.perf_counter()
+    generator = SyntheticSeasonGenerator(
+        leagues=args.leagues,
+        teams_per_league=args.teams,
+        seasons=args.seasons,
+        seed=args.seed,
+        current_season=args.season,
+        played_fraction=args.played
+    )
+    logger.info(f"Generated {len(generator.all_fixtures())} fixtures for {args.leagues} leagues x "
+                f"{args.teams} teams x {args.seasons} seasons in {time.perf_counter() - start:.1f}s")
+
+    if args.db:
+        saved = generator.populate_db(DatabaseManager(args.db), args.predictions_per_round)
+        logger.info(f"Saved to {args.db}: " + ", ".join(f"{count} {table}" for table, count in saved.items()))
+
+    if args.cassette:
+        if not args.base_url:
+            logger.error("No API base URL: set BASE_URL or pass --base-url")
+            return 1
+        generator.write_cassette(args.cassette, args.base_url)
+        logger.info(f"Wrote replay cassette {args.cassette}")
+
+    if args.json_dir:
+        written = write_json_files(generator, args.json_dir)
+        logger.info(f"Wrote {written} JSON files to {args.json_dir}")
+
+    logger.info(f"Finished in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,9 @@
+import time
+
+# Measure startup from process start, before the heavy imports below
+STARTUP_TIME = time.perf_counter()
+
+import importlib
 import os
 import json
 import logging
@@ -10,28 +16,52 @@ from datetime import datetime
 
 # Import modules
 from modules.api_client import FootballAPI
-from modules.config import API_KEY, BASE_URL, ALL_LEAGUES, PERF_DIFF_THRESHOLD
+from modules.config import API_KEY, BASE_URL, ALL_LEAGUES, PERF_DIFF_THRESHOLD, SCHEDULER_STATE_FILE
 from modules.firebase_auth import FirebaseAuth
 from modules.league_names import LEAGUE_NAMES
 from modules.db_manager import DatabaseManager
+from modules.db.logs import get_log_store
+from modules.log_buffer import get_log_buffer
+from modules import profiler
+from modules.refresh_scheduler import RefreshScheduler
 from modules.settings_manager import SettingsManager
-from modules.translations import translate, set_language, get_language
+from modules.translations import translate, translate_many, set_language, get_language, add_language_listener
 
 # Import tabs
-from tabs.form_tab import FormTab
 from tabs.login.login_tab import LoginTab
-from tabs.settings_tab import SettingsTab
 
-from tabs.stats_tab.stats_tab import StatsTab
-from tabs.winless_tab import WinlessTab
-from tabs.team_tab import TeamTab
-from tabs.next_round_tab import NextRoundTab
-from tabs.league_stats_tab import LeagueStatsTab
-from tabs.data_collection_tab import DataCollectionTab
-from tabs.db_view_tab import DbViewTab
-from tabs.about_tab import AboutTab
-from tabs.logs_tab import LogsTab
-from tabs.activity_log_tab import ActivityLogTab
+# Tab titles in English, translated for the tabview
+TAB_TITLES = {
+    "activity_log": "Activity Log",
+    "winless": "Winless Streaks",
+    "team": "Team Analysis",
+    "next_round": "Next Round",
+    "league_stats": "League Stats",
+    "form": "Form Analysis",
+    "data_collection": "Data Collection",
+    "firebase": "Firebase Analysis",
+    "stats": "Statistics",
+    "db_view": "Database View",
+    "logs": "Logs",
+    "about": "About",
+    "settings": "Settings"
+}
+
+# Tab modules and classes, imported the first time the tab is selected
+TAB_MODULES = {
+    "activity_log": ("tabs.activity_log_tab", "ActivityLogTab"),
+    "about": ("tabs.about_tab", "AboutTab"),
+    "winless": ("tabs.winless_tab", "WinlessTab"),
+    "team": ("tabs.team_tab", "TeamTab"),
+    "next_round": ("tabs.next_round_tab", "NextRoundTab"),
+    "league_stats": ("tabs.league_stats_tab", "LeagueStatsTab"),
+    "form": ("tabs.form_tab", "FormTab"),
+    "data_collection": ("tabs.data_collection_tab", "DataCollectionTab"),
+    "stats": ("tabs.stats_tab.stats_tab", "StatsTab"),
+    "db_view": ("tabs.db_view_tab", "DbViewTab"),
+    "logs": ("tabs.logs_tab", "LogsTab"),
+    "settings": ("tabs.settings_tab", "SettingsTab")
+}
 
 # Configure root logger
 logging.basicConfig(
@@ -73,6 +103,16 @@ class FootballStatsApp(ctk.CTk):
         
         # Initialize settings manager
         self.settings_manager = SettingsManager()
+        profiler.set_enabled(self.settings_manager.get_profiling())
+        
+        # Persist logs so the Logs tab can search earlier sessions
+        get_log_store().start_capture(get_log_buffer())
+        
+        # Initialize the refresh scheduler that keeps the API cache warm; it starts after login
+        self.refresh_scheduler = RefreshScheduler(
+            self.api, self.db_manager, self.settings_manager, state_file=SCHEDULER_STATE_FILE
+        )
+        self.logged_in = False
         
         # Set up global styles
         self._setup_global_styles()
@@ -83,6 +123,12 @@ class FootballStatsApp(ctk.CTk):
         set_language(language)
         logger.info(f"Application language set to: {language}")
         
+        # Later language switches update texts in place
+        add_language_listener(self._on_language_changed)
+        
+        # Apply settings as they change
+        self.settings_manager.add_listener(self._apply_settings_changes)
+        
         # Configure window
         self.title(translate("Football Statistics Analyzer"))
         self.geometry("1200x800")
@@ -117,25 +163,11 @@ class FootballStatsApp(ctk.CTk):
         style.configure("TNotebook", font=('Helvetica', 36))  # Add font configuration for the notebook itself
         
         # Create tabview (initially hidden)
-        self.tabview = ctk.CTkTabview(self.main_container)
+        self.tabview = self._create_tabview()
         # Don't pack it yet - we'll show it after login
         
         # Store tab names for later use
-        self.tab_names = {
-            "activity_log": translate("Activity Log"),
-            "winless": translate("Winless Streaks"),
-            "team": translate("Team Analysis"),
-            "next_round": translate("Next Round"),
-            "league_stats": translate("League Stats"),
-            "form": translate("Form Analysis"),
-            "data_collection": translate("Data Collection"),
-            "firebase": translate("Firebase Analysis"),
-            "stats": translate("Statistics"),
-            "db_view": translate("Database View"),
-            "logs": translate("Logs"),
-            "about": translate("About"),
-            "settings": translate("Settings")
-        }
+        self.tab_names = dict(zip(TAB_TITLES, translate_many(TAB_TITLES.values())))
         
         # Create default Firebase config if needed
         try:
@@ -158,12 +190,84 @@ class FootballStatsApp(ctk.CTk):
         self.login_loading = ctk.CTkLabel(self.login_container, text="Loading Firebase authentication...", font=ctk.CTkFont(size=16))
         self.login_loading.pack(pady=50)
         
-        # Initialize Firebase login after a delay
-        self.after(1000, self._init_firebase_login)
+        # Initialize Firebase login once the window has been drawn
+        self.after(100, self._init_firebase_login)
         
         # Create status bar
         self.status_bar = ctk.CTkLabel(self, text=translate("Ready"), anchor="w", font=ctk.CTkFont(size=14))
         self.status_bar.pack(fill="x", padx=10, pady=(0, 10))
+        
+        # Log time to first window once the main loop is idle
+        self.after_idle(self._log_startup_time, "First window ready")
+    
+    def _update_refresh_scheduler(self):
+        """Start or stop the refresh scheduler to match the login state and auto refresh setting"""
+        try:
+            if self.logged_in and self.settings_manager.get_auto_refresh():
+                self.refresh_scheduler.start()
+            elif self.refresh_scheduler.is_running:
+                self.refresh_scheduler.stop()
+        except Exception as e:
+            logger.error(f"Error updating refresh scheduler: {str(e)}")
+    
+    def _log_startup_time(self, stage):
+        """Log the time elapsed since process start"""
+        logger.info(f"Startup: {stage} after {(time.perf_counter() - STARTUP_TIME) * 1000:.0f} ms")
+    
+    def _create_tabview(self):
+        """Create the main tabview; tab contents are built when a tab is first selected"""
+        return ctk.CTkTabview(self.main_container, command=self._on_tab_selected)
+    
+    def _on_tab_selected(self):
+        """Build the selected tab's content if it has not been built yet"""
+        try:
+            tab_name = self.tabview.get()
+            for tab_key in self.tabs:
+                if self.tab_names.get(tab_key) == tab_name:
+                    self._build_tab(tab_key)
+                    break
+        except Exception as e:
+            logger.error(f"Error handling tab selection: {str(e)}")
+    
+    def _build_tab(self, tab_key):
+        """Import a tab's module and create its content in the tab frame"""
+        if tab_key in self.tab_contents or tab_key not in self.tabs:
+            return
+        
+        try:
+            start = time.perf_counter()
+            self.status_bar.configure(text=f"{translate('Loading')} {self.tab_names[tab_key]}...")
+            self.update_idletasks()
+            
+            # Import the tab module on first use
+            module_name, class_name = TAB_MODULES[tab_key]
+            tab_class = getattr(importlib.import_module(module_name), class_name)
+            
+            # Special case for StatsTab which has different constructor
+            if tab_key == "stats":
+                self.tab_contents[tab_key] = tab_class(self.tabs[tab_key], self.db_manager)
+            # Special case for SettingsTab which has different constructor
+            elif tab_key == "settings":
+                self.tab_contents[tab_key] = tab_class(
+                    self.tabs[tab_key], 
+                    self.settings_manager, 
+                    self.on_settings_changed, 
+                    self.db_manager
+                )
+            else:
+                # Standard constructor for most tabs
+                self.tab_contents[tab_key] = tab_class(
+                    self.tabs[tab_key], 
+                    self.api, 
+                    self.db_manager, 
+                    self.settings_manager
+                )
+            
+            logger.info(f"Built tab {tab_key} in {(time.perf_counter() - start) * 1000:.0f} ms")
+            self.status_bar.configure(text=translate("Ready"))
+        except Exception as e:
+            logger.error(f"Error building tab {tab_key}: {str(e)}", exc_info=True)
+            self.status_bar.configure(text=f"Error: {str(e)}")
     
     def _setup_global_styles(self):
         """Set up global styles for the application"""
@@ -216,6 +320,7 @@ class FootballStatsApp(ctk.CTk):
             
             # Update status
             self.status_bar.configure(text=translate("Login system loaded"))
+            self._log_startup_time("Login screen ready")
             
         except Exception as e:
             logger.error(f"Error initializing Firebase login: {str(e)}", exc_info=True)
@@ -255,7 +360,7 @@ class FootballStatsApp(ctk.CTk):
             # Check if tabview needs to be recreated
             if not hasattr(self, 'tabview') or self.tabview is None or not self.tabview.winfo_exists():
                 logger.info("Creating new tabview")
-                self.tabview = ctk.CTkTabview(self.main_container)
+                self.tabview = self._create_tabview()
                 
                 # Reset tab dictionaries
                 self.tabs = {}
@@ -272,7 +377,7 @@ class FootballStatsApp(ctk.CTk):
             # Create a new tabview as fallback
             try:
                 logger.info("Creating new tabview (fallback)")
-                self.tabview = ctk.CTkTabview(self.main_container)
+                self.tabview = self._create_tabview()
                 self.tabview.pack(fill="both", expand=True)
                 
                 # Reset tab dictionaries
@@ -284,6 +389,10 @@ class FootballStatsApp(ctk.CTk):
         # Add all tabs
         self._add_tabs_after_login()
         
+        # Start background refreshes
+        self.logged_in = True
+        self._update_refresh_scheduler()
+        
         # Update status
         self.status_bar.configure(text=translate("Logged in successfully"))
         
@@ -291,6 +400,10 @@ class FootballStatsApp(ctk.CTk):
         """Called when a user logs out"""
         logger.info("User logged out")
         
+        # Stop background refreshes
+        self.logged_in = False
+        self._update_refresh_scheduler()
+        
         # Remove user info label
         if hasattr(self, 'user_info_label'):
             self.user_info_label.destroy()
@@ -309,7 +422,7 @@ class FootballStatsApp(ctk.CTk):
                 
                 # Create a new tabview (but don't pack it yet)
                 logger.info("Creating new tabview")
-                self.tabview = ctk.CTkTabview(self.main_container)
+                self.tabview = self._create_tabview()
                 
                 # Reset tab dictionaries
                 self.tabs = {}
@@ -351,7 +464,7 @@ class FootballStatsApp(ctk.CTk):
                     
                     # Remove from our dictionaries
                     del self.tabs[tab_key]
-                    del self.tab_contents[tab_key]
+                    self.tab_contents.pop(tab_key, None)
                     logger.info(f"Successfully removed tab: {tab_key}")
                 except Exception as e:
                     logger.error(f"Error removing tab {tab_key}: {str(e)}")
@@ -371,7 +484,7 @@ class FootballStatsApp(ctk.CTk):
             # Ensure tabview is properly initialized
             if not hasattr(self, 'tabview') or self.tabview is None or not self.tabview.winfo_exists():
                 logger.info("Recreating tabview in _add_tabs_after_login")
-                self.tabview = ctk.CTkTabview(self.main_container)
+                self.tabview = self._create_tabview()
                 self.tabview.pack(fill="both", expand=True)
                 
                 # Reset tab dictionaries
@@ -392,23 +505,15 @@ class FootballStatsApp(ctk.CTk):
             else:
                 logger.warning("No user ID found or user not signed in")
             
-            # Get tab permissions
+            # Get tab permissions; the profile was prefetched during sign in, so this is a cache hit
             tab_permissions = {}
             if user_id:
-                # Try multiple times to get permissions if needed
-                for attempt in range(3):
-                    logger.info(f"Attempting to get tab permissions (attempt {attempt+1}/3)")
-                    success, permissions = self.login_content.firebase_auth.get_user_tab_permissions(user_id)
-                    if success:
-                        tab_permissions = permissions
-                        logger.info(f"Tab permissions: {tab_permissions}")
-                        break
-                    else:
-                        logger.warning(f"Failed to get tab permissions (attempt {attempt+1}/3)")
-                        if attempt < 2:  # Don't sleep on the last attempt
-                            self.update_idletasks()  # Process any pending events
-                            import time
-                            time.sleep(0.5)  # Short delay before retrying
+                success, permissions = self.login_content.firebase_auth.get_user_tab_permissions(user_id)
+                if success:
+                    tab_permissions = permissions
+                    logger.info(f"Tab permissions: {tab_permissions}")
+                else:
+                    logger.warning("Failed to get tab permissions")
             
             # Grant all permissions for admin users
             if hasattr(self.login_content, 'firebase_auth') and self.login_content.firebase_auth.current_user.get('isAdmin', False):
@@ -438,24 +543,7 @@ class FootballStatsApp(ctk.CTk):
             added_tabs = set()
             
             # Add tabs based on permissions
-            tab_classes = {
-                "activity_log": ActivityLogTab,
-                "about": AboutTab,
-                "winless": WinlessTab,
-                "team": TeamTab,
-                "next_round": NextRoundTab,
-                "league_stats": LeagueStatsTab,
-                "form": FormTab,
-                "data_collection": DataCollectionTab,
-
-                "stats": StatsTab,
-                "db_view": DbViewTab,
-                "logs": LogsTab,
-                "settings": SettingsTab
-            }
-            
-            # Add tabs based on permissions
-            for tab_key, tab_class in tab_classes.items():
+            for tab_key in TAB_MODULES:
                 # Check if user has permission for this tab and it hasn't been added yet
                 if tab_permissions.get(tab_key, False) and tab_key not in added_tabs:
                     logger.info(f"Adding tab: {tab_key}")
@@ -482,27 +570,9 @@ class FootballStatsApp(ctk.CTk):
                                         # Add it to our tabs dictionary
                                         self.tabs[tab_key] = existing_tab
                                         
-                                        # Create the tab content
-                                        if tab_key == "stats":
-                                            self.tab_contents[tab_key] = tab_class(self.tabs[tab_key], self.db_manager)
-                                        elif tab_key == "settings":
-                                            self.tab_contents[tab_key] = tab_class(
-                                                self.tabs[tab_key], 
-                                                self.settings_manager, 
-                                                self.on_settings_changed, 
-                                                self.db_manager
-                                            )
-                                        else:
-                                            self.tab_contents[tab_key] = tab_class(
-                                                self.tabs[tab_key], 
-                                                self.api, 
-                                                self.db_manager, 
-                                                self.settings_manager
-                                            )
-                                        
-                                        # Mark this tab as added
+                                        # Mark this tab as added; its content is built when first selected
                                         added_tabs.add(tab_key)
-                                        logger.info(f"Successfully added content to existing tab: {tab_key}")
+                                        logger.info(f"Successfully reused existing tab: {tab_key}")
                                         continue
                                 except Exception as e:
                                     logger.error(f"Error using existing tab: {str(e)}")
@@ -518,27 +588,9 @@ class FootballStatsApp(ctk.CTk):
                                         # Add it to our tabs dictionary
                                         self.tabs[tab_key] = test_tab
                                         
-                                        # Create the tab content
-                                        if tab_key == "stats":
-                                            self.tab_contents[tab_key] = tab_class(self.tabs[tab_key], self.db_manager)
-                                        elif tab_key == "settings":
-                                            self.tab_contents[tab_key] = tab_class(
-                                                self.tabs[tab_key], 
-                                                self.settings_manager, 
-                                                self.on_settings_changed, 
-                                                self.db_manager
-                                            )
-                                        else:
-                                            self.tab_contents[tab_key] = tab_class(
-                                                self.tabs[tab_key], 
-                                                self.api, 
-                                                self.db_manager, 
-                                                self.settings_manager
-                                            )
-                                        
-                                        # Mark this tab as added
+                                        # Mark this tab as added; its content is built when first selected
                                         added_tabs.add(tab_key)
-                                        logger.info(f"Successfully added content to existing tab from _tab_dict: {tab_key}")
+                                        logger.info(f"Successfully reused existing tab from _tab_dict: {tab_key}")
                                         continue
                                     except Exception as e:
                                         logger.error(f"Error using existing tab from _tab_dict: {str(e)}")
@@ -551,27 +603,7 @@ class FootballStatsApp(ctk.CTk):
                             
                         self.tabs[tab_key] = self.tabview.add(tab_name)
                         
-                        # Special case for StatsTab which has different constructor
-                        if tab_key == "stats":
-                            self.tab_contents[tab_key] = tab_class(self.tabs[tab_key], self.db_manager)
-                        # Special case for SettingsTab which has different constructor
-                        elif tab_key == "settings":
-                            self.tab_contents[tab_key] = tab_class(
-                                self.tabs[tab_key], 
-                                self.settings_manager, 
-                                self.on_settings_changed, 
-                                self.db_manager
-                            )
-                        else:
-                            # Standard constructor for most tabs
-                            self.tab_contents[tab_key] = tab_class(
-                                self.tabs[tab_key], 
-                                self.api, 
-                                self.db_manager, 
-                                self.settings_manager
-                            )
-                        
-                        # Mark this tab as added
+                        # Mark this tab as added; its content is built when first selected
                         added_tabs.add(tab_key)
                         
                         logger.info(f"Successfully added tab: {tab_key}")
@@ -617,7 +649,7 @@ class FootballStatsApp(ctk.CTk):
                         
                         # Remove from our dictionaries
                         del self.tabs[tab_key]
-                        del self.tab_contents[tab_key]
+                        self.tab_contents.pop(tab_key, None)
                         logger.info(f"Successfully removed tab: {tab_key}")
                     except Exception as e:
                         logger.error(f"Error removing tab {tab_key}: {str(e)}")
@@ -633,35 +665,70 @@ class FootballStatsApp(ctk.CTk):
     
     def on_settings_changed(self):
         """Callback when settings are changed"""
-        # Check if language has changed
-        old_language = get_language()
-        new_language = self.settings_manager.get_language()
-        language_changed = old_language != new_language
+        # Listeners (see _apply_settings_changes) react only to the keys that changed
+        changed = self.settings_manager.notify_changes()
+        if changed:
+            logger.info(f"Settings changed: {', '.join(sorted(changed))}")
+        
+        # Update status
+        self.status_bar.configure(text=f"{translate('Settings updated at')} {datetime.now().strftime('%H:%M:%S')}")
         
+    def _apply_settings_changes(self, changed):
+        """Apply changed settings to the window and the tabs that depend on them"""
         # Update language
-        if language_changed:
+        if "language" in changed:
+            old_language = get_language()
+            new_language = self.settings_manager.get_language()
             set_language(new_language)
             logger.info(f"Language updated from {old_language} to {new_language}")
         
         # Update appearance
-        ctk.set_appearance_mode(self.settings_manager.get_setting("appearance_mode"))
-        ctk.set_default_color_theme(self.settings_manager.get_setting("color_theme"))
+        if "appearance_mode" in changed:
+            ctk.set_appearance_mode(self.settings_manager.get_setting("appearance_mode"))
+        if "color_theme" in changed:
+            ctk.set_default_color_theme(self.settings_manager.get_setting("color_theme"))
+        
+        # Start or stop background refreshes
+        if "auto_refresh" in changed:
+            self._update_refresh_scheduler()
+        
+        # Turn profiling of long operations on or off
+        if "profiling" in changed:
+            profiler.set_enabled(self.settings_manager.get_profiling())
         
-        # Update all tab contents
+        # Update only the tabs that use a changed setting
         for tab_key, tab_content in self.tab_contents.items():
-            if hasattr(tab_content, 'update_settings'):
+            if not hasattr(tab_content, 'update_settings'):
+                continue
+            settings_keys = getattr(tab_content, 'SETTINGS_KEYS', None)
+            if settings_keys is None or changed & set(settings_keys):
                 tab_content.update_settings()
         
+    def _on_language_changed(self, language_code):
+        """Translate the window, tab titles and tracked tab widgets in place"""
         # Update window title
         self.title(translate("Football Statistics Analyzer"))
         
         # Update logout button text
         self.logout_button.configure(text=translate("Logout"))
         
-        # Update status
-        self.status_bar.configure(text=f"{translate('Settings updated at')} {datetime.now().strftime('%H:%M:%S')}")
+        # Rename added tabs; tab contents are kept
+        new_names = dict(zip(TAB_TITLES, translate_many(TAB_TITLES.values())))
+        for tab_key in self.tabs:
+            old_name, new_name = self.tab_names.get(tab_key), new_names.get(tab_key)
+            if old_name and new_name and old_name != new_name:
+                try:
+                    self.tabview.rename(old_name, new_name)
+                except Exception as e:
+                    logger.error(f"Error renaming tab {tab_key}: {str(e)}")
+                    new_names[tab_key] = old_name
+        self.tab_names = new_names
+        
+        # Update only the widgets each built tab tracks
+        for tab_content in self.tab_contents.values():
+            if hasattr(tab_content, 'retranslate'):
+                tab_content.retranslate()
         
-    # Removed _update_tab_names method as it's no longer needed
     
     def _set_first_tab(self):
         """Set the active tab to the first available tab"""
@@ -711,6 +778,8 @@ class FootballStatsApp(ctk.CTk):
                 # Try to set the tab
                 self.tabview.set(first_tab_name)
                 logger.info(f"Successfully set active tab to: '{first_tab_name}'")
+                # Build the selected tab now that it is visible
+                self._on_tab_selected()
                 return
             except Exception as e:
                 logger.warning(f"Failed to set tab by name: {str(e)}")
@@ -723,6 +792,8 @@ class FootballStatsApp(ctk.CTk):
                     # Select the first segment
                     self.tabview._segmented_button.set(0)
                     logger.info("Set tab by segment index 0")
+                    # Build the selected tab now that it is visible
+                    self._on_tab_selected()
                     return
                 else:
                     logger.error("Could not access segmented button")
@@ -739,6 +810,8 @@ class FootballStatsApp(ctk.CTk):
                     # Select it
                     self.tabview.set(first_tab_name_in_dict)
                     logger.info(f"Set tab by _tab_dict key: {first_tab_name_in_dict}")
+                    # Build the selected tab now that it is visible
+                    self._on_tab_selected()
                     return
                 else:
                     logger.error("Could not access _tab_dict or it's empty")
@@ -753,6 +826,8 @@ class FootballStatsApp(ctk.CTk):
                 if existing_tabs:
                     self.tabview.set(existing_tabs[0])
                     logger.info(f"Set tab by get() result: {existing_tabs[0]}")
+                    # Build the selected tab now that it is visible
+                    self._on_tab_selected()
                     return
                 else:
                     logger.error("No tabs returned by get()")
@@ -770,7 +845,7 @@ class FootballStatsApp(ctk.CTk):
                 self.tabview.pack_forget()
                 
                 # Create a new tabview
-                self.tabview = ctk.CTkTabview(self.main_container)
+                self.tabview = self._create_tabview()
                 self.tabview.pack(fill="both", expand=True)
                 
                 # Clear our tab dictionaries
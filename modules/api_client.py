@@ -3,16 +3,22 @@ import time
 import requests
 import logging
 import json
-from typing import Dict, Any, Optional, List
+import os
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 
+from modules.api_transport import create_transport_from_env
 from modules.config import ALL_LEAGUES, PERF_DIFF_THRESHOLD
 from modules.league_names import LEAGUE_NAMES
 from modules.form_analyzer import FormAnalyzer
+from modules.instrumentation import timer, count
 
 logger = logging.getLogger(__name__)
 
 class FootballAPI:
-    def __init__(self, api_key, base_url, disable_auto_fetch=False):
+    def __init__(self, api_key, base_url, disable_auto_fetch=False, transport=None):
         self.api_key = api_key
         self.base_url = base_url
         self.headers = {'x-apisports-key': api_key}
@@ -20,6 +26,17 @@ class FootballAPI:
         self.disable_auto_fetch = disable_auto_fetch
         self._initialize_cache()
         
+        # HTTP transport: live API, or record/replay of a cassette (see api_transport)
+        self.transport = transport or create_transport_from_env()
+        
+        # Shared rate limit: minimum seconds between request starts across all threads
+        self.min_request_interval = 0.2
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        
+        # Per-thread flags, see bypass_cache()
+        self._thread_state = threading.local()
+        
     def _initialize_cache(self):
         """Initialize different cache stores with different durations"""
         self.cache = {
@@ -30,18 +47,113 @@ class FootballAPI:
         
     def _get_from_cache(self, key: str, cache_type: str = 'short') -> Optional[Any]:
         """Get data from cache with specified duration type"""
+        if getattr(self._thread_state, 'bypass_cache', False):
+            count("cache.bypass")
+            return None
         cache_store = self.cache[cache_type]['data']
         if key in cache_store:
             data, timestamp = cache_store[key]
             if datetime.now() - timestamp < self.cache[cache_type]['duration']:
+                count(f"cache.{cache_type}.hit")
                 return data
-            del cache_store[key]
+            cache_store.pop(key, None)
+            count(f"cache.{cache_type}.expired")
+        count(f"cache.{cache_type}.miss")
+        return None
+
+    def peek_cache(self, key: str, cache_type: str = 'short') -> Optional[Any]:
+        """Get unexpired cached data without fetching, also while bypass_cache() is active"""
+        entry = self.cache[cache_type]['data'].get(key)
+        if entry is not None and datetime.now() - entry[1] < self.cache[cache_type]['duration']:
+            return entry[0]
         return None
 
     def _set_cache(self, key: str, data: Any, cache_type: str = 'short'):
         """Set data in cache with specified duration type"""
         self.cache[cache_type]['data'][key] = (data, datetime.now())
 
+    @contextmanager
+    def bypass_cache(self):
+        """
+        Make fetches on the current thread skip cached entries.
+        
+        Fresh responses are still written to the cache, so this is how a
+        background refresh replaces stale data for everyone else.
+        """
+        previous = getattr(self._thread_state, 'bypass_cache', False)
+        self._thread_state.bypass_cache = True
+        try:
+            yield
+        finally:
+            self._thread_state.bypass_cache = previous
+
+    def save_cache(self, path: str) -> int:
+        """
+        Write unexpired cache entries to a JSON file for a later warm start
+        
+        Args:
+            path: Cache file path
+            
+        Returns:
+            int: Number of entries written
+        """
+        now = datetime.now()
+        snapshot = {}
+        for cache_type, store in self.cache.items():
+            entries = {}
+            for key, (data, timestamp) in list(store['data'].items()):
+                if now - timestamp < store['duration']:
+                    entries[key] = [data, timestamp.isoformat()]
+            snapshot[cache_type] = entries
+        
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        os.replace(temp_path, path)
+        return sum(len(entries) for entries in snapshot.values())
+
+    def load_cache(self, path: str) -> int:
+        """
+        Load cache entries saved by save_cache, skipping expired ones
+        
+        Args:
+            path: Cache file path
+            
+        Returns:
+            int: Number of entries loaded
+        """
+        if not os.path.exists(path):
+            return 0
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading API cache from {path}: {str(e)}")
+            return 0
+        
+        now = datetime.now()
+        loaded = 0
+        for cache_type, entries in snapshot.items():
+            store = self.cache.get(cache_type)
+            if store is None:
+                continue
+            for key, (data, timestamp) in entries.items():
+                timestamp = datetime.fromisoformat(timestamp)
+                if now - timestamp < store['duration']:
+                    store['data'][key] = (data, timestamp)
+                    loaded += 1
+        return loaded
+
+    def _wait_for_rate_limit(self):
+        """Space out request starts across every thread using this client"""
+        with self._rate_lock:
+            wait = self._next_request_time - time.monotonic()
+            if wait > 0:
+                with timer("api.rate_limit_wait"):
+                    time.sleep(wait)
+            self._next_request_time = time.monotonic() + self.min_request_interval
+
     def _batch_request(self, url: str, params_list: list) -> Dict:
         """Make batch requests and handle rate limiting and interruptions"""
         results = {}
@@ -55,30 +167,40 @@ class FootballAPI:
 
             try:
                 # Set a timeout for the request to prevent hanging
-                response = requests.get(url, headers=self.headers, params=params, timeout=10)
+                self._wait_for_rate_limit()
+                count("api.requests")
+                with timer("api.http", endpoint=url.rsplit('/', 1)[-1]):
+                    response = self.transport.get(url, headers=self.headers, params=params, timeout=10)
                 if response.status_code == 200:
-                    data = response.json()
+                    with timer("api.json_decode"):
+                        data = response.json()
                     self._set_cache(cache_key, data)
                     results[json.dumps(params)] = data
                 elif response.status_code == 429:  # Rate limit
+                    count("api.rate_limited")
                     logger.warning(f"Rate limit hit for {url} with params {params}")
                     time.sleep(2)  # Reduced wait time to avoid long pauses
                     try:
-                        response = requests.get(url, headers=self.headers, params=params, timeout=10)
+                        self._wait_for_rate_limit()
+                        count("api.requests")
+                        with timer("api.http", endpoint=url.rsplit('/', 1)[-1]):
+                            response = self.transport.get(url, headers=self.headers, params=params, timeout=10)
                         if response.status_code == 200:
-                            data = response.json()
+                            with timer("api.json_decode"):
+                                data = response.json()
                             self._set_cache(cache_key, data)
                             results[json.dumps(params)] = data
                     except Exception as retry_e:
                         logger.error(f"Error in retry request: {str(retry_e)}")
                 else:
+                    count("api.failed")
                     logger.warning(f"Request failed with status {response.status_code} for {url} with params {params}")
-                
-                time.sleep(0.2)  # Small delay between requests
             except requests.exceptions.Timeout:
+                count("api.timeouts")
                 logger.warning(f"Request timeout for {url} with params {params}")
                 continue
             except requests.exceptions.ConnectionError:
+                count("api.connection_errors")
                 logger.warning(f"Connection error for {url} with params {params}")
                 continue
             except KeyboardInterrupt:
@@ -91,13 +213,14 @@ class FootballAPI:
                 
         return results
     
-    def fetch_all_teams(self, league_names, matches_count=5):
+    def fetch_all_teams(self, league_names, matches_count=5, force_fetch=False):
         """
         Fetch all teams across all leagues with form analysis
         
         Args:
             league_names: Dictionary of league IDs and names
             matches_count: Number of recent matches to analyze for form
+            force_fetch: Fetch even when auto-fetch is disabled
             
         Returns:
             list: List of teams with their form analysis
@@ -121,7 +244,7 @@ class FootballAPI:
                 logger.info(f"Processing league: {league_id} ({league_info.get('name', 'Unknown')})")
                 
                 # Fetch standings for this specific league
-                standings = self.fetch_standings(league_id)
+                standings = self.fetch_standings(league_id, force_fetch=force_fetch)
                 
                 if not standings:
                     logger.warning(f"No standings available for league {league_id}")
@@ -152,7 +275,7 @@ class FootballAPI:
                     continue
                 
                 # Get fixtures with caching
-                fixtures = self.fetch_fixtures(league_id)
+                fixtures = self.fetch_fixtures(league_id, force_fetch=force_fetch)
                 logger.info(f"Fetched {len(fixtures)} fixtures for league {league_id}")
 
                 # Process each team
@@ -217,7 +340,7 @@ class FootballAPI:
         # Sort by absolute performance difference
         return sorted(all_teams, key=lambda x: abs(x.get('performance_diff', 0)), reverse=True)
 
-    def fetch_standings(self, league_id):
+    def fetch_standings(self, league_id, force_fetch=False):
         """Optimized standings fetch with better caching"""
         # Special handling for ALL_LEAGUES
         if league_id == ALL_LEAGUES:
@@ -233,7 +356,7 @@ class FootballAPI:
             return cached_data
             
         # If auto-fetch is disabled and no cache, return empty result
-        if self.disable_auto_fetch:
+        if self.disable_auto_fetch and not force_fetch:
             return None
 
         url = f"{self.base_url}/standings"
@@ -245,7 +368,7 @@ class FootballAPI:
             return data
         return None
 
-    def fetch_fixtures(self, league_id, season='2025', team_id=None, fixture_id=None):
+    def fetch_fixtures(self, league_id, season='2025', team_id=None, fixture_id=None, force_fetch=False):
         """Optimized fixtures fetch with smarter caching"""
         cache_key = f'fixtures_{league_id}_{team_id}_{fixture_id}'
         
@@ -256,7 +379,7 @@ class FootballAPI:
             return cached_data
             
         # If auto-fetch is disabled and no cache, return empty result
-        if self.disable_auto_fetch:
+        if self.disable_auto_fetch and not force_fetch:
             return []
 
         url = f"{self.base_url}/fixtures"
@@ -377,7 +500,7 @@ class FootballAPI:
         self._set_cache(cache_key, data, 'medium')
         return data
 
-    def fetch_team_statistics(self, league_id, team_id, season='2025'):
+    def fetch_team_statistics(self, league_id, team_id, season='2025', force_fetch=False):
         """Optimized team statistics fetch with null safety"""
         cache_key = f'team_stats_{league_id}_{team_id}'
         cached_data = self._get_from_cache(cache_key, 'medium')
@@ -385,7 +508,7 @@ class FootballAPI:
             return cached_data
             
         # If auto-fetch is disabled and no cache, return empty result
-        if self.disable_auto_fetch:
+        if self.disable_auto_fetch and not force_fetch:
             return {}
             
         url = f"{self.base_url}/teams/statistics"
@@ -424,7 +547,64 @@ class FootballAPI:
             self.logger.error(f"Error fetching team statistics for {team_id}: {str(e)}")
             return {}
 
-    def fetch_next_fixtures(self, league_id, season='2025'):
+    def fetch_team_statistics_batch(self, pairs: Iterable[Tuple[int, int]], season='2025', max_workers=4,
+                                    force_fetch=False, refresh=False) -> Dict[Tuple[int, int], Dict]:
+        """
+        Fetch team statistics for many (league_id, team_id) pairs concurrently.
+        
+        Cached pairs are returned directly; the rest are fetched in one parallel
+        wave that still respects the client's shared rate limit.
+        
+        Args:
+            pairs: (league_id, team_id) pairs, duplicates are fetched once
+            season: Season year
+            max_workers: Maximum number of concurrent requests
+            force_fetch: Fetch even when auto-fetch is disabled
+            refresh: Ignore cached statistics and fetch every pair again
+            
+        Returns:
+            Dict: Statistics per (league_id, team_id) pair, {} when unavailable
+        """
+        refresh = refresh or getattr(self._thread_state, 'bypass_cache', False)
+        
+        def fetch(league_id, team_id):
+            if refresh:
+                with self.bypass_cache():
+                    return self.fetch_team_statistics(league_id, team_id, season, True)
+            return self.fetch_team_statistics(league_id, team_id, season, True)
+        
+        results = {}
+        missing = []
+        for league_id, team_id in dict.fromkeys(pairs):
+            cached_data = None if refresh else self._get_from_cache(f'team_stats_{league_id}_{team_id}', 'medium')
+            if cached_data:
+                results[(league_id, team_id)] = cached_data
+            elif self.disable_auto_fetch and not force_fetch:
+                results[(league_id, team_id)] = {}
+            else:
+                missing.append((league_id, team_id))
+        
+        if not missing:
+            return results
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing)), thread_name_prefix="TeamStats") as pool:
+            futures = {
+                pool.submit(fetch, league_id, team_id): (league_id, team_id)
+                for league_id, team_id in missing
+            }
+            for future in as_completed(futures):
+                pair = futures[future]
+                try:
+                    results[pair] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error fetching team statistics for {pair[1]}: {str(e)}")
+                    results[pair] = {}
+        
+        self.logger.info(f"Fetched statistics for {len(missing)} teams in {time.perf_counter() - start:.2f}s")
+        return results
+
+    def fetch_next_fixtures(self, league_id, season='2025', force_fetch=False):
         """Fetch next round of fixtures for a league with short-term caching"""
         cache_key = f'next_fixtures_{league_id}_{season}'
         cached_data = self._get_from_cache(cache_key, 'short')  # Short cache for upcoming fixtures
@@ -432,7 +612,7 @@ class FootballAPI:
             return cached_data
             
         # If auto-fetch is disabled and no cache, return empty result
-        if self.disable_auto_fetch:
+        if self.disable_auto_fetch and not force_fetch:
             return []
             
         url = f"{self.base_url}/fixtures"
@@ -0,0 +1,242 @@
+"""
+Pluggable HTTP transports for FootballAPI.
+
+- HttpTransport sends real requests to the API.
+- RecordingTransport wraps another transport and saves every request and
+  response pair to a cassette file.
+- ReplayTransport serves responses from a cassette without the network. It
+  can inject latency, 429 rate-limit responses and timeouts.
+
+With replay, refresh throughput, rate-limit handling and cache effectiveness
+can be measured reproducibly on a machine with no network. The transport is
+chosen with FootballAPI(transport=...), or for the whole app with environment
+variables:
+
+    FOOTBALL_API_TRANSPORT=record FOOTBALL_API_CASSETTE=cassette.json python main.py
+    FOOTBALL_API_TRANSPORT=replay FOOTBALL_API_CASSETTE=cassette.json \
+        FOOTBALL_API_LATENCY=0.05 FOOTBALL_API_FAULT_429=0.1 python main.py
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+def interaction_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Build the lookup key of a request; headers are not part of it"""
+    return f"{url}?{json.dumps(params or {}, sort_keys=True)}"
+
+
+class CassetteResponse:
+    """Minimal stand-in for requests.Response served from a cassette."""
+
+    def __init__(self, status_code: int, body: Any):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        """Return the decoded response body"""
+        return self._body
+
+
+class HttpTransport:
+    """Sends requests to the live API."""
+
+    def get(self, url: str, headers=None, params=None, timeout=10):
+        """Send a GET request"""
+        return requests.get(url, headers=headers, params=params, timeout=timeout)
+
+
+class RecordingTransport:
+    """Forwards requests to another transport and records the responses."""
+
+    def __init__(self, path: str, inner=None, autosave: bool = True):
+        """
+        Initialize the recorder.
+
+        Args:
+            path: Cassette file to write; existing interactions are kept
+            inner: Transport that sends the requests (defaults to HttpTransport)
+            autosave: Write the cassette after every recorded response
+        """
+        self.path = path
+        self.inner = inner or HttpTransport()
+        self.autosave = autosave
+        self._lock = threading.Lock()
+        self.interactions: Dict[str, List[Dict[str, Any]]] = load_cassette(path) if os.path.exists(path) else {}
+
+    def get(self, url: str, headers=None, params=None, timeout=10):
+        """Send a request through the inner transport and record the response"""
+        start = time.perf_counter()
+        response = self.inner.get(url, headers=headers, params=params, timeout=timeout)
+        elapsed = time.perf_counter() - start
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+
+        # The API key lives in the headers, so only the URL and params are stored
+        with self._lock:
+            self.interactions.setdefault(interaction_key(url, params), []).append({
+                "url": url,
+                "params": params or {},
+                "status_code": response.status_code,
+                "elapsed": round(elapsed, 4),
+                "body": body
+            })
+        if self.autosave:
+            self.save()
+        return response
+
+    def save(self):
+        """Write the cassette atomically"""
+        with self._lock:
+            save_cassette(self.path, self.interactions)
+
+
+class ReplayTransport:
+    """Serves recorded responses with optional latency and injected faults."""
+
+    def __init__(self, path: str, latency: Optional[float] = None, jitter: float = 0.0,
+                 rate_limit_rate: float = 0.0, timeout_rate: float = 0.0, timeout_delay: Optional[float] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize the replayer.
+
+        Args:
+            path: Cassette file to read
+            latency: Seconds added to every response; None replays the recorded time
+            jitter: Extra random seconds, uniformly from 0 to jitter
+            rate_limit_rate: Share of requests answered with 429 Too Many Requests
+            timeout_rate: Share of requests that raise a timeout
+            timeout_delay: Seconds before an injected timeout; None waits the request's timeout
+            seed: Seed for the fault and jitter random generator
+        """
+        self.path = path
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_delay = timeout_delay
+        self.interactions = load_cassette(path)
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._positions: Dict[str, int] = {}
+        self.stats = {"requests": 0, "hits": 0, "misses": 0, "rate_limited": 0, "timeouts": 0}
+
+    def get(self, url: str, headers=None, params=None, timeout=10):
+        """Serve the recorded response for a request"""
+        key = interaction_key(url, params)
+        with self._lock:
+            self.stats["requests"] += 1
+            roll = self._random.random()
+            delay = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+
+            # Repeated requests cycle through the recorded responses in order
+            recorded = self.interactions.get(key)
+            interaction = None
+            if recorded:
+                position = self._positions.get(key, 0)
+                interaction = recorded[position % len(recorded)]
+
+            if roll < self.timeout_rate:
+                self.stats["timeouts"] += 1
+                fault = "timeout"
+            elif roll < self.timeout_rate + self.rate_limit_rate:
+                self.stats["rate_limited"] += 1
+                fault = "rate_limit"
+            else:
+                fault = None
+                if interaction is not None:
+                    self._positions[key] = self._positions.get(key, 0) + 1
+                    self.stats["hits"] += 1
+                else:
+                    self.stats["misses"] += 1
+
+        if fault == "timeout":
+            time.sleep(self.timeout_delay if self.timeout_delay is not None else (timeout or 0))
+            raise requests.exceptions.Timeout(f"Injected timeout for {key}")
+
+        base = self.latency if self.latency is not None else (interaction or {}).get("elapsed", 0.0)
+        if base + delay > 0:
+            time.sleep(base + delay)
+
+        if fault == "rate_limit":
+            return CassetteResponse(429, {"errors": {"requests": "Injected rate limit"}, "response": []})
+        if interaction is None:
+            logger.warning(f"No recorded response for {key}")
+            return CassetteResponse(404, {"errors": {"cassette": "Not recorded"}, "response": []})
+        return CassetteResponse(interaction["status_code"], interaction["body"])
+
+
+def load_cassette(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load a cassette file.
+
+    Returns:
+        dict: Recorded interactions by request key, oldest first
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        cassette = json.load(f)
+
+    interactions = {}
+    for interaction in cassette.get("interactions", []):
+        interactions.setdefault(interaction_key(interaction["url"], interaction["params"]), []).append(interaction)
+    return interactions
+
+
+def save_cassette(path: str, interactions: Dict[str, List[Dict[str, Any]]]):
+    """Write interactions to a cassette file atomically"""
+    cassette = {
+        "version": CASSETTE_VERSION,
+        "interactions": [interaction for recorded in interactions.values() for interaction in recorded]
+    }
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(cassette, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def create_transport_from_env():
+    """
+    Create the transport selected by FOOTBALL_API_TRANSPORT.
+
+    Returns:
+        Transport for "record" or "replay", otherwise HttpTransport
+    """
+    mode = os.getenv("FOOTBALL_API_TRANSPORT", "").lower()
+    path = os.getenv("FOOTBALL_API_CASSETTE", "api_cassette.json")
+
+    try:
+        if mode == "record":
+            logger.info(f"Recording API responses to {path}")
+            return RecordingTransport(path)
+        if mode == "replay":
+            latency = os.getenv("FOOTBALL_API_LATENCY")
+            timeout_delay = os.getenv("FOOTBALL_API_TIMEOUT_DELAY")
+            seed = os.getenv("FOOTBALL_API_SEED")
+            logger.info(f"Replaying API responses from {path}")
+            return ReplayTransport(
+                path,
+                latency=float(latency) if latency else None,
+                jitter=float(os.getenv("FOOTBALL_API_JITTER", "0")),
+                rate_limit_rate=float(os.getenv("FOOTBALL_API_FAULT_429", "0")),
+                timeout_rate=float(os.getenv("FOOTBALL_API_FAULT_TIMEOUT", "0")),
+                timeout_delay=float(timeout_delay) if timeout_delay else None,
+                seed=int(seed) if seed else None
+            )
+    except Exception as e:
+        logger.error(f"Error creating {mode} transport, using live API: {str(e)}")
+    return HttpTransport()
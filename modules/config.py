@@ -5,6 +5,50 @@ BASE_URL = "https://v3.football.api-sports.io"
 # Special value for all leagues
 ALL_LEAGUES = -1
 
+# Refresh scheduler cadence
+MATCH_DURATION_MINUTES = 120  # Kickoff to final whistle, including half time
+MATCH_WINDOW_LEAD_MINUTES = 15  # Start watching a league this long before kickoff
+STANDINGS_REFRESH_DELAY_MINUTES = 30  # Wait for final results before refreshing standings
+RECENT_RESULTS_HOURS = 12  # How far back a finished match triggers refreshes
+NIGHTLY_REFRESH_HOUR = 4  # Local hour after which team statistics are refreshed
+SCHEDULER_TICK_SECONDS = 60
+SCHEDULER_STATE_FILE = "scheduler_state.json"  # Last run times, so restarts keep the schedule
+
+# Profiling of long operations (opt-in)
+PROFILE_DIR = "profiles"
+PROFILE_TOP_FUNCTIONS = 40  # Functions listed in each profile summary
+PROFILE_KEEP_RUNS = 50  # Older profiles are deleted
+
+# Logs tab
+LOG_BUFFER_SIZE = 5000  # Records kept in memory for the Logs tab
+LOG_TREE_LIMIT = 2000  # Rows shown in the log table
+LOG_DRAIN_INTERVAL_MS = 200  # How often new records are added to the table
+LOG_DB_PATH = "logs.db"  # Persistent, searchable log store
+LOG_STORE_MAX_ROWS = 2000000  # Oldest records are deleted beyond this
+LOG_STORE_FLUSH_SECONDS = 1.0  # How often buffered records are written to the store
+LOG_STORE_LEVEL = "INFO"  # Lowest level written to the store, independent of the Logs tab filter
+LOG_PAGE_SIZE = 200  # Records per page when searching stored logs
+
+# Firebase console log shipping
+FIRESTORE_BATCH_LIMIT = 500  # Maximum operations in one Firestore batch
+LOG_SHIP_FLUSH_SIZE = 100  # Pending logs that trigger a flush before the interval
+LOG_SHIP_FLUSH_SECONDS = 5.0
+LOG_SHIP_QUEUE_LIMIT = 10000  # Oldest pending logs are dropped beyond this
+LOG_CLEANUP_SLACK = 100  # Logs allowed over the per-user maximum before trimming
+
+# Firebase user and permission cache
+USER_CACHE_FILE = "user_cache.json"
+USER_CACHE_TTL = 600  # Seconds before a cached user document is read again
+ACTIVITY_PAGE_SIZE = 100  # Activity Log documents loaded per page
+
+# Offline-first Firebase writes
+OUTBOX_DB_PATH = "firebase_outbox.db"  # Writes waiting to reach Firestore
+OUTBOX_BATCH_SIZE = 100  # Writes replayed per batch
+OUTBOX_FLUSH_SECONDS = 2.0  # How often due writes are retried when idle
+OUTBOX_RETRY_BASE_SECONDS = 2.0  # First retry delay, doubled on each failure
+OUTBOX_RETRY_MAX_SECONDS = 300.0
+OUTBOX_MAX_ATTEMPTS = 20  # Writes are kept but no longer retried after this
+
 # Performance difference threshold
 PERF_DIFF_THRESHOLD = 0.75
 
@@ -61,6 +105,13 @@ THEMES = {
     }
 }
 
+# Settings persistence
+SETTINGS_SAVE_DELAY = 0.5  # Seconds without changes before settings.json is written
+SETTINGS_SAVE_MAX_DELAY = 5.0  # Longest a continuous burst of changes can postpone the write
+
+# Accuracy over time
+ACCURACY_CHART_BUCKET = "week"  # Bucket of the Stats tab accuracy chart: "day", "week" or "month"
+
 # Default settings
 DEFAULT_SETTINGS = {
     "appearance_mode": "System",
@@ -74,6 +125,7 @@ DEFAULT_SETTINGS = {
     "prediction_threshold_level2": PREDICTION_THRESHOLD_LEVEL2,
     "font_size": 30,  # Default font size for tables and detail windows
     "language": "sk",  # Default language (Slovak)
+    "profiling": False,  # Write cProfile output for long operations
     
     # Firebase settings
     "firebase_config": {
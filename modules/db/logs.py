@@ -0,0 +1,297 @@
+"""
+Persistent log store for the Logs tab.
+
+Records from the in-memory log buffer are appended to a separate SQLite
+database in batches by a background thread. Messages are indexed with FTS5
+(when the SQLite build has it), and level, source and time filters use
+ordinary indexes, so the Logs tab can page through millions of records
+without loading them into widgets.
+"""
+
+import atexit
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Any, Optional
+
+from modules.config import LOG_DB_PATH, LOG_STORE_MAX_ROWS, LOG_STORE_FLUSH_SECONDS, LOG_STORE_LEVEL
+
+logger = logging.getLogger(__name__)
+
+
+class LogStore:
+    """Append-only SQLite store for log records."""
+
+    def __init__(self, db_path: str = LOG_DB_PATH, max_rows: int = LOG_STORE_MAX_ROWS):
+        """Initialize the log store and create its tables"""
+        self.db_path = db_path
+        self.max_rows = max_rows
+        # Lowest level stored; the buffer may hold lower ones for the Logs tab
+        self.min_level = getattr(logging, LOG_STORE_LEVEL)
+        self.has_fts = False
+        self._capture_thread = None
+        self._stop_event = threading.Event()
+        self._initialize_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; WAL lets searches run while the writer appends"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _initialize_db(self):
+        """Create the log table, its indexes and the full-text index"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS logs (
+                    id INTEGER PRIMARY KEY,
+                    created REAL NOT NULL,
+                    level INTEGER NOT NULL,
+                    level_name TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    message TEXT NOT NULL
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_created ON logs (created)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_level ON logs (level, id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_source ON logs (source, id)')
+
+            # Full-text index over messages, kept in sync by triggers
+            try:
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts
+                    USING fts5(message, content='logs', content_rowid='id')
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS logs_fts_insert AFTER INSERT ON logs BEGIN
+                        INSERT INTO logs_fts (rowid, message) VALUES (new.id, new.message);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS logs_fts_delete AFTER DELETE ON logs BEGIN
+                        INSERT INTO logs_fts (logs_fts, rowid, message) VALUES ('delete', old.id, old.message);
+                    END
+                ''')
+                self.has_fts = True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 not available, message search will be slower: {str(e)}")
+
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error initializing log store: {str(e)}")
+
+    def append(self, entries: List[tuple]) -> int:
+        """
+        Append log buffer entries in one transaction.
+
+        Args:
+            entries: (sequence, created, levelno, levelname, source, message) tuples
+
+        Returns:
+            int: Number of records stored
+        """
+        if not entries:
+            return 0
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    'INSERT INTO logs (created, level, level_name, source, message) VALUES (?, ?, ?, ?, ?)',
+                    [entry[1:] for entry in entries]
+                )
+                self._prune(conn)
+            conn.close()
+            return len(entries)
+        except Exception as e:
+            logger.error(f"Error appending to log store: {str(e)}")
+            return 0
+
+    def _prune(self, conn: sqlite3.Connection):
+        """Delete the oldest records beyond max_rows"""
+        # Ids are only ever appended, so the id range bounds the row count
+        oldest, newest = conn.execute('SELECT MIN(id), MAX(id) FROM logs').fetchone()
+        if oldest is None or newest - oldest + 1 <= self.max_rows:
+            return
+        # Trim an extra tenth so pruning does not run on every batch
+        cutoff = newest - self.max_rows + self.max_rows // 10
+        conn.execute('DELETE FROM logs WHERE id <= ?', (cutoff,))
+
+    def search(self, min_level: int = logging.NOTSET, source: Optional[str] = None,
+               start: Optional[float] = None, end: Optional[float] = None, text: Optional[str] = None,
+               before_id: Optional[int] = None, after_id: Optional[int] = None,
+               limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Find log records, newest first.
+
+        Args:
+            min_level: Lowest level to include (e.g. logging.WARNING)
+            source: Logger name prefix
+            start: Earliest creation time (epoch seconds)
+            end: Latest creation time (epoch seconds)
+            text: Words that must all appear in the message
+            before_id: Only records older than this id, for the next page
+            after_id: Only records newer than this id, for the previous page
+            limit: Maximum number of records
+
+        Returns:
+            list: Records as dicts with id, created, level, level_name, source and message
+        """
+        try:
+            where, params = self._build_filters(min_level, source, start, end, text)
+            if before_id is not None:
+                where.append('logs.id < ?')
+                params.append(before_id)
+            if after_id is not None:
+                where.append('logs.id > ?')
+                params.append(after_id)
+
+            # Walking up from after_id needs ascending order; results are flipped below
+            order = 'ASC' if after_id is not None and before_id is None else 'DESC'
+            sql = f'''
+                SELECT logs.id, logs.created, logs.level, logs.level_name, logs.source, logs.message
+                FROM logs {self._fts_join(text)}
+                {('WHERE ' + ' AND '.join(where)) if where else ''}
+                ORDER BY logs.id {order}
+                LIMIT ?
+            '''
+            conn = self._connect()
+            conn.row_factory = sqlite3.Row
+            rows = [dict(row) for row in conn.execute(sql, params + [limit])]
+            conn.close()
+            return rows[::-1] if order == 'ASC' else rows
+        except Exception as e:
+            logger.error(f"Error searching log store: {str(e)}")
+            return []
+
+    def count(self, min_level: int = logging.NOTSET, source: Optional[str] = None,
+              start: Optional[float] = None, end: Optional[float] = None, text: Optional[str] = None) -> int:
+        """Count records matching the same filters as search()"""
+        try:
+            where, params = self._build_filters(min_level, source, start, end, text)
+            sql = f'''
+                SELECT COUNT(*) FROM logs {self._fts_join(text)}
+                {('WHERE ' + ' AND '.join(where)) if where else ''}
+            '''
+            conn = self._connect()
+            total = conn.execute(sql, params).fetchone()[0]
+            conn.close()
+            return total
+        except Exception as e:
+            logger.error(f"Error counting log records: {str(e)}")
+            return 0
+
+    def get_sources(self) -> List[str]:
+        """Get the distinct logger names in the store"""
+        try:
+            conn = self._connect()
+            sources = [row[0] for row in conn.execute('SELECT DISTINCT source FROM logs ORDER BY source')]
+            conn.close()
+            return sources
+        except Exception as e:
+            logger.error(f"Error getting log sources: {str(e)}")
+            return []
+
+    def clear(self) -> bool:
+        """Delete all stored records"""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute('DELETE FROM logs')
+                if self.has_fts:
+                    conn.execute("INSERT INTO logs_fts (logs_fts) VALUES ('rebuild')")
+            conn.close()
+            return True
+        except Exception as e:
+            logger.error(f"Error clearing log store: {str(e)}")
+            return False
+
+    def _fts_join(self, text: Optional[str]) -> str:
+        """Join clause for full-text search"""
+        if text and self.has_fts:
+            return 'JOIN logs_fts ON logs_fts.rowid = logs.id'
+        return ''
+
+    def _build_filters(self, min_level, source, start, end, text):
+        """Build WHERE conditions and parameters shared by search and count"""
+        where, params = [], []
+        if min_level and min_level > logging.NOTSET:
+            where.append('logs.level >= ?')
+            params.append(min_level)
+        if source:
+            where.append('logs.source LIKE ? ESCAPE \'\\\'')
+            params.append(_escape_like(source) + '%')
+        if start is not None:
+            where.append('logs.created >= ?')
+            params.append(start)
+        if end is not None:
+            where.append('logs.created <= ?')
+            params.append(end)
+        if text:
+            if self.has_fts:
+                where.append('logs_fts MATCH ?')
+                params.append(_fts_query(text))
+            else:
+                for word in text.split():
+                    where.append('logs.message LIKE ? ESCAPE \'\\\'')
+                    params.append('%' + _escape_like(word) + '%')
+        return where, params
+
+    def start_capture(self, log_buffer, interval: float = LOG_STORE_FLUSH_SECONDS):
+        """Append new log buffer records to the store from a background thread"""
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_logs, args=(log_buffer, interval), name="log-store-writer", daemon=True
+        )
+        self._capture_thread.start()
+        atexit.register(self.stop_capture)
+
+    def stop_capture(self, timeout: float = 2.0):
+        """Stop the background writer after a final flush"""
+        self._stop_event.set()
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout)
+
+    def _capture_logs(self, log_buffer, interval: float):
+        """Writer loop: move new buffer records into the store in batches"""
+        sequence = 0
+        while True:
+            stopping = self._stop_event.wait(interval)
+            previous = sequence
+            entries, sequence = log_buffer.read_since(sequence)
+            self.append([entry for entry in entries if entry[2] >= self.min_level])
+            # The buffer drops its oldest records when it wraps between flushes
+            missed = sequence - previous - len(entries)
+            if missed > 0:
+                logger.warning(f"Log store missed {missed} records because the log buffer wrapped between flushes")
+            if stopping:
+                break
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _fts_query(text: str) -> str:
+    """Turn user input into an FTS5 query where every word must match as a prefix"""
+    words = [word.replace('"', '""') for word in text.split()]
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_log_store() -> LogStore:
+    """Get the shared log store, creating it the first time"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LogStore()
+        return _store
@@ -9,9 +9,11 @@ from modules.db.schema import initialize_database
 from modules.db.predictions import PredictionsManager
 from modules.db.fixtures import FixturesManager
 from modules.db.teams import TeamsManager
+from modules.instrumentation import instrument_methods
 
 logger = logging.getLogger(__name__)
 
+@instrument_methods("db")
 class DatabaseManager:
     """Main database manager class that integrates all database operations."""
     
@@ -35,6 +37,10 @@ class DatabaseManager:
         """Save a prediction to the database"""
         return self.predictions.save_prediction(prediction_data)
     
+    def save_predictions(self, predictions: List[Dict[str, Any]]) -> int:
+        """Save many predictions in one transaction"""
+        return self.predictions.save_predictions(predictions)
+    
     def update_prediction_result(self, prediction_id: int, result: str, correct: int) -> bool:
         """Update a prediction with its result"""
         return self.predictions.update_prediction_result(prediction_id, result, correct)
@@ -59,6 +65,16 @@ class DatabaseManager:
         """Get prediction statistics"""
         return self.predictions.get_prediction_stats()
     
+    def get_accuracy_over_time(self, bucket_type: str = "week", league_id: Optional[int] = None,
+                               prediction_level: Optional[int] = None, start: Optional[str] = None,
+                               end: Optional[str] = None, by_level: bool = False) -> List[Dict[str, Any]]:
+        """Get prediction accuracy per day, week or month"""
+        return self.predictions.get_accuracy_over_time(bucket_type, league_id, prediction_level, start, end, by_level)
+    
+    def rebuild_accuracy_aggregates(self) -> bool:
+        """Recompute the accuracy-over-time aggregates from all predictions"""
+        return self.predictions.rebuild_accuracy_aggregates()
+    
     def export_predictions_to_csv(self, filepath: str) -> bool:
         """Export predictions to CSV file"""
         return self.predictions.export_predictions_to_csv(filepath)
@@ -8,6 +8,8 @@ import csv
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from modules.db.schema import ACCURACY_BUCKETS, rebuild_accuracy_aggregates
+
 logger = logging.getLogger(__name__)
 
 class PredictionsManager:
@@ -69,6 +71,67 @@ class PredictionsManager:
             logger.error(f"Error saving prediction: {str(e)}")
             return 0
     
+    def save_predictions(self, predictions: List[Dict[str, Any]]) -> int:
+        """
+        Save many predictions in one transaction, skipping existing ones
+        
+        Args:
+            predictions: Prediction dictionaries in the save_prediction format
+            
+        Returns:
+            int: Number of new predictions saved
+        """
+        if not predictions:
+            return 0
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            # Load existing (fixture, team) pairs once instead of querying per prediction
+            cursor.execute("SELECT fixture_id, team_id FROM predictions")
+            existing = set(cursor.fetchall())
+            
+            created_at = datetime.now().isoformat()
+            rows = []
+            for prediction_data in predictions:
+                key = (prediction_data['fixture_id'], prediction_data['team_id'])
+                if key in existing:
+                    continue
+                existing.add(key)
+                rows.append((
+                    prediction_data['team_id'],
+                    prediction_data['team_name'],
+                    prediction_data['league_id'],
+                    prediction_data['league_name'],
+                    prediction_data['fixture_id'],
+                    prediction_data['opponent_id'],
+                    prediction_data['opponent_name'],
+                    prediction_data['match_date'],
+                    prediction_data.get('venue', ''),
+                    prediction_data['performance_diff'],
+                    prediction_data['prediction'],
+                    prediction_data['prediction_level'],
+                    created_at
+                ))
+            
+            cursor.executemany('''
+                INSERT INTO predictions (
+                    team_id, team_name, league_id, league_name, fixture_id,
+                    opponent_id, opponent_name, match_date, venue,
+                    performance_diff, prediction, prediction_level, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            
+            conn.commit()
+            conn.close()
+            
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"Error saving predictions: {str(e)}")
+            return 0
+    
     def update_prediction_result(self, prediction_id: int, result: str, correct: int) -> bool:
         """Update a prediction with its result"""
         try:
@@ -253,6 +316,95 @@ class PredictionsManager:
                 }
             }
     
+    def get_accuracy_over_time(self, bucket_type: str = "week", league_id: Optional[int] = None,
+                               prediction_level: Optional[int] = None, start: Optional[str] = None,
+                               end: Optional[str] = None, by_level: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get prediction accuracy per time bucket from the precomputed aggregates
+        
+        Args:
+            bucket_type: "day", "week" (starting Monday) or "month"
+            league_id: Only count predictions of this league
+            prediction_level: Only count predictions of this level
+            start: First bucket to include (YYYY-MM-DD)
+            end: Last bucket to include (YYYY-MM-DD)
+            by_level: Return one series per prediction level instead of one combined series
+            
+        Returns:
+            List[Dict[str, Any]]: Buckets in date order with completed, correct and accuracy (percent)
+        """
+        if bucket_type not in ACCURACY_BUCKETS:
+            logger.error(f"Unknown accuracy bucket type: {bucket_type}")
+            return []
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            # Build filters
+            conditions = ["bucket_type = ?"]
+            params: List[Any] = [bucket_type]
+            if league_id is not None:
+                conditions.append("league_id = ?")
+                params.append(league_id)
+            if prediction_level is not None:
+                conditions.append("prediction_level = ?")
+                params.append(prediction_level)
+            if start:
+                conditions.append("bucket >= ?")
+                params.append(start)
+            if end:
+                conditions.append("bucket <= ?")
+                params.append(end)
+            
+            group = "bucket, prediction_level" if by_level else "bucket"
+            cursor.execute(f'''
+                SELECT {group}, SUM(completed), SUM(correct)
+                FROM prediction_accuracy
+                WHERE {" AND ".join(conditions)}
+                GROUP BY {group}
+                HAVING SUM(completed) > 0
+                ORDER BY {group}
+            ''', params)
+            rows = cursor.fetchall()
+            
+            conn.close()
+            
+            series = []
+            for row in rows:
+                completed, correct = row[-2], row[-1]
+                point = {
+                    "bucket": row[0],
+                    "completed": completed,
+                    "correct": correct,
+                    "accuracy": correct / completed * 100
+                }
+                if by_level:
+                    point["prediction_level"] = row[1]
+                series.append(point)
+            return series
+            
+        except Exception as e:
+            logger.error(f"Error getting accuracy over time: {str(e)}")
+            return []
+    
+    def rebuild_accuracy_aggregates(self) -> bool:
+        """Recompute the accuracy-over-time aggregates from all predictions"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            rebuild_accuracy_aggregates(cursor)
+            
+            conn.commit()
+            conn.close()
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error rebuilding accuracy aggregates: {str(e)}")
+            return False
+    
     def export_predictions_to_csv(self, filepath: str) -> bool:
         """Export predictions to CSV file"""
         try:
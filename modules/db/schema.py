@@ -7,6 +7,94 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Accuracy aggregate buckets: bucket type -> start date of the bucket for a match_date column.
+# match_date may carry a time, so only its date part is used.
+ACCURACY_BUCKETS = {
+    "day": "date(substr({row}.match_date, 1, 10))",
+    "week": "date(substr({row}.match_date, 1, 10), 'weekday 0', '-6 days')",  # Monday
+    "month": "date(substr({row}.match_date, 1, 10), 'start of month')"
+}
+
+def _accuracy_upsert(row: str, sign: int) -> str:
+    """SQL adding (sign=1) or removing (sign=-1) a graded prediction row to every bucket"""
+    # Rows without a parseable match date are left out rather than failing the write
+    selects = " UNION ALL ".join(
+        f"SELECT '{bucket_type}', {expression.format(row=row)}, {row}.prediction_level, {row}.league_id, "
+        f"{sign}, {sign} * ({row}.correct = 1) "
+        f"WHERE {row}.correct IS NOT NULL AND {expression.format(row=row)} IS NOT NULL"
+        for bucket_type, expression in ACCURACY_BUCKETS.items()
+    )
+    return f'''
+        INSERT INTO prediction_accuracy (bucket_type, bucket, prediction_level, league_id, completed, correct)
+        {selects}
+        ON CONFLICT (bucket_type, bucket, prediction_level, league_id) DO UPDATE SET
+            completed = completed + excluded.completed,
+            correct = correct + excluded.correct;
+    '''
+
+def _create_accuracy_aggregates(cursor):
+    """
+    Create the time-bucketed accuracy aggregates of graded predictions.
+    
+    Counts per day, week and month x prediction level x league are kept up to
+    date by triggers whenever a prediction is graded, regraded or deleted, so
+    accuracy over time never has to scan the predictions table.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'prediction_accuracy'")
+    exists = cursor.fetchone() is not None
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS prediction_accuracy (
+            bucket_type TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            prediction_level INTEGER NOT NULL,
+            league_id INTEGER NOT NULL,
+            completed INTEGER NOT NULL,
+            correct INTEGER NOT NULL,
+            PRIMARY KEY (bucket_type, bucket, prediction_level, league_id)
+        ) WITHOUT ROWID
+    ''')
+    
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS prediction_accuracy_insert AFTER INSERT ON predictions
+        WHEN new.correct IS NOT NULL
+        BEGIN
+            {_accuracy_upsert("new", 1)}
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS prediction_accuracy_update
+        AFTER UPDATE OF correct, match_date, prediction_level, league_id ON predictions
+        BEGIN
+            {_accuracy_upsert("old", -1)}
+            {_accuracy_upsert("new", 1)}
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS prediction_accuracy_delete AFTER DELETE ON predictions
+        WHEN old.correct IS NOT NULL
+        BEGIN
+            {_accuracy_upsert("old", -1)}
+        END
+    ''')
+    
+    # Fill the aggregates from predictions graded before the table existed
+    if not exists:
+        rebuild_accuracy_aggregates(cursor)
+
+def rebuild_accuracy_aggregates(cursor):
+    """Recompute all accuracy aggregates from the predictions table"""
+    cursor.execute("DELETE FROM prediction_accuracy")
+    for bucket_type, expression in ACCURACY_BUCKETS.items():
+        cursor.execute(f'''
+            INSERT INTO prediction_accuracy (bucket_type, bucket, prediction_level, league_id, completed, correct)
+            SELECT '{bucket_type}', {expression.format(row="p")} AS bucket, p.prediction_level, p.league_id,
+                   COUNT(*), SUM(p.correct = 1)
+            FROM predictions p
+            WHERE p.correct IS NOT NULL AND bucket IS NOT NULL
+            GROUP BY bucket, p.prediction_level, p.league_id
+        ''')
+
 def initialize_database(db_path: str) -> bool:
     """Initialize the database with required tables"""
     try:
@@ -115,6 +203,9 @@ def initialize_database(db_path: str) -> bool:
             )
         ''')
         
+        # Create accuracy-over-time aggregates
+        _create_accuracy_aggregates(cursor)
+        
         conn.commit()
         conn.close()
         
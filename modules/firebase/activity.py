@@ -6,17 +6,20 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from modules.firebase.outbox import FirebaseOutbox, get_outbox
+
 logger = logging.getLogger(__name__)
 
 class FirebaseActivityLogger:
     """Activity logging for Firebase authentication."""
     
-    def __init__(self, db):
+    def __init__(self, db, outbox: Optional[FirebaseOutbox] = None):
         """Initialize the activity logger with required dependencies."""
         self.db = db
+        self.outbox = outbox or get_outbox(db)
     
     def log_activity(self, user_id, activity_type, details=None):
-        """Log user activity"""
+        """Queue a user activity in the outbox; it reaches Firestore in the background"""
         if not self.db:
             return False
             
@@ -28,8 +31,7 @@ class FirebaseActivityLogger:
                 "details": details or {}
             }
             
-            self.db.collection('activity_logs').add(log_data)
-            return True
+            return self.outbox.add('activity_logs', log_data) is not None
             
         except Exception as e:
             logger.error(f"Log activity error: {str(e)}")
@@ -79,6 +81,66 @@ class FirebaseActivityLogger:
             logger.error(f"Get all activity error: {str(e)}")
             return False, []
     
+    def get_activity_page(self, limit=100, start_after=None):
+        """
+        Get one page of activity logs, newest first
+        
+        Args:
+            limit: Page size
+            start_after: Cursor returned with the previous page, None for the first page
+            
+        Returns:
+            tuple: (success, activity logs, cursor for the next page or None at the end)
+        """
+        if not self.db:
+            return False, [], None
+            
+        try:
+            query = self.db.collection('activity_logs').order_by('timestamp', direction='DESCENDING')
+            if start_after is not None:
+                query = query.start_after(start_after)
+            docs = list(query.limit(limit).stream())
+            
+            activity_logs = []
+            for doc in docs:
+                log_data = doc.to_dict()
+                log_data['id'] = doc.id
+                activity_logs.append(log_data)
+            
+            # A short page means there is nothing older
+            cursor = docs[-1] if len(docs) == limit else None
+            return True, activity_logs, cursor
+            
+        except Exception as e:
+            logger.error(f"Get activity page error: {str(e)}")
+            return False, [], None
+    
+    def get_activity_since(self, timestamp, batch_size=500):
+        """Get all activity logs newer than a timestamp, newest first"""
+        if not self.db:
+            return False, []
+            
+        try:
+            query = self.db.collection('activity_logs').where('timestamp', '>', timestamp).order_by(
+                'timestamp', direction='DESCENDING'
+            )
+            activity_logs = []
+            cursor = None
+            while True:
+                page = query.start_after(cursor) if cursor is not None else query
+                docs = list(page.limit(batch_size).stream())
+                for doc in docs:
+                    log_data = doc.to_dict()
+                    log_data['id'] = doc.id
+                    activity_logs.append(log_data)
+                if len(docs) < batch_size:
+                    return True, activity_logs
+                cursor = docs[-1]
+            
+        except Exception as e:
+            logger.error(f"Get activity since error: {str(e)}")
+            return False, []
+    
     def get_activity_by_type(self, activity_type, limit=100):
         """Get activity logs by type"""
         if not self.db:
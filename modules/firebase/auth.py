@@ -10,18 +10,23 @@ import os
 from typing import Dict, List, Tuple, Any, Optional
 import requests
 
-# Firebase Admin SDK imports
-import firebase_admin
-from firebase_admin import credentials, firestore
+# Firebase Admin SDK is imported when Firebase is first initialized
+from modules.lazy_imports import lazy_import
 
 # Import component managers
 from modules.firebase.users import FirebaseUserManager
 from modules.firebase.permissions import FirebasePermissionsManager
 from modules.firebase.activity import FirebaseActivityLogger
 from modules.firebase.console_logs import FirebaseConsoleLogger
+from modules.firebase.user_cache import FirebaseUserCache
+from modules.firebase.outbox import get_outbox
 
 logger = logging.getLogger(__name__)
 
+firebase_admin = lazy_import("firebase_admin")
+credentials = lazy_import("firebase_admin.credentials")
+firestore = lazy_import("firebase_admin.firestore")
+
 class FirebaseAuth:
     """Firebase Authentication and Firestore Database Manager"""
     
@@ -46,6 +51,8 @@ class FirebaseAuth:
         self.permissions = None
         self.activity = None
         self.console_logs = None
+        self.user_cache = None
+        self.outbox = None
         
     def initialize(self, api_key=None, project_id=None):
         """Initialize Firebase with API key, project ID, and service account"""
@@ -187,10 +194,32 @@ class FirebaseAuth:
     
     def _initialize_component_managers(self):
         """Initialize component managers"""
-        self.users = FirebaseUserManager(self.db, self.api_key, self.FIREBASE_AUTH_URL)
-        self.permissions = FirebasePermissionsManager(self.db)
-        self.activity = FirebaseActivityLogger(self.db)
+        self.user_cache = FirebaseUserCache(self.db)
+        self.outbox = get_outbox(self.db)
+        self.users = FirebaseUserManager(self.db, self.api_key, self.FIREBASE_AUTH_URL, self.user_cache, self.outbox)
+        self.permissions = FirebasePermissionsManager(self.db, self.user_cache, self.outbox)
+        self.activity = FirebaseActivityLogger(self.db, self.outbox)
         self.console_logs = FirebaseConsoleLogger(self.db)
+        self.outbox.add_give_up_listener(self._on_write_given_up)
+    
+    def _on_write_given_up(self, entry, error):
+        """Forget the cached copy of a user document whose queued write never reached Firestore"""
+        if entry["collection"] == "users" and self.user_cache:
+            self.user_cache.invalidate(entry["document"])
+    
+    def add_write_failure_listener(self, callback) -> bool:
+        """
+        Register callback(entry, error) for queued writes that were given up on.
+        
+        The callback runs on the outbox writer thread.
+        
+        Returns:
+            bool: False if Firebase is not initialized
+        """
+        if not self.initialized or not self.outbox:
+            return False
+        self.outbox.add_give_up_listener(callback)
+        return True
             
     def initialize_async(self):
         """Initialize Firebase in a background thread"""
@@ -270,15 +299,21 @@ class FirebaseAuth:
                 self.refresh_token = data.get('refreshToken')
                 self.current_user = data
                 
-                # Update last login timestamp
+                # Load the profile needed for tab assembly while logging the login and
+                # creating a test log entry (so the console_logs collection exists)
                 user_id = data.get('localId')
-                self.users.update_last_login(user_id, email)
-                
-                # Log activity
-                self.activity.log_activity(user_id, "login", {"email": email})
+                profile = self.user_cache.prefetch(user_id, tasks=[
+                    lambda: self.activity.log_activity(user_id, "login", {"email": email}),
+                    lambda: self.console_logs.create_test_log(user_id)
+                ])
                 
-                # Create a test log entry to ensure the console_logs collection exists
-                self.console_logs.create_test_log(user_id)
+                # Update last login timestamp; only a missing profile has to be created first
+                if profile is None:
+                    self.users.update_last_login(user_id, email)
+                else:
+                    threading.Thread(
+                        target=self.users.update_last_login, args=(user_id, email), daemon=True
+                    ).start()
                 
                 return True, "Login successful"
             else:
@@ -301,6 +336,10 @@ class FirebaseAuth:
         if self.current_user:
             user_id = self.current_user.get('localId')
             self.activity.log_activity(user_id, "logout")
+        
+        # Drop cached profiles and permissions so the next account starts clean
+        if self.user_cache:
+            self.user_cache.invalidate()
             
         self.id_token = None
         self.refresh_token = None
@@ -384,11 +423,11 @@ class FirebaseAuth:
             return False
     
     # User management methods - delegated to UserManager
-    def get_all_users(self) -> Tuple[bool, List[Dict]]:
+    def get_all_users(self, force_refresh=False) -> Tuple[bool, List[Dict]]:
         """Get all users from Firestore"""
         if not self.initialized:
             return False, "Not authenticated"
-        return self.users.get_all_users()
+        return self.users.get_all_users(force_refresh)
     
     def update_user_license(self, user_id, grant=True) -> Tuple[bool, str]:
         """Grant or revoke a user's license"""
@@ -434,6 +473,18 @@ class FirebaseAuth:
             return False
         return self.activity.log_activity(user_id, activity_type, details)
     
+    def get_activity_page(self, limit=100, start_after=None):
+        """Get one page of activity logs and the cursor for the next page"""
+        if not self.initialized:
+            return False, [], None
+        return self.activity.get_activity_page(limit, start_after)
+    
+    def get_activity_since(self, timestamp):
+        """Get activity logs newer than a timestamp"""
+        if not self.initialized:
+            return False, []
+        return self.activity.get_activity_since(timestamp)
+    
     # Console logging methods - delegated to ConsoleLogger
     def log_console_message(self, user_id, level, source, message):
         """Log a console message"""
@@ -3,11 +3,17 @@ Console logs functionality for Firebase.
 This module handles storing and retrieving console logs from Firebase.
 """
 
+import atexit
 import logging
-import time
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
+from modules.config import (
+    FIRESTORE_BATCH_LIMIT, LOG_SHIP_FLUSH_SIZE, LOG_SHIP_FLUSH_SECONDS, LOG_SHIP_QUEUE_LIMIT, LOG_CLEANUP_SLACK
+)
+
 logger = logging.getLogger(__name__)
 
 class FirebaseConsoleLogger:
@@ -16,19 +22,33 @@ class FirebaseConsoleLogger:
     def __init__(self, db):
         """Initialize the console logger with required dependencies."""
         self.db = db
-        self.log_buffer = []
-        self.buffer_size = 5  # Reduced buffer size to write to Firebase more frequently
+        self.log_buffer = deque(maxlen=LOG_SHIP_QUEUE_LIMIT)
+        self.buffer_size = LOG_SHIP_FLUSH_SIZE  # Pending logs that trigger an early flush
+        self.flush_interval = LOG_SHIP_FLUSH_SECONDS
         self.max_logs_per_user = 1000  # Maximum number of logs to store per user
+        
+        # Logs stored per user, counted once and then tracked locally
+        self.log_counts: Dict[str, int] = {}
+        
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._shipper = None
+        self._running = False
+        
+        # Ship what is still queued when the app exits
+        atexit.register(self.stop, 2.0)
         logger.info("FirebaseConsoleLogger initialized")
     
     def log_console_message(self, user_id: str, level: str, source: str, message: str) -> bool:
-        """Log a console message to Firebase"""
+        """Queue a console message for the background shipper; never blocks on Firebase"""
         if not self.db or not user_id:
-            logger.warning(f"Cannot log message: db={bool(self.db)}, user_id={bool(user_id)}")
             return False
+        
+        # The shipper's own logs would otherwise be shipped in an endless loop
+        if source == __name__:
+            return True
             
         try:
-            # Create log entry
             log_data = {
                 "user_id": user_id,
                 "timestamp": datetime.now().isoformat(),
@@ -37,100 +57,140 @@ class FirebaseConsoleLogger:
                 "message": message
             }
             
-            # Add to buffer
-            self.log_buffer.append(log_data)
-            logger.debug(f"Added log to buffer. Buffer size: {len(self.log_buffer)}/{self.buffer_size}")
-            
-            # If buffer is full, write to Firebase
-            if len(self.log_buffer) >= self.buffer_size:
-                logger.info(f"Buffer full ({len(self.log_buffer)} logs). Flushing to Firebase.")
-                return self._flush_buffer()
-                
+            with self._condition:
+                self.log_buffer.append(log_data)
+                self._start_shipper()
+                if len(self.log_buffer) >= self.buffer_size:
+                    self._condition.notify()
             return True
             
         except Exception as e:
             logger.error(f"Error logging console message: {str(e)}")
             return False
     
+    def _start_shipper(self):
+        """Start the background shipper thread; the caller holds the condition"""
+        if self._shipper is None or not self._shipper.is_alive():
+            self._running = True
+            self._shipper = threading.Thread(target=self._ship_logs, name="console-log-shipper", daemon=True)
+            self._shipper.start()
+    
+    def _ship_logs(self):
+        """Flush queued logs when the buffer fills or the flush interval passes"""
+        flushed = True
+        while True:
+            with self._condition:
+                # After a failed write, wait before retrying even if the buffer is full
+                if self._running and (not flushed or len(self.log_buffer) < self.buffer_size):
+                    self._condition.wait(self.flush_interval)
+                running = self._running
+            
+            flushed = self._flush_buffer()
+            if not running:
+                break
+    
+    def stop(self, timeout: float = 5.0):
+        """Flush pending logs and stop the shipper"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+            shipper = self._shipper
+        if shipper is not None and shipper.is_alive():
+            shipper.join(timeout)
+        else:
+            self._flush_buffer()
+    
     def _flush_buffer(self) -> bool:
-        """Flush the log buffer to Firebase"""
-        if not self.db or not self.log_buffer:
-            logger.warning(f"Cannot flush buffer: db={bool(self.db)}, buffer={len(self.log_buffer)}")
+        """Write queued logs to Firebase with batched writes"""
+        if not self.db:
             return False
-            
-        try:
-            # Group logs by user_id
-            logs_by_user = {}
-            for log in self.log_buffer:
-                user_id = log["user_id"]
-                if user_id not in logs_by_user:
-                    logs_by_user[user_id] = []
-                logs_by_user[user_id].append(log)
-            
-            # Write logs for each user
-            for user_id, logs in logs_by_user.items():
-                logger.info(f"Flushing {len(logs)} logs to Firebase for user {user_id}")
+        
+        with self._flush_lock:
+            while True:
+                # Take up to one batch worth of logs
+                with self._condition:
+                    logs = [self.log_buffer.popleft() for _ in range(min(len(self.log_buffer), FIRESTORE_BATCH_LIMIT))]
+                if not logs:
+                    return True
                 
                 try:
-                    # Write each log individually to ensure collection is created
+                    batch = self.db.batch()
+                    collection = self.db.collection('console_logs')
                     for log in logs:
-                        # Create a new document reference
-                        log_ref = self.db.collection('console_logs').document()
-                        log_ref.set(log)
-                        logger.debug(f"Wrote log to Firebase: {log['message'][:30]}...")
-                    
-                    # Clean up old logs if needed
-                    self._cleanup_old_logs(user_id)
-                    
-                    logger.info(f"Successfully flushed {len(logs)} logs to Firebase")
+                        batch.set(collection.document(), log)
+                    batch.commit()
                 except Exception as e:
+                    # Put the logs back in order and retry on the next flush
+                    with self._condition:
+                        self.log_buffer.extendleft(reversed(logs))
                     logger.error(f"Error writing logs to Firebase: {str(e)}")
-            
-            # Clear the buffer
-            self.log_buffer = []
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error flushing log buffer: {str(e)}")
-            return False
+                    return False
+                
+                # Track stored logs per user and trim only when over the limit
+                written_by_user: Dict[str, int] = {}
+                for log in logs:
+                    written_by_user[log["user_id"]] = written_by_user.get(log["user_id"], 0) + 1
+                for user_id, written in written_by_user.items():
+                    try:
+                        if user_id in self.log_counts:
+                            self.log_counts[user_id] += written
+                        else:
+                            self.log_counts[user_id] = self._count_logs(user_id)
+                        if self.log_counts[user_id] > self.max_logs_per_user + LOG_CLEANUP_SLACK:
+                            self._cleanup_old_logs(user_id)
+                    except Exception as e:
+                        logger.error(f"Error counting logs for user {user_id}: {str(e)}")
+    
+    def _count_logs(self, user_id: str) -> int:
+        """Count stored logs for a user with an aggregation query"""
+        query = self.db.collection('console_logs').where('user_id', '==', user_id)
+        try:
+            return int(query.count().get()[0][0].value)
+        except AttributeError:
+            # Older clients have no count(); fall back to streaming document ids only
+            return sum(1 for _ in query.select([]).stream())
     
     def _cleanup_old_logs(self, user_id: str) -> bool:
-        """Clean up old logs for a user if they exceed the maximum"""
+        """Delete a user's oldest logs down to the maximum"""
         if not self.db or not user_id:
             return False
             
         try:
-            # Count logs for this user
-            logs_ref = self.db.collection('console_logs').where('user_id', '==', user_id)
-            logs = logs_ref.order_by('timestamp').limit(self.max_logs_per_user + 1).stream()
-            
-            # Convert to list to get count
-            logs_list = list(logs)
-            
-            # If we have more logs than the maximum, delete the oldest ones
-            if len(logs_list) > self.max_logs_per_user:
-                # Calculate how many logs to delete
-                logs_to_delete = len(logs_list) - self.max_logs_per_user
-                logger.info(f"Cleaning up {logs_to_delete} old logs for user {user_id}")
-                
-                # Get the oldest logs
-                oldest_logs = self.db.collection('console_logs').where('user_id', '==', user_id).order_by('timestamp').limit(logs_to_delete).stream()
-                
-                # Delete each log
-                batch = self.db.batch()
-                for log in oldest_logs:
-                    batch.delete(log.reference)
-                
-                # Commit the batch
-                batch.commit()
+            logs_to_delete = self.log_counts.get(user_id, 0) - self.max_logs_per_user
+            if logs_to_delete <= 0:
+                return True
+            logger.info(f"Cleaning up {logs_to_delete} old logs for user {user_id}")
             
+            oldest_logs = (self.db.collection('console_logs').where('user_id', '==', user_id)
+                           .order_by('timestamp').limit(logs_to_delete).stream())
+            deleted = self._delete_documents(oldest_logs)
+            self.log_counts[user_id] -= deleted
             return True
             
         except Exception as e:
+            # Recount on the next flush
+            self.log_counts.pop(user_id, None)
             logger.error(f"Error cleaning up old logs: {str(e)}")
             return False
     
+    def _delete_documents(self, documents) -> int:
+        """Delete documents in batches of at most FIRESTORE_BATCH_LIMIT"""
+        deleted = 0
+        batch = self.db.batch()
+        pending = 0
+        for document in documents:
+            batch.delete(document.reference)
+            pending += 1
+            if pending == FIRESTORE_BATCH_LIMIT:
+                batch.commit()
+                deleted += pending
+                batch = self.db.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+            deleted += pending
+        return deleted
+    
     def get_logs_for_user(self, user_id: str, limit: int = 100) -> Tuple[bool, List[Dict[str, Any]]]:
         """Get console logs for a specific user"""
         if not self.db or not user_id:
@@ -140,7 +200,6 @@ class FirebaseConsoleLogger:
         try:
             # Flush any pending logs
             if self.log_buffer:
-                logger.info(f"Flushing {len(self.log_buffer)} pending logs before retrieving")
                 self._flush_buffer()
             
             # Get logs for this user
@@ -171,22 +230,14 @@ class FirebaseConsoleLogger:
             # Get logs for this user
             logger.info(f"Clearing logs for user {user_id}")
             logs_ref = self.db.collection('console_logs').where('user_id', '==', user_id)
-            logs = logs_ref.stream()
-            
-            # Delete each log
-            batch = self.db.batch()
-            count = 0
-            for log in logs:
-                batch.delete(log.reference)
-                count += 1
-            
-            # Commit the batch
-            batch.commit()
+            count = self._delete_documents(logs_ref.stream())
+            self.log_counts[user_id] = 0
             logger.info(f"Cleared {count} logs for user {user_id}")
             
             return True
             
         except Exception as e:
+            self.log_counts.pop(user_id, None)
             logger.error(f"Error clearing logs for user: {str(e)}")
             return False
     
@@ -209,6 +260,8 @@ class FirebaseConsoleLogger:
             # Write directly to Firebase
             log_ref = self.db.collection('console_logs').document()
             log_ref.set(log_data)
+            if user_id in self.log_counts:
+                self.log_counts[user_id] += 1
             
             logger.info(f"Created test log for user {user_id}")
             return True
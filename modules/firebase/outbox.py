@@ -0,0 +1,350 @@
+"""
+Offline-first write queue for Firebase.
+
+Activity logs, last-login stamps and license/permission updates are recorded
+in a local SQLite outbox and return immediately. A background thread replays
+them to Firestore in batched writes; writes that fail are retried with
+exponential backoff, so a flaky connection never blocks the UI and nothing is
+lost across restarts.
+
+Every write is idempotent (documents get their id when queued), so a batch
+that is replayed after a partial failure cannot create duplicates. Writes to
+the same document are always replayed in the order they were queued.
+
+Anything with the Firestore client's collection()/document()/batch() API can
+be used as the target, including the Firestore emulator or an in-process fake:
+
+    outbox = FirebaseOutbox(fake_db, db_path=":memory:")
+    outbox.add("activity_logs", {...})
+    outbox.flush()
+"""
+
+import atexit
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Any, Optional
+
+from modules.config import (
+    FIRESTORE_BATCH_LIMIT, OUTBOX_DB_PATH, OUTBOX_BATCH_SIZE, OUTBOX_FLUSH_SECONDS,
+    OUTBOX_RETRY_BASE_SECONDS, OUTBOX_RETRY_MAX_SECONDS, OUTBOX_MAX_ATTEMPTS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FirebaseOutbox:
+    """Durable queue of Firestore writes replayed by a background thread."""
+
+    def __init__(self, db, db_path: str = OUTBOX_DB_PATH, batch_size: int = OUTBOX_BATCH_SIZE):
+        """Initialize the outbox and create its table"""
+        self.db = db
+        self.db_path = db_path
+        self.batch_size = min(batch_size, FIRESTORE_BATCH_LIMIT)
+        self.flush_interval = OUTBOX_FLUSH_SECONDS
+
+        # An in-memory database only lives as long as its connection
+        self._shared_conn = sqlite3.connect(":memory:", check_same_thread=False) if db_path == ":memory:" else None
+        self._conn_lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._running = False
+        self._writer = None
+        # Called with (entry, error) when a write is given up on
+        self._give_up_listeners: List[Callable[[Dict[str, Any], Exception], None]] = []
+        self._initialize_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the outbox database"""
+        if self._shared_conn is not None:
+            return self._shared_conn
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _close(self, conn: sqlite3.Connection):
+        """Close a connection opened by _connect"""
+        if conn is not self._shared_conn:
+            conn.close()
+
+    def _initialize_db(self):
+        """Create the outbox table"""
+        try:
+            with self._conn_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute('''
+                        CREATE TABLE IF NOT EXISTS outbox (
+                            id INTEGER PRIMARY KEY,
+                            created REAL NOT NULL,
+                            operation TEXT NOT NULL,
+                            collection TEXT NOT NULL,
+                            document TEXT NOT NULL,
+                            data TEXT NOT NULL,
+                            attempts INTEGER NOT NULL DEFAULT 0,
+                            next_attempt REAL NOT NULL DEFAULT 0,
+                            last_error TEXT,
+                            failed INTEGER NOT NULL DEFAULT 0
+                        )
+                    ''')
+                    conn.execute('CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (failed, next_attempt, id)')
+                    conn.execute('CREATE INDEX IF NOT EXISTS idx_outbox_document ON outbox (collection, document, id)')
+                self._close(conn)
+        except Exception as e:
+            logger.error(f"Error initializing Firebase outbox: {str(e)}")
+
+    def add(self, collection: str, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Queue a new document.
+
+        Returns:
+            str: Id the document will be stored under, or None if it could not be queued
+        """
+        document_id = uuid.uuid4().hex
+        if self._enqueue("set", collection, document_id, data):
+            return document_id
+        return None
+
+    def set(self, collection: str, document_id: str, data: Dict[str, Any]) -> bool:
+        """Queue a full write of a document"""
+        return self._enqueue("set", collection, document_id, data)
+
+    def update(self, collection: str, document_id: str, changes: Dict[str, Any]) -> bool:
+        """Queue an update of some fields; dotted keys update nested fields"""
+        return self._enqueue("update", collection, document_id, changes)
+
+    def add_give_up_listener(self, callback: Callable[[Dict[str, Any], Exception], None]):
+        """
+        Register a callback for writes that are given up on.
+
+        The callback runs on the writer thread with the outbox entry (its data
+        decoded) and the last error, so UI code must hand it to the main thread.
+        """
+        if callback not in self._give_up_listeners:
+            self._give_up_listeners.append(callback)
+
+    def _enqueue(self, operation: str, collection: str, document_id: str, data: Dict[str, Any]) -> bool:
+        """Record a write and wake the background writer"""
+        try:
+            with self._conn_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        'INSERT INTO outbox (created, operation, collection, document, data) VALUES (?, ?, ?, ?, ?)',
+                        (time.time(), operation, collection, document_id, json.dumps(data, default=str))
+                    )
+                self._close(conn)
+            self._wake.set()
+            return True
+        except Exception as e:
+            logger.error(f"Error queueing Firebase write to {collection}/{document_id}: {str(e)}")
+            return False
+
+    def start(self):
+        """Start replaying queued writes in the background"""
+        if self._writer is not None and self._writer.is_alive():
+            return
+        self._running = True
+        self._wake.set()  # Replay what is left from the last session straight away
+        self._writer = threading.Thread(target=self._replay_writes, name="firebase-outbox", daemon=True)
+        self._writer.start()
+        atexit.register(self.stop, 2.0)
+
+    def stop(self, timeout: float = 5.0):
+        """Make a final replay attempt and stop the writer"""
+        self._running = False
+        self._wake.set()
+        if self._writer is not None and self._writer.is_alive():
+            self._writer.join(timeout)
+
+    def _replay_writes(self):
+        """Writer loop: flush when woken by a new write or when the interval passes"""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            running = self._running
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error replaying Firebase writes: {str(e)}")
+            if not running:
+                break
+
+    def flush(self) -> int:
+        """
+        Replay all due writes now.
+
+        Returns:
+            int: Number of writes stored in Firestore
+        """
+        if not self.db:
+            return 0
+
+        written = 0
+        single_failures = 0
+        with self._flush_lock:
+            while True:
+                entries = self._due_entries(self.batch_size)
+                if not entries:
+                    return written
+
+                try:
+                    # Retry a spoiled batch one write at a time, oldest first, to find the bad write
+                    if len(entries) > 1 and not single_failures:
+                        try:
+                            self._commit(entries)
+                            self._delete([entry["id"] for entry in entries])
+                            written += len(entries)
+                            continue
+                        except Exception as e:
+                            logger.debug(f"Batched Firebase write failed, retrying the oldest write alone: {str(e)}")
+                    self._commit(entries[:1])
+                    self._delete([entries[0]["id"]])
+                    written += 1
+                    single_failures = 0
+                except Exception as e:
+                    single_failures += 1
+                    if single_failures >= 2:
+                        # Writes to different documents keep failing, most likely offline
+                        logger.warning(f"Firebase writes failed, backing off: {str(e)}")
+                        self._reschedule(self._due_entries(None), e)
+                        return written
+                    self._reschedule(entries[:1], e)
+
+    def _due_entries(self, limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Get due writes, oldest first, skipping documents with an earlier write still waiting"""
+        with self._conn_lock:
+            conn = self._connect()
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute('''
+                SELECT * FROM outbox AS entry
+                WHERE entry.failed = 0 AND entry.next_attempt <= ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM outbox AS earlier
+                      WHERE earlier.collection = entry.collection AND earlier.document = entry.document
+                        AND earlier.id < entry.id AND earlier.failed = 0 AND earlier.next_attempt > ?
+                  )
+                ORDER BY entry.id
+                LIMIT ?
+            ''', (time.time(), time.time(), -1 if limit is None else limit)).fetchall()
+            conn.row_factory = None
+            self._close(conn)
+        return [dict(row) for row in rows]
+
+    def _commit(self, entries: List[Dict[str, Any]]):
+        """Write entries to Firestore in one batch"""
+        batch = self.db.batch()
+        for entry in entries:
+            doc_ref = self.db.collection(entry["collection"]).document(entry["document"])
+            data = json.loads(entry["data"])
+            if entry["operation"] == "update":
+                batch.update(doc_ref, data)
+            else:
+                batch.set(doc_ref, data)
+        batch.commit()
+
+    def _delete(self, entry_ids: List[int]):
+        """Remove written entries"""
+        with self._conn_lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany('DELETE FROM outbox WHERE id = ?', [(entry_id,) for entry_id in entry_ids])
+            self._close(conn)
+
+    def _reschedule(self, entries: List[Dict[str, Any]], error: Exception):
+        """Back off failed writes, giving up on each after OUTBOX_MAX_ATTEMPTS"""
+        now = time.time()
+        updates = []
+        given_up = []
+        for entry in entries:
+            attempts = entry["attempts"] + 1
+            failed = attempts >= OUTBOX_MAX_ATTEMPTS
+            delay = min(OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), OUTBOX_RETRY_MAX_SECONDS)
+            delay *= random.uniform(0.5, 1.0)  # Jitter so a reconnect does not replay in lockstep
+            if failed:
+                logger.error(f"Giving up on Firebase write to {entry['collection']}/{entry['document']} "
+                             f"after {attempts} attempts: {str(error)}")
+                given_up.append(entry)
+            updates.append((attempts, now + delay, str(error), int(failed), entry["id"]))
+
+        if len(entries) == 1 and not updates[0][3]:
+            logger.warning(f"Firebase write to {entries[0]['collection']}/{entries[0]['document']} failed "
+                           f"(attempt {updates[0][0]}), retrying in {updates[0][1] - now:.0f} s: {str(error)}")
+
+        with self._conn_lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    'UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ?, failed = ? WHERE id = ?',
+                    updates
+                )
+            self._close(conn)
+
+        for entry in given_up:
+            self._notify_give_up(entry, error)
+
+    def _notify_give_up(self, entry: Dict[str, Any], error: Exception):
+        """Tell listeners that a write was given up on"""
+        entry = dict(entry, data=json.loads(entry["data"]))
+        for callback in list(self._give_up_listeners):
+            try:
+                callback(entry, error)
+            except Exception as e:
+                logger.error(f"Error in outbox give-up listener: {str(e)}")
+
+    def pending_count(self) -> int:
+        """Number of writes waiting to be replayed"""
+        return self._count('SELECT COUNT(*) FROM outbox WHERE failed = 0')
+
+    def failed_count(self) -> int:
+        """Number of writes that were given up on"""
+        return self._count('SELECT COUNT(*) FROM outbox WHERE failed = 1')
+
+    def _count(self, sql: str) -> int:
+        """Run a COUNT query"""
+        try:
+            with self._conn_lock:
+                conn = self._connect()
+                total = conn.execute(sql).fetchone()[0]
+                self._close(conn)
+            return total
+        except Exception as e:
+            logger.error(f"Error counting outbox writes: {str(e)}")
+            return 0
+
+    def retry_failed(self) -> int:
+        """Queue writes that were given up on again"""
+        try:
+            with self._conn_lock:
+                conn = self._connect()
+                with conn:
+                    retried = conn.execute(
+                        'UPDATE outbox SET failed = 0, attempts = 0, next_attempt = 0 WHERE failed = 1'
+                    ).rowcount
+                self._close(conn)
+            self._wake.set()
+            return retried
+        except Exception as e:
+            logger.error(f"Error retrying failed outbox writes: {str(e)}")
+            return 0
+
+
+_outbox = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox(db) -> FirebaseOutbox:
+    """Get the shared outbox, creating and starting it the first time"""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = FirebaseOutbox(db)
+            _outbox.start()
+        elif _outbox.db is None:
+            _outbox.db = db
+        return _outbox
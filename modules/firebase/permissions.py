@@ -5,14 +5,19 @@ Permission management functionality for Firebase authentication.
 import logging
 from typing import Dict, List, Tuple, Any, Optional
 
+from modules.firebase.outbox import FirebaseOutbox, get_outbox
+from modules.firebase.user_cache import FirebaseUserCache
+
 logger = logging.getLogger(__name__)
 
 class FirebasePermissionsManager:
     """Permission management for Firebase authentication."""
     
-    def __init__(self, db):
+    def __init__(self, db, cache: Optional[FirebaseUserCache] = None, outbox: Optional[FirebaseOutbox] = None):
         """Initialize the permissions manager with required dependencies."""
         self.db = db
+        self.cache = cache or FirebaseUserCache(db)
+        self.outbox = outbox or get_outbox(db)
     
     def get_user_tab_permissions(self, user_id) -> Tuple[bool, Dict]:
         """Get tab permissions for a user"""
@@ -20,11 +25,9 @@ class FirebasePermissionsManager:
             return False, {}
             
         try:
-            user_ref = self.db.collection('users').document(user_id)
-            user_doc = user_ref.get()
+            user_data = self.cache.get_profile(user_id)
             
-            if user_doc.exists:
-                user_data = user_doc.to_dict()
+            if user_data is not None:
                 permissions = user_data.get("tab_permissions", {})
                 
                 if not permissions:
@@ -65,23 +68,22 @@ class FirebasePermissionsManager:
             # Log the conversion for debugging
             logger.info(f"Permission update: {tab_key} = {granted} (type: {type(granted)}) -> {granted_bool} (type: {type(granted_bool)})")
             
-            # Get current permissions
-            user_ref = self.db.collection('users').document(user_id)
-            user_doc = user_ref.get()
+            # Get current permissions; the cached copy already has changes still queued in the outbox
+            user_data = self.cache.get_profile(user_id)
             
-            if not user_doc.exists:
+            if user_data is None:
                 return False, "User not found"
                 
-            user_data = user_doc.to_dict()
-            permissions = user_data.get("tab_permissions", {})
+            permissions = dict(user_data.get("tab_permissions", {}))
             
             # Update specific permission
             permissions[tab_key] = granted_bool
             
-            # Save updated permissions
-            user_ref.update({
-                "tab_permissions": permissions
-            })
+            # Queue only the changed field, so queued updates to other tabs are not overwritten
+            if not self.outbox.update('users', user_id, {f"tab_permissions.{tab_key}": granted_bool}):
+                return False, "Could not save the permission change"
+            # Patch only this field of the cached copy instead of replacing the document
+            self.cache.update_profile(user_id, {"tab_permissions": permissions})
             
             action = "granted" if granted_bool else "revoked"
             return True, f"Permission {action} successfully"
@@ -0,0 +1,209 @@
+"""
+Cache of Firestore user documents for the Football Stats application.
+
+Permissions, admin and license checks all read the same users/{id}
+document, so it is fetched once and shared. Entries expire after a TTL.
+Only the signed-in user's own profile is persisted to disk, so a relaunch
+within the TTL can assemble tabs without waiting for Firestore; other
+users' profiles and the admin user list are kept in memory only.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from modules.config import USER_CACHE_FILE, USER_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class FirebaseUserCache:
+    """TTL cache of user documents and the user list; the session profile is persisted."""
+
+    def __init__(self, db, cache_file: str = USER_CACHE_FILE, ttl: float = USER_CACHE_TTL):
+        """Initialize the cache and load persisted entries."""
+        self.db = db
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self.profiles: Dict[str, Dict[str, Any]] = {}  # user_id -> {"data": ..., "fetched_at": ...}
+        self.user_list: Optional[Dict[str, Any]] = None  # {"data": [...], "fetched_at": ...}
+        # Signed-in user, the only profile written to disk
+        self.session_user_id: Optional[str] = None
+        self._load()
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        """Check whether a cache entry is within the TTL"""
+        return entry is not None and time.time() - entry["fetched_at"] < self.ttl
+
+    def get_profile(self, user_id: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get a user document.
+
+        Args:
+            user_id: Firebase user ID
+            force_refresh: Skip the cache and read Firestore
+
+        Returns:
+            dict: User document data, or None if the user does not exist
+
+        Raises:
+            Exception: If Firestore cannot be read and nothing is cached
+        """
+        with self._lock:
+            entry = self.profiles.get(user_id)
+            if not force_refresh and self._is_fresh(entry):
+                return entry["data"]
+
+        try:
+            user_doc = self.db.collection('users').document(user_id).get()
+        except Exception as e:
+            # Serve stale data rather than failing the login
+            if entry is not None:
+                logger.warning(f"Using cached profile for {user_id} after read error: {str(e)}")
+                return entry["data"]
+            raise
+
+        data = user_doc.to_dict() if user_doc.exists else None
+        self.set_profile(user_id, data)
+        return data
+
+    def set_profile(self, user_id: str, data: Optional[Dict[str, Any]]):
+        """Store a user document, or forget it if data is None"""
+        with self._lock:
+            if data is None:
+                self.profiles.pop(user_id, None)
+            else:
+                self.profiles[user_id] = {"data": data, "fetched_at": time.time()}
+        self._save()
+
+    def update_profile(self, user_id: str, changes: Dict[str, Any]):
+        """Apply fields just written to Firestore to the cached document"""
+        with self._lock:
+            entry = self.profiles.get(user_id)
+            if entry is not None:
+                entry["data"].update(changes)
+            if self.user_list is not None:
+                for user in self.user_list["data"]:
+                    if user.get("id") == user_id:
+                        user.update({key: value for key, value in changes.items() if key in user})
+        self._save()
+
+    def get_all_users(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the summary of all users.
+
+        Returns:
+            list: Dicts with id, email, created_at, last_login, is_admin and has_license
+        """
+        with self._lock:
+            if not force_refresh and self._is_fresh(self.user_list):
+                return self.user_list["data"]
+
+        users = []
+        for doc in self.db.collection('users').stream():
+            user_data = doc.to_dict()
+            users.append({
+                "id": doc.id,
+                "email": user_data.get("email", ""),
+                "created_at": user_data.get("created_at", ""),
+                "last_login": user_data.get("last_login", ""),
+                "is_admin": user_data.get("is_admin", False),
+                "has_license": user_data.get("has_license", False)
+            })
+
+        with self._lock:
+            self.user_list = {"data": users, "fetched_at": time.time()}
+        self._save()
+        return users
+
+    def invalidate(self, user_id: Optional[str] = None):
+        """Forget a user, or everything when no user is given"""
+        with self._lock:
+            if user_id is None:
+                self.profiles.clear()
+                self.session_user_id = None
+            else:
+                self.profiles.pop(user_id, None)
+            self.user_list = None
+        self._save()
+
+    def prefetch(self, user_id: str, tasks: Optional[List] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load everything tab assembly needs in one parallel step.
+
+        The user document (permissions, admin and license flags) is read
+        alongside any extra login tasks, and admins also get the user list
+        for the admin panel.
+
+        Args:
+            user_id: Firebase user ID
+            tasks: Extra callables to run in the same step (e.g. activity logging)
+
+        Returns:
+            dict: User document data, or None if it could not be read
+        """
+        tasks = list(tasks or [])
+        with self._lock:
+            self.session_user_id = user_id
+        with ThreadPoolExecutor(max_workers=len(tasks) + 2, thread_name_prefix="login-prefetch") as pool:
+            profile_future = pool.submit(self.get_profile, user_id, True)
+
+            # The cached profile tells whether the user list will be needed
+            with self._lock:
+                cached = self.profiles.get(user_id)
+            users_future = None
+            if cached is not None and cached["data"].get("is_admin"):
+                users_future = pool.submit(self.get_all_users)
+
+            for task in tasks:
+                pool.submit(task)
+
+            try:
+                profile = profile_future.result()
+            except Exception as e:
+                logger.error(f"Error prefetching profile for {user_id}: {str(e)}")
+                return None
+
+            if users_future is None and profile and profile.get("is_admin"):
+                users_future = pool.submit(self.get_all_users)
+            if users_future is not None:
+                try:
+                    users_future.result()
+                except Exception as e:
+                    logger.error(f"Error prefetching users: {str(e)}")
+            return profile
+
+    def _load(self):
+        """Load persisted entries"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                self.session_user_id = cache.get("session_user_id")
+                profile = cache.get("profile")
+                if self.session_user_id and profile:
+                    self.profiles = {self.session_user_id: profile}
+        except Exception as e:
+            logger.error(f"Error loading user cache: {str(e)}")
+
+    def _save(self):
+        """Persist the session user's profile atomically, or remove the file when signed out"""
+        try:
+            with self._lock:
+                profile = self.profiles.get(self.session_user_id) if self.session_user_id else None
+                if profile is None:
+                    if os.path.exists(self.cache_file):
+                        os.remove(self.cache_file)
+                    return
+                cache = {"session_user_id": self.session_user_id, "profile": profile}
+                temp_path = f"{self.cache_file}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, default=str)
+                os.replace(temp_path, self.cache_file)
+        except Exception as e:
+            logger.error(f"Error saving user cache: {str(e)}")
@@ -6,17 +6,25 @@ import logging
 from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime
 import requests
-import firebase_admin
-from firebase_admin import auth as firebase_auth
+
+from modules.firebase.outbox import FirebaseOutbox, get_outbox
+from modules.firebase.user_cache import FirebaseUserCache
+from modules.lazy_imports import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# Firebase Admin SDK is imported on first use
+firebase_auth = lazy_import("firebase_admin.auth")
+
 class FirebaseUserManager:
     """User management for Firebase authentication."""
     
-    def __init__(self, db, api_key, firebase_auth_url):
+    def __init__(self, db, api_key, firebase_auth_url, cache: Optional[FirebaseUserCache] = None,
+                 outbox: Optional[FirebaseOutbox] = None):
         """Initialize the user manager with required dependencies."""
         self.db = db
+        self.cache = cache or FirebaseUserCache(db)
+        self.outbox = outbox or get_outbox(db)
         self.api_key = api_key
         self.firebase_auth_url = firebase_auth_url
     
@@ -49,12 +57,12 @@ class FirebaseUserManager:
                 }
             }
             
-            # Check if this is the first user
+            # Check if this is the first user; one document is enough to tell
             users_ref = self.db.collection('users')
-            users_count = len(list(users_ref.stream()))
+            is_first_user = len(users_ref.limit(1).get()) == 0
             
             # If this is the first user, make them an admin with a license
-            if users_count == 0:
+            if is_first_user:
                 user_data["is_admin"] = True
                 user_data["has_license"] = True
                 
@@ -76,6 +84,8 @@ class FirebaseUserManager:
             # Create the user record
             user_ref = self.db.collection('users').document(user_id)
             user_ref.set(user_data)
+            self.cache.invalidate(user_id)
+            self.cache.set_profile(user_id, user_data)
             
             return True
             
@@ -89,18 +99,16 @@ class FirebaseUserManager:
             return False
             
         try:
-            user_ref = self.db.collection('users').document(user_id)
-            user_doc = user_ref.get()
-            
             # If user document doesn't exist, create it
-            if not user_doc.exists:
+            if self.cache.get_profile(user_id) is None:
                 logger.info(f"Creating missing user document for: {user_id}")
                 self.create_user_record(user_id, email or 'unknown@email.com')
             
             # Update last login
-            user_ref.update({
-                "last_login": datetime.now().isoformat()
-            })
+            last_login = datetime.now().isoformat()
+            if not self.outbox.update('users', user_id, {"last_login": last_login}):
+                return False
+            self.cache.update_profile(user_id, {"last_login": last_login})
             
             return True
             
@@ -108,29 +116,13 @@ class FirebaseUserManager:
             logger.error(f"Update last login error: {str(e)}")
             return False
     
-    def get_all_users(self) -> Tuple[bool, List[Dict]]:
-        """Get all users from Firestore"""
+    def get_all_users(self, force_refresh=False) -> Tuple[bool, List[Dict]]:
+        """Get all users from Firestore, cached for USER_CACHE_TTL"""
         if not self.db:
             return False, "Not authenticated"
             
         try:
-            users_ref = self.db.collection('users')
-            users_docs = users_ref.stream()
-            
-            users = []
-            for doc in users_docs:
-                user_data = doc.to_dict()
-                user = {
-                    "id": doc.id,
-                    "email": user_data.get("email", ""),
-                    "created_at": user_data.get("created_at", ""),
-                    "last_login": user_data.get("last_login", ""),
-                    "is_admin": user_data.get("is_admin", False),
-                    "has_license": user_data.get("has_license", False)
-                }
-                users.append(user)
-                
-            return True, users
+            return True, self.cache.get_all_users(force_refresh)
             
         except Exception as e:
             logger.error(f"Get users error: {str(e)}")
@@ -142,10 +134,10 @@ class FirebaseUserManager:
             return False, "Not authenticated"
             
         try:
-            user_ref = self.db.collection('users').document(user_id)
-            user_ref.update({
-                "has_license": grant
-            })
+            if not self.outbox.update('users', user_id, {"has_license": grant}):
+                return False, "Could not save the license change"
+            # Drop the cached copy instead of patching a possibly stale one
+            self.cache.invalidate(user_id)
             
             action = "granted" if grant else "revoked"
             return True, f"License {action} successfully"
@@ -160,11 +152,9 @@ class FirebaseUserManager:
             return False, False
             
         try:
-            user_ref = self.db.collection('users').document(user_id)
-            user_doc = user_ref.get()
+            user_data = self.cache.get_profile(user_id)
             
-            if user_doc.exists:
-                user_data = user_doc.to_dict()
+            if user_data is not None:
                 has_license = user_data.get("has_license", False)
                 return True, has_license
             else:
@@ -191,6 +181,7 @@ class FirebaseUserManager:
             # Delete user from Firestore
             user_ref = self.db.collection('users').document(user_id)
             user_ref.delete()
+            self.cache.invalidate(user_id)
             
             return True, "User deleted successfully"
             
@@ -204,11 +195,9 @@ class FirebaseUserManager:
             return False, False
             
         try:
-            user_ref = self.db.collection('users').document(user_id)
-            user_doc = user_ref.get()
+            user_data = self.cache.get_profile(user_id)
             
-            if user_doc.exists:
-                user_data = user_doc.to_dict()
+            if user_data is not None:
                 is_admin = user_data.get("is_admin", False)
                 return True, is_admin
             else:
@@ -1,10 +1,13 @@
 from datetime import datetime
 import logging
 
+from modules.instrumentation import timed
+
 logger = logging.getLogger(__name__)
 
 class FormAnalyzer:
     @staticmethod
+    @timed("form.analyze_team_form")
     def analyze_team_form(fixtures, team_id, matches_count=3):
         """
         Analyze a team's recent form with enhanced debugging and null safety
@@ -172,6 +175,7 @@ class FormAnalyzer:
         }
         
     @staticmethod
+    @timed("form.get_upcoming_opponents")
     def get_upcoming_opponents(fixtures, team_id, top_n=5):
         """
         Get upcoming opponents for a team from fixtures
@@ -0,0 +1,228 @@
+"""
+Lightweight performance instrumentation.
+
+Timers, counters and histograms shared by the whole app, so a slow refresh
+can be broken down into HTTP, JSON decoding, analysis, SQLite and table
+updates:
+
+    with timer("api.http"):
+        response = transport.get(...)
+
+    @timed("form.analyze_team_form")
+    def analyze_team_form(...): ...
+
+    count("cache.hit")
+
+Every timed span is also kept as a trace event. snapshot() summarizes the
+metrics, export_json() writes that summary and export_chrome_trace() writes
+the spans in Chrome trace format (chrome://tracing, Perfetto).
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional
+
+# Recent samples kept per metric for percentiles
+SAMPLE_LIMIT = 1024
+
+# Trace events kept for export, oldest dropped first
+TRACE_LIMIT = 50000
+
+_lock = threading.Lock()
+_enabled = os.getenv("FOOTBALL_STATS_METRICS", "1") != "0"
+_origin = time.perf_counter()
+
+_counters: Dict[str, float] = {}
+_histograms: Dict[str, Dict[str, Any]] = {}
+_timer_names = set()
+_trace_events = deque(maxlen=TRACE_LIMIT)
+_thread_names: Dict[int, str] = {}
+
+
+def set_enabled(enabled: bool):
+    """Turn metric collection on or off"""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Whether metrics are being collected"""
+    return _enabled
+
+
+def count(name: str, value: float = 1):
+    """Add to a counter"""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def observe(name: str, value: float):
+    """Record a value in a histogram"""
+    if not _enabled:
+        return
+    with _lock:
+        _observe(name, value)
+
+
+def _observe(name: str, value: float):
+    """Record a histogram value; the caller holds the lock"""
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = {
+            "count": 0, "total": 0.0, "min": value, "max": value, "samples": deque(maxlen=SAMPLE_LIMIT)
+        }
+    histogram["count"] += 1
+    histogram["total"] += value
+    histogram["min"] = min(histogram["min"], value)
+    histogram["max"] = max(histogram["max"], value)
+    histogram["samples"].append(value)
+
+
+@contextmanager
+def timer(name: str, **args):
+    """
+    Time a block of code.
+
+    Args:
+        name: Metric name, dotted by area (e.g. "db.save_fixtures")
+        **args: Extra details stored with the trace event
+    """
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _record_span(name, start, end, args)
+
+
+def timed(name: Optional[str] = None):
+    """Decorator that times every call of a function"""
+    def decorate(func):
+        metric = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record_span(metric, start, time.perf_counter(), None)
+        return wrapper
+    return decorate
+
+
+def instrument_methods(prefix: str):
+    """Class decorator that times every public method as "<prefix>.<method>" """
+    def decorate(cls):
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("_") and inspect.isfunction(value):
+                setattr(cls, attr, timed(f"{prefix}.{attr}")(value))
+        return cls
+    return decorate
+
+
+def _record_span(name: str, start: float, end: float, args: Optional[Dict[str, Any]]):
+    """Store a finished span as a timer sample and a trace event"""
+    thread = threading.current_thread()
+    event = {
+        "name": name,
+        "cat": name.split(".", 1)[0],
+        "ph": "X",
+        "ts": round((start - _origin) * 1e6, 1),
+        "dur": round((end - start) * 1e6, 1),
+        "pid": os.getpid(),
+        "tid": thread.ident
+    }
+    if args:
+        event["args"] = {key: str(value) for key, value in args.items()}
+
+    with _lock:
+        _timer_names.add(name)
+        _observe(name, (end - start) * 1000)
+        _trace_events.append(event)
+        _thread_names.setdefault(thread.ident, thread.name)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Summarize all metrics.
+
+    Returns:
+        dict: "timers" (milliseconds) and "histograms" with count, total,
+            mean, p50, p95, min and max, plus "counters"
+    """
+    with _lock:
+        counters = dict(_counters)
+        histograms = {name: dict(data, samples=sorted(data["samples"])) for name, data in _histograms.items()}
+        timer_names = set(_timer_names)
+
+    summary = {"timers": {}, "histograms": {}, "counters": counters}
+    for name, data in sorted(histograms.items()):
+        samples = data["samples"]
+        section = "timers" if name in timer_names else "histograms"
+        summary[section][name] = {
+            "count": data["count"],
+            "total": round(data["total"], 3),
+            "mean": round(data["total"] / data["count"], 3),
+            "p50": round(_percentile(samples, 0.5), 3),
+            "p95": round(_percentile(samples, 0.95), 3),
+            "min": round(data["min"], 3),
+            "max": round(data["max"], 3)
+        }
+    return summary
+
+
+def reset():
+    """Forget all metrics and trace events"""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _timer_names.clear()
+        _trace_events.clear()
+
+
+def export_json(path: str):
+    """Write the metric summary as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot(), f, indent=2)
+
+
+def export_chrome_trace(path: str) -> int:
+    """
+    Write recorded spans in Chrome trace event format.
+
+    Returns:
+        int: Number of spans written
+    """
+    with _lock:
+        events = list(_trace_events)
+        thread_names = dict(_thread_names)
+
+    pid = os.getpid()
+    metadata = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+        for tid, thread_name in thread_names.items()
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+    return len(events)
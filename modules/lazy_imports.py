@@ -0,0 +1,89 @@
+"""
+Deferred imports for heavy optional libraries.
+
+matplotlib, pandas and firebase_admin each take a noticeable amount of time
+to import. Modules that need them bind a lazy proxy at import time instead:
+
+    plt = lazy_import("matplotlib.pyplot")
+
+The real module is imported the first time an attribute of the proxy is used,
+so the cost is only paid by code paths that actually need the library.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from types import ModuleType
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Guards the first import of each module when proxies are used from worker threads
+_import_lock = threading.RLock()
+
+
+class LazyModule:
+    """Proxy that imports a module on first attribute access."""
+
+    def __init__(self, module_name: str):
+        """
+        Initialize the proxy.
+
+        Args:
+            module_name: Fully qualified name of the module to import
+        """
+        self.__dict__["_module_name"] = module_name
+        self.__dict__["_module"] = None
+
+    def _load(self) -> ModuleType:
+        """Import the module if it has not been imported yet."""
+        module = self.__dict__["_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._module_name)
+                    self.__dict__["_module"] = module
+                    logger.debug(f"Imported {self._module_name} in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying module has been imported"""
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._load(), name, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self._module_name} ({state})>"
+
+
+# One proxy per module name, so every caller shares the same import
+_proxies: Dict[str, LazyModule] = {}
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    """
+    Get a lazy proxy for a module.
+
+    Args:
+        module_name: Fully qualified name of the module
+
+    Returns:
+        LazyModule: Proxy that imports the module on first use
+    """
+    with _import_lock:
+        proxy = _proxies.get(module_name)
+        if proxy is None:
+            proxy = _proxies[module_name] = LazyModule(module_name)
+        return proxy
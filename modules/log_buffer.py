@@ -0,0 +1,100 @@
+"""
+Bounded in-memory log buffer for the Logs tab.
+
+A logging handler appends each record to a fixed-size ring buffer as a small
+tuple, so logging from hot paths costs one level check and a deque append.
+Readers poll with a sequence number and receive only the records added since
+their last read; when the buffer wraps, the oldest records are dropped.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import List, Tuple
+
+from modules.config import LOG_BUFFER_SIZE
+
+# (sequence, created, levelno, levelname, logger name, message)
+LogEntry = Tuple[int, float, int, str, str, str]
+
+
+class RingBufferHandler(logging.Handler):
+    """Logging handler that keeps the most recent records in a ring buffer."""
+
+    def __init__(self, capacity: int = LOG_BUFFER_SIZE, level=logging.NOTSET):
+        super().__init__(level)
+        self.entries = deque(maxlen=capacity)
+        self._sequence = 0
+        self._sequence_lock = threading.Lock()
+
+    def handle(self, record):
+        """Store a record; the deque is thread safe, so no handler lock is taken"""
+        if not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record):
+        """Append a compact copy of the record"""
+        try:
+            # The console handler usually formatted the message already
+            message = record.__dict__.get("message")
+            if message is None:
+                message = record.getMessage()
+            with self._sequence_lock:
+                self._sequence += 1
+                self.entries.append(
+                    (self._sequence, record.created, record.levelno, record.levelname, record.name, message)
+                )
+        except Exception:
+            self.handleError(record)
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the newest record"""
+        return self._sequence
+
+    def read_since(self, sequence: int, limit: int = None) -> Tuple[List[LogEntry], int]:
+        """
+        Get records newer than a sequence number.
+
+        Args:
+            sequence: Sequence number returned by the previous read (0 for all)
+            limit: Return at most this many of the newest records
+
+        Returns:
+            tuple: (entries oldest first, sequence to pass to the next read)
+        """
+        with self._sequence_lock:
+            latest = self._sequence
+            new_count = latest - sequence
+            if new_count <= 0:
+                return [], latest
+            snapshot = list(self.entries)
+
+        new_count = min(new_count, len(snapshot))
+        if limit is not None:
+            new_count = min(new_count, limit)
+        return snapshot[len(snapshot) - new_count:], latest
+
+    def clear(self):
+        """Drop all buffered records"""
+        with self._sequence_lock:
+            self.entries.clear()
+
+
+_handler = None
+_install_lock = threading.Lock()
+
+
+def get_log_buffer() -> RingBufferHandler:
+    """Get the ring buffer handler, installing it on the root logger the first time"""
+    global _handler
+    with _install_lock:
+        if _handler is None:
+            _handler = RingBufferHandler(level=logging.DEBUG)
+        # Re-attach if something reset the root handlers since
+        root_logger = logging.getLogger()
+        if _handler not in root_logger.handlers:
+            root_logger.addHandler(_handler)
+        return _handler
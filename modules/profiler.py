@@ -0,0 +1,120 @@
+"""
+Opt-in cProfile hook for long-running operations.
+
+When profiling is on, every run of a @profiled function is written to the
+profile directory as a .prof file (for snakeviz, pstats or gprof2dot) with a
+.txt summary of the top functions next to it:
+
+    @profiled("form_refresh")
+    def _fetch_form_data(self, task, ...): ...
+
+Profiling is turned on with the "profiling" setting or FOOTBALL_STATS_PROFILE=1.
+FOOTBALL_STATS_PROFILE_DIR overrides where profiles are written.
+"""
+
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import re
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+from modules.config import PROFILE_DIR, PROFILE_TOP_FUNCTIONS, PROFILE_KEEP_RUNS
+
+logger = logging.getLogger(__name__)
+
+_env_enabled = os.getenv("FOOTBALL_STATS_PROFILE", "0") not in ("", "0")
+_enabled = _env_enabled
+_profile_dir = os.getenv("FOOTBALL_STATS_PROFILE_DIR", PROFILE_DIR)
+
+# Only one profiler can be active per process; overlapping runs go unprofiled
+_active = threading.Lock()
+
+
+def set_enabled(enabled: bool):
+    """Turn profiling on or off; the environment variable keeps it on"""
+    global _enabled
+    _enabled = enabled or _env_enabled
+
+
+def is_enabled() -> bool:
+    """Whether operations are being profiled"""
+    return _enabled
+
+
+def get_profile_dir() -> str:
+    """Directory profiles are written to"""
+    return _profile_dir
+
+
+def profiled(name: str):
+    """Decorator that profiles each call when profiling is enabled"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled or not _active.acquire(blocking=False):
+                return func(*args, **kwargs)
+            try:
+                profile = cProfile.Profile()
+                started = datetime.now()
+                profile.enable()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profile.disable()
+                    _save_profile(profile, name, started)
+            finally:
+                _active.release()
+        return wrapper
+    return decorate
+
+
+def _save_profile(profile: cProfile.Profile, name: str, started: datetime) -> Optional[str]:
+    """
+    Write a profile and its top-functions summary.
+
+    Returns:
+        str: Path of the .prof file, or None if it could not be written
+    """
+    try:
+        os.makedirs(_profile_dir, exist_ok=True)
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        base = os.path.join(_profile_dir, f"{started.strftime('%Y%m%d_%H%M%S_%f')}_{safe_name}")
+        profile.dump_stats(f"{base}.prof")
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stream.write(f"{name} started {started.isoformat(timespec='seconds')}, "
+                     f"{stats.total_tt:.3f} s profiled\n\n")
+        stats.sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        stream.write("\nBy own time:\n")
+        stats.sort_stats("tottime").print_stats(PROFILE_TOP_FUNCTIONS)
+        with open(f"{base}.txt", 'w', encoding='utf-8') as f:
+            f.write(stream.getvalue())
+
+        logger.info(f"Profile for {name} ({stats.total_tt:.2f} s) written to {base}.prof")
+        _prune_profiles()
+        return f"{base}.prof"
+    except Exception as e:
+        logger.error(f"Error saving profile for {name}: {str(e)}")
+        return None
+
+
+def list_profiles() -> List[str]:
+    """Get saved .prof files, newest first"""
+    if not os.path.isdir(_profile_dir):
+        return []
+    files = [os.path.join(_profile_dir, f) for f in os.listdir(_profile_dir) if f.endswith(".prof")]
+    return sorted(files, reverse=True)
+
+
+def _prune_profiles():
+    """Delete the oldest profiles beyond PROFILE_KEEP_RUNS"""
+    for path in list_profiles()[PROFILE_KEEP_RUNS:]:
+        for file_path in (path, f"{path[:-len('.prof')]}.txt"):
+            if os.path.exists(file_path):
+                os.remove(file_path)
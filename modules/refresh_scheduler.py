@@ -0,0 +1,342 @@
+"""
+Background refresh scheduler.
+
+Plans the minimum set of API calls from the fixture calendar that is already
+in the API cache or the database, and runs them ahead of the UI:
+
+- fixtures every refresh interval while a league has a match in progress
+- standings, final fixture scores and the next round once after a match day
+- team statistics nightly, only for leagues that played since the last run
+
+Leagues without recent or live matches cost no API calls at all.
+
+Run standalone with:  python -m modules.refresh_scheduler
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional
+
+from modules.config import (
+    ALL_LEAGUES, MATCH_DURATION_MINUTES, MATCH_WINDOW_LEAD_MINUTES, STANDINGS_REFRESH_DELAY_MINUTES,
+    RECENT_RESULTS_HOURS, NIGHTLY_REFRESH_HOUR, SCHEDULER_TICK_SECONDS, SCHEDULER_STATE_FILE
+)
+from modules.league_names import LEAGUE_NAMES
+
+logger = logging.getLogger(__name__)
+
+# Fixture status codes from API-Football
+FINISHED_STATUSES = ('FT', 'AET', 'PEN')
+LIVE_STATUSES = ('1H', 'HT', '2H', 'ET', 'BT', 'P', 'LIVE', 'INT', 'SUSP')
+
+
+class RefreshScheduler:
+    """Plans and runs cache refreshes on a per-resource cadence."""
+
+    def __init__(self, api, db_manager, settings_manager, state_file: Optional[str] = None,
+                 tick_seconds: int = SCHEDULER_TICK_SECONDS):
+        """
+        Initialize the scheduler.
+
+        Args:
+            api: FootballAPI client whose cache is kept warm
+            db_manager: DatabaseManager used for the fixture calendar
+            settings_manager: SettingsManager with leagues and refresh interval
+            state_file: Optional JSON file that keeps last run times across restarts
+            tick_seconds: Seconds between planning passes
+        """
+        self.api = api
+        self.db_manager = db_manager
+        self.settings_manager = settings_manager
+        self.state_file = state_file
+        self.tick_seconds = tick_seconds
+
+        # Last successful run per (resource, league), as UTC datetimes
+        self.last_runs: Dict[tuple, datetime] = {}
+        self._load_state()
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._run_lock = threading.Lock()
+
+    # Lifecycle
+
+    def start(self):
+        """Start planning and refreshing on a daemon thread"""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="RefreshScheduler", daemon=True)
+        self._thread.start()
+        logger.info("Refresh scheduler started")
+
+    def stop(self):
+        """Stop the scheduler thread after the current pass"""
+        self._stop_event.set()
+        self._thread = None
+        logger.info("Refresh scheduler stopped")
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the scheduler thread is active"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(self):
+        """Run a pass every tick until stopped"""
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Error in refresh scheduler pass: {str(e)}")
+            self._stop_event.wait(self.tick_seconds)
+
+    # Planning
+
+    def get_league_ids(self) -> List[int]:
+        """Get the configured leagues, expanding All Leagues"""
+        leagues = self.settings_manager.get_leagues() or []
+        if ALL_LEAGUES in leagues:
+            return [lid for lid in LEAGUE_NAMES if isinstance(lid, int) and lid != ALL_LEAGUES]
+        return list(leagues)
+
+    def get_calendar(self, league_id: int) -> List[Dict[str, Any]]:
+        """
+        Get a league's fixture calendar without calling the API.
+
+        Returns:
+            list: Dicts with "kickoff" (UTC datetime), "finished", "live",
+                "home_team_id" and "away_team_id"
+        """
+        calendar = []
+
+        # Prefer the API cache, it has exact kickoff timestamps and status codes
+        cached = self.api.peek_cache(f'fixtures_{league_id}_None_None', 'long')
+        if cached:
+            for fixture in cached:
+                try:
+                    timestamp = fixture['fixture'].get('timestamp')
+                    if timestamp:
+                        kickoff = datetime.fromtimestamp(timestamp, timezone.utc)
+                    else:
+                        kickoff = datetime.fromisoformat(fixture['fixture']['date'])
+                    status = fixture['fixture']['status']['short']
+                    calendar.append({
+                        "kickoff": kickoff,
+                        "finished": status in FINISHED_STATUSES,
+                        "live": status in LIVE_STATUSES,
+                        "home_team_id": fixture['teams']['home']['id'],
+                        "away_team_id": fixture['teams']['away']['id']
+                    })
+                except (KeyError, TypeError, ValueError):
+                    continue
+            return calendar
+
+        # Fall back to fixtures stored in the database (dates and times are UTC)
+        for fixture in self.db_manager.get_fixtures_by_league(league_id):
+            try:
+                kickoff = datetime.strptime(
+                    f"{fixture['match_date']} {fixture.get('match_time') or '00:00'}", "%Y-%m-%d %H:%M"
+                ).replace(tzinfo=timezone.utc)
+            except (KeyError, TypeError, ValueError):
+                continue
+            status = (fixture.get('status') or '').lower()
+            calendar.append({
+                "kickoff": kickoff,
+                "finished": fixture.get('home_score') is not None or status in ('match finished', 'completed'),
+                "live": status.startswith(('first half', 'halftime', 'second half', 'extra time', 'break time', 'penalty in progress')),
+                "home_team_id": fixture['home_team_id'],
+                "away_team_id": fixture['away_team_id']
+            })
+        return calendar
+
+    def plan(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Plan the refreshes that are due.
+
+        Args:
+            now: Current UTC time (defaults to now)
+
+        Returns:
+            list: Jobs with "resource", "league_id" and "reason"
+        """
+        now = now or datetime.now(timezone.utc)
+        live_interval = timedelta(minutes=max(5, int(self.settings_manager.get_refresh_interval() or 30)))
+        duration = timedelta(minutes=MATCH_DURATION_MINUTES)
+        lead = timedelta(minutes=MATCH_WINDOW_LEAD_MINUTES)
+        standings_delay = timedelta(minutes=STANDINGS_REFRESH_DELAY_MINUTES)
+        recent = timedelta(hours=RECENT_RESULTS_HOURS)
+        nightly = now.astimezone().hour >= NIGHTLY_REFRESH_HOUR
+
+        jobs = []
+        for league_id in self.get_league_ids():
+            calendar = self.get_calendar(league_id)
+
+            # Nothing cached yet: fetch the calendar once so the UI starts warm
+            if not calendar:
+                if self._is_due(("fixtures", league_id), now, timedelta(hours=24)):
+                    jobs.append({"resource": "fixtures", "league_id": league_id, "reason": "no fixture calendar"})
+                continue
+
+            # Matches in progress: keep fixtures (scores, status) fresh
+            in_window = any(
+                entry["live"] or (not entry["finished"] and entry["kickoff"] - lead <= now <= entry["kickoff"] + duration)
+                for entry in calendar
+            )
+            if in_window and self._is_due(("fixtures", league_id), now, live_interval):
+                jobs.append({"resource": "fixtures", "league_id": league_id, "reason": "match in progress"})
+
+            # Recently finished matches: refresh results-driven data once
+            ends = [
+                entry["kickoff"] + duration for entry in calendar
+                if now - recent <= entry["kickoff"] + duration <= now - standings_delay
+            ]
+            if ends:
+                last_end = max(ends)
+                last_standings = self.last_runs.get(("standings", league_id))
+                if last_standings is None or last_standings < last_end + standings_delay:
+                    reason = "matches finished"
+                    if not in_window:
+                        jobs.append({"resource": "fixtures", "league_id": league_id, "reason": reason})
+                    jobs.append({"resource": "standings", "league_id": league_id, "reason": reason})
+                    jobs.append({"resource": "next_fixtures", "league_id": league_id, "reason": reason})
+
+            # Nightly: team statistics for leagues that played since the last run
+            if nightly:
+                last_stats = self.last_runs.get(("team_stats", league_id))
+                played = any(
+                    entry["finished"] and (last_stats is None or entry["kickoff"] > last_stats)
+                    for entry in calendar
+                )
+                ran_today = last_stats is not None and last_stats.astimezone().date() == now.astimezone().date()
+                if played and not ran_today:
+                    jobs.append({"resource": "team_stats", "league_id": league_id, "reason": "nightly"})
+
+        return jobs
+
+    def _is_due(self, key: tuple, now: datetime, interval: timedelta) -> bool:
+        """Check whether a resource has not been refreshed within an interval"""
+        last_run = self.last_runs.get(key)
+        return last_run is None or now - last_run >= interval
+
+    # Execution
+
+    def run_once(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Plan and run all due refreshes.
+
+        Args:
+            now: Current UTC time (defaults to now)
+
+        Returns:
+            list: The jobs that ran successfully
+        """
+        now = now or datetime.now(timezone.utc)
+        with self._run_lock:
+            jobs = self.plan(now)
+            if not jobs:
+                return []
+
+            done = []
+            for job in jobs:
+                if self._stop_event.is_set():
+                    break
+                try:
+                    start = time.perf_counter()
+                    self._run_job(job)
+                    self.last_runs[(job["resource"], job["league_id"])] = now
+                    done.append(job)
+                    logger.info(f"Refreshed {job['resource']} for league {job['league_id']} "
+                                f"({job['reason']}) in {time.perf_counter() - start:.1f}s")
+                except Exception as e:
+                    logger.error(f"Error refreshing {job['resource']} for league {job['league_id']}: {str(e)}")
+
+            self._save_state()
+            return done
+
+    def _run_job(self, job: Dict[str, Any]):
+        """Fetch one resource, bypassing and then replacing its cached entry"""
+        league_id = job["league_id"]
+        resource = job["resource"]
+
+        # Read the teams from the cached calendar before bypassing the cache
+        pairs = set()
+        if resource == "team_stats":
+            for entry in self.get_calendar(league_id):
+                pairs.add((league_id, entry["home_team_id"]))
+                pairs.add((league_id, entry["away_team_id"]))
+
+        with self.api.bypass_cache():
+            if resource == "fixtures":
+                fixtures = self.api.fetch_fixtures(league_id, force_fetch=True)
+                if fixtures:
+                    self.db_manager.save_fixtures(fixtures)
+            elif resource == "standings":
+                self.api.fetch_standings(league_id, force_fetch=True)
+            elif resource == "next_fixtures":
+                self.api.fetch_next_fixtures(league_id, force_fetch=True)
+            elif resource == "team_stats":
+                self.api.fetch_team_statistics_batch(pairs, force_fetch=True, refresh=True)
+
+    # State
+
+    def _load_state(self):
+        """Load last run times from the state file"""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            for entry in state.get("last_runs", []):
+                self.last_runs[(entry["resource"], entry["league_id"])] = datetime.fromisoformat(entry["time"])
+        except Exception as e:
+            logger.error(f"Error loading scheduler state: {str(e)}")
+
+    def _save_state(self):
+        """Write last run times to the state file"""
+        if not self.state_file:
+            return
+        try:
+            state = {"last_runs": [
+                {"resource": resource, "league_id": league_id, "time": run_time.isoformat()}
+                for (resource, league_id), run_time in self.last_runs.items()
+            ]}
+            # Write next to the target and swap it in, so a crash cannot leave a partial file
+            temp_path = f"{self.state_file}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            os.replace(temp_path, self.state_file)
+        except Exception as e:
+            logger.error(f"Error saving scheduler state: {str(e)}")
+
+
+def main():
+    """Run the scheduler in the foreground, persisting the API cache between passes"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    from modules.api_client import FootballAPI
+    from modules.config import API_KEY, BASE_URL
+    from modules.db_manager import DatabaseManager
+    from modules.settings_manager import SettingsManager
+
+    cache_file = "api_cache.json"
+    api = FootballAPI(API_KEY, BASE_URL, disable_auto_fetch=False)
+    api.load_cache(cache_file)
+    scheduler = RefreshScheduler(api, DatabaseManager("football_stats.db"), SettingsManager(),
+                                 state_file=SCHEDULER_STATE_FILE)
+
+    try:
+        while True:
+            if scheduler.run_once():
+                api.save_cache(cache_file)
+            time.sleep(scheduler.tick_seconds)
+    except KeyboardInterrupt:
+        logger.info("Refresh scheduler interrupted")
+        api.save_cache(cache_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,46 @@
-import json
-import os
 import logging
-from typing import Dict, List, Any, Optional
-import customtkinter as ctk
+from typing import Callable, Dict, Iterable, List, Any, Optional, Set
 
 from modules.config import DEFAULT_SETTINGS, THEMES, AVAILABLE_LANGUAGES
+from modules.lazy_imports import lazy_import
+from modules.settings_store import get_settings_store
 
 logger = logging.getLogger(__name__)
 
+# customtkinter is only needed to apply appearance settings, not for headless use
+ctk = lazy_import("customtkinter")
+
 class SettingsManager:
     def __init__(self, settings_file="settings.json"):
         self.settings_file = settings_file
-        self.settings = self._load_settings()
-        
-    def _load_settings(self) -> Dict[str, Any]:
-        """Load settings from file or use defaults"""
-        try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                logger.info(f"Settings loaded from {self.settings_file}")
-                return settings
-            else:
-                logger.info(f"Settings file {self.settings_file} not found using defaults")
-                return DEFAULT_SETTINGS.copy()
-        except Exception as e:
-            logger.error(f"Error loading settings: {str(e)}")
-            return DEFAULT_SETTINGS.copy()
-            
+        # Managers for the same file share one store
+        self.store = get_settings_store(settings_file)
+        
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Current settings, shared with other managers for the same file"""
+        return self.store.settings
+        
     def _save_settings(self) -> bool:
-        """Save settings to file"""
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
-            logger.info(f"Settings saved to {self.settings_file}")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving settings: {str(e)}")
-            return False
+        """Schedule a debounced save of the settings file"""
+        self.store.schedule_save()
+        return True
+        
+    def flush(self) -> bool:
+        """Write pending changes to the settings file now"""
+        return self.store.flush()
+        
+    def add_listener(self, callback: Callable[[Set[str]], None], keys: Optional[Iterable[str]] = None):
+        """Call a function with the changed keys when settings change (see notify_changes)"""
+        self.store.add_listener(callback, keys)
+        
+    def remove_listener(self, callback: Callable[[Set[str]], None]):
+        """Stop calling a function registered with add_listener"""
+        self.store.remove_listener(callback)
+        
+    def notify_changes(self) -> Set[str]:
+        """Notify listeners of the keys changed since the last call and return them"""
+        return self.store.notify_changes()
             
     def get_setting(self, key: str) -> Any:
         """Get a setting value"""
@@ -45,8 +48,8 @@ class SettingsManager:
         
     def set_setting(self, key: str, value: Any) -> bool:
         """Set a setting value"""
-        self.settings[key] = value
-        return self._save_settings()
+        self.store.set(key, value)
+        return True
         
     def get_leagues(self) -> List[int]:
         """Get selected leagues"""
@@ -68,6 +71,10 @@ class SettingsManager:
         """Get refresh interval in minutes"""
         return self.settings.get("refresh_interval", DEFAULT_SETTINGS.get("refresh_interval"))
         
+    def get_profiling(self) -> bool:
+        """Get whether long operations are profiled"""
+        return self.settings.get("profiling", DEFAULT_SETTINGS.get("profiling"))
+        
     def get_appearance_mode(self) -> str:
         """Get appearance mode"""
         return self.settings.get("appearance_mode", DEFAULT_SETTINGS.get("appearance_mode"))
@@ -96,8 +103,7 @@ class SettingsManager:
     def set_language(self, language_code: str) -> bool:
         """Set current language"""
         if language_code in AVAILABLE_LANGUAGES:
-            self.settings["language"] = language_code
-            return self._save_settings()
+            return self.set_setting("language", language_code)
         return False
         
     def get_available_languages(self) -> Dict[str, str]:
@@ -106,8 +112,8 @@ class SettingsManager:
         
     def reset_to_defaults(self) -> bool:
         """Reset settings to defaults"""
-        self.settings = DEFAULT_SETTINGS.copy()
-        return self._save_settings()
+        self.store.replace(DEFAULT_SETTINGS.copy())
+        return True
         
     def apply_appearance_settings(self):
         """Apply appearance settings to CustomTkinter"""
@@ -126,8 +132,7 @@ class SettingsManager:
         
     def save_firebase_config(self, config: Dict[str, str]) -> bool:
         """Save Firebase configuration"""
-        self.settings["firebase_config"] = config
-        return self._save_settings()
+        return self.set_setting("firebase_config", config)
         
     def get_firebase_credentials(self) -> Dict[str, str]:
         """Get saved Firebase credentials for auto-login"""
@@ -135,5 +140,4 @@ class SettingsManager:
         
     def save_firebase_credentials(self, credentials: Dict[str, str]) -> bool:
         """Save Firebase credentials for auto-login"""
-        self.settings["firebase_credentials"] = credentials
-        return self._save_settings()
+        return self.set_setting("firebase_credentials", credentials)
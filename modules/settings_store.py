@@ -0,0 +1,183 @@
+"""
+Shared, debounced store behind SettingsManager.
+
+Every SettingsManager for the same file shares one store, so a manager
+created by the login code never works from a stale copy of the settings.
+Changes are written by a background timer once they settle, a burst of
+set_setting() calls becomes a single write, and the file is replaced
+atomically so a crash mid-write cannot corrupt it.
+
+Changed keys are collected until notify_changes() is called (main does this
+when the Settings tab applies its changes), and each listener is called once
+with the changed keys it subscribed to.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from modules.config import DEFAULT_SETTINGS, SETTINGS_SAVE_DELAY, SETTINGS_SAVE_MAX_DELAY
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsStore:
+    """Settings dict with debounced atomic persistence and change listeners."""
+
+    def __init__(self, settings_file: str, save_delay: float = SETTINGS_SAVE_DELAY):
+        """Initialize the store and load the settings file"""
+        self.settings_file = settings_file
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty_since: Optional[float] = None
+        self._changed_keys: Set[str] = set()
+        self._listeners: List[Tuple[Callable[[Set[str]], None], Optional[Set[str]]]] = []
+        self.settings = self._load()
+        atexit.register(self.flush)
+
+    def _load(self) -> Dict[str, Any]:
+        """Load settings from file or use defaults"""
+        try:
+            if os.path.exists(self.settings_file):
+                with open(self.settings_file, 'r') as f:
+                    settings = json.load(f)
+                logger.info(f"Settings loaded from {self.settings_file}")
+                return settings
+            else:
+                logger.info(f"Settings file {self.settings_file} not found using defaults")
+                return DEFAULT_SETTINGS.copy()
+        except Exception as e:
+            logger.error(f"Error loading settings: {str(e)}")
+            return DEFAULT_SETTINGS.copy()
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        Change a setting and schedule a save.
+
+        Returns:
+            bool: True if the value changed
+        """
+        with self._lock:
+            current = self.settings.get(key)
+            # A list or dict may have been changed in place, so passing the same object counts as a change
+            mutated_in_place = current is value and isinstance(value, (dict, list, set))
+            if key in self.settings and current == value and not mutated_in_place:
+                return False
+            self.settings[key] = value
+            self._changed_keys.add(key)
+            self.schedule_save()
+            return True
+
+    def replace(self, settings: Dict[str, Any]):
+        """Replace all settings, e.g. when resetting to defaults"""
+        with self._lock:
+            for key in set(self.settings) | set(settings):
+                if self.settings.get(key) != settings.get(key):
+                    self._changed_keys.add(key)
+            self.settings.clear()
+            self.settings.update(settings)
+            self.schedule_save()
+
+    def schedule_save(self):
+        """Write the settings once changes have settled for save_delay seconds"""
+        with self._lock:
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            # Keep postponing during a burst, but not beyond the maximum delay
+            elif self._timer is not None and now - self._dirty_since >= SETTINGS_SAVE_MAX_DELAY:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.save_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes now"""
+        with self._write_lock:
+            return self._write()
+
+    def _write(self) -> bool:
+        """Write a snapshot of the settings; the caller holds the write lock"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty_since is None:
+                return True
+            self._dirty_since = None
+            snapshot = copy.deepcopy(self.settings)
+
+        try:
+            # Write next to the target and swap it in, so readers never see a partial file
+            temp_path = f"{self.settings_file}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(snapshot, f, indent=4)
+            os.replace(temp_path, self.settings_file)
+            logger.info(f"Settings saved to {self.settings_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving settings: {str(e)}")
+            with self._lock:
+                if self._dirty_since is None:
+                    self._dirty_since = time.monotonic()
+            return False
+
+    def add_listener(self, callback: Callable[[Set[str]], None], keys: Optional[Iterable[str]] = None):
+        """
+        Call a function when settings change.
+
+        Args:
+            callback: Called with the set of changed keys
+            keys: Only call it when one of these keys changed (all keys if None)
+        """
+        with self._lock:
+            self.remove_listener(callback)
+            self._listeners.append((callback, set(keys) if keys is not None else None))
+
+    def remove_listener(self, callback: Callable[[Set[str]], None]):
+        """Stop calling a function registered with add_listener"""
+        with self._lock:
+            self._listeners = [(listener, keys) for listener, keys in self._listeners if listener != callback]
+
+    def notify_changes(self) -> Set[str]:
+        """
+        Tell listeners about the keys changed since the last notification.
+
+        Returns:
+            set: The changed keys
+        """
+        with self._lock:
+            changed, self._changed_keys = self._changed_keys, set()
+            listeners = list(self._listeners)
+
+        if changed:
+            for callback, keys in listeners:
+                relevant = changed if keys is None else changed & keys
+                if relevant:
+                    try:
+                        callback(relevant)
+                    except Exception as e:
+                        logger.error(f"Error in settings listener: {str(e)}")
+        return changed
+
+
+_stores: Dict[str, SettingsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_settings_store(settings_file: str) -> SettingsStore:
+    """Get the shared store for a settings file, creating it the first time"""
+    path = os.path.abspath(settings_file)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = SettingsStore(settings_file)
+        return _stores[path]
@@ -0,0 +1,318 @@
+"""
+Streak analytics for the Winless tab.
+
+Fixtures are packed into compact numpy arrays with one entry per team and
+match, so current streaks for every team of every league are computed in a
+single vectorized pass instead of per-team Python loops.
+"""
+
+import logging
+import threading
+import time
+from datetime import date
+from typing import Dict, List, Any, Optional, Iterable
+
+import numpy as np
+
+from modules.config import ALL_LEAGUES
+from modules.instrumentation import timed
+from modules.league_names import get_league_display_name
+
+logger = logging.getLogger(__name__)
+
+# Streak types offered in the UI, in display order
+STREAK_TYPES = ["Winless", "Lossless", "Scoring", "Clean Sheet", "BTTS"]
+
+# Name of the match result that ends each streak type, for "Last ..." and "Days Since ..." headings
+STREAK_BREAKS = {
+    "Winless": "Win",
+    "Lossless": "Loss",
+    "Scoring": "Blank",
+    "Clean Sheet": "Goal Conceded",
+    "BTTS": "Non-BTTS"
+}
+
+
+class StreakEngine:
+    """Computes and caches current streaks per league."""
+
+    def __init__(self, api, cache_seconds: int = 900):
+        """
+        Initialize the engine.
+
+        Args:
+            api: FootballAPI client used to fetch fixtures
+            cache_seconds: How long computed streaks stay valid
+        """
+        self.api = api
+        self.cache_seconds = cache_seconds
+        self._cache: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_streaks(self, league_id: int, streak_type: str,
+                    league_ids: Optional[Iterable[int]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached streak rows for a league without fetching anything.
+
+        Args:
+            league_id: League ID, or ALL_LEAGUES
+            streak_type: One of STREAK_TYPES
+            league_ids: Leagues covered by ALL_LEAGUES, as passed to compute_league
+
+        Returns:
+            list: Streak rows sorted by streak length, or None if not cached
+        """
+        with self._lock:
+            entry = self._cache.get(league_id)
+        if entry is None or time.time() - entry["computed_at"] > self.cache_seconds:
+            return None
+        if league_id == ALL_LEAGUES and entry.get("league_ids") != self._league_key(league_ids):
+            return None
+        return entry["streaks"].get(streak_type, [])
+
+    @staticmethod
+    def _league_key(league_ids: Optional[Iterable[int]]) -> Optional[tuple]:
+        """Comparable form of the leagues covered by an ALL_LEAGUES scan"""
+        return tuple(sorted(set(league_ids))) if league_ids is not None else None
+
+    def compute_league(self, league_id: int, refresh: bool = False, force_fetch: bool = False,
+                       league_ids: Optional[Iterable[int]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Compute every streak type for a league, or for several leagues at once.
+
+        Args:
+            league_id: League ID, or ALL_LEAGUES to scan several leagues
+            refresh: Recompute even if a cached result is still valid
+            force_fetch: Fetch fixtures even when the API's auto-fetch is disabled
+            league_ids: Leagues scanned for ALL_LEAGUES (every known league if None)
+
+        Returns:
+            dict: Streak rows per streak type; empty if there are no fixtures
+        """
+        league_key = self._league_key(league_ids) if league_id == ALL_LEAGUES else None
+        if not refresh:
+            with self._lock:
+                entry = self._cache.get(league_id)
+            if entry is not None and time.time() - entry["computed_at"] <= self.cache_seconds \
+                    and entry.get("league_ids") == league_key:
+                return entry["streaks"]
+
+        if league_key is not None:
+            # Fetch the chosen leagues one by one, each served from its own fixtures cache
+            fixtures = []
+            for single_league in league_key:
+                fixtures.extend(self._fetch_fixtures(single_league, force_fetch))
+        else:
+            fixtures = self._fetch_fixtures(league_id, force_fetch)
+        if not fixtures:
+            return {}
+
+        start = time.perf_counter()
+        streaks = self.compute_streaks(fixtures)
+        logger.info(f"Computed streaks for league {league_id} from {len(fixtures)} fixtures "
+                    f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        computed_at = time.time()
+        with self._lock:
+            self._cache[league_id] = {"computed_at": computed_at, "streaks": streaks, "league_ids": league_key}
+
+            # A cross-league scan also fills the cache of each league it covered
+            if league_id == ALL_LEAGUES:
+                for single_league, single_streaks in self._split_by_league(streaks).items():
+                    self._cache[single_league] = {"computed_at": computed_at, "streaks": single_streaks}
+
+        return streaks
+
+    def _fetch_fixtures(self, league_id: int, force_fetch: bool) -> List[Dict[str, Any]]:
+        """Fetch a league's fixtures as a list"""
+        fixtures = self.api.fetch_fixtures(league_id, force_fetch=force_fetch)
+        if isinstance(fixtures, dict):
+            fixtures = fixtures.get('response', [])
+        return fixtures or []
+
+    def invalidate(self, league_id: Optional[int] = None):
+        """Forget cached streaks for one league, or for all leagues"""
+        with self._lock:
+            if league_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(league_id, None)
+
+    @staticmethod
+    def _split_by_league(streaks: Dict[str, List[Dict[str, Any]]]) -> Dict[int, Dict[str, List[Dict[str, Any]]]]:
+        """Split cross-league streak rows into per-league results"""
+        by_league = {}
+        for streak_type, rows in streaks.items():
+            for row in rows:
+                league_streaks = by_league.setdefault(row['league_id'], {name: [] for name in STREAK_TYPES})
+                league_streaks[streak_type].append(row)
+        return by_league
+
+    @staticmethod
+    def pack_fixtures(fixtures: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Pack API fixtures into compact arrays with one entry per team and match.
+
+        Args:
+            fixtures: Fixtures in API-Football format
+
+        Returns:
+            dict: Arrays "league", "team", "opponent", "goals_for", "goals_against",
+                "day", "finished" and "home", plus a "names" dict of team names
+        """
+        leagues, homes, aways, home_goals, away_goals, days, finished = [], [], [], [], [], [], []
+        names = {}
+
+        for fixture in fixtures:
+            try:
+                fixture_date = fixture['fixture']['date'][:10]  # YYYY-MM-DD
+                home = fixture['teams']['home']
+                away = fixture['teams']['away']
+                goals = fixture.get('goals') or {}
+                status = fixture['fixture']['status']['short']
+                league_id = fixture['league']['id']
+            except (KeyError, TypeError):
+                continue
+            if len(fixture_date) != 10:
+                continue
+
+            names[home['id']] = home['name']
+            names[away['id']] = away['name']
+
+            is_finished = status == 'FT' and goals.get('home') is not None and goals.get('away') is not None
+            leagues.append(league_id)
+            homes.append(home['id'])
+            aways.append(away['id'])
+            home_goals.append(goals['home'] if is_finished else -1)
+            away_goals.append(goals['away'] if is_finished else -1)
+            days.append(fixture_date)
+            finished.append(is_finished)
+
+        # Each fixture appears twice: once from the home side, once from the away side
+        league = np.array(leagues, dtype=np.int64)
+        home = np.array(homes, dtype=np.int64)
+        away = np.array(aways, dtype=np.int64)
+        hg = np.array(home_goals, dtype=np.int16)
+        ag = np.array(away_goals, dtype=np.int16)
+        day = np.array(days, dtype='datetime64[D]')
+        done = np.array(finished, dtype=bool)
+        count = len(league)
+
+        return {
+            "league": np.concatenate([league, league]),
+            "team": np.concatenate([home, away]),
+            "opponent": np.concatenate([away, home]),
+            "goals_for": np.concatenate([hg, ag]),
+            "goals_against": np.concatenate([ag, hg]),
+            "day": np.concatenate([day, day]),
+            "finished": np.concatenate([done, done]),
+            "home": np.concatenate([np.ones(count, dtype=bool), np.zeros(count, dtype=bool)]),
+            "names": names
+        }
+
+    @staticmethod
+    @timed("streaks.compute_streaks")
+    def compute_streaks(fixtures: Iterable[Dict[str, Any]], today: Optional[date] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Compute the current streak of every type for every (league, team).
+
+        Args:
+            fixtures: Fixtures in API-Football format
+            today: Reference date for "days since" and upcoming fixtures
+
+        Returns:
+            dict: Rows per streak type, sorted by streak length (longest first).
+                Only teams with a current streak are included.
+        """
+        streaks = {name: [] for name in STREAK_TYPES}
+        packed = StreakEngine.pack_fixtures(fixtures)
+        names = packed["names"]
+        today = np.datetime64(today or date.today(), 'D')
+
+        # Order played matches by league, team, then newest first
+        played = np.flatnonzero(packed["finished"])
+        if len(played) == 0:
+            return streaks
+        day_numbers = packed["day"].astype(np.int64)
+        order = played[np.lexsort((-day_numbers[played], packed["team"][played], packed["league"][played]))]
+
+        league = packed["league"][order]
+        team = packed["team"][order]
+        goals_for = packed["goals_for"][order]
+        goals_against = packed["goals_against"][order]
+        day = packed["day"][order]
+
+        # Group boundaries and each match's position within its group
+        new_group = np.ones(len(order), dtype=bool)
+        new_group[1:] = (team[1:] != team[:-1]) | (league[1:] != league[:-1])
+        starts = np.flatnonzero(new_group)
+        sizes = np.diff(np.append(starts, len(order)))
+        position = np.arange(len(order)) - np.repeat(starts, sizes)
+        group_size = np.repeat(sizes, sizes)
+
+        # Per-match condition that keeps each streak alive
+        alive_by_type = {
+            "Winless": goals_for <= goals_against,
+            "Lossless": goals_for >= goals_against,
+            "Scoring": goals_for > 0,
+            "Clean Sheet": goals_against == 0,
+            "BTTS": (goals_for > 0) & (goals_against > 0)
+        }
+
+        next_fixtures = StreakEngine._next_fixtures(packed, today)
+        group_leagues = league[starts].tolist()
+        group_teams = team[starts].tolist()
+
+        for streak_type, alive in alive_by_type.items():
+            # The streak ends at the first match (newest first) that breaks it
+            lengths = np.minimum.reduceat(np.where(alive, group_size, position), starts)
+            broken = lengths < sizes
+            break_index = starts + np.minimum(lengths, sizes - 1)
+            break_days = day[break_index]
+            days_since = (today - break_days).astype(np.int64)
+
+            rows = streaks[streak_type]
+            for i in np.flatnonzero(lengths > 0).tolist():
+                league_id = group_leagues[i]
+                team_id = group_teams[i]
+                next_fixture = next_fixtures.get((league_id, team_id))
+                rows.append({
+                    'team': names.get(team_id, str(team_id)),
+                    'team_id': team_id,
+                    'league_id': league_id,
+                    'league': get_league_display_name(league_id),
+                    'streak': int(lengths[i]),
+                    'last_win': str(break_days[i]) if broken[i] else 'Never',
+                    'days_since_win': int(days_since[i]) if broken[i] else 0,
+                    'next_opponent': next_fixture['opponent'] if next_fixture else 'None scheduled',
+                    'match_date': next_fixture['date'] if next_fixture else 'N/A',
+                    'venue': next_fixture['venue'] if next_fixture else 'N/A'
+                })
+            rows.sort(key=lambda row: row['streak'], reverse=True)
+
+        return streaks
+
+    @staticmethod
+    def _next_fixtures(packed: Dict[str, Any], today) -> Dict[tuple, Dict[str, Any]]:
+        """Find each (league, team)'s earliest unplayed fixture from today on"""
+        upcoming = np.flatnonzero(~packed["finished"] & (packed["day"] >= today))
+        if len(upcoming) == 0:
+            return {}
+        order = upcoming[np.lexsort((packed["day"][upcoming].astype(np.int64),
+                                     packed["team"][upcoming], packed["league"][upcoming]))]
+
+        league = packed["league"][order]
+        team = packed["team"][order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (team[1:] != team[:-1]) | (league[1:] != league[:-1])
+
+        names = packed["names"]
+        next_fixtures = {}
+        for index in order[first].tolist():
+            opponent = int(packed["opponent"][index])
+            next_fixtures[(int(packed["league"][index]), int(packed["team"][index]))] = {
+                'opponent': names.get(opponent, str(opponent)),
+                'date': str(packed["day"][index]),
+                'venue': 'Home' if packed["home"][index] else 'Away'
+            }
+        return next_fixtures
@@ -0,0 +1,374 @@
+"""
+Synthetic season generator for scale testing.
+
+Produces API-Sports-shaped fixtures and standings, plus database rows, for
+N leagues x M teams x K seasons. Scores are drawn from Poisson distributions
+driven by per-team attack and defence strengths with a home advantage, which
+gives realistic goal averages, draw rates and table spreads. Output is fully
+deterministic for a given seed.
+
+The data feeds the replay transport (write_cassette), the database layer
+(populate_db) and the benchmarks.
+"""
+
+import math
+import random
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Any, Tuple
+
+from modules.api_transport import save_cassette, interaction_key
+from modules.config import PREDICTION_THRESHOLD_LEVEL2
+
+# Synthetic IDs start well above real API-Sports IDs so the two never collide
+LEAGUE_ID_BASE = 900000
+TEAM_ID_BASE = 90000000
+FIXTURE_ID_BASE = 900000000
+
+# Goals per team per match before strengths and home advantage
+BASE_GOAL_RATE = 1.25
+HOME_ADVANTAGE = 1.15
+
+# Kickoff slots (weekday offset from Saturday, UTC time)
+KICKOFF_SLOTS = [(0, "12:30"), (0, "15:00"), (0, "17:30"), (1, "14:00"), (1, "16:30"), (2, "20:00")]
+
+PLACE_NAMES = [
+    "North", "South", "East", "West", "Port", "Lake", "River", "Stone", "Oak", "Iron",
+    "Green", "Red", "White", "Black", "Silver", "Bright", "Kings", "Queens", "Castle", "Mill"
+]
+PLACE_SUFFIXES = ["ton", "field", "bridge", "ford", "burgh", "wick", "vale", "mouth", "dale", "haven"]
+CLUB_SUFFIXES = ["United", "City", "Athletic", "Rovers", "Town", "FC", "Wanderers", "Albion", "Sporting", "Olympic"]
+
+
+class SyntheticSeasonGenerator:
+    """Generates leagues, teams, fixtures and standings from a seed."""
+
+    def __init__(self, leagues: int = 5, teams_per_league: int = 20, seasons: int = 1, seed: int = 0,
+                 current_season: int = 2025, played_fraction: float = 0.6):
+        """
+        Initialize the generator and build the league and team structure.
+
+        Args:
+            leagues: Number of leagues
+            teams_per_league: Teams in each league (odd counts get a bye each round)
+            seasons: Number of seasons, ending with current_season
+            seed: Random seed; the same arguments always produce the same data
+            current_season: Season year of the latest season
+            played_fraction: Share of rounds already played in the current season;
+                earlier seasons are complete
+        """
+        self.seed = seed
+        self.current_season = current_season
+        self.seasons = [current_season - offset for offset in range(seasons - 1, -1, -1)]
+        self.played_fraction = played_fraction
+
+        rng = random.Random(seed)
+        self.leagues: List[Dict[str, Any]] = []
+        self.teams: Dict[int, List[Dict[str, Any]]] = {}
+        for league_index in range(leagues):
+            league_id = LEAGUE_ID_BASE + league_index + 1
+            self.leagues.append({
+                "id": league_id,
+                "name": f"Synthetic League {league_index + 1}",
+                "country": "Synthetic",
+                "flag": ""
+            })
+            names = set()
+            teams = []
+            for team_index in range(teams_per_league):
+                name = self._team_name(rng, names)
+                teams.append({
+                    "id": TEAM_ID_BASE + league_index * 1000 + team_index + 1,
+                    "name": name,
+                    "league_id": league_id,
+                    # Strengths are multiplicative around 1.0
+                    "attack": math.exp(rng.gauss(0, 0.2)),
+                    "defence": math.exp(rng.gauss(0, 0.2))
+                })
+            self.teams[league_id] = teams
+
+        self._fixtures: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+
+    @staticmethod
+    def _team_name(rng: random.Random, used: set) -> str:
+        """Draw a club name that is unique within a league"""
+        while True:
+            name = f"{rng.choice(PLACE_NAMES)}{rng.choice(PLACE_SUFFIXES)} {rng.choice(CLUB_SUFFIXES)}"
+            if name not in used:
+                used.add(name)
+                return name
+
+    @staticmethod
+    def _poisson(rng: random.Random, rate: float) -> int:
+        """Draw a Poisson-distributed goal count"""
+        limit = math.exp(-rate)
+        goals = 0
+        product = rng.random()
+        while product > limit:
+            goals += 1
+            product *= rng.random()
+        return goals
+
+    @staticmethod
+    def _round_robin(team_ids: List[int]) -> List[List[Tuple[int, int]]]:
+        """Double round-robin schedule using the circle method"""
+        ids = list(team_ids)
+        if len(ids) % 2:
+            ids.append(None)
+        count = len(ids)
+        first_half = []
+        for round_index in range(count - 1):
+            pairs = []
+            for i in range(count // 2):
+                home, away = ids[i], ids[count - 1 - i]
+                if home is None or away is None:
+                    continue
+                # Alternate home and away so no team is always at home
+                pairs.append((home, away) if (round_index + i) % 2 == 0 else (away, home))
+            first_half.append(pairs)
+            ids = [ids[0]] + [ids[-1]] + ids[1:-1]
+        second_half = [[(away, home) for home, away in pairs] for pairs in first_half]
+        return first_half + second_half
+
+    def fixtures(self, league_id: int, season: int) -> List[Dict[str, Any]]:
+        """
+        Get a league season's fixtures in API-Sports format.
+
+        Returns:
+            list: Fixtures ordered by kickoff; played ones have status FT and goals
+        """
+        key = (league_id, season)
+        if key in self._fixtures:
+            return self._fixtures[key]
+
+        # Each league season has its own random stream, so results do not
+        # depend on which other leagues or seasons are generated
+        rng = random.Random(f"{self.seed}-{league_id}-{season}")
+        league = next(l for l in self.leagues if l["id"] == league_id)
+        teams = {team["id"]: team for team in self.teams[league_id]}
+        rounds = self._round_robin(list(teams))
+        played_rounds = len(rounds) if season != self.current_season else int(len(rounds) * self.played_fraction)
+
+        # Seasons start on the second Saturday of August
+        season_start = date(season, 8, 1)
+        season_start += timedelta(days=(5 - season_start.weekday()) % 7 + 7)
+
+        league_index = league_id - LEAGUE_ID_BASE
+        season_index = season - self.seasons[0]
+        fixture_id = FIXTURE_ID_BASE + (league_index * 100 + season_index) * 10000
+
+        fixtures = []
+        for round_index, pairs in enumerate(rounds):
+            round_start = season_start + timedelta(weeks=round_index)
+            for home_id, away_id in pairs:
+                fixture_id += 1
+                day_offset, kickoff_time = rng.choice(KICKOFF_SLOTS)
+                hour, minute = map(int, kickoff_time.split(":"))
+                kickoff = datetime.combine(round_start + timedelta(days=day_offset), datetime.min.time(),
+                                           tzinfo=timezone.utc).replace(hour=hour, minute=minute)
+
+                home, away = teams[home_id], teams[away_id]
+                home_rate = BASE_GOAL_RATE * HOME_ADVANTAGE * home["attack"] / away["defence"]
+                away_rate = BASE_GOAL_RATE * away["attack"] / home["defence"]
+                home_goals = self._poisson(rng, home_rate)
+                away_goals = self._poisson(rng, away_rate)
+                played = round_index < played_rounds
+
+                fixtures.append({
+                    "fixture": {
+                        "id": fixture_id,
+                        "date": kickoff.isoformat(),
+                        "timestamp": int(kickoff.timestamp()),
+                        "venue": {"id": home_id, "name": f"{home['name']} Stadium"},
+                        "status": {"long": "Match Finished", "short": "FT"} if played
+                        else {"long": "Not Started", "short": "NS"}
+                    },
+                    "league": {
+                        "id": league_id,
+                        "name": league["name"],
+                        "country": league["country"],
+                        "season": season,
+                        "round": f"Regular Season - {round_index + 1}"
+                    },
+                    "teams": {
+                        "home": {"id": home_id, "name": home["name"],
+                                 "winner": (home_goals > away_goals if home_goals != away_goals else None) if played else None},
+                        "away": {"id": away_id, "name": away["name"],
+                                 "winner": (away_goals > home_goals if home_goals != away_goals else None) if played else None}
+                    },
+                    "goals": {"home": home_goals if played else None, "away": away_goals if played else None}
+                })
+
+        fixtures.sort(key=lambda fixture: fixture["fixture"]["timestamp"])
+        self._fixtures[key] = fixtures
+        return fixtures
+
+    def standings(self, league_id: int, season: int) -> List[Dict[str, Any]]:
+        """
+        Get a league season's table in API-Sports format, from played fixtures.
+
+        Returns:
+            list: Standings entries ordered by rank
+        """
+        table = {
+            team["id"]: {"team": team, "played": 0, "win": 0, "draw": 0, "lose": 0,
+                         "for": 0, "against": 0, "results": []}
+            for team in self.teams[league_id]
+        }
+
+        for fixture in self.fixtures(league_id, season):
+            home_goals, away_goals = fixture["goals"]["home"], fixture["goals"]["away"]
+            if home_goals is None:
+                continue
+            for side, goals_for, goals_against in (("home", home_goals, away_goals), ("away", away_goals, home_goals)):
+                row = table[fixture["teams"][side]["id"]]
+                row["played"] += 1
+                row["for"] += goals_for
+                row["against"] += goals_against
+                if goals_for > goals_against:
+                    row["win"] += 1
+                    row["results"].append("W")
+                elif goals_for < goals_against:
+                    row["lose"] += 1
+                    row["results"].append("L")
+                else:
+                    row["draw"] += 1
+                    row["results"].append("D")
+
+        rows = sorted(
+            table.values(),
+            key=lambda row: (-(row["win"] * 3 + row["draw"]), -(row["for"] - row["against"]), -row["for"], row["team"]["name"])
+        )
+
+        league = next(l for l in self.leagues if l["id"] == league_id)
+        standings = []
+        for rank, row in enumerate(rows, start=1):
+            standings.append({
+                "rank": rank,
+                "team": {"id": row["team"]["id"], "name": row["team"]["name"]},
+                "points": row["win"] * 3 + row["draw"],
+                "goalsDiff": row["for"] - row["against"],
+                "group": league["name"],
+                "form": "".join(row["results"][-5:]),
+                "all": {
+                    "played": row["played"],
+                    "win": row["win"],
+                    "draw": row["draw"],
+                    "lose": row["lose"],
+                    "goals": {"for": row["for"], "against": row["against"]}
+                },
+                "league": {"id": league_id}
+            })
+        return standings
+
+    def standings_response(self, league_id: int, season: int) -> Dict[str, Any]:
+        """Wrap a table in the /standings response envelope"""
+        league = next(l for l in self.leagues if l["id"] == league_id)
+        return {
+            "get": "standings",
+            "results": 1,
+            "response": [{"league": {
+                "id": league_id,
+                "name": league["name"],
+                "country": league["country"],
+                "season": season,
+                "standings": [self.standings(league_id, season)]
+            }}]
+        }
+
+    def predictions(self, league_id: int, per_round: int = 2) -> List[Dict[str, Any]]:
+        """
+        Get prediction rows for the current season in the database save format.
+
+        Each round, the teams whose last five results differ most from their
+        season points per game get a prediction, as in the Form Analysis tab.
+        """
+        rng = random.Random(f"{self.seed}-{league_id}-predictions")
+        league = next(l for l in self.leagues if l["id"] == league_id)
+        names = {team["id"]: team["name"] for team in self.teams[league_id]}
+
+        by_round: Dict[str, List[Dict[str, Any]]] = {}
+        for fixture in self.fixtures(league_id, self.current_season):
+            by_round.setdefault(fixture["league"]["round"], []).append(fixture)
+
+        rows = []
+        for fixtures in by_round.values():
+            for fixture in rng.sample(fixtures, min(per_round, len(fixtures))):
+                side = rng.choice(("home", "away"))
+                team_id = fixture["teams"][side]["id"]
+                opponent_id = fixture["teams"]["away" if side == "home" else "home"]["id"]
+                performance_diff = round(rng.choice((-1, 1)) * rng.uniform(0.76, 1.6), 2)
+                level = 2 if abs(performance_diff) >= PREDICTION_THRESHOLD_LEVEL2 else 1
+                if performance_diff > 0:
+                    prediction = "VEĽKÁ PREHRA S" if level == 2 else "PREHRA s"
+                else:
+                    prediction = "VEĽKÁ VÝHRA s" if level == 2 else "VÝHRA s"
+                rows.append({
+                    "team_id": team_id,
+                    "team_name": names[team_id],
+                    "league_id": league_id,
+                    "league_name": league["name"],
+                    "fixture_id": fixture["fixture"]["id"],
+                    "opponent_id": opponent_id,
+                    "opponent_name": names[opponent_id],
+                    "match_date": fixture["fixture"]["date"][:10],
+                    "venue": "Home" if side == "home" else "Away",
+                    "performance_diff": performance_diff,
+                    "prediction": prediction,
+                    "prediction_level": level
+                })
+        return rows
+
+    def all_fixtures(self) -> List[Dict[str, Any]]:
+        """Get every fixture of every league and season"""
+        return [fixture for league in self.leagues for season in self.seasons
+                for fixture in self.fixtures(league["id"], season)]
+
+    def write_cassette(self, path: str, base_url: str):
+        """
+        Write current-season responses as a replay cassette.
+
+        Requests match the ones FootballAPI sends for standings, fixtures and
+        the next round, so ReplayTransport can serve the app and benchmarks.
+        """
+        interactions = {}
+
+        def add(url, params, body):
+            interactions[interaction_key(url, params)] = [{
+                "url": url, "params": params, "status_code": 200, "elapsed": 0.0, "body": body
+            }]
+
+        season = self.current_season
+        for league in self.leagues:
+            league_id = league["id"]
+            fixtures = self.fixtures(league_id, season)
+            upcoming = [fixture for fixture in fixtures if fixture["goals"]["home"] is None][:10]
+
+            add(f"{base_url}/standings", {"league": league_id, "season": season},
+                self.standings_response(league_id, season))
+            add(f"{base_url}/fixtures", {"league": league_id, "season": str(season)},
+                {"get": "fixtures", "results": len(fixtures), "response": fixtures})
+            add(f"{base_url}/fixtures", {"league": league_id, "season": str(season), "next": 10},
+                {"get": "fixtures", "results": len(upcoming), "response": upcoming})
+
+        save_cassette(path, interactions)
+
+    def populate_db(self, db_manager, predictions_per_round: int = 2) -> Dict[str, int]:
+        """
+        Save teams, fixtures of all seasons, current standings and predictions.
+
+        Returns:
+            dict: Rows saved per table
+        """
+        teams = [{"team": {"id": team["id"], "name": team["name"]}, "league": {"id": team["league_id"]}}
+                 for league in self.leagues for team in self.teams[league["id"]]]
+        standings = [entry for league in self.leagues
+                     for entry in self.standings(league["id"], self.current_season)]
+        predictions = [row for league in self.leagues
+                       for row in self.predictions(league["id"], predictions_per_round)]
+
+        return {
+            "teams": db_manager.save_teams(teams),
+            "fixtures": db_manager.save_fixtures(self.all_fixtures()),
+            "standings": db_manager.save_standings(standings),
+            "predictions": db_manager.save_predictions(predictions)
+        }
@@ -8,18 +8,48 @@ from tkinter import ttk
 from typing import Dict, List, Any, Callable, Optional
 import re
 import locale
-from datetime import datetime
+from datetime import datetime, timezone
+
+from modules.instrumentation import timed
 
 logger = logging.getLogger(__name__)
 
 class TableSorter:
     """Utility class for making Treeview tables sortable by column."""
     
-    def __init__(self, treeview: ttk.Treeview):
-        """Initialize the sorter with a treeview widget."""
+    # Number of non-empty cells inspected when inferring a column type
+    TYPE_SAMPLE_SIZE = 25
+    
+    # Cell values treated as empty when inferring types
+    EMPTY_VALUES = ("", "-", "n/a")
+    
+    # Schema type names accepted from column configs, mapped to sort types
+    TYPE_ALIASES = {
+        "number": "number",
+        "numeric": "number",
+        "int": "number",
+        "float": "number",
+        "date": "date",
+        "datetime": "date",
+        "string": "string",
+        "text": "string"
+    }
+    
+    def __init__(self, treeview: ttk.Treeview, column_types: Optional[Dict[str, str]] = None):
+        """
+        Initialize the sorter with a treeview widget.
+        
+        Args:
+            treeview: The treeview to sort
+            column_types: Optional schema mapping column IDs to "number", "date" or "string".
+                Columns without an entry have their type inferred once per data load.
+        """
         self.treeview = treeview
         self.sort_column = None
         self.sort_reverse = False
+        # True once the user picked a sort by clicking a heading
+        self.user_sorted = False
+        self.column_schema = self._normalize_schema(column_types or {})
         self.date_formats = [
             "%Y-%m-%d %H:%M:%S",
             "%Y-%m-%d %H:%M",
@@ -29,17 +59,39 @@ class TableSorter:
             "%d/%m/%Y"
         ]
         
+        # Inferred column types, valid for one version of the row model
+        self._column_types = {}
+        self._types_version = None
+        
+        # Last date format that matched, per column
+        self._date_format_hints = {}
+        
         # Bind header click event
         self.treeview.bind("<ButtonRelease-1>", self._header_click)
         
         # Create a dictionary mapping column IDs to their display text
+        self._columns = ()
         self.column_names = {}
-        for col in self.treeview["columns"]:
-            self.column_names[col] = self.treeview.heading(col, "text")
+        self._sync_columns()
         
         # Add sort indicators to headings
         self._update_headings()
     
+    def set_column_types(self, column_types: Dict[str, str]):
+        """Set the type of one or more columns, overriding inference."""
+        self.column_schema.update(self._normalize_schema(column_types))
+    
+    def _normalize_schema(self, column_types: Dict[str, str]) -> Dict[str, str]:
+        """Map schema type names to sort types, leaving unknown types to inference."""
+        schema = {}
+        for column, value_type in column_types.items():
+            sort_type = self.TYPE_ALIASES.get(str(value_type).lower())
+            if sort_type is None:
+                logger.debug(f"Unknown column type {value_type!r} for {column}, inferring it instead")
+                continue
+            schema[column] = sort_type
+        return schema
+    
     def _header_click(self, event):
         """Handle header click event."""
         region = self.treeview.identify_region(event.x, event.y)
@@ -54,49 +106,173 @@ class TableSorter:
             else:
                 self.sort_column = column_id
                 self.sort_reverse = False
+            self.user_sorted = True
             
             # Sort the treeview
             self.sort_by_column(column_id, self.sort_reverse)
     
+    @timed("table.sort_by_column")
     def sort_by_column(self, column: str, reverse: bool = False):
         """Sort treeview by a specific column."""
         try:
-            # Save current selection
-            selected_items = self.treeview.selection()
-            
-            # Get all items
-            items = [(self.treeview.set(item, column), item) for item in self.treeview.get_children("")]
-            
-            # Determine value type for sorting
-            if items:
-                value_type = self._determine_value_type(items[0][0])
-                
-                # Sort based on value type
-                if value_type == "number":
-                    # Sort numerically
-                    items.sort(key=lambda x: self._safe_float(x[0]), reverse=reverse)
-                elif value_type == "date":
-                    # Sort dates
-                    items.sort(key=lambda x: self._parse_date(x[0]), reverse=reverse)
-                else:
-                    # Default sort (case-insensitive string)
-                    items.sort(key=lambda x: locale.strxfrm(str(x[0]).lower()), reverse=reverse)
+            self._sync_columns()
             
-            # Rearrange items
-            for index, (_, item) in enumerate(items):
-                self.treeview.move(item, "", index)
+            # Resolve numeric indexes to column IDs
+            column_id = self._column_id(column)
+            if column_id is None:
+                logger.warning(f"Cannot sort by unknown column: {column}")
+                return
+            index = self._columns.index(column_id)
             
-            # Restore selection
-            self.treeview.selection_set(selected_items)
+            virtual = getattr(self.treeview, "virtual", None)
+            if virtual is not None and virtual.active:
+                # Sort the backing model on precomputed keys and re-render once
+                self._invalidate_types(virtual.version)
+                rows = virtual.get_rows()
+                key_id = self._ensure_sort_keys(rows, column_id, index)
+                virtual.sort(lambda row: row["sort_keys"][key_id], reverse=reverse)
+            else:
+                self._sort_items(column_id, index, reverse)
             
             # Update headings with sort indicators
-            self.sort_column = column
+            self.sort_column = column_id
             self.sort_reverse = reverse
             self._update_headings()
             
         except Exception as e:
             logger.error(f"Error sorting table: {str(e)}")
     
+    def _sort_items(self, column_id: str, index: int, reverse: bool = False):
+        """Sort a plain (non-virtual) treeview by moving its items."""
+        # Save current selection
+        selected_items = self.treeview.selection()
+        
+        # Read every row once
+        children = self.treeview.get_children("")
+        rows = []
+        for item in children:
+            values = self.treeview.item(item, "values")
+            rows.append({"item": item, "values": values})
+        
+        # The item list is rebuilt on every call, so use a fresh type cache
+        self._invalidate_types(None)
+        key_id = self._ensure_sort_keys(rows, column_id, index)
+        rows.sort(key=lambda row: row["sort_keys"][key_id], reverse=reverse)
+        
+        # Move only when the order actually changed
+        ordered = [row["item"] for row in rows]
+        if ordered != list(children):
+            for position, item in enumerate(ordered):
+                self.treeview.move(item, "", position)
+        
+        # Restore selection
+        self.treeview.selection_set(selected_items)
+    
+    def _ensure_sort_keys(self, rows: List[Dict[str, Any]], column_id: str, index: int):
+        """
+        Compute the sort key of a column for every row that does not have one yet.
+        
+        Keys are stored on the row dictionaries, so they are computed once per
+        data load and re-used by every later sort on the same column.
+        
+        Args:
+            rows: Row dictionaries with a "values" tuple
+            column_id: The column ID
+            index: Position of the column in the values
+            
+        Returns:
+            tuple: The key under which the sort keys are stored in row["sort_keys"]
+        """
+        value_type = self._get_column_type(rows, column_id, index)
+        key_id = (column_id, value_type)
+        
+        for row in rows:
+            keys = row.get("sort_keys")
+            if keys is None:
+                keys = row["sort_keys"] = {}
+            if key_id not in keys:
+                values = row["values"]
+                value = values[index] if index < len(values) else ""
+                keys[key_id] = self._make_sort_key(value, value_type, column_id)
+        
+        return key_id
+    
+    def _get_column_type(self, rows: List[Dict[str, Any]], column_id: str, index: int) -> str:
+        """Get the column type from the schema or the cached inference."""
+        if column_id in self.column_schema:
+            return self.column_schema[column_id]
+        
+        if column_id not in self._column_types:
+            # Infer from a sample of non-empty cells instead of the first row only
+            sample = []
+            for row in rows:
+                values = row["values"]
+                value = values[index] if index < len(values) else ""
+                if str(value).strip().lower() not in self.EMPTY_VALUES:
+                    sample.append(value)
+                    if len(sample) >= self.TYPE_SAMPLE_SIZE:
+                        break
+            self._column_types[column_id] = self._infer_column_type(sample)
+        
+        return self._column_types[column_id]
+    
+    def _infer_column_type(self, sample: List[Any]) -> str:
+        """Infer a column type that fits every value in the sample."""
+        if not sample:
+            return "string"
+        
+        types = set(self._determine_value_type(value) for value in sample)
+        if len(types) == 1:
+            return types.pop()
+        return "string"
+    
+    def _invalidate_types(self, version):
+        """Forget inferred column types when the row model changes."""
+        if version is None or version != self._types_version:
+            self._column_types = {}
+            self._types_version = version
+    
+    def _make_sort_key(self, value: Any, value_type: str, column_id: str = None):
+        """Build the comparable sort key for a cell value."""
+        if value_type == "number":
+            return self._safe_float(value)
+        if value_type == "date":
+            return self._parse_date(str(value).strip(), column_id)
+        # Default sort (case-insensitive, locale aware string)
+        return locale.strxfrm(str(value).lower())
+    
+    def _sync_columns(self):
+        """Refresh column names and caches if the treeview's columns changed."""
+        columns = tuple(self.treeview["columns"])
+        if columns == self._columns:
+            return
+        
+        self._columns = columns
+        self.column_names = {}
+        for col in columns:
+            self.column_names[col] = self.treeview.heading(col, "text").rstrip("▲▼ ")
+        self._column_types = {}
+        self._date_format_hints = {}
+        if self.sort_column not in columns:
+            self.sort_column = None
+    
+    def _column_id(self, column: str) -> Optional[str]:
+        """Map a column identifier or numeric index to a column ID."""
+        if column in self._columns:
+            return column
+        if str(column).isdigit() and int(column) < len(self._columns):
+            return self._columns[int(column)]
+        return None
+    
+    def set_heading(self, column: str, text: str):
+        """Change a column's heading text, keeping its sort indicator."""
+        self._sync_columns()
+        column_id = self._column_id(column)
+        if column_id is None:
+            return
+        self.column_names[column_id] = text
+        self._update_headings()
+    
     def _update_headings(self):
         """Update column headings with sort indicators."""
         # Reset all headings
@@ -105,7 +281,7 @@ class TableSorter:
             self.treeview.heading(col, text=original_text)
         
         # Add sort indicator to the sorted column
-        if self.sort_column:
+        if self.sort_column and self.sort_column in self.column_names:
             original_text = self.column_names.get(self.sort_column, self.sort_column)
             indicator = " ▼" if self.sort_reverse else " ▲"
             self.treeview.heading(self.sort_column, text=f"{original_text}{indicator}")
@@ -123,7 +299,7 @@ class TableSorter:
             return "string"
             
         # Check if value is a number as string
-        if re.match(r'^-?\d+(\.\d+)?$', value_str):
+        if re.match(r'^[-+]?\d+(\.\d+)?%?$', value_str):
             return "number"
             
         # Check if value is a date
@@ -135,22 +311,38 @@ class TableSorter:
     
     def _is_date(self, value_str: str) -> bool:
         """Check if a string is a date."""
-        for date_format in self.date_formats:
-            try:
-                datetime.strptime(value_str, date_format)
-                return True
-            except ValueError:
-                continue
-        return False
+        return self._parse_date(value_str) != datetime.min
     
-    def _parse_date(self, date_str: str) -> datetime:
+    def _parse_date(self, date_str: str, column_id: str = None) -> datetime:
         """Parse a date string to datetime object."""
         if not date_str or date_str == "-" or date_str.lower() == "n/a":
             return datetime.min
+
+        # ISO dates (the common case) parse much faster without strptime
+        if date_str[:4].isdigit():
+            try:
+                parsed = datetime.fromisoformat(date_str)
+                # Compare offset dates as naive UTC so they sort alongside naive ones
+                if parsed.tzinfo is not None:
+                    parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+                return parsed
+            except ValueError:
+                pass
+
+        # Try the format that matched last time for this column first
+        hint = self._date_format_hints.get(column_id)
+        if hint:
+            try:
+                return datetime.strptime(date_str, hint)
+            except ValueError:
+                pass
             
         for date_format in self.date_formats:
             try:
-                return datetime.strptime(date_str, date_format)
+                parsed = datetime.strptime(date_str, date_format)
+                if column_id is not None:
+                    self._date_format_hints[column_id] = date_format
+                return parsed
             except ValueError:
                 continue
                 
@@ -170,10 +362,11 @@ class TableSorter:
         """Reset the sort order."""
         self.sort_column = None
         self.sort_reverse = False
+        self.user_sorted = False
         self._update_headings()
     
     def apply_initial_sort(self, column: str, reverse: bool = False):
         """Apply an initial sort to the table."""
         self.sort_column = column
         self.sort_reverse = reverse
-        self.sort_by_column(column, reverse)
\ No newline at end of file
+        self.sort_by_column(column, reverse)
@@ -4,7 +4,10 @@ This is a backward compatibility module that imports from the new translations p
 """
 
 # Import from the new translations package
-from modules.translations import translate, set_language, get_language, get_available_languages, format_translated
+from modules.translations import (
+    translate, translate_many, set_language, get_language, get_available_languages, format_translated,
+    add_language_listener, remove_language_listener
+)
 from modules.translations.slovak import EN_TO_SK
 from modules.translations.czech import EN_TO_CS
 from modules.translations.german import EN_TO_DE
@@ -12,10 +15,13 @@ from modules.translations.german import EN_TO_DE
 # Export all symbols for backward compatibility
 __all__ = [
     'translate', 
+    'translate_many',
     'set_language', 
     'get_language',
     'get_available_languages',
     'format_translated',
+    'add_language_listener',
+    'remove_language_listener',
     'EN_TO_SK',
     'EN_TO_CS',
     'EN_TO_DE'
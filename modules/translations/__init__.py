@@ -1,9 +1,14 @@
 """
 Translation module for the Football Statistics Analyzer application.
 Contains translations from English to Slovak, Czech, and German.
+
+Each language is compiled once into a flat catalog of interned strings, and
+the catalog of the current language is swapped in by set_language(), so
+translate() is a single dict lookup.
 """
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 import logging
+import sys
 
 # Import language dictionaries
 from .slovak import EN_TO_SK
@@ -27,6 +32,34 @@ TRANSLATIONS = {
     "en": {}  # English is just the original text
 }
 
+# Compiled catalogs by language code, built on first use
+_catalogs: Dict[str, Dict[str, str]] = {}
+
+# Called with the new language code after the language changes
+_language_listeners: List[Callable[[str], None]] = []
+
+def _compile_catalog(language_code: str) -> Dict[str, str]:
+    """
+    Get the compiled catalog for a language.
+    
+    Args:
+        language_code (str): Language code ('sk', 'cs', 'de', 'en')
+        
+    Returns:
+        Dict[str, str]: Interned English text mapped to interned translations
+    """
+    catalog = _catalogs.get(language_code)
+    if catalog is None:
+        catalog = {
+            sys.intern(text): sys.intern(translated)
+            for text, translated in TRANSLATIONS.get(language_code, {}).items()
+        }
+        _catalogs[language_code] = catalog
+    return catalog
+
+# Catalog of the current language
+_catalog = _compile_catalog(CURRENT_LANGUAGE)
+
 def set_language(language_code: str) -> bool:
     """
     Set the current language for translations.
@@ -37,10 +70,18 @@ def set_language(language_code: str) -> bool:
     Returns:
         bool: True if language was set successfully, False otherwise
     """
-    global CURRENT_LANGUAGE
+    global CURRENT_LANGUAGE, _catalog
     if language_code in TRANSLATIONS:
+        changed = language_code != CURRENT_LANGUAGE
         CURRENT_LANGUAGE = language_code
+        _catalog = _compile_catalog(language_code)
         logger.info(f"Language set to {language_code} ({AVAILABLE_LANGUAGES.get(language_code, 'Unknown')})")
+        if changed:
+            for listener in list(_language_listeners):
+                try:
+                    listener(language_code)
+                except Exception as e:
+                    logger.error(f"Error in language change listener: {e}")
         return True
     logger.warning(f"Attempted to set unknown language: {language_code}")
     return False
@@ -77,17 +118,47 @@ def translate(text: str, language_code: Optional[str] = None) -> str:
         str: Translated text
     """
     if language_code is None:
-        language_code = CURRENT_LANGUAGE
+        return _catalog.get(text, text)
         
     if language_code not in TRANSLATIONS:
         return text
         
-    # For English, just return the original text
-    if language_code == "en":
-        return text
+    return _compile_catalog(language_code).get(text, text)
+
+def translate_many(texts: Iterable[str], language_code: Optional[str] = None) -> List[str]:
+    """
+    Translate several texts at once, e.g. all column headers of a table.
+    
+    Args:
+        texts (Iterable[str]): Texts to translate
+        language_code (str, optional): Language code to translate to.
+                                      If None, use the current language.
         
-    translation_dict = TRANSLATIONS[language_code]
-    return translation_dict.get(text, text)
+    Returns:
+        List[str]: Translated texts in the same order
+    """
+    catalog = _catalog if language_code is None else _compile_catalog(language_code)
+    return [catalog.get(text, text) for text in texts]
+
+def add_language_listener(listener: Callable[[str], None]):
+    """
+    Call a function with the new language code whenever the language changes.
+    
+    Args:
+        listener (Callable[[str], None]): Function to call
+    """
+    if listener not in _language_listeners:
+        _language_listeners.append(listener)
+
+def remove_language_listener(listener: Callable[[str], None]):
+    """
+    Stop calling a function registered with add_language_listener.
+    
+    Args:
+        listener (Callable[[str], None]): Function to remove
+    """
+    if listener in _language_listeners:
+        _language_listeners.remove(listener)
 
 def format_translated(text: str, *args, **kwargs) -> str:
     """
@@ -0,0 +1,417 @@
+"""
+Local read-only HTTP/JSON service over the analysis data.
+
+Serves standings, form analysis, streaks and predictions to notebooks and
+dashboards without the GUI. All clients share one API client and one response
+cache, so concurrent requests for the same data cost a single computation.
+
+    python query_service.py --port 8765 --refresh
+
+Endpoints (GET, JSON):
+    /leagues
+    /standings?league=39
+    /form?league=39&form_length=5
+    /streaks?league=39&type=Winless
+    /predictions?league=39&status=pending|completed|correct|incorrect
+
+List endpoints accept page (from 1) and page_size. Responses carry an ETag;
+a request with a matching If-None-Match header gets 304 Not Modified.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Callable, Tuple
+from urllib.parse import urlparse, parse_qs
+
+# Add the current directory to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from modules.api_client import FootballAPI
+from modules.config import API_KEY, BASE_URL, ALL_LEAGUES
+from modules.db_manager import DatabaseManager
+from modules.league_names import LEAGUE_NAMES
+from modules.refresh_scheduler import RefreshScheduler
+from modules.settings_manager import SettingsManager
+from modules.streak_engine import StreakEngine, STREAK_TYPES
+
+logger = logging.getLogger("query_service")
+
+# Seconds a computed dataset is served from the response cache
+CACHE_TTL = {
+    "leagues": 3600,
+    "standings": 300,
+    "form": 300,
+    "streaks": 300,
+    "predictions": 30
+}
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_CACHED_PAGES = 32  # Encoded pages kept per dataset, least recently used dropped first
+
+PREDICTION_STATUSES = ("pending", "completed", "correct", "incorrect")
+
+
+class QueryError(Exception):
+    """Invalid query parameters; reported to the client as 400 Bad Request"""
+
+
+class UnknownEndpointError(Exception):
+    """Request for a path without a route; reported to the client as 404 Not Found"""
+
+
+class QueryService:
+    """Computes datasets and caches encoded responses shared by all clients."""
+
+    def __init__(self, api: FootballAPI, db_manager: DatabaseManager):
+        """
+        Initialize the service.
+
+        Args:
+            api: API client whose cache is shared by all requests
+            db_manager: Database with stored predictions
+        """
+        self.api = api
+        self.db_manager = db_manager
+        self.streak_engine = StreakEngine(api, cache_seconds=CACHE_TTL["streaks"])
+
+        # Dataset cache: key -> {"expires", "rows", "pages"}; pages is an LRU of encoded pages
+        self._cache: Dict[tuple, Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+
+        # One lock per dataset key, so concurrent misses compute it once
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+
+        self.routes: Dict[str, Callable[[Dict[str, str]], Tuple[tuple, Callable[[], List[Dict[str, Any]]]]]] = {
+            "/leagues": self._leagues,
+            "/standings": self._standings,
+            "/form": self._form,
+            "/streaks": self._streaks,
+            "/predictions": self._predictions
+        }
+
+    def handle(self, path: str, params: Dict[str, str]) -> Tuple[bytes, str, int]:
+        """
+        Get the encoded response for a request.
+
+        Args:
+            path: Endpoint path
+            params: Query parameters (first value of each)
+
+        Returns:
+            tuple: (body, etag, max_age)
+
+        Raises:
+            UnknownEndpointError: Unknown endpoint
+            QueryError: Invalid parameters
+        """
+        route = self.routes.get(path)
+        if route is None:
+            raise UnknownEndpointError(path)
+        key, compute = route(params)
+        page = self._int_param(params, "page", 1, minimum=1)
+        page_size = self._int_param(params, "page_size", DEFAULT_PAGE_SIZE, minimum=1, maximum=MAX_PAGE_SIZE)
+
+        entry = self._get_dataset(key, compute)
+        page_key = (page, page_size)
+        with self._cache_lock:
+            cached_page = entry["pages"].get(page_key)
+            if cached_page is not None:
+                entry["pages"].move_to_end(page_key)
+        if cached_page is None:
+            cached_page = self._encode_page(key[0], entry["rows"], page, page_size)
+            with self._cache_lock:
+                entry["pages"][page_key] = cached_page
+                while len(entry["pages"]) > MAX_CACHED_PAGES:
+                    entry["pages"].popitem(last=False)
+
+        max_age = max(0, int(entry["expires"] - time.time()))
+        return cached_page[0], cached_page[1], max_age
+
+    def _get_dataset(self, key: tuple, compute: Callable[[], List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Get a cached dataset, computing it once on a miss"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry["expires"] > time.time():
+                return entry
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another request may have filled the cache while we waited
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry["expires"] > time.time():
+                    return entry
+
+            start = time.perf_counter()
+            rows = compute()
+            logger.info(f"Computed {key} ({len(rows)} rows) in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+            entry = {"expires": time.time() + CACHE_TTL[key[0]], "rows": rows, "pages": OrderedDict()}
+            with self._cache_lock:
+                self._cache[key] = entry
+            return entry
+
+    @staticmethod
+    def _encode_page(endpoint: str, rows: List[Dict[str, Any]], page: int, page_size: int) -> Tuple[bytes, str]:
+        """Encode one page of rows as JSON and derive its ETag"""
+        total = len(rows)
+        start = (page - 1) * page_size
+        body = json.dumps({
+            "endpoint": endpoint,
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "pages": (total + page_size - 1) // page_size,
+            "items": rows[start:start + page_size]
+        }, ensure_ascii=False, default=str).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        return body, etag
+
+    # Parameter parsing
+
+    @staticmethod
+    def _int_param(params: Dict[str, str], name: str, default=None, minimum=None, maximum=None):
+        """Parse an integer query parameter within bounds"""
+        value = params.get(name)
+        if value is None or value == "":
+            if default is None:
+                raise QueryError(f"Missing parameter: {name}")
+            return default
+        try:
+            number = int(value)
+        except ValueError:
+            raise QueryError(f"Parameter {name} must be an integer")
+        if (minimum is not None and number < minimum) or (maximum is not None and number > maximum):
+            raise QueryError(f"Parameter {name} out of range")
+        return number
+
+    def _league_param(self, params: Dict[str, str], allow_all: bool = False) -> int:
+        """Parse and validate the league parameter"""
+        league_id = self._int_param(params, "league")
+        if league_id == ALL_LEAGUES and allow_all:
+            return league_id
+        if league_id not in LEAGUE_NAMES or league_id == ALL_LEAGUES:
+            raise QueryError(f"Unknown league: {league_id}")
+        return league_id
+
+    # Datasets
+
+    def _leagues(self, params):
+        """Known leagues"""
+        def compute():
+            return [
+                {"league_id": league_id, "name": info.get("name", ""), "flag": info.get("flag", "")}
+                for league_id, info in LEAGUE_NAMES.items()
+                if isinstance(league_id, int) and league_id != ALL_LEAGUES
+            ]
+        return ("leagues",), compute
+
+    def _standings(self, params):
+        """League table rows for one league"""
+        league_id = self._league_param(params)
+
+        def compute():
+            standings = self.api.fetch_standings(league_id)
+            if not standings or not standings.get('response'):
+                return []
+            groups = standings['response'][0].get('league', {}).get('standings', [])
+            rows = []
+            for team in (groups[0] if groups else []):
+                record = team.get('all', {})
+                goals = record.get('goals', {})
+                rows.append({
+                    'rank': team.get('rank'),
+                    'team_id': team.get('team', {}).get('id'),
+                    'team': team.get('team', {}).get('name'),
+                    'played': record.get('played'),
+                    'won': record.get('win'),
+                    'drawn': record.get('draw'),
+                    'lost': record.get('lose'),
+                    'goals_for': goals.get('for'),
+                    'goals_against': goals.get('against'),
+                    'goal_diff': team.get('goalsDiff'),
+                    'points': team.get('points'),
+                    'form': team.get('form')
+                })
+            return rows
+        return ("standings", league_id), compute
+
+    def _form(self, params):
+        """Teams whose recent form differs from their season average"""
+        league_id = self._league_param(params)
+        form_length = self._int_param(params, "form_length", 5, minimum=1, maximum=10)
+
+        def compute():
+            return self.api.fetch_all_teams({league_id: LEAGUE_NAMES[league_id]}, form_length)
+        return ("form", league_id, form_length), compute
+
+    def _streaks(self, params):
+        """Current streaks of one type for one league, or all leagues"""
+        league_id = self._league_param(params, allow_all=True)
+        streak_type = params.get("type") or STREAK_TYPES[0]
+        if streak_type not in STREAK_TYPES:
+            raise QueryError(f"Unknown streak type: {streak_type}")
+
+        def compute():
+            return self.streak_engine.compute_league(league_id).get(streak_type, [])
+        return ("streaks", league_id, streak_type), compute
+
+    def _predictions(self, params):
+        """Stored predictions, newest match first"""
+        league_id = self._int_param(params, "league", 0)
+        status = params.get("status") or ""
+        if status and status not in PREDICTION_STATUSES:
+            raise QueryError(f"Unknown status: {status}")
+
+        def compute():
+            rows = self.db_manager.get_predictions()
+            if league_id:
+                rows = [row for row in rows if row.get('league_id') == league_id]
+            if status == "pending":
+                rows = [row for row in rows if row.get('correct') is None]
+            elif status == "completed":
+                rows = [row for row in rows if row.get('correct') is not None]
+            elif status == "correct":
+                rows = [row for row in rows if row.get('correct') == 1]
+            elif status == "incorrect":
+                rows = [row for row in rows if row.get('correct') == 0]
+            return rows
+        return ("predictions", league_id, status), compute
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the server's QueryService."""
+
+    server_version = "FootballStatsQuery/1.0"
+
+    def do_GET(self):
+        """Serve a query, or 304 if the client's copy is current"""
+        url = urlparse(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        try:
+            body, etag, max_age = self.server.service.handle(url.path.rstrip("/") or "/", params)
+        except UnknownEndpointError:
+            self._send_error(404, f"Unknown endpoint: {url.path}")
+            return
+        except QueryError as e:
+            self._send_error(400, str(e))
+            return
+        except Exception as e:
+            logger.error(f"Error serving {self.path}: {str(e)}")
+            self._send_error(500, "Internal error")
+            return
+
+        if self._etag_matches(etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"max-age={max_age}")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", f"max-age={max_age}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _etag_matches(self, etag: str) -> bool:
+        """Check the If-None-Match header against an ETag"""
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        if header.strip() == "*":
+            return True
+        candidates = [tag.strip() for tag in header.split(",")]
+        return etag in candidates or f"W/{etag}" in candidates
+
+    def _send_error(self, status: int, message: str):
+        """Send a JSON error response"""
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Send access logs to the logging module instead of stderr"""
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def create_server(service: QueryService, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """Create a threaded HTTP server bound to a QueryService"""
+    server = ThreadingHTTPServer((host, port), QueryRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Serve analysis data as JSON over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--db", default="football_stats.db", help="SQLite database path")
+    parser.add_argument("--settings", default="settings.json", help="Settings file path")
+    parser.add_argument("--cache-file", default="api_cache.json", help="API cache file for warm starts")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the API cache file")
+    parser.add_argument("--refresh", action="store_true", help="Run the refresh scheduler to keep data current")
+    parser.add_argument("--verbose", action="store_true", help="Log debug output, including each request")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the service until interrupted; returns the process exit code"""
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    api = FootballAPI(API_KEY, BASE_URL, disable_auto_fetch=False)
+    if not args.no_cache:
+        loaded = api.load_cache(args.cache_file)
+        logger.info(f"Warm start: loaded {loaded} cached API responses from {args.cache_file}")
+
+    db_manager = DatabaseManager(args.db)
+    service = QueryService(api, db_manager)
+
+    scheduler = None
+    if args.refresh:
+        scheduler = RefreshScheduler(api, db_manager, SettingsManager(args.settings))
+        scheduler.start()
+
+    server = create_server(service, args.host, args.port)
+    logger.info(f"Serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down")
+    finally:
+        server.server_close()
+        if scheduler is not None:
+            scheduler.stop()
+        if not args.no_cache:
+            try:
+                written = api.save_cache(args.cache_file)
+                logger.info(f"Saved {written} API responses to {args.cache_file}")
+            except Exception as e:
+                logger.error(f"Error saving API cache: {str(e)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
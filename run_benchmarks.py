@@ -0,0 +1,448 @@
+"""
+Benchmark suite for the hot paths of the app.
+
+Runs fixed scenarios against synthetic, replayed data (no network needed),
+appends the results to a history file and compares each scenario with the
+previous run, so regressions show up before a release:
+
+    python run_benchmarks.py                     # all scenarios, scale 1
+    python run_benchmarks.py --scale 10 -k form  # 10x data, form scenarios only
+    python run_benchmarks.py --fail-on-regression --threshold 0.25
+
+Replayed requests wait a fixed latency (the cassette's median recorded
+time, or DEFAULT_REPLAY_LATENCY for synthetic cassettes that record none),
+so cold and warm API scenarios show what the cache saves.
+
+Treeview scenarios need a display. On a headless machine a private Xvfb
+display is started when Xvfb is installed (or run under xvfb-run);
+otherwise they are reported as skipped.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional
+
+# Add the current directory to the path so we can import modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from modules.api_client import FootballAPI
+from modules.api_transport import ReplayTransport
+from modules.db_manager import DatabaseManager
+from modules.form_analyzer import FormAnalyzer
+from modules.synthetic_data import SyntheticSeasonGenerator
+
+logger = logging.getLogger("run_benchmarks")
+
+BASE_URL = "https://bench.invalid"
+
+# Seconds per replayed request when the cassette has no recorded times (a typical API round trip)
+DEFAULT_REPLAY_LATENCY = 0.05
+
+# Display used for Treeview scenarios when none is available
+XVFB_DISPLAY = ":99"
+
+# Registered scenarios, in run order: name -> function(context) -> Benchmark or None
+SCENARIOS: Dict[str, Callable[[Dict[str, Any]], Optional["Benchmark"]]] = {}
+
+
+class Benchmark:
+    """A timed operation with optional per-round setup."""
+
+    def __init__(self, run: Callable[..., Any], before_each: Optional[Callable[[], Any]] = None, size: int = 0):
+        """
+        Args:
+            run: Operation to time; receives the result of before_each if given
+            before_each: Untimed setup run before every round
+            size: Number of items processed per round, for reporting
+        """
+        self.run = run
+        self.before_each = before_each
+        self.size = size
+
+
+def scenario(name: str):
+    """Register a scenario function under a name"""
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+# Scenarios
+
+def _replay_api(context: Dict[str, Any]) -> FootballAPI:
+    """Create an API client that replays the cassette with a fixed latency and no rate limit"""
+    api = FootballAPI("benchmark", BASE_URL, transport=context["transport"])
+    api.min_request_interval = 0
+    return api
+
+
+@scenario("api.fetch_all_teams.cold")
+def bench_fetch_all_teams_cold(context):
+    """Form analysis for every league through an empty cache"""
+    leagues = context["league_names"]
+    return Benchmark(
+        lambda api: api.fetch_all_teams(leagues, 5),
+        before_each=lambda: _replay_api(context),
+        size=len(leagues)
+    )
+
+
+@scenario("api.fetch_all_teams.warm")
+def bench_fetch_all_teams_warm(context):
+    """Form analysis for every league with standings and fixtures cached"""
+    leagues = context["league_names"]
+    api = _replay_api(context)
+    api.fetch_all_teams(leagues, 5)
+    return Benchmark(lambda: api.fetch_all_teams(leagues, 5), size=len(leagues))
+
+
+def _form_scenario(fixture_count: int):
+    """Build a FormAnalyzer scenario over a given number of fixtures"""
+    def bench(context):
+        fixtures = context["all_fixtures"]
+        # Repeat the data at small scales so every size can be measured
+        fixtures = (fixtures * (fixture_count // len(fixtures) + 1))[-fixture_count:]
+        team_id = fixtures[-1]["teams"]["home"]["id"]
+        return Benchmark(lambda: FormAnalyzer.analyze_team_form(fixtures, team_id, 5), size=fixture_count)
+    return bench
+
+
+for _count in (100, 1000, 10000):
+    scenario(f"form.analyze_team_form.{_count}")(_form_scenario(_count))
+
+
+@scenario("db.save_fixtures")
+def bench_save_fixtures(context):
+    """Bulk write of every synthetic fixture into a fresh database"""
+    fixtures = context["all_fixtures"]
+
+    def fresh_db():
+        return DatabaseManager(os.path.join(context["tmp_dir"], f"save_{uuid.uuid4().hex}.db"))
+
+    return Benchmark(lambda db: db.save_fixtures(fixtures), before_each=fresh_db, size=len(fixtures))
+
+
+@scenario("db.get_predictions.sorted")
+def bench_get_predictions(context):
+    """Load all predictions and sort them like the prediction tables"""
+    db = DatabaseManager(os.path.join(context["tmp_dir"], "predictions.db"))
+    generator = context["generator"]
+    db.save_predictions([row for league in generator.leagues
+                         for row in generator.predictions(league["id"], per_round=10)])
+    count = len(db.get_predictions())
+
+    def run():
+        rows = db.get_predictions()
+        rows.sort(key=lambda row: (row['match_date'], abs(row['performance_diff'])), reverse=True)
+        return rows
+
+    return Benchmark(run, size=count)
+
+
+def _table_rows(context) -> List[Dict[str, Any]]:
+    """Rows shaped like the Form Analysis table"""
+    rows = []
+    for fixture in context["all_fixtures"][:5000]:
+        goals = fixture["goals"]
+        rows.append({"values": (
+            fixture["teams"]["home"]["name"], fixture["teams"]["away"]["name"],
+            fixture["fixture"]["date"][:10], goals["home"] if goals["home"] is not None else "-",
+            goals["away"] if goals["away"] is not None else "-", fixture["league"]["round"]
+        )})
+    return rows
+
+
+def _treeview(context):
+    """Create a Treeview in the shared hidden Tk root, or None without a display"""
+    root = context.get("tk_root")
+    if root is None:
+        return None
+    from tkinter import ttk
+    columns = ("home", "away", "date", "home_goals", "away_goals", "round")
+    tree = ttk.Treeview(root, columns=columns, show="headings", height=25)
+    tree.pack()
+    return tree
+
+
+@scenario("table.treeview.insert")
+def bench_treeview_insert(context):
+    """Populate a plain Treeview item by item"""
+    if _treeview(context) is None:
+        return None
+    rows = _table_rows(context)
+
+    def run(tree):
+        for row in rows:
+            tree.insert("", "end", values=row["values"])
+        tree.update_idletasks()
+
+    def fresh_tree():
+        for child in context["tk_root"].winfo_children():
+            child.destroy()
+        return _treeview(context)
+
+    return Benchmark(run, before_each=fresh_tree, size=len(rows))
+
+
+@scenario("table.virtual.set_rows")
+def bench_virtual_set_rows(context):
+    """Replace all rows of a virtualized table"""
+    tree = _treeview(context)
+    if tree is None:
+        return None
+    from tabs.base_tab.virtual_table import VirtualTable
+    virtual = VirtualTable(tree)
+    rows = _table_rows(context)
+
+    def run():
+        virtual.set_rows(rows)
+        tree.update_idletasks()
+
+    return Benchmark(run, size=len(rows))
+
+
+@scenario("table.virtual.sort")
+def bench_virtual_sort(context):
+    """Sort a virtualized table by a date column, as on a header click"""
+    tree = _treeview(context)
+    if tree is None:
+        return None
+    from modules.table_sorter import TableSorter
+    from tabs.base_tab.virtual_table import VirtualTable
+    tree.virtual = VirtualTable(tree)
+    sorter = TableSorter(tree)
+    rows = _table_rows(context)
+    tree.virtual.set_rows(rows)
+    state = {"reverse": False}
+
+    def run():
+        state["reverse"] = not state["reverse"]
+        sorter.sort_by_column("date", state["reverse"])
+        tree.update_idletasks()
+
+    return Benchmark(run, size=len(rows))
+
+
+# Harness
+
+def replay_latency(transport: ReplayTransport, latency: Optional[float] = None) -> float:
+    """Per-request replay latency: the given one, the median recorded time, or the default"""
+    if latency is not None:
+        return latency
+    recorded = [interaction.get("elapsed") or 0.0
+                for interactions in transport.interactions.values() for interaction in interactions]
+    median = statistics.median(recorded) if recorded else 0.0
+    return median if median > 0 else DEFAULT_REPLAY_LATENCY
+
+
+def _start_xvfb() -> Optional[subprocess.Popen]:
+    """Start a private Xvfb display if Xvfb is installed; returns the process or None"""
+    if not shutil.which("Xvfb"):
+        return None
+    try:
+        process = subprocess.Popen(["Xvfb", XVFB_DISPLAY, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        time.sleep(0.5)
+        if process.poll() is not None:
+            return None
+        os.environ["DISPLAY"] = XVFB_DISPLAY
+        return process
+    except Exception as e:
+        logger.warning(f"Could not start Xvfb: {str(e)}")
+        return None
+
+
+def _create_tk_root(context: Dict[str, Any]):
+    """Create a withdrawn Tk root for the table scenarios, starting Xvfb when there is no display"""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except Exception as e:
+        context["xvfb"] = _start_xvfb()
+        if context["xvfb"] is None:
+            logger.warning(f"No display and no Xvfb, table scenarios will be skipped: {str(e)}")
+            return
+        try:
+            root = tk.Tk()
+        except Exception as e:
+            logger.warning(f"No display under Xvfb, table scenarios will be skipped: {str(e)}")
+            return
+    root.withdraw()
+    context["tk_root"] = root
+
+
+def build_context(scale: int, seed: int, tmp_dir: str, latency: Optional[float] = None) -> Dict[str, Any]:
+    """Generate the shared synthetic data and replay cassette"""
+    generator = SyntheticSeasonGenerator(leagues=4 * scale, teams_per_league=20, seasons=3, seed=seed)
+    cassette = os.path.join(tmp_dir, "cassette.json")
+    generator.write_cassette(cassette, BASE_URL)
+
+    transport = ReplayTransport(cassette)
+    transport.latency = replay_latency(transport, latency)
+
+    context = {
+        "generator": generator,
+        "all_fixtures": generator.all_fixtures(),
+        "league_names": {league["id"]: league for league in generator.leagues},
+        "transport": transport,
+        "tmp_dir": tmp_dir,
+        "tk_root": None,
+        "xvfb": None
+    }
+
+    try:
+        _create_tk_root(context)
+    except Exception as e:
+        logger.warning(f"Tk is not available, table scenarios will be skipped: {str(e)}")
+    return context
+
+
+def run_scenario(benchmark: Benchmark, rounds: int, warmup: int = 1) -> Dict[str, Any]:
+    """Time a benchmark; returns timing statistics in milliseconds"""
+    timings = []
+    for index in range(warmup + rounds):
+        args = (benchmark.before_each(),) if benchmark.before_each else ()
+        start = time.perf_counter()
+        benchmark.run(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        if index >= warmup:
+            timings.append(elapsed)
+
+    return {
+        "rounds": rounds,
+        "size": benchmark.size,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.mean(timings), 3),
+        "stdev_ms": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0
+    }
+
+
+def load_previous(history_file: str, scale: int) -> Dict[str, Any]:
+    """Get the results of the last recorded run at the same scale"""
+    if not os.path.exists(history_file):
+        return {}
+    previous = {}
+    with open(history_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("scale") == scale:
+                previous = record.get("results", {})
+    return previous
+
+
+def git_revision() -> str:
+    """Get the current commit hash, or an empty string outside a checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=current_dir,
+                              capture_output=True, text=True, timeout=5).stdout.strip()
+    except Exception:
+        return ""
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Run the performance benchmark suite.")
+    parser.add_argument("-k", "--filter", help="Only run scenarios whose name contains this text")
+    parser.add_argument("--scale", type=int, default=1, help="Data volume multiplier (default: 1 = 4 leagues)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per scenario (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0)")
+    parser.add_argument("--history", default="benchmark_history.jsonl", help="Results history file")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Median slowdown counted as a regression (default: 0.2 = 20%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on a regression")
+    parser.add_argument("--latency", type=float, default=None,
+                        help="Seconds per replayed request (default: the cassette's median recorded time)")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the selected scenarios; returns the process exit code"""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    names = [name for name in SCENARIOS if not args.filter or args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    previous = load_previous(args.history, args.scale)
+    results = {}
+    regressions = []
+
+    with tempfile.TemporaryDirectory(prefix="football_bench_") as tmp_dir:
+        start = time.perf_counter()
+        context = build_context(args.scale, args.seed, tmp_dir, args.latency)
+        print(f"Prepared {len(context['all_fixtures'])} fixtures in {time.perf_counter() - start:.1f}s, "
+              f"replaying requests with {context['transport'].latency * 1000:.0f} ms latency\n")
+        print(f"{'scenario':<34}{'size':>8}{'median ms':>12}{'min ms':>10}{'change':>10}")
+
+        for name in names:
+            try:
+                benchmark = SCENARIOS[name](context)
+                if benchmark is None:
+                    print(f"{name:<34}{'':>8}{'skipped':>12}")
+                    continue
+                result = run_scenario(benchmark, args.rounds)
+            except Exception as e:
+                logger.error(f"Error in scenario {name}: {str(e)}")
+                continue
+
+            results[name] = result
+            change = ""
+            baseline = previous.get(name)
+            if baseline and baseline.get("median_ms") and baseline.get("size") == result["size"]:
+                ratio = result["median_ms"] / baseline["median_ms"] - 1
+                change = f"{ratio:+.0%}"
+                if ratio > args.threshold:
+                    regressions.append((name, ratio))
+                    change += " !"
+            print(f"{name:<34}{result['size']:>8}{result['median_ms']:>12.2f}{result['min_ms']:>10.2f}{change:>10}")
+
+        if context["tk_root"] is not None:
+            context["tk_root"].destroy()
+        if context["xvfb"] is not None:
+            context["xvfb"].terminate()
+
+    if not args.no_history and results:
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "results": results
+        }
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+
+    if regressions:
+        print("\nRegressions over {:.0%}:".format(args.threshold))
+        for name, ratio in regressions:
+            print(f"  {name}: {ratio:+.0%}")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
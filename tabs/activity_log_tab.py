@@ -9,9 +9,11 @@ from typing import Dict, List, Any, Optional
 from modules.api_client import FootballAPI
 from modules.db_manager import DatabaseManager
 from modules.settings_manager import SettingsManager
+from modules.config import ACTIVITY_PAGE_SIZE
 from modules.firebase_auth import FirebaseAuth
 from modules.translations import translate
 from tabs.base_tab.base_tab import BaseTab
+from tabs.base_tab.table_utils import TableUtils
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,17 @@ class ActivityLogTab(BaseTab):
     def __init__(self, parent, api: FootballAPI, db_manager: DatabaseManager, settings_manager: SettingsManager):
         super().__init__(parent, api, db_manager, settings_manager)
         
+        # All loaded activity rows, newest first (filters render a subset of these)
+        self.activity_rows = []
+        self.activity_ids = set()
+        
+        # Paging state: cursor for the next older page and the newest loaded timestamp
+        self.page_cursor = None
+        self.newest_timestamp = None
+        # Task loading an older page; a cancelled task never reaches on_done,
+        # so its done flag rather than a boolean guards against double loads
+        self.load_more_task = None
+        
         # Initialize Firebase Auth
         self.firebase_auth = FirebaseAuth()
         
@@ -110,6 +123,17 @@ class ActivityLogTab(BaseTab):
         )
         self.refresh_button.grid(row=0, column=4, padx=20, pady=10, sticky="e")
         
+        # Load older activities
+        self.load_more_button = self._create_button(
+            filter_frame,
+            text="Load More",
+            command=self._load_more,
+            width=100,
+            height=30
+        )
+        self.load_more_button.grid(row=0, column=5, padx=(0, 20), pady=10, sticky="e")
+        self.load_more_button.configure(state="disabled")
+        
         # Create activities table
         table_container, self.activities_table = self._create_sortable_table(
             self.content_frame,
@@ -123,6 +147,16 @@ class ActivityLogTab(BaseTab):
         )
         table_container.grid(row=2, column=0, padx=20, pady=10, sticky="nsew")
         
+        # Scrolling to the last row loads the next page
+        self.activities_table.virtual.on_scroll_end = self._load_more
+        
+        # Activity colors
+        self.activities_table.tag_configure('login', foreground='green')
+        self.activities_table.tag_configure('logout', foreground='orange')
+        self.activities_table.tag_configure('signup', foreground='blue')
+        self.activities_table.tag_configure('license_update', foreground='purple')
+        self.activities_table.tag_configure('user_deleted', foreground='red')
+        
         # Configure grid for footer_frame
         self.footer_frame.grid_columnconfigure(0, weight=1)
         
@@ -135,7 +169,7 @@ class ActivityLogTab(BaseTab):
         self.status_label.grid(row=0, column=0, pady=10, padx=20, sticky="w")
         
     def _load_activities(self):
-        """Load activities from Firebase"""
+        """Load the first page of activities, or only newer ones once loaded"""
         # Check if Firebase is initialized
         if not self.firebase_auth.is_initialized():
             self.status_label.configure(
@@ -153,111 +187,112 @@ class ActivityLogTab(BaseTab):
         # Disable refresh button
         self.refresh_button.configure(text="Loading...", state="disabled")
         
-        # Load in a separate thread
-        self.parent.after(100, self._perform_load_activities)
+        if self.newest_timestamp is None:
+            self.run_in_background(
+                self._fetch_activity_page, None,
+                on_success=self._on_page_loaded,
+                on_error=self._on_load_failed,
+                on_done=self._reset_load_buttons
+            )
+        else:
+            self.run_in_background(
+                self._fetch_new_activities, self.newest_timestamp,
+                on_success=self._on_new_activities,
+                on_error=self._on_load_failed,
+                on_done=self._reset_load_buttons
+            )
+        
+    def _load_more(self):
+        """Load the next page of older activities"""
+        loading = self.load_more_task is not None and not self.load_more_task.done
+        if loading or self.page_cursor is None:
+            return
+        self.load_more_button.configure(text="Loading...", state="disabled")
+        self.load_more_task = self.run_in_background(
+            self._fetch_activity_page, self.page_cursor,
+            on_success=self._on_page_loaded,
+            on_error=self._on_load_failed,
+            on_done=self._reset_load_buttons
+        )
+        
+    def _fetch_activity_page(self, task, cursor):
+        """
+        Fetch one page of activities (runs on a worker thread)
+        
+        Returns:
+            tuple: (activities, cursor for the next page or None, user list)
+        """
+        success, activities, next_cursor = self.firebase_auth.get_activity_page(ACTIVITY_PAGE_SIZE, cursor)
+        if not success:
+            raise RuntimeError("Could not load activities from Firestore")
+        return activities, next_cursor, self._fetch_users(task) if activities else []
         
-    def _perform_load_activities(self):
-        """Perform activities loading"""
+    def _fetch_new_activities(self, task, since):
+        """Fetch activities newer than the newest loaded one (runs on a worker thread)"""
+        success, activities = self.firebase_auth.get_activity_since(since)
+        if not success:
+            raise RuntimeError("Could not load new activities from Firestore")
+        return activities, self._fetch_users(task) if activities else []
+        
+    def _fetch_users(self, task):
+        """Get the user list for resolving emails (runs on a worker thread)"""
+        task.check_cancelled()
         try:
-            # Since get_user_activities might not be available, let's use a direct Firestore query
-            # Get activities directly from Firestore
-            if not hasattr(self.firebase_auth, 'db') or self.firebase_auth.db is None:
-                logger.error("Firestore database not initialized")
-                self.status_label.configure(
-                    text="Firestore not initialized",
-                    text_color="red"
-                )
-                self.refresh_button.configure(text="Refresh", state="normal")
-                return
-                
-            logger.info("Querying activity_logs collection")
-            
-            # Get activities collection
-            activities_ref = self.firebase_auth.db.collection('activity_logs')
+            success, users = self.firebase_auth.get_all_users()
+            if success:
+                return users
+        except Exception as e:
+            logger.error(f"Error getting users: {str(e)}")
+        return []
+        
+    def _on_page_loaded(self, result):
+        """Append a page of older activities (runs on the main thread)"""
+        activities, self.page_cursor, users = result
+        self._add_activities(activities, users)
+        
+    def _on_new_activities(self, result):
+        """Add activities newer than the loaded ones (runs on the main thread)"""
+        activities, users = result
+        self._add_activities(activities, users)
+        
+    def _on_load_failed(self, error):
+        """Show a loading error (runs on the main thread)"""
+        logger.error(f"Error loading activities: {str(error)}")
+        self.status_label.configure(
+            text=f"Error: {str(error)}",
+            text_color="red"
+        )
+        
+    def _add_activities(self, activities, users):
+        """Merge fetched activities into the loaded rows and refresh the table"""
+        try:
+            # Resolve user emails once for all new rows
+            user_emails = {user.get('id'): user.get('email', 'N/A') for user in users}
             
-            # Order by timestamp and limit
-            query = activities_ref.order_by('timestamp', direction='DESCENDING').limit(100)
+            for activity in activities:
+                if activity['id'] in self.activity_ids:
+                    continue
+                self.activity_ids.add(activity['id'])
+                self.activity_rows.append(self._build_activity_row(activity, user_emails))
+                
+                timestamp = activity.get('timestamp')
+                if timestamp and (self.newest_timestamp is None or timestamp > self.newest_timestamp):
+                    self.newest_timestamp = timestamp
             
-            # Get activities
-            logger.info("Executing Firestore query")
-            activity_docs = query.get()
-            logger.info(f"Query returned {len(list(activity_docs))} documents")
+            # Keep rows newest first; each page only adds to the loaded set
+            self.activity_rows.sort(key=lambda row: row["sort_time"], reverse=True)
+            self._filter_activities()
             
-            # Convert to list of dictionaries
-            activities = []
-            for doc in activity_docs:
-                activity_data = doc.to_dict()
-                activity_data['id'] = doc.id
-                
-                # Format timestamp
-                timestamp = activity_data.get('timestamp')
-                if timestamp:
-                    if isinstance(timestamp, str):
-                        # If it's already a string (ISO format), try to parse it
-                        try:
-                            dt = datetime.fromisoformat(timestamp)
-                            activity_data['formatted_time'] = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        except:
-                            activity_data['formatted_time'] = timestamp
-                    else:
-                        try:
-                            activity_data['formatted_time'] = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                        except:
-                            activity_data['formatted_time'] = str(timestamp)
-                else:
-                    activity_data['formatted_time'] = "N/A"
-                    
-                activities.append(activity_data)
-                
-            success = True
+            # Update status
+            more = " - scroll down for older activities" if self.page_cursor is not None else ""
+            self.status_label.configure(
+                text=f"Loaded {len(self.activity_rows)} activities ({len(activities)} new){more}",
+                text_color="black"
+            )
             
-            if success:
-                # Clear table
-                for item in self.activities_table.get_children():
-                    self.activities_table.delete(item)
-                    
-                # Add activities to table
-                for activity in activities:
-                    # Format details
-                    details = self._format_activity_details(activity)
-                    
-                    # Add row
-                    self.activities_table.insert(
-                        "", "end",
-                        values=(
-                            activity.get('formatted_time', 'N/A'),
-                            self._get_user_email(activity.get('user_id', 'unknown')),
-                            activity.get('activity_type', 'N/A'),
-                            details
-                        ),
-                        tags=(activity.get('activity_type', '').lower(),)
-                    )
-                    
-                # Configure tags
-                self.activities_table.tag_configure('login', foreground='green')
-                self.activities_table.tag_configure('logout', foreground='orange')
-                self.activities_table.tag_configure('signup', foreground='blue')
-                self.activities_table.tag_configure('license_update', foreground='purple')
-                self.activities_table.tag_configure('user_deleted', foreground='red')
-                
-                # Update status
-                self.status_label.configure(
-                    text=f"Loaded {len(activities)} activities",
-                    text_color="black"
-                )
-                
-                # Update user filter
-                self._update_user_filter()
-                
-            else:
-                # Show error message
-                self.status_label.configure(
-                    text=f"Error: {activities}",
-                    text_color="red"
-                )
-                
-            # Reset button
-            self.refresh_button.configure(text="Refresh", state="normal")
+            # Update user filter
+            if users:
+                self._update_user_filter(users)
                 
         except Exception as e:
             logger.error(f"Error loading activities: {str(e)}")
@@ -265,24 +300,62 @@ class ActivityLogTab(BaseTab):
                 text=f"Error: {str(e)}",
                 text_color="red"
             )
-            self.refresh_button.configure(text="Refresh", state="normal")
+        
+    def _reset_load_buttons(self):
+        """Re-enable the refresh and load more buttons"""
+        self.refresh_button.configure(text="Refresh", state="normal")
+        self.load_more_button.configure(
+            text="Load More",
+            state="normal" if self.page_cursor is not None else "disabled"
+        )
+        
+    def _build_activity_row(self, activity, user_emails):
+        """Format an activity once into a table row"""
+        timestamp = activity.get('timestamp')
+        sort_time = ""
+        if timestamp:
+            if isinstance(timestamp, str):
+                # If it's already a string (ISO format), try to parse it
+                try:
+                    dt = datetime.fromisoformat(timestamp)
+                    formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
+                except ValueError:
+                    formatted_time = timestamp
+                sort_time = timestamp
+            else:
+                try:
+                    formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+                    sort_time = timestamp.isoformat()
+                except AttributeError:
+                    formatted_time = str(timestamp)
+                    sort_time = formatted_time
+        else:
+            formatted_time = "N/A"
+        
+        return {
+            "key": activity['id'],
+            "sort_time": sort_time,
+            "values": (
+                formatted_time,
+                self._get_user_email(activity.get('user_id', 'unknown'), user_emails),
+                activity.get('activity_type', 'N/A'),
+                self._format_activity_details(activity)
+            ),
+            "tags": (activity.get('activity_type', '').lower(),)
+        }
             
-    def _update_user_filter(self):
+    def _update_user_filter(self, users):
         """Update user filter with available users"""
         try:
-            # Get all users
-            success, users = self.firebase_auth.get_all_users()
-            
-            if success:
-                # Create user map
-                user_emails = ["All Users"]
-                for user in users:
-                    email = user.get('email')
-                    if email:
-                        user_emails.append(email)
-                        
-                # Update filter menu
-                self.user_filter_menu.configure(values=user_emails)
+            # Create user map
+            user_emails = ["All Users"]
+            for user in users:
+                email = user.get('email')
+                if email:
+                    user_emails.append(email)
+                    
+            # Update filter menu
+            self.user_filter_menu.configure(values=user_emails)
                 
         except Exception as e:
             logger.error(f"Error updating user filter: {str(e)}")
@@ -294,26 +367,22 @@ class ActivityLogTab(BaseTab):
             user_filter = self.user_filter_var.get()
             type_filter = self.type_filter_var.get()
             
-            # Show all items
-            for item in self.activities_table.get_children():
-                self.activities_table.item(item, tags=self.activities_table.item(item, "tags"))
+            # Start from all loaded rows
+            rows = self.activity_rows
                 
             # Apply user filter
             if user_filter != "All Users":
-                for item in self.activities_table.get_children():
-                    values = self.activities_table.item(item, "values")
-                    if values[1] != user_filter:
-                        self.activities_table.detach(item)
+                rows = [row for row in rows if row["values"][1] == user_filter]
                         
             # Apply type filter
             if type_filter != "All Activities":
-                for item in self.activities_table.get_children():
-                    values = self.activities_table.item(item, "values")
-                    if values[2] != type_filter:
-                        self.activities_table.detach(item)
+                rows = [row for row in rows if row["values"][2] == type_filter]
+            
+            # Show the filtered rows; only rows not shown yet are added
+            TableUtils.update_rows(self.activities_table, rows)
                         
             # Update status
-            visible_items = len(self.activities_table.get_children())
+            visible_items = len(rows)
             self.status_label.configure(
                 text=f"Showing {visible_items} activities",
                 text_color="black"
@@ -346,7 +415,7 @@ class ActivityLogTab(BaseTab):
         else:
             return str(details)
             
-    def _get_user_email(self, user_id):
+    def _get_user_email(self, user_id, user_emails):
         """Get user email from user ID"""
         if not user_id:
             return "N/A"
@@ -355,16 +424,4 @@ class ActivityLogTab(BaseTab):
         if self.firebase_auth.is_signed_in() and self.firebase_auth.current_user.get('localId') == user_id:
             return self.firebase_auth.current_user.get('email', 'N/A')
             
-        # Try to get from cached users
-        try:
-            success, users = self.firebase_auth.get_all_users()
-            
-            if success:
-                for user in users:
-                    if user.get('id') == user_id:
-                        return user.get('email', 'N/A')
-                        
-        except Exception:
-            pass
-            
-        return user_id
+        return user_emails.get(user_id, user_id)
@@ -7,8 +7,9 @@ from typing import Dict, List, Any, Optional, Callable
 from modules.api_client import FootballAPI
 from modules.db_manager import DatabaseManager
 from modules.settings_manager import SettingsManager
-from modules.translations import translate
+from modules.translations import translate, get_available_languages
 from tabs.base_tab.table_utils import TableUtils
+from tabs.base_tab.task_executor import Task, TaskExecutor, PRIORITY_NORMAL, get_shared_executor
 from tabs.base_tab.tooltip import ToolTip
 
 
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 class BaseTab:
     """Base class for all tabs with common functionality"""
     
+    # Settings whose change calls update_settings(); subclasses add the ones they use
+    SETTINGS_KEYS = ("appearance_mode", "color_theme", "font_size")
+    
     def __init__(self, parent, api: FootballAPI, db_manager: DatabaseManager, settings_manager: SettingsManager):
         self.parent = parent
         self.api = api
@@ -26,6 +30,9 @@ class BaseTab:
         # Get theme colors
         self.theme = self.settings_manager.get_theme()
         
+        # Widgets whose text is re-translated when the language changes: (widget, English text)
+        self._translated_widgets = []
+        
         # Create main frame
         self.main_frame = ctk.CTkFrame(self.parent)
         self.main_frame.grid(row=0, column=0, sticky="nsew", padx=2, pady=2)
@@ -105,6 +112,7 @@ class BaseTab:
             font=ctk.CTkFont(size=font_size, weight="bold")
         )
         title_label.grid(row=0, column=0, pady=10, sticky="w", padx=10)
+        self._track_translation(title_label, text)
         
         # Add refresh button
         self.refresh_button = self._create_button(
@@ -142,6 +150,60 @@ class BaseTab:
         # Reset refresh button
         self.refresh_button.configure(text="Refresh Data", state="normal")
         
+    @property
+    def executor(self) -> TaskExecutor:
+        """Shared background task executor"""
+        return get_shared_executor(self.parent)
+    
+    def run_in_background(self, func: Callable, *args, key: Optional[str] = None,
+                          priority: int = PRIORITY_NORMAL, on_success: Optional[Callable] = None,
+                          on_error: Optional[Callable] = None, on_progress: Optional[Callable] = None,
+                          on_done: Optional[Callable] = None, **kwargs) -> Task:
+        """
+        Run func(task, *args, **kwargs) on a worker thread.
+        
+        The function must not touch widgets; callbacks run on the main thread.
+        Starting a task with the same key cancels the previous one, so
+        repeated refresh clicks do not pile up.
+        
+        Args:
+            func: Function to run in the background
+            key: Optional task key, defaults to the function name
+            priority: Task priority (lower runs first)
+            on_success: Called with the function's return value
+            on_error: Called with the raised exception
+            on_progress: Called with (value, message) progress reports
+            on_done: Called after success or error
+            
+        Returns:
+            Task: Handle that can be used to cancel the task
+        """
+        if not hasattr(self, '_background_tasks'):
+            self._background_tasks = {}
+        
+        key = key or getattr(func, "__name__", "task")
+        previous = self._background_tasks.get(key)
+        if previous is not None and not previous.done:
+            previous.cancel()
+        
+        task = self.executor.submit(
+            func, *args,
+            priority=priority,
+            name=f"{type(self).__name__}.{key}",
+            on_success=on_success,
+            on_error=on_error,
+            on_progress=on_progress,
+            on_done=on_done,
+            **kwargs
+        )
+        self._background_tasks[key] = task
+        return task
+    
+    def cancel_background_tasks(self):
+        """Cancel all background tasks started by this tab"""
+        for task in getattr(self, '_background_tasks', {}).values():
+            task.cancel()
+        
     def _create_button(self, parent, text, command, width=150, height=32, tooltip_text=None, fg_color=None, hover_color=None):
         """Create a styled button with optional tooltip"""
         
@@ -165,6 +227,7 @@ class BaseTab:
             hover_color=hover_color,
             text_color="white",
         )
+        self._track_translation(button, text)
         
         # Add tooltip if provided
         if tooltip_text:
@@ -177,6 +240,30 @@ class BaseTab:
                 
         return button
         
+    def _track_translation(self, widget, text):
+        """Re-translate a widget's text when the language changes"""
+        self._translated_widgets.append((widget, text))
+        
+    def retranslate(self):
+        """Update the text of tracked widgets to the current language"""
+        languages = tuple(get_available_languages())
+        alive = []
+        for widget, text in self._translated_widgets:
+            try:
+                if not widget.winfo_exists():
+                    continue
+                alive.append((widget, text))
+                # Leave widgets whose text code has since changed (loading animations,
+                # status texts such as "No Data Found"); only a translation of the
+                # source text is replaced
+                current = widget.cget("text")
+                if current != text and current not in (translate(text, code) for code in languages):
+                    continue
+                widget.configure(text=translate(text))
+            except Exception as e:
+                logger.error(f"Error translating widget text '{text}': {str(e)}")
+        self._translated_widgets = alive
+        
     def _add_tooltip(self, widget, text):
         """Add tooltip to widget"""
         tooltip = ToolTip(widget, text)
@@ -0,0 +1,327 @@
+import logging
+import math
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+class CachedChart:
+    """
+    Base for matplotlib charts that keep their artists between updates.
+
+    Updates change bar sizes, wedge angles and label texts in place and ask
+    for a redraw with draw_idle(), so several updates in a row cost one draw.
+    Each rendered variant can be cached under a key such as
+    (league_id, "Points"): the rendered pixels are saved after the draw and
+    restored with a blit the next time the same key is shown, as long as
+    the chart still has the layout (e.g. the categories) it was saved with.
+    """
+
+    def __init__(self, fig, canvas):
+        """Wrap a figure and its canvas with a single axes."""
+        self.fig = fig
+        self.canvas = canvas
+        self.ax = fig.add_subplot(111)
+        self.message = None
+        self.current_key: Optional[Hashable] = None
+        # key -> (figure size in pixels, layout, saved background)
+        self.backgrounds: Dict[Hashable, Tuple[Tuple[int, int], Hashable, Any]] = {}
+        self._draw_connection = canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _figure_size(self) -> Tuple[int, int]:
+        """Current figure size in pixels"""
+        return int(self.fig.bbox.width), int(self.fig.bbox.height)
+
+    def _layout(self) -> Hashable:
+        """What a saved render depends on besides the data, such as the categories"""
+        return ()
+
+    def _on_draw(self, event):
+        """Save what was just drawn for the current key"""
+        if self.current_key is None:
+            return
+        try:
+            self.backgrounds[self.current_key] = (
+                self._figure_size(), self._layout(), self.canvas.copy_from_bbox(self.fig.bbox)
+            )
+        except Exception as e:
+            logger.debug(f"Could not cache chart background: {str(e)}")
+
+    def _present(self, key: Optional[Hashable] = None):
+        """Show the artists: blit the cached pixels for key if they fit, otherwise redraw when idle"""
+        self.current_key = key
+        cached = self.backgrounds.get(key) if key is not None else None
+        if cached is not None and cached[:2] == (self._figure_size(), self._layout()):
+            try:
+                self.canvas.restore_region(cached[2])
+                self.canvas.blit(self.fig.bbox)
+                return
+            except Exception as e:
+                logger.debug(f"Could not restore cached chart: {str(e)}")
+        self.canvas.draw_idle()
+
+    def invalidate(self, match: Optional[Callable[[Hashable], bool]] = None):
+        """Forget cached renders, or only those whose key matches"""
+        if match is None:
+            self.backgrounds.clear()
+        else:
+            for key in [key for key in self.backgrounds if match(key)]:
+                del self.backgrounds[key]
+
+    def _set_message(self, text: Optional[str]):
+        """Show a centered message instead of the chart, or hide it when text is None"""
+        if text is None:
+            if self.message is not None:
+                self.message.set_visible(False)
+            self.ax.axison = True
+            return
+        if self.message is None:
+            self.message = self.ax.text(0.5, 0.5, text, ha='center', va='center', transform=self.ax.transAxes)
+        self.message.set_text(text)
+        self.message.set_visible(True)
+        self.ax.axison = False
+
+    def show_message(self, text: str):
+        """Replace the chart with a centered message"""
+        self._set_data_visible(False)
+        self._set_message(text)
+        self._present()
+
+    def _set_data_visible(self, visible: bool):
+        """Show or hide the chart's data artists"""
+        raise NotImplementedError
+
+
+class BarChart(CachedChart):
+    """Bar chart whose bars and value labels are updated in place."""
+
+    def __init__(self, fig, canvas, horizontal: bool = False):
+        """Initialize an empty bar chart."""
+        super().__init__(fig, canvas)
+        self.horizontal = horizontal
+        self.categories: List[str] = []
+        self.bars = []
+        self.value_texts = []
+
+    def _layout(self) -> Hashable:
+        """Renders depend on the categories, so each league keeps its own"""
+        return (self.horizontal, tuple(self.categories))
+
+    def update(self, categories: Sequence[str], values: Sequence[float], key: Optional[Hashable] = None,
+               color: Optional[str] = None, title: str = "", xlabel: str = "", ylabel: str = "",
+               value_labels: Optional[Sequence[str]] = None):
+        """
+        Show values per category.
+
+        Args:
+            categories: Bar labels; the bars are only rebuilt when these change
+            values: Bar lengths
+            key: Cache key of this variant, e.g. (league_id, "Points")
+            color: Bar color
+            title: Axes title
+            xlabel: X axis label
+            ylabel: Y axis label
+            value_labels: Texts drawn at the end of each bar (the values if None)
+        """
+        categories = list(categories)
+        values = [value or 0 for value in values]
+        if value_labels is None:
+            value_labels = [f"{value:g}" for value in values]
+
+        rebuilt = categories != self.categories
+        if rebuilt:
+            self._rebuild(categories)
+
+        self._set_message(None)
+        self._set_data_visible(True)
+
+        # Move bars and labels to the new values
+        top = max(values, default=0)
+        offset = max(top * 0.01, 0.1)
+        for bar, text, value, label in zip(self.bars, self.value_texts, values, value_labels):
+            if self.horizontal:
+                bar.set_width(value)
+                text.set_position((value + offset, bar.get_y() + bar.get_height() / 2))
+            else:
+                bar.set_height(value)
+                text.set_position((bar.get_x() + bar.get_width() / 2, value + offset))
+            text.set_text(label)
+            if color is not None:
+                bar.set_color(color)
+
+        # Leave room for the labels past the longest bar
+        limit = top * 1.15 + 1 if top > 0 else 1
+        if self.horizontal:
+            self.ax.set_xlim(0, limit)
+        else:
+            self.ax.set_ylim(0, limit)
+
+        self.ax.set_title(title)
+        self.ax.set_xlabel(xlabel)
+        self.ax.set_ylabel(ylabel)
+
+        # Tick labels only change on a rebuild, so the layout is fitted once per category set
+        if rebuilt:
+            try:
+                self.fig.tight_layout()
+            except Exception as e:
+                logger.debug(f"Could not fit chart layout: {str(e)}")
+        self._present(key)
+
+    def _rebuild(self, categories: List[str]):
+        """Create one bar and one value label per category"""
+        self.ax.clear()
+        self.message = None
+        self.categories = categories
+        positions = range(len(categories))
+        if self.horizontal:
+            container = self.ax.barh(positions, [0] * len(categories))
+            self.ax.set_yticks(list(positions))
+            self.ax.set_yticklabels(categories)
+            self.value_texts = [self.ax.text(0, 0, "", ha='left', va='center') for _ in categories]
+        else:
+            container = self.ax.bar(positions, [0] * len(categories))
+            self.ax.set_xticks(list(positions))
+            self.ax.set_xticklabels(categories)
+            self.value_texts = [self.ax.text(0, 0, "", ha='center', va='bottom') for _ in categories]
+        self.bars = list(container.patches)
+
+    def _set_data_visible(self, visible: bool):
+        """Show or hide bars and labels"""
+        for artist in self.bars + self.value_texts:
+            artist.set_visible(visible)
+
+
+class PieChart(CachedChart):
+    """Pie chart whose wedges and percentage labels are updated in place."""
+
+    def __init__(self, fig, canvas, labels: Sequence[str], colors: Sequence[str], start_angle: float = 90):
+        """Create the wedges once; their sizes are set by update()."""
+        super().__init__(fig, canvas)
+        self.start_angle = start_angle
+        count = len(labels)
+        self.wedges, self.label_texts, self.percent_texts = self.ax.pie(
+            [1] * count, labels=list(labels), colors=list(colors), autopct='%1.1f%%', startangle=start_angle
+        )
+        self.ax.axis('equal')
+
+    def update(self, values: Sequence[float], key: Optional[Hashable] = None):
+        """Resize the wedges to the values; an all-zero pie shows nothing"""
+        total = sum(values)
+        if total <= 0:
+            self.show_message("No data")
+            return
+
+        self._set_message(None)
+        self.ax.axis('equal')
+        self.ax.axison = False
+        angle = self.start_angle
+        for wedge, label, percent, value in zip(self.wedges, self.label_texts, self.percent_texts, values):
+            sweep = 360.0 * value / total
+            wedge.set_theta1(angle)
+            wedge.set_theta2(angle + sweep)
+
+            # Place the texts like ax.pie() does: label outside, percentage inside
+            middle = math.radians(angle + sweep / 2)
+            x, y = math.cos(middle), math.sin(middle)
+            label.set_position((1.1 * x, 1.1 * y))
+            label.set_horizontalalignment('left' if x > 0 else 'right')
+            percent.set_position((0.6 * x, 0.6 * y))
+            percent.set_text(f"{100.0 * value / total:.1f}%")
+
+            # A zero slice shows no texts
+            visible = value > 0
+            wedge.set_visible(visible)
+            label.set_visible(visible)
+            percent.set_visible(visible)
+            angle += sweep
+        self._present(key)
+
+    def _set_data_visible(self, visible: bool):
+        """Show or hide wedges and texts"""
+        for artist in list(self.wedges) + list(self.label_texts) + list(self.percent_texts):
+            artist.set_visible(visible)
+
+
+class LineChart(CachedChart):
+    """Line chart over shared categories, such as dates, whose lines are updated in place."""
+
+    def __init__(self, fig, canvas, max_ticks: int = 12):
+        """Initialize an empty line chart."""
+        super().__init__(fig, canvas)
+        self.max_ticks = max_ticks
+        self.categories: List[str] = []
+        self.lines: Dict[str, Any] = {}
+        self.legend = None
+
+    def _layout(self) -> Hashable:
+        """Renders depend on the categories and the set of lines"""
+        return (tuple(self.categories), tuple(self.lines))
+
+    def update(self, categories: Sequence[str], series: Dict[str, Sequence[Optional[float]]],
+               key: Optional[Hashable] = None, colors: Optional[Dict[str, str]] = None,
+               title: str = "", ylabel: str = "", ylim: Optional[Tuple[float, float]] = None):
+        """
+        Show one line per series over the categories.
+
+        Args:
+            categories: X axis labels, e.g. bucket dates
+            series: Line label -> one value per category (None leaves a gap)
+            key: Cache key of this variant
+            colors: Line label -> color
+            title: Axes title
+            ylabel: Y axis label
+            ylim: Fixed Y axis range (fitted to the data if None)
+        """
+        categories = list(categories)
+        colors = colors or {}
+
+        # Lines are only created or dropped when the set of series changes
+        rebuilt = categories != self.categories or list(series) != list(self.lines)
+        if rebuilt:
+            self._rebuild(categories, list(series), colors)
+
+        self._set_message(None)
+        self._set_data_visible(True)
+
+        positions = list(range(len(categories)))
+        for label, values in series.items():
+            self.lines[label].set_data(positions, [math.nan if value is None else value for value in values])
+
+        if ylim is not None:
+            self.ax.set_ylim(*ylim)
+        else:
+            self.ax.relim()
+            self.ax.autoscale_view(scalex=False)
+        self.ax.set_title(title)
+        self.ax.set_ylabel(ylabel)
+
+        if rebuilt:
+            try:
+                self.fig.tight_layout()
+            except Exception as e:
+                logger.debug(f"Could not fit chart layout: {str(e)}")
+        self._present(key)
+
+    def _rebuild(self, categories: List[str], labels: List[str], colors: Dict[str, str]):
+        """Create one line per series and label at most max_ticks categories"""
+        self.ax.clear()
+        self.message = None
+        self.categories = categories
+        self.lines = {
+            label: self.ax.plot([], [], marker='o', markersize=3, label=label, color=colors.get(label))[0]
+            for label in labels
+        }
+        self.ax.set_xlim(-0.5, max(len(categories) - 0.5, 0.5))
+        step = max(1, math.ceil(len(categories) / self.max_ticks))
+        ticks = list(range(0, len(categories), step))
+        self.ax.set_xticks(ticks)
+        self.ax.set_xticklabels([categories[tick] for tick in ticks], rotation=30, ha='right')
+        self.ax.grid(True, alpha=0.3)
+        self.legend = self.ax.legend(loc='upper left', fontsize='small') if len(labels) > 1 else None
+
+    def _set_data_visible(self, visible: bool):
+        """Show or hide lines and legend"""
+        for line in self.lines.values():
+            line.set_visible(visible)
+        if self.legend is not None:
+            self.legend.set_visible(visible)
@@ -2,7 +2,10 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+from modules.instrumentation import timed
+from tabs.base_tab.virtual_table import VirtualTable
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +75,9 @@ class TableUtils:
         # Store the frame as an attribute of the table for future reference
         table.container_frame = frame
         
+        # Render rows through a virtual model (see TableUtils.set_rows)
+        table.virtual = VirtualTable(table, scrollbar)
+        
         return table
         
     @staticmethod    
@@ -136,10 +142,18 @@ class TableUtils:
         frame.grid_columnconfigure(0, weight=1)
         frame.grid_rowconfigure(0, weight=1)
         
+        # Render rows through a virtual model (see TableUtils.set_rows)
+        table.virtual = VirtualTable(table, vsb)
+        
         # Try to add sorting functionality
         try:
             from modules.table_sorter import TableSorter
-            sorter = TableSorter(table)
+            column_types = {
+                f"col{i}": col["type"]
+                for i, col in enumerate(columns)
+                if isinstance(col, dict) and "type" in col
+            }
+            sorter = TableSorter(table, column_types)
             table.sorter = sorter
             
             # Apply default sort by date if a date column exists
@@ -185,7 +199,8 @@ class TableUtils:
         
         Args:
             parent: Parent widget
-            columns: List of column configuration dictionaries
+            columns: List of column configuration dictionaries (text, width, anchor, stretch and
+                an optional sort "type" of "number", "date" or "string")
             height: Table height
             
         Returns:
@@ -230,10 +245,16 @@ class TableUtils:
                 table.column(i, width=col.get("width", 100), stretch=col.get("stretch", True))
                 table.heading(i, text=col.get("text", ""), anchor=col.get("anchor", "w"))
         
+        # Render rows through a virtual model (see TableUtils.set_rows)
+        table.virtual = VirtualTable(table, v_scrollbar)
+        
         # Try to import and initialize the TableSorter
         try:
             from modules.table_sorter import TableSorter
-            sorter = TableSorter(table)
+            
+            # Optional column schema ("number", "date" or "string") from the column config
+            column_types = {col["text"]: col["type"] for col in (columns or []) if "type" in col}
+            sorter = TableSorter(table, column_types)
             
             # Store the sorter reference in the table for future access
             table.sorter = sorter
@@ -254,18 +275,167 @@ class TableUtils:
         return frame, table
     
     @staticmethod
-    def add_row(table, values):
+    def add_row(table, values, tags=()):
         """
         Add a row to the table.
         
         Args:
             table: The table widget
             values: List of values for the row
+            tags: Optional tags for the row
+            
+        Returns:
+            str: Item ID of the new row, or None for virtualized tables
+        """
+        virtual = getattr(table, "virtual", None)
+        if virtual is not None and virtual.active:
+            virtual.append_rows([{"values": tuple(values), "tags": tuple(tags)}])
+            return None
+        return table.insert("", "end", values=values, tags=tags)
+    
+    @staticmethod
+    @timed("table.set_rows")
+    def set_rows(table, rows: Iterable[Any]):
+        """
+        Replace all rows of the table in one step.
+        
+        Tables created by TableUtils keep their rows in a virtual model and
+        only render the visible window, so this is cheap even for thousands
+        of rows. Plain treeviews fall back to a bulk clear and insert.
+        
+        Args:
+            table: The table widget
+            rows: Row dictionaries ({"values": (...), "tags": (...)}) or value sequences
+        """
+        virtual = getattr(table, "virtual", None)
+        if virtual is not None:
+            virtual.set_rows(rows)
+            return
+        
+        TableUtils.clear_table(table)
+        for row in rows:
+            if isinstance(row, dict):
+                table.insert("", "end", values=row.get("values", ()), tags=row.get("tags", ()))
+            else:
+                table.insert("", "end", values=row)
+    
+    @staticmethod
+    @timed("table.update_rows")
+    def update_rows(table, rows: Iterable[Dict[str, Any]], key: Any = "key",
+                    initial_sort: Optional[Tuple[str, bool]] = None) -> Dict[str, int]:
+        """
+        Update the table in place from a new row set, matching rows by key.
+
+        Only rows that were added, changed or removed are touched. Selection
+        and scroll position are kept, and a sort the user picked (or the
+        initial_sort) is re-applied so periodic refreshes cause no visible
+        churn. Otherwise rows are shown in the order given.
+
+        Args:
+            table: The table widget
+            rows: Row dictionaries ({"key": ..., "values": (...), "tags": (...)})
+            key: Name of the row field holding the key, or a function returning it
+            initial_sort: Optional (column, reverse) applied when the table was empty
+
+        Returns:
+            dict: Number of rows "inserted", "updated", "deleted" and "unchanged"
+        """
+        key_func = key if callable(key) else (lambda row: row.get(key))
+        rows = list(rows)
+        virtual = getattr(table, "virtual", None)
+
+        if virtual is not None:
+            was_empty = not virtual.get_rows()
+            stats = virtual.update_rows(rows, key_func)
+        else:
+            was_empty = not table.get_children()
+            stats = TableUtils._update_items(table, rows, key_func)
+
+        # Keep a sort the user or caller chose, or apply the default one on first load
+        sorter = getattr(table, "sorter", None)
+        if sorter is not None:
+            if was_empty and initial_sort:
+                sorter.apply_initial_sort(initial_sort[0], reverse=initial_sort[1])
+            elif sorter.sort_column and (sorter.user_sorted or initial_sort):
+                sorter.sort_by_column(sorter.sort_column, sorter.sort_reverse)
+            elif sorter.sort_column:
+                # Rows keep the caller's order, so drop the creation-time sort indicator
+                sorter.reset_sort()
+
+        return stats
+
+    @staticmethod
+    def _update_items(table, rows: List[Dict[str, Any]], key_func) -> Dict[str, int]:
+        """Keyed in-place update for plain treeviews, using the key as item ID."""
+        stats = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        wanted = []
+
+        for row in rows:
+            item = str(key_func(row))
+            values = tuple(row.get("values", ()))
+            tags = tuple(row.get("tags", ()))
+            if table.exists(item):
+                current_values = tuple(str(v) for v in table.item(item, "values"))
+                current_tags = tuple(str(t) for t in table.item(item, "tags"))
+                if current_values == tuple(str(v) for v in values) and \
+                        current_tags == tuple(str(t) for t in tags):
+                    stats["unchanged"] += 1
+                else:
+                    table.item(item, values=values, tags=tags)
+                    stats["updated"] += 1
+            else:
+                table.insert("", "end", iid=item, values=values, tags=tags)
+                stats["inserted"] += 1
+            wanted.append(item)
+
+        # Remove rows that disappeared
+        stale = set(table.get_children()) - set(wanted)
+        if stale:
+            table.delete(*stale)
+        stats["deleted"] = len(stale)
+
+        # Restore the new order where it differs
+        if list(table.get_children()) != wanted:
+            for position, item in enumerate(wanted):
+                table.move(item, "", position)
+
+        return stats
+
+    @staticmethod
+    def get_rows(table) -> List[Tuple]:
+        """
+        Get the values of all rows in display order, including rows that
+        are not currently rendered.
+        
+        Args:
+            table: The table widget
             
         Returns:
-            str: Item ID of the new row
+            list: List of value tuples
         """
-        return table.insert("", "end", values=values)
+        virtual = getattr(table, "virtual", None)
+        if virtual is not None and virtual.active:
+            return [row["values"] for row in virtual.get_rows()]
+        return [table.item(item, "values") for item in table.get_children()]
+    
+    @staticmethod
+    def get_row_data(table, item) -> Optional[Dict[str, Any]]:
+        """
+        Get the model row rendered in a table item.
+        
+        Args:
+            table: The table widget
+            item: Treeview item ID
+            
+        Returns:
+            dict: Row dictionary with "values", "tags" and any extra keys, or None
+        """
+        virtual = getattr(table, "virtual", None)
+        if virtual is not None and virtual.active:
+            return virtual.row_for_item(item)
+        if not table.exists(item):
+            return None
+        return {"values": table.item(item, "values"), "tags": table.item(item, "tags")}
         
     @staticmethod
     def clear_table(table):
@@ -275,8 +445,14 @@ class TableUtils:
         Args:
             table: The table widget
         """
-        for item in table.get_children():
-            table.delete(item)
+        virtual = getattr(table, "virtual", None)
+        if virtual is not None and virtual.active:
+            virtual.clear()
+            return
+        
+        children = table.get_children()
+        if children:
+            table.delete(*children)
             
     @staticmethod
     def get_selected_row(table):
@@ -303,4 +479,4 @@ class TableUtils:
         for i, col in enumerate(columns):
             row_data[col] = values[i] if i < len(values) else None
             
-        return row_data
\ No newline at end of file
+        return row_data
@@ -0,0 +1,293 @@
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Any, Optional, Callable
+
+from modules.instrumentation import timer, observe
+
+logger = logging.getLogger(__name__)
+
+# Task priorities (lower runs first)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task function when its task has been cancelled"""
+    pass
+
+
+class Task:
+    """
+    Handle for a unit of background work.
+
+    The task function receives this handle as its first argument and can use
+    it to report progress and to check for cancellation. Callbacks are always
+    invoked on the Tk main thread.
+    """
+
+    def __init__(self, executor, func: Callable, args: tuple, kwargs: Dict[str, Any],
+                 priority: int = PRIORITY_NORMAL, name: Optional[str] = None, group: Optional[str] = None,
+                 on_success: Optional[Callable] = None, on_error: Optional[Callable] = None,
+                 on_progress: Optional[Callable] = None, on_done: Optional[Callable] = None):
+        self.executor = executor
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.name = name or getattr(func, "__name__", "task")
+        self.group = group
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.result = None
+        self.error = None
+        self.done = False
+        self.submitted_at = time.perf_counter()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation; pending tasks are skipped and callbacks are dropped"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested"""
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Raise TaskCancelled if the task has been cancelled (call from the task function)"""
+        if self.cancelled:
+            raise TaskCancelled(self.name)
+
+    def report_progress(self, value: float, message: Optional[str] = None):
+        """
+        Report progress from the worker thread.
+
+        Args:
+            value: Progress between 0.0 and 1.0
+            message: Optional status text
+        """
+        if self.on_progress is not None and not self.cancelled:
+            self.executor._post(self, self.on_progress, value, message)
+
+    def post(self, callback: Callable, *args):
+        """Run a callback on the main thread (for example a status log update)"""
+        if not self.cancelled:
+            self.executor._post(self, callback, *args)
+
+
+# Executor shared by every tab, created on first use
+_shared_executor = None
+
+
+def get_shared_executor(widget) -> "TaskExecutor":
+    """
+    Get the application-wide task executor.
+
+    Args:
+        widget: Any Tk widget; the executor polls through its toplevel window
+
+    Returns:
+        TaskExecutor: The shared executor
+    """
+    global _shared_executor
+    if _shared_executor is None:
+        _shared_executor = TaskExecutor(widget.winfo_toplevel())
+    return _shared_executor
+
+
+class TaskExecutor:
+    """
+    Small priority thread pool whose results are delivered on the Tk main thread.
+
+    Work runs on daemon worker threads. Results, errors and progress updates
+    are put on a queue that the main loop drains with after(), so callbacks
+    can safely update widgets. The poll loop only runs while tasks are in
+    flight.
+    """
+
+    def __init__(self, widget, max_workers: int = 4, poll_interval: int = 50):
+        """
+        Initialize the executor.
+
+        Args:
+            widget: Any Tk widget, used to schedule polling on the main loop
+            max_workers: Maximum number of worker threads
+            poll_interval: Milliseconds between result queue polls
+        """
+        self.widget = widget
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self._tasks = queue.PriorityQueue()
+        self._results = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._running: Dict[int, Task] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._idle_workers = 0
+        self._polling = False
+        self._shutdown = False
+
+    def submit(self, func: Callable, *args, priority: int = PRIORITY_NORMAL, name: Optional[str] = None,
+               group: Optional[str] = None, on_success: Optional[Callable] = None,
+               on_error: Optional[Callable] = None, on_progress: Optional[Callable] = None,
+               on_done: Optional[Callable] = None, **kwargs) -> Task:
+        """
+        Queue a function to run on a worker thread. Must be called from the main thread.
+
+        Args:
+            func: Function called as func(task, *args, **kwargs) on a worker thread
+            priority: Lower values run first (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+            name: Optional task name for logging
+            group: Optional group name, used by cancel_group()
+            on_success: Called on the main thread with the function's return value
+            on_error: Called on the main thread with the raised exception
+            on_progress: Called on the main thread with (value, message)
+            on_done: Called on the main thread after success or error
+
+        Returns:
+            Task: Handle that can be used to cancel the task
+        """
+        if self._shutdown:
+            raise RuntimeError("TaskExecutor has been shut down")
+
+        task = Task(self, func, args, kwargs, priority, name, group,
+                    on_success, on_error, on_progress, on_done)
+
+        with self._lock:
+            self._in_flight += 1
+            start_worker = self._tasks.qsize() >= self._idle_workers and len(self._workers) < self.max_workers
+
+        self._tasks.put((priority, next(self._counter), task))
+
+        if start_worker:
+            self._start_worker()
+
+        self._ensure_polling()
+        return task
+
+    def cancel_group(self, group: str):
+        """Cancel every queued or running task in a group"""
+        with self._lock:
+            pending = [entry[2] for entry in list(self._tasks.queue)]
+            running = list(self._running.values())
+        for task in pending + running:
+            if task.group == group:
+                task.cancel()
+
+    def shutdown(self):
+        """Stop accepting work and let the worker threads exit"""
+        self._shutdown = True
+        for _ in self._workers:
+            self._tasks.put((float("inf"), next(self._counter), None))
+
+    # Worker side
+
+    def _start_worker(self):
+        """Start a new daemon worker thread"""
+        worker = threading.Thread(target=self._worker_loop, name=f"TaskWorker-{len(self._workers) + 1}", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _worker_loop(self):
+        """Take tasks off the priority queue until shut down"""
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            _, _, task = self._tasks.get()
+            with self._lock:
+                self._idle_workers -= 1
+
+            if task is None:
+                return
+
+            if task.cancelled:
+                self._finish(task)
+                continue
+
+            with self._lock:
+                self._running[threading.get_ident()] = task
+            observe("task.queue_wait_ms", (time.perf_counter() - task.submitted_at) * 1000)
+            try:
+                with timer(f"task.{task.name}"):
+                    task.result = task.func(task, *task.args, **task.kwargs)
+            except TaskCancelled:
+                logger.info(f"Task {task.name} cancelled")
+            except Exception as e:
+                logger.error(f"Error in background task {task.name}: {str(e)}")
+                task.error = e
+            finally:
+                with self._lock:
+                    self._running.pop(threading.get_ident(), None)
+
+            self._finish(task)
+
+    def _finish(self, task: Task):
+        """Queue the completion callbacks of a task for the main thread"""
+        task.done = True
+        self._results.put((task, None, ()))
+
+    def _post(self, task: Task, callback: Callable, *args):
+        """Queue a callback for the main thread"""
+        self._results.put((task, callback, args))
+
+    # Main thread side
+
+    def _ensure_polling(self):
+        """Start the main-loop poll if it is not already running"""
+        if self._polling:
+            return
+        self._polling = True
+        try:
+            self.widget.after(self.poll_interval, self._poll)
+        except Exception as e:
+            self._polling = False
+            logger.error(f"Error scheduling task executor poll: {str(e)}")
+
+    def _poll(self):
+        """Deliver queued callbacks on the main thread"""
+        while True:
+            try:
+                task, callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if callback is not None:
+                # Progress update
+                if not task.cancelled:
+                    self._call(callback, *args)
+                continue
+
+            # Completion
+            with self._lock:
+                self._in_flight -= 1
+            if task.cancelled:
+                continue
+            if task.error is not None:
+                if task.on_error is not None:
+                    self._call(task.on_error, task.error)
+            elif task.on_success is not None:
+                self._call(task.on_success, task.result)
+            if task.on_done is not None:
+                self._call(task.on_done)
+
+        with self._lock:
+            busy = self._in_flight > 0
+        if busy:
+            self.widget.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
+
+    @staticmethod
+    def _call(callback: Callable, *args):
+        """Invoke a callback, logging instead of breaking the poll loop"""
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.error(f"Error in task callback: {str(e)}")
@@ -0,0 +1,393 @@
+import tkinter as tk
+from tkinter import ttk
+import logging
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+from modules.instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+class VirtualTable:
+    """
+    Virtualized rendering for a ttk.Treeview.
+
+    The table keeps every row in a backing model and only materializes the
+    rows that fit in the visible window. Scrolling re-uses the same Treeview
+    items ("slots") and just rewrites their values, so inserting, clearing or
+    replacing thousands of rows costs the same as a single screen of rows.
+
+    Rows are dictionaries with a "values" tuple and optional "tags" tuple.
+    Any other keys (for example "data") are kept untouched and can be read
+    back with row_for_item().
+    """
+
+    # Rows rendered before the widget has been laid out
+    DEFAULT_VISIBLE_ROWS = 20
+
+    def __init__(self, treeview: ttk.Treeview, scrollbar: Optional[ttk.Scrollbar] = None):
+        """Attach a virtual row model to a treeview and its vertical scrollbar."""
+        self.treeview = treeview
+        self.scrollbar = scrollbar
+        self.rows: List[Dict[str, Any]] = []
+        self.active = False
+        self.offset = 0
+        self.visible_rows = self.DEFAULT_VISIBLE_ROWS
+        self.slots: List[str] = []
+        # Row object currently shown in each slot, to skip redundant writes
+        self.slot_rows: List[Optional[Dict[str, Any]]] = []
+        self.selected_indices = set()
+        # <<TreeviewSelect>> events still to come from our own selection_set calls
+        self._pending_select_events = 0
+
+        # Bumped on every set_rows so caches keyed on the data can be invalidated
+        self.version = 0
+
+        # Called when the user scrolls to the last row, e.g. to load another page
+        self.on_scroll_end: Optional[Callable[[], None]] = None
+
+        # Route scrolling through the model
+        if self.scrollbar is not None:
+            self.scrollbar.configure(command=self.yview)
+        self.treeview.configure(yscrollcommand=self._on_treeview_scroll)
+
+        # Use a dedicated bind tag so tab-level bindings on the widget
+        # (for example <<TreeviewSelect>>) do not replace ours
+        self.bind_tag = f"VirtualTable{id(self)}"
+        self.treeview.bindtags((self.bind_tag,) + self.treeview.bindtags())
+        self.treeview.bind_class(self.bind_tag, "<Configure>", self._on_configure)
+        self.treeview.bind_class(self.bind_tag, "<MouseWheel>", self._on_mousewheel)
+        self.treeview.bind_class(self.bind_tag, "<Button-4>", self._on_mousewheel)
+        self.treeview.bind_class(self.bind_tag, "<Button-5>", self._on_mousewheel)
+        self.treeview.bind_class(self.bind_tag, "<Up>", lambda e: self._on_arrow_key(-1))
+        self.treeview.bind_class(self.bind_tag, "<Down>", lambda e: self._on_arrow_key(1))
+        self.treeview.bind_class(self.bind_tag, "<Prior>", lambda e: self._on_page_key(-1))
+        self.treeview.bind_class(self.bind_tag, "<Next>", lambda e: self._on_page_key(1))
+        self.treeview.bind_class(self.bind_tag, "<<TreeviewSelect>>", self._on_select)
+
+    # Model operations
+
+    @timed("table.virtual.set_rows")
+    def set_rows(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Replace the whole backing model and re-render the visible window.
+
+        Args:
+            rows: Iterable of row dictionaries with "values" and optional "tags"
+        """
+        if not self.active:
+            # Drop anything inserted directly before virtualization took over
+            children = self.treeview.get_children()
+            if children:
+                self.treeview.delete(*children)
+            self.active = True
+
+        self.rows = [self._normalize_row(row) for row in rows]
+        self.version += 1
+        self.selected_indices = set()
+        # Repaint every slot, rows may have been edited in place
+        self.slot_rows = [None] * len(self.slots)
+        self.offset = min(self.offset, self._max_offset())
+        self._render()
+
+    @timed("table.virtual.update_rows")
+    def update_rows(self, rows: Iterable[Dict[str, Any]], key: Callable[[Dict[str, Any]], Any]) -> Dict[str, int]:
+        """
+        Merge a new row set into the model by key.
+
+        Rows whose values and tags did not change keep their existing row
+        object (and any cached sort keys), so re-rendering them is skipped.
+        Selection follows the row keys and the first visible row stays
+        anchored at the top of the window.
+
+        Args:
+            rows: Iterable of row dictionaries with "values" and optional "tags"
+            key: Function returning the identity of a row
+
+        Returns:
+            dict: Number of rows "inserted", "updated", "deleted" and "unchanged"
+        """
+        if not self.active:
+            self.set_rows(rows)
+            return {"inserted": len(self.rows), "updated": 0, "deleted": 0, "unchanged": 0}
+
+        # Remember selection and scroll anchor by key
+        selected_keys = set(key(row) for row in self.selected_rows())
+        anchor_key = key(self.rows[self.offset]) if self.offset < len(self.rows) else None
+
+        existing = {}
+        for row in self.rows:
+            existing.setdefault(key(row), row)
+
+        stats = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        merged = []
+        for row in rows:
+            row = self._normalize_row(row)
+            old = existing.pop(key(row), None)
+            if old is None:
+                stats["inserted"] += 1
+                merged.append(row)
+            elif old["values"] == row["values"] and tuple(old["tags"]) == tuple(row["tags"]):
+                stats["unchanged"] += 1
+                merged.append(old)
+            else:
+                stats["updated"] += 1
+                merged.append(row)
+        stats["deleted"] = len(existing)
+
+        self.rows = merged
+        self.version += 1
+        self.selected_indices = set(i for i, row in enumerate(self.rows) if key(row) in selected_keys)
+
+        # Keep the same row at the top of the window where possible
+        if anchor_key is not None:
+            for i, row in enumerate(self.rows):
+                if key(row) == anchor_key:
+                    self.offset = i
+                    break
+        self.offset = max(0, min(self.offset, self._max_offset()))
+
+        self._render()
+        return stats
+
+    def append_rows(self, rows: Iterable[Dict[str, Any]]):
+        """Add rows at the end of the model without rebuilding it"""
+        if not self.active:
+            self.set_rows(rows)
+            return
+        self.rows.extend(self._normalize_row(row) for row in rows)
+        self.version += 1
+        self._render()
+
+    def clear(self):
+        """Remove all rows from the model"""
+        self.set_rows([])
+
+    @timed("table.virtual.sort")
+    def sort(self, key: Callable[[Dict[str, Any]], Any], reverse: bool = False):
+        """Sort the backing model in place and re-render"""
+        selected = [self.rows[i] for i in sorted(self.selected_indices) if i < len(self.rows)]
+        self.rows.sort(key=key, reverse=reverse)
+        self._reselect(selected)
+        self._render()
+
+    def get_rows(self) -> List[Dict[str, Any]]:
+        """Get all rows of the backing model in display order"""
+        return self.rows
+
+    def row_for_item(self, item: str) -> Optional[Dict[str, Any]]:
+        """Get the model row currently rendered in a treeview item"""
+        try:
+            index = self.offset + self.slots.index(item)
+        except ValueError:
+            return None
+        return self.rows[index] if index < len(self.rows) else None
+
+    def selected_rows(self) -> List[Dict[str, Any]]:
+        """Get the selected model rows, including rows scrolled out of view"""
+        return [self.rows[i] for i in sorted(self.selected_indices) if i < len(self.rows)]
+
+    def see(self, index: int):
+        """Scroll so that the row at the given model index is visible"""
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible_rows:
+            self.offset = index - self.visible_rows + 1
+        self.offset = max(0, min(self.offset, self._max_offset()))
+        self._render()
+
+    # Scrolling
+
+    def yview(self, *args):
+        """Scrollbar command handler (moveto/scroll) for the virtual model"""
+        if not self.active:
+            return self.treeview.yview(*args)
+
+        if not args:
+            return self._fractions()
+
+        if args[0] == "moveto":
+            fraction = float(args[1])
+            self.offset = int(round(fraction * len(self.rows)))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self.visible_rows - 1)
+            self.offset += amount
+
+        self.offset = max(0, min(self.offset, self._max_offset()))
+        self._render()
+        self._check_scroll_end()
+
+    def _check_scroll_end(self):
+        """Notify on_scroll_end when the window shows the last row"""
+        if self.on_scroll_end is not None and self.rows and self.offset + len(self.slots) >= len(self.rows):
+            self.on_scroll_end()
+
+    def _fractions(self):
+        """Get the (first, last) fractions of the visible window"""
+        total = len(self.rows)
+        if total == 0:
+            return 0.0, 1.0
+        first = self.offset / total
+        last = min(1.0, (self.offset + len(self.slots)) / total)
+        return first, last
+
+    def _max_offset(self) -> int:
+        """Get the largest valid window offset"""
+        return max(0, len(self.rows) - self.visible_rows)
+
+    def _on_treeview_scroll(self, first, last):
+        """Forward the treeview's own scroll report while not virtualized"""
+        if self.active or self.scrollbar is None:
+            return
+        self.scrollbar.set(first, last)
+
+    def _on_mousewheel(self, event):
+        """Scroll the model with the mouse wheel"""
+        if not self.active:
+            return None
+
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        else:
+            # Windows reports multiples of 120, macOS small deltas
+            step = -3 if event.delta > 0 else 3
+
+        self.yview("scroll", step, "units")
+        return "break"
+
+    def _on_arrow_key(self, direction: int):
+        """Move the focused row, scrolling the window at its edges"""
+        if not self.active or not self.rows:
+            return None
+
+        focus = self.treeview.focus()
+        if focus in self.slots:
+            index = self.offset + self.slots.index(focus) + direction
+        else:
+            index = self.offset
+        index = max(0, min(index, len(self.rows) - 1))
+
+        self.see(index)
+        slot = self.slots[index - self.offset]
+        self.selected_indices = {index}
+        self.treeview.selection_set(slot)
+        self.treeview.focus(slot)
+        self._check_scroll_end()
+        return "break"
+
+    def _on_page_key(self, direction: int):
+        """Scroll one page with Page Up / Page Down"""
+        if not self.active:
+            return None
+        self.yview("scroll", direction, "pages")
+        return "break"
+
+    def _on_configure(self, event=None):
+        """Recompute the number of visible rows after a resize"""
+        visible = self._compute_visible_rows()
+        if visible != self.visible_rows:
+            self.visible_rows = visible
+            self.offset = max(0, min(self.offset, self._max_offset()))
+            if self.active:
+                self._render()
+
+    def _compute_visible_rows(self) -> int:
+        """Work out how many rows fit in the treeview's current height"""
+        height = self.treeview.winfo_height()
+        if height <= 1:
+            return self.visible_rows
+
+        header_height = None
+        row_height = None
+
+        # Measure an existing row if one is on screen
+        if self.slots:
+            bbox = self.treeview.bbox(self.slots[0])
+            if bbox:
+                header_height = bbox[1]
+                row_height = bbox[3]
+
+        if not row_height:
+            try:
+                row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 0)
+            except (tk.TclError, ValueError):
+                row_height = 0
+            row_height = row_height or 20
+
+        if header_height is None:
+            header_height = row_height
+
+        return max(1, (height - header_height) // row_height)
+
+    # Selection
+
+    def _on_select(self, event=None):
+        """Remember the selected rows by model index"""
+        if not self.active:
+            return None
+
+        # Re-syncing slots after a scroll is not a user selection, so keep it from tab handlers
+        if self._pending_select_events:
+            self._pending_select_events -= 1
+            return "break"
+
+        window = range(self.offset, self.offset + len(self.slots))
+        selected = set(i for i in self.selected_indices if i not in window)
+        for item in self.treeview.selection():
+            if item in self.slots:
+                selected.add(self.offset + self.slots.index(item))
+        self.selected_indices = selected
+        return None
+
+    def _reselect(self, rows: List[Dict[str, Any]]):
+        """Restore selection to the given row objects after a reorder"""
+        wanted = set(id(row) for row in rows)
+        self.selected_indices = set(i for i, row in enumerate(self.rows) if id(row) in wanted)
+
+    # Rendering
+
+    @timed("table.virtual.render")
+    def _render(self):
+        """Materialize the visible window of rows into the treeview slots"""
+        count = min(self.visible_rows, len(self.rows) - self.offset)
+        count = max(0, count)
+
+        # Grow or shrink the slot pool
+        while len(self.slots) < count:
+            self.slots.append(self.treeview.insert("", "end"))
+            self.slot_rows.append(None)
+        if len(self.slots) > count:
+            self.treeview.delete(*self.slots[count:])
+            del self.slots[count:]
+            del self.slot_rows[count:]
+
+        selection = []
+        for i, slot in enumerate(self.slots):
+            index = self.offset + i
+            row = self.rows[index]
+            # Only touch slots that now show a different row object
+            if self.slot_rows[i] is not row:
+                self.treeview.item(slot, values=row["values"], tags=row["tags"])
+                self.slot_rows[i] = row
+            if index in self.selected_indices:
+                selection.append(slot)
+
+        if tuple(selection) != tuple(self.treeview.selection()):
+            # Tk queues <<TreeviewSelect>> for this change, _on_select swallows it
+            self._pending_select_events += 1
+            self.treeview.selection_set(selection)
+
+        if self.scrollbar is not None:
+            self.scrollbar.set(*self._fractions())
+
+    @staticmethod
+    def _normalize_row(row) -> Dict[str, Any]:
+        """Accept plain value sequences as well as row dictionaries"""
+        if isinstance(row, dict):
+            row.setdefault("tags", ())
+            row["values"] = tuple(row.get("values", ()))
+            return row
+        return {"values": tuple(row), "tags": ()}
@@ -9,6 +9,7 @@ from datetime import datetime
 from tkinter import filedialog
 
 from modules.league_names import get_league_display_name
+from tabs.base_tab.table_utils import TableUtils
 
 logger = logging.getLogger(__name__)
 
@@ -76,8 +77,7 @@ class DataCollectionExport:
             writer.writerow(headers)
             
             # Write data
-            for item in self.ui_elements["data_table"].get_children():
-                values = self.ui_elements["data_table"].item(item, "values")
+            for values in TableUtils.get_rows(self.ui_elements["data_table"]):
                 writer.writerow(values)
     
     def _export_to_json(self, file_path, collected_data, league_id, data_type):
@@ -94,8 +94,7 @@ class DataCollectionExport:
         
         # Add items based on data type
         if data_type == "Fixtures":
-            for item in self.ui_elements["data_table"].get_children():
-                values = self.ui_elements["data_table"].item(item, "values")
+            for values in TableUtils.get_rows(self.ui_elements["data_table"]):
                 json_data["items"].append({
                     "id": values[0],
                     "home_team": values[1],
@@ -105,8 +104,7 @@ class DataCollectionExport:
                     "score": values[5]
                 })
         elif data_type == "Teams":
-            for item in self.ui_elements["data_table"].get_children():
-                values = self.ui_elements["data_table"].item(item, "values")
+            for values in TableUtils.get_rows(self.ui_elements["data_table"]):
                 json_data["items"].append({
                     "id": values[0],
                     "name": values[1],
@@ -116,8 +114,7 @@ class DataCollectionExport:
                     "capacity": values[5]
                 })
         elif data_type == "Players":
-            for item in self.ui_elements["data_table"].get_children():
-                values = self.ui_elements["data_table"].item(item, "values")
+            for values in TableUtils.get_rows(self.ui_elements["data_table"]):
                 json_data["items"].append({
                     "id": values[0],
                     "name": values[1],
@@ -127,8 +124,7 @@ class DataCollectionExport:
                     "nationality": values[5]
                 })
         else:  # Standings
-            for item in self.ui_elements["data_table"].get_children():
-                values = self.ui_elements["data_table"].item(item, "values")
+            for values in TableUtils.get_rows(self.ui_elements["data_table"]):
                 json_data["items"].append({
                     "position": values[0],
                     "team": values[1],
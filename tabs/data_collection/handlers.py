@@ -6,6 +6,8 @@ import logging
 from typing import Dict, List, Any, Optional, Callable
 
 from modules.league_names import get_league_options, get_league_display_name
+from modules.profiler import profiled
+from tabs.base_tab.table_utils import TableUtils
 from tabs.data_collection.export import DataCollectionExport
 
 logger = logging.getLogger(__name__)
@@ -82,6 +84,7 @@ class DataCollectionHandlers:
         # Get data in a separate thread
         self.parent.after(100, lambda: self._fetch_data_thread(selected_league, selected_data_type))
     
+    @profiled("data_collection_fetch")
     def _fetch_data_thread(self, selected_league, selected_data_type):
         """Fetch data from API in a separate thread"""
         try:
@@ -116,22 +119,22 @@ class DataCollectionHandlers:
     
     def _update_data_table(self, data_type):
         """Update the data table with fetched data"""
-        # Clear table
-        for item in self.ui_elements["data_table"].get_children():
-            self.ui_elements["data_table"].delete(item)
-            
-        # Add data based on type
+        # Build rows based on type
         if data_type == "Fixtures":
-            self._update_fixtures_table()
+            rows = self._get_fixtures_rows()
         elif data_type == "Teams":
-            self._update_teams_table()
+            rows = self._get_teams_rows()
         elif data_type == "Players":
-            self._update_players_table()
+            rows = self._get_players_rows()
         else:  # Standings
-            self._update_standings_table()
+            rows = self._get_standings_rows()
+        
+        # Replace table contents in one pass
+        TableUtils.set_rows(self.ui_elements["data_table"], rows)
     
-    def _update_fixtures_table(self):
-        """Update table with fixtures data"""
+    def _get_fixtures_rows(self):
+        """Build table rows from fixtures data"""
+        rows = []
         for fixture in self.collected_data:
             # Get fixture data
             fixture_id = fixture['fixture']['id']
@@ -147,20 +150,19 @@ class DataCollectionHandlers:
                 score = "vs"
                 
             # Add row
-            self.ui_elements["data_table"].insert(
-                "", "end",
-                values=(
-                    fixture_id,
-                    home_team,
-                    away_team,
-                    date,
-                    status,
-                    score
-                )
-            )
+            rows.append((
+                fixture_id,
+                home_team,
+                away_team,
+                date,
+                status,
+                score
+            ))
+        return rows
     
-    def _update_teams_table(self):
-        """Update table with teams data"""
+    def _get_teams_rows(self):
+        """Build table rows from teams data"""
+        rows = []
         for team in self.collected_data:
             # Get team data (placeholder)
             team_id = team['team']['id']
@@ -171,20 +173,19 @@ class DataCollectionHandlers:
             capacity = "50000"  # Placeholder
             
             # Add row
-            self.ui_elements["data_table"].insert(
-                "", "end",
-                values=(
-                    team_id,
-                    name,
-                    country,
-                    founded,
-                    stadium,
-                    capacity
-                )
-            )
+            rows.append((
+                team_id,
+                name,
+                country,
+                founded,
+                stadium,
+                capacity
+            ))
+        return rows
     
-    def _update_players_table(self):
-        """Update table with players data"""
+    def _get_players_rows(self):
+        """Build table rows from players data"""
+        rows = []
         for player in self.collected_data:
             # Get player data (placeholder)
             player_id = player['player']['id']
@@ -195,20 +196,19 @@ class DataCollectionHandlers:
             nationality = "England"  # Placeholder
             
             # Add row
-            self.ui_elements["data_table"].insert(
-                "", "end",
-                values=(
-                    player_id,
-                    name,
-                    team,
-                    position,
-                    age,
-                    nationality
-                )
-            )
+            rows.append((
+                player_id,
+                name,
+                team,
+                position,
+                age,
+                nationality
+            ))
+        return rows
     
-    def _update_standings_table(self):
-        """Update table with standings data"""
+    def _get_standings_rows(self):
+        """Build table rows from standings data"""
+        rows = []
         for team in self.collected_data:
             # Get team data
             position = team['rank']
@@ -222,20 +222,18 @@ class DataCollectionHandlers:
             points = team['points']
             
             # Add row
-            self.ui_elements["data_table"].insert(
-                "", "end",
-                values=(
-                    position,
-                    team_name,
-                    played,
-                    wins,
-                    draws,
-                    losses,
-                    goals_for,
-                    goals_against,
-                    points
-                )
-            )
+            rows.append((
+                position,
+                team_name,
+                played,
+                wins,
+                draws,
+                losses,
+                goals_for,
+                goals_against,
+                points
+            ))
+        return rows
     
     def _export_data(self, selected_league, selected_data_type):
         """Export data to file"""
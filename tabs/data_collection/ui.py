@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 
 from modules.league_names import get_league_options
+from tabs.base_tab.table_utils import TableUtils
 
 
 class DataCollectionUI:
@@ -287,8 +288,7 @@ class DataCollectionUI:
             ]
             
         # Recreate table with new columns
-        for item in data_table.get_children():
-            data_table.delete(item)
+        TableUtils.clear_table(data_table)
             
         # Update table columns
         for i, col in enumerate(data_table["columns"]):
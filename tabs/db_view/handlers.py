@@ -3,16 +3,22 @@ Event handlers and data processing for the Database View tab.
 """
 
 import logging
-import pandas as pd
 from datetime import datetime
 from tkinter import filedialog
 from typing import Dict, List, Any, Optional, Callable
 
+from modules.lazy_imports import lazy_import
+from modules.profiler import profiled
 from modules.translations import translate
+from tabs.base_tab.table_utils import TableUtils
+from tabs.base_tab.task_executor import get_shared_executor
 from tabs.db_view.table_config import TableConfig
 
 logger = logging.getLogger(__name__)
 
+# pandas is only needed for CSV export
+pd = lazy_import("pandas")
+
 class DbViewHandlers:
     """Handlers for the Database View tab events and data processing."""
     
@@ -24,6 +30,8 @@ class DbViewHandlers:
         self.parent = parent
         self.table_config = TableConfig()
         self.current_data = []
+        self.load_task = None
+        self.verify_task = None
     
     def on_table_changed(self, selection, current_table, tables):
         """Handle table selection change"""
@@ -51,18 +59,31 @@ class DbViewHandlers:
         # Show loading animation on button
         self._show_loading_animation(self.ui_elements["refresh_button"], translate("Refresh Data"))
         
-        # Get data in a separate thread
-        self.parent.after(100, self._fetch_data)
+        # Get current table
+        table = self.ui_elements["table_dropdown"].cget("variable").get()
+        
+        # Drop a load that is still running for a previous selection
+        if self.load_task is not None and not self.load_task.done:
+            self.load_task.cancel()
+        
+        # Query the database on a worker thread
+        self.load_task = get_shared_executor(self.parent).submit(
+            self._fetch_data,
+            table,
+            name="db_view.load_data",
+            on_success=lambda data: self._show_data(table, data),
+            on_error=self._on_load_failed
+        )
     
-    def _fetch_data(self):
-        """Fetch data from database"""
+    def _fetch_data(self, task, table):
+        """Fetch data from database (runs on a worker thread)"""
+        return self.table_config.load_table_data(table, self.db_manager)
+    
+    def _show_data(self, table, data):
+        """Show fetched data in the table (runs on the main thread)"""
         try:
-            # Get current table
-            table = self.ui_elements["table_dropdown"].cget("variable").get()
-            
             # Clear table
-            for item in self.ui_elements["data_table"].get_children():
-                self.ui_elements["data_table"].delete(item)
+            TableUtils.clear_table(self.ui_elements["data_table"])
             
             # Stat cards dictionary for easier access
             stat_cards = {
@@ -78,31 +99,36 @@ class DbViewHandlers:
                     self.ui_elements["data_table"],
                     self.db_manager,
                     self.ui_elements["prediction_filter_var"],
-                    stat_cards
+                    stat_cards,
+                    data
                 )
             elif table == "fixtures":
                 self.current_data = self.table_config.configure_fixtures_table(
                     self.ui_elements["data_table"],
                     self.db_manager,
-                    stat_cards
+                    stat_cards,
+                    data
                 )
             elif table == "teams":
                 self.current_data = self.table_config.configure_teams_table(
                     self.ui_elements["data_table"],
                     self.db_manager,
-                    stat_cards
+                    stat_cards,
+                    data
                 )
             elif table == "leagues":
                 self.current_data = self.table_config.configure_leagues_table(
                     self.ui_elements["data_table"],
                     self.db_manager,
-                    stat_cards
+                    stat_cards,
+                    data
                 )
             elif table == "form_changes":
                 self.current_data = self.table_config.configure_form_changes_table(
                     self.ui_elements["data_table"],
                     self.db_manager,
-                    stat_cards
+                    stat_cards,
+                    data
                 )
             
             # Update status
@@ -112,9 +138,13 @@ class DbViewHandlers:
             self.ui_elements["refresh_button"].configure(text=translate("Refresh Data"), state="normal")
             
         except Exception as e:
-            logger.error(f"Error fetching data: {str(e)}")
-            self.ui_elements["refresh_button"].configure(text=translate("Refresh Failed"), state="normal")
-            self.parent.after(2000, lambda: self.ui_elements["refresh_button"].configure(text=translate("Refresh Data")))
+            self._on_load_failed(e)
+    
+    def _on_load_failed(self, error):
+        """Handle a failed data load (runs on the main thread)"""
+        logger.error(f"Error fetching data: {str(error)}")
+        self.ui_elements["refresh_button"].configure(text=translate("Refresh Failed"), state="normal")
+        self.parent.after(2000, lambda: self.ui_elements["refresh_button"].configure(text=translate("Refresh Data")))
     
     def export_data(self):
         """Export current table data to CSV"""
@@ -149,103 +179,114 @@ class DbViewHandlers:
     def verify_prediction_results(self):
         """Verify and update prediction correctness based on match results from API"""
         try:
+            # Ignore repeated clicks while a verification is running
+            if self.verify_task is not None and not self.verify_task.done:
+                return
+            
             # Show dialog with loading indicator
             self._show_loading_animation(self.ui_elements["refresh_button"], translate("Verifying..."))
             
-            # Verify results in a separate thread
-            self.parent.after(100, self._verify_results)
+            # Verify results on a worker thread
+            self.verify_task = get_shared_executor(self.parent).submit(
+                self._verify_results,
+                name="db_view.verify_results",
+                on_progress=self._on_verify_progress,
+                on_success=self._on_verify_finished,
+                on_error=self._on_verify_failed
+            )
         except Exception as e:
             logger.error(f"Error starting result verification: {str(e)}")
 
-    def _verify_results(self):
-        """Run the verification in a separate thread to prevent UI freezing"""
-        try:
-            # First, get predictions that need to be checked
-            predictions_to_check = self.db_manager.get_predictions_to_check()
-            
-            # Temporarily enable API fetching if it was disabled
-            original_auto_fetch = self.api.disable_auto_fetch
-            self.api.disable_auto_fetch = False
-            
-            # Update status
-            self.ui_elements["status_label"].configure(
-                text=f"{translate('Fetching latest results from API...')}"
-            )
+    @profiled("verify_results")
+    def _verify_results(self, task):
+        """
+        Run the verification on a worker thread to prevent UI freezing
+        
+        Returns:
+            str: Status message describing the outcome
+        """
+        # First, get predictions that need to be checked
+        predictions_to_check = self.db_manager.get_predictions_to_check()
+        
+        # Update status
+        task.report_progress(0.0, f"{translate('Fetching latest results from API...')}")
+        
+        # Fetch latest results from API for each prediction
+        fixtures_updated = 0
+        for index, prediction in enumerate(predictions_to_check):
+            task.check_cancelled()
             
-            # Fetch latest results from API for each prediction
-            fixtures_updated = 0
-            for prediction in predictions_to_check:
-                fixture_id = prediction.get('fixture_id')
-                if not fixture_id:
-                    continue
-                    
-                # Fetch fixture data from API
-                fixture_data = self.api.fetch_fixtures(None, fixture_id=fixture_id)
-                
-                if not fixture_data or not fixture_data[0]:
-                    logger.warning(f"No fixture data found for fixture ID {fixture_id}")
-                    continue
-                
-                # Get fixture details
-                fixture = fixture_data[0]
-                status = fixture.get('fixture', {}).get('status', {}).get('short')
+            fixture_id = prediction.get('fixture_id')
+            if not fixture_id:
+                continue
                 
-                # Only update completed fixtures
-                if status != 'FT':
-                    continue
-                    
-                # Get scores
-                goals = fixture.get('goals', {})
-                home_score = goals.get('home')
-                away_score = goals.get('away')
-                
-                if home_score is None or away_score is None:
-                    logger.warning(f"Missing scores for fixture ID {fixture_id}")
-                    continue
-                
-                # Update fixture in database
-                self.db_manager.update_fixture_scores(fixture_id, home_score, away_score, 'COMPLETED')
-                fixtures_updated += 1
+            # Fetch fixture data from API
+            fixture_data = self.api.fetch_fixtures(None, fixture_id=fixture_id, force_fetch=True)
             
-            # Restore original auto-fetch setting
-            self.api.disable_auto_fetch = original_auto_fetch
+            # Report progress
+            task.report_progress((index + 1) / len(predictions_to_check))
             
-            # Update status
-            self.ui_elements["status_label"].configure(
-                text=f"{translate('Updated')} {fixtures_updated} {translate('fixtures from API')}"
-            )
+            if not fixture_data or not fixture_data[0]:
+                logger.warning(f"No fixture data found for fixture ID {fixture_id}")
+                continue
+            
+            # Get fixture details
+            fixture = fixture_data[0]
+            status = fixture.get('fixture', {}).get('status', {}).get('short')
             
-            # Now verify prediction results
-            issues = self.db_manager.verify_all_prediction_results()
-            
-            if issues:
-                # Log issues
-                for issue in issues:
-                    logger.warning(f"Prediction issue: {issue}")
-                    
-                # Update predictions
-                updated = self.db_manager.update_prediction_correctness()
-                logger.info(f"Updated {updated} prediction results")
+            # Only update completed fixtures
+            if status != 'FT':
+                continue
                 
-                # Show message on status bar
-                if updated > 0:
-                    self.ui_elements["status_label"].configure(
-                        text=f"{translate('Updated')} {fixtures_updated} {translate('fixtures and fixed')} {updated} {translate('prediction results')}"
-                    )
-                else:
-                    self.ui_elements["status_label"].configure(
-                        text=f"{translate('Updated')} {fixtures_updated} {translate('fixtures, found')} {len(issues)} {translate('issues but no updates made')}"
-                    )
-            else:
-                # Show message on status bar
-                self.ui_elements["status_label"].configure(
-                    text=f"{translate('Updated')} {fixtures_updated} {translate('fixtures, all prediction results verified correctly')}"
-                )
+            # Get scores
+            goals = fixture.get('goals', {})
+            home_score = goals.get('home')
+            away_score = goals.get('away')
             
-            # Reload data to show corrected results
-            self.load_data()
+            if home_score is None or away_score is None:
+                logger.warning(f"Missing scores for fixture ID {fixture_id}")
+                continue
             
-        except Exception as e:
-            logger.error(f"Error verifying results: {str(e)}")
-            # Reset button state
-            self.ui_elements["refresh_button"].configure(text=translate("Refresh Data"), state="normal")
+            # Update fixture in database
+            self.db_manager.update_fixture_scores(fixture_id, home_score, away_score, 'COMPLETED')
+            fixtures_updated += 1
+        
+        # Update status
+        task.report_progress(1.0, f"{translate('Updated')} {fixtures_updated} {translate('fixtures from API')}")
+        
+        # Now verify prediction results
+        issues = self.db_manager.verify_all_prediction_results()
+        
+        if issues:
+            # Log issues
+            for issue in issues:
+                logger.warning(f"Prediction issue: {issue}")
+                
+            # Update predictions
+            updated = self.db_manager.update_prediction_correctness()
+            logger.info(f"Updated {updated} prediction results")
+            
+            # Show message on status bar
+            if updated > 0:
+                return f"{translate('Updated')} {fixtures_updated} {translate('fixtures and fixed')} {updated} {translate('prediction results')}"
+            return f"{translate('Updated')} {fixtures_updated} {translate('fixtures, found')} {len(issues)} {translate('issues but no updates made')}"
+        
+        return f"{translate('Updated')} {fixtures_updated} {translate('fixtures, all prediction results verified correctly')}"
+    
+    def _on_verify_progress(self, value, message):
+        """Show verification progress on the status bar (runs on the main thread)"""
+        if message:
+            self.ui_elements["status_label"].configure(text=message)
+    
+    def _on_verify_finished(self, message):
+        """Show the verification outcome and reload (runs on the main thread)"""
+        self.ui_elements["status_label"].configure(text=message)
+        
+        # Reload data to show corrected results
+        self.load_data()
+    
+    def _on_verify_failed(self, error):
+        """Handle a failed verification (runs on the main thread)"""
+        logger.error(f"Error verifying results: {str(error)}")
+        # Reset button state
+        self.ui_elements["refresh_button"].configure(text=translate("Refresh Data"), state="normal")
@@ -6,15 +6,48 @@ import logging
 from typing import Dict, List, Any
 from datetime import datetime
 
-from modules.translations import translate
+from modules.translations import translate, translate_many
+from tabs.base_tab.table_utils import TableUtils
 
 logger = logging.getLogger(__name__)
 
 class TableConfig:
     """Table configuration for different database tables."""
     
-    def configure_predictions_table(self, data_table, db_manager, prediction_filter_var, stat_cards):
-        """Configure and load predictions table"""
+    def _set_headings(self, data_table, headings):
+        """Set translated column headings (column -> English heading) in one pass"""
+        for column, text in zip(headings, translate_many(headings.values())):
+            data_table.heading(column, text=text)
+    
+    def load_table_data(self, table, db_manager):
+        """
+        Query the records for a table without touching any widgets.
+        
+        Safe to call from a worker thread; pass the result to the matching
+        configure_*_table method as its data argument.
+        
+        Args:
+            table: Table name ("predictions", "fixtures", "teams", "leagues" or "form_changes")
+            db_manager: Database manager
+            
+        Returns:
+            dict: {"records": list, "stats": prediction stats or None}
+        """
+        fetchers = {
+            "predictions": db_manager.get_predictions,
+            "fixtures": db_manager.get_fixtures,
+            "teams": db_manager.get_teams,
+            "leagues": db_manager.get_leagues,
+            "form_changes": db_manager.get_form_changes
+        }
+        
+        records = fetchers[table]() if table in fetchers else []
+        stats = db_manager.get_prediction_stats() if table == "predictions" else None
+        
+        return {"records": records, "stats": stats}
+    
+    def configure_predictions_table(self, data_table, db_manager, prediction_filter_var, stat_cards, data=None):
+        """Configure and load predictions table (data: optional result of load_table_data)"""
         # Configure columns
         data_table["columns"] = (
             "id", "team", "league", "opponent", "date", "prediction",
@@ -28,15 +61,17 @@ class TableConfig:
             
         # Set new column headings
         data_table.heading("id", text="ID")
-        data_table.heading("team", text=translate("Team"))
-        data_table.heading("league", text=translate("League"))
-        data_table.heading("opponent", text=translate("Opponent"))
-        data_table.heading("date", text=translate("Date"))
-        data_table.heading("prediction", text=translate("Prediction"))
-        data_table.heading("performance_diff", text=translate("Perf. Diff"))
-        data_table.heading("status", text=translate("Status"))
-        data_table.heading("result", text=translate("Result"))
-        data_table.heading("correct", text=translate("Correct"))
+        self._set_headings(data_table, {
+            "team": "Team",
+            "league": "League",
+            "opponent": "Opponent",
+            "date": "Date",
+            "prediction": "Prediction",
+            "performance_diff": "Perf. Diff",
+            "status": "Status",
+            "result": "Result",
+            "correct": "Correct"
+        })
         
         # Set column widths
         data_table.column("id", width=50)
@@ -51,24 +86,31 @@ class TableConfig:
         data_table.column("correct", width=100)
         
         # Get predictions
-        predictions = db_manager.get_predictions()
+        predictions = data["records"] if data else db_manager.get_predictions()
         
         # Sort predictions by date (newest first)
         predictions = sorted(predictions, key=lambda x: self._parse_date(x.get("match_date", "")), reverse=True)
         
         # Apply filter
         filter_value = prediction_filter_var.get()
+        correct_text, incorrect_text, waiting_text, completed_text = translate_many(
+            ("Correct", "Incorrect", "WAITING", "COMPLETED")
+        )
         
-        if filter_value == translate("Correct"):
+        if filter_value == correct_text:
             predictions = [p for p in predictions if p["correct"] == 1]
-        elif filter_value == translate("Incorrect"):
+        elif filter_value == incorrect_text:
             predictions = [p for p in predictions if p["correct"] == 0 and p["status"] == "COMPLETED"]
-        elif filter_value == translate("WAITING"):
+        elif filter_value == waiting_text:
             predictions = [p for p in predictions if p["status"] == "WAITING"]
-        elif filter_value == translate("COMPLETED"):
+        elif filter_value == completed_text:
             predictions = [p for p in predictions if p["status"] == "COMPLETED"]
         
-        # Add data to table
+        # Translate the repeated cell texts once, not per row
+        yes_text, no_text = translate_many(("Yes", "No"))
+        
+        # Build table rows
+        rows = []
         for prediction in predictions:
             # Determine tag
             if prediction["status"] == "WAITING":
@@ -88,7 +130,7 @@ class TableConfig:
                     logger.warning(f"Missing result for completed match ID: {prediction['id']}")
                 
                 # Verify correct prediction calculation
-                correct_value = translate("Yes") if prediction["correct"] == 1 else translate("No")
+                correct_value = yes_text if prediction["correct"] == 1 else no_text
                 
                 # Log any inconsistencies
                 if not result_value and prediction["correct"] == 1:
@@ -100,9 +142,8 @@ class TableConfig:
                     logger.error(f"Prediction correctness mismatch for ID {prediction['id']}: DB={prediction['correct']}, Calculated={actual_correct}")
                 
             # Add row
-            data_table.insert(
-                "", "end",
-                values=(
+            rows.append({
+                "values": (
                     prediction["id"],
                     prediction["team_name"],
                     prediction["league_name"],
@@ -114,8 +155,11 @@ class TableConfig:
                     result_value,
                     correct_value
                 ),
-                tags=(tag,)
-            )
+                "tags": (tag,)
+            })
+        
+        # Render rows
+        TableUtils.set_rows(data_table, rows)
             
         # Configure tags
         data_table.tag_configure("correct", foreground="green")
@@ -123,7 +167,7 @@ class TableConfig:
         data_table.tag_configure("waiting", foreground="blue")
         
         # Update stats
-        stats = db_manager.get_prediction_stats()
+        stats = data["stats"] if data and data.get("stats") else db_manager.get_prediction_stats()
         
         stat_cards["total_card"]["value"].configure(text=str(stats["total"]))
         stat_cards["completed_card"]["value"].configure(text=str(stats["completed"]))
@@ -132,8 +176,8 @@ class TableConfig:
         
         return predictions
     
-    def configure_fixtures_table(self, data_table, db_manager, stat_cards):
-        """Configure and load fixtures table"""
+    def configure_fixtures_table(self, data_table, db_manager, stat_cards, data=None):
+        """Configure and load fixtures table (data: optional result of load_table_data)"""
         # Configure columns
         data_table["columns"] = (
             "id", "league", "home_team", "away_team", "date", "status", "score"
@@ -146,12 +190,14 @@ class TableConfig:
             
         # Set new column headings
         data_table.heading("id", text="ID")
-        data_table.heading("league", text=translate("League"))
-        data_table.heading("home_team", text=translate("Home"))
-        data_table.heading("away_team", text=translate("Away"))
-        data_table.heading("date", text=translate("Date"))
-        data_table.heading("status", text=translate("Status"))
-        data_table.heading("score", text=translate("Score"))
+        self._set_headings(data_table, {
+            "league": "League",
+            "home_team": "Home",
+            "away_team": "Away",
+            "date": "Date",
+            "status": "Status",
+            "score": "Score"
+        })
         
         # Set column widths
         data_table.column("id", width=50)
@@ -163,12 +209,13 @@ class TableConfig:
         data_table.column("score", width=100)
         
         # Get fixtures
-        fixtures = db_manager.get_fixtures()
+        fixtures = data["records"] if data else db_manager.get_fixtures()
         
         # Sort fixtures by date (newest first)
         fixtures = sorted(fixtures, key=lambda x: self._parse_date(x.get("match_date", "")), reverse=True)
         
-        # Add data to table
+        # Build table rows
+        rows = []
         for fixture in fixtures:
             try:
                 # Create score string
@@ -180,20 +227,20 @@ class TableConfig:
                 if fixture["status"] == "COMPLETED" and score == "-":
                     logger.warning(f"Completed fixture without score - ID: {fixture['id']}")
                 
-                data_table.insert(
-                    "", "end",
-                    values=(
-                        fixture["id"],
-                        fixture.get("league_name", ""),
-                        fixture["home_team_name"],
-                        fixture["away_team_name"],
-                        fixture["match_date"],
-                        fixture["status"],
-                        score
-                    )
-                )
+                rows.append((
+                    fixture["id"],
+                    fixture.get("league_name", ""),
+                    fixture["home_team_name"],
+                    fixture["away_team_name"],
+                    fixture["match_date"],
+                    fixture["status"],
+                    score
+                ))
             except Exception as e:
                 logger.error(f"Error adding fixture to table: {str(e)}")
+        
+        # Render rows
+        TableUtils.set_rows(data_table, rows)
             
         # Update stats
         total = len(fixtures)
@@ -206,8 +253,8 @@ class TableConfig:
         
         return fixtures
     
-    def configure_form_changes_table(self, data_table, db_manager, stat_cards):
-        """Configure and load form changes table"""
+    def configure_form_changes_table(self, data_table, db_manager, stat_cards, data=None):
+        """Configure and load form changes table (data: optional result of load_table_data)"""
         # Configure columns
         data_table["columns"] = (
             "id", "team", "league", "date", "performance_diff", "fixture_id"
@@ -220,11 +267,13 @@ class TableConfig:
             
         # Set new column headings
         data_table.heading("id", text="ID")
-        data_table.heading("team", text=translate("Team"))
-        data_table.heading("league", text=translate("League"))
-        data_table.heading("date", text=translate("Date"))
-        data_table.heading("performance_diff", text=translate("Perf. Diff"))
-        data_table.heading("fixture_id", text=translate("Fixture ID"))
+        self._set_headings(data_table, {
+            "team": "Team",
+            "league": "League",
+            "date": "Date",
+            "performance_diff": "Perf. Diff",
+            "fixture_id": "Fixture ID"
+        })
         
         # Set column widths
         data_table.column("id", width=50)
@@ -235,24 +284,23 @@ class TableConfig:
         data_table.column("fixture_id", width=100)
         
         # Get form changes
-        form_changes = db_manager.get_form_changes()
+        form_changes = data["records"] if data else db_manager.get_form_changes()
         
         # Sort form changes by date (newest first)
         form_changes = sorted(form_changes, key=lambda x: self._parse_date(x.get("date", "")), reverse=True)
         
         # Add data to table
-        for change in form_changes:
-            data_table.insert(
-                "", "end",
-                values=(
-                    change["id"],
-                    change["team_name"],
-                    change["league_name"],
-                    change["date"],
-                    change["performance_diff"],
-                    change["fixture_id"]
-                )
+        TableUtils.set_rows(data_table, [
+            (
+                change["id"],
+                change["team_name"],
+                change["league_name"],
+                change["date"],
+                change["performance_diff"],
+                change["fixture_id"]
             )
+            for change in form_changes
+        ])
             
         # Update stats
         total = len(form_changes)
@@ -264,8 +312,8 @@ class TableConfig:
         
         return form_changes
     
-    def configure_teams_table(self, data_table, db_manager, stat_cards):
-        """Configure and load teams table"""
+    def configure_teams_table(self, data_table, db_manager, stat_cards, data=None):
+        """Configure and load teams table (data: optional result of load_table_data)"""
         # No date sorting for teams - implement original method
         # Configure columns
         data_table["columns"] = (
@@ -279,9 +327,11 @@ class TableConfig:
             
         # Set new column headings
         data_table.heading("id", text="ID")
-        data_table.heading("name", text=translate("Team"))
-        data_table.heading("league", text=translate("League"))
-        data_table.heading("country", text=translate("Country"))
+        self._set_headings(data_table, {
+            "name": "Team",
+            "league": "League",
+            "country": "Country"
+        })
         
         # Set column widths
         data_table.column("id", width=50)
@@ -290,22 +340,23 @@ class TableConfig:
         data_table.column("country", width=150)
         
         # Get teams
-        teams = db_manager.get_teams()
+        teams = data["records"] if data else db_manager.get_teams()
         
-        # Add data to table
+        # Build table rows
+        rows = []
         for team in teams:
             try:
-                data_table.insert(
-                    "", "end",
-                    values=(
-                        team["id"],
-                        team["name"],
-                        team.get("league_name", ""),
-                        team.get("country", "")
-                    )
-                )
+                rows.append((
+                    team["id"],
+                    team["name"],
+                    team.get("league_name", ""),
+                    team.get("country", "")
+                ))
             except Exception as e:
                 logger.error(f"Error adding team to table: {str(e)}")
+        
+        # Render rows
+        TableUtils.set_rows(data_table, rows)
             
         # Update stats
         total = len(teams)
@@ -317,8 +368,8 @@ class TableConfig:
         
         return teams
     
-    def configure_leagues_table(self, data_table, db_manager, stat_cards):
-        """Configure and load leagues table"""
+    def configure_leagues_table(self, data_table, db_manager, stat_cards, data=None):
+        """Configure and load leagues table (data: optional result of load_table_data)"""
         # No date sorting for leagues - implement original method
         # Configure columns
         data_table["columns"] = (
@@ -332,10 +383,12 @@ class TableConfig:
             
         # Set new column headings
         data_table.heading("id", text="ID")
-        data_table.heading("name", text=translate("League"))
-        data_table.heading("country", text=translate("Country"))
-        data_table.heading("logo", text=translate("Logo URL"))
-        data_table.heading("season", text=translate("Season"))
+        self._set_headings(data_table, {
+            "name": "League",
+            "country": "Country",
+            "logo": "Logo URL",
+            "season": "Season"
+        })
         
         # Set column widths
         data_table.column("id", width=50)
@@ -345,20 +398,19 @@ class TableConfig:
         data_table.column("season", width=100)
         
         # Get leagues
-        leagues = db_manager.get_leagues()
+        leagues = data["records"] if data else db_manager.get_leagues()
         
         # Add data to table
-        for league in leagues:
-            data_table.insert(
-                "", "end",
-                values=(
-                    league["id"],
-                    league["name"],
-                    league["country"],
-                    league["logo"],
-                    league["season"]
-                )
+        TableUtils.set_rows(data_table, [
+            (
+                league["id"],
+                league["name"],
+                league["country"],
+                league["logo"],
+                league["season"]
             )
+            for league in leagues
+        ])
             
         # Update stats
         total = len(leagues)
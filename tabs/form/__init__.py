@@ -3,6 +3,12 @@ Form Analysis module for the Football Stats application.
 This package contains components for the form analysis tab.
 """
 
-from tabs.form.tab import FormTab
-
 __all__ = ['FormTab']
+
+
+def __getattr__(name):
+    # Import the tab on first use so the prediction code can run without Tk
+    if name == 'FormTab':
+        from tabs.form.tab import FormTab
+        return FormTab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
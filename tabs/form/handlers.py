@@ -6,7 +6,11 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 
+from modules.instrumentation import timed
+from modules.profiler import profiled
 from modules.league_names import LEAGUE_NAMES, get_league_options, get_league_display_name
+from tabs.base_tab.table_utils import TableUtils
+from tabs.base_tab.task_executor import get_shared_executor
 from .predictions import FormPredictions
 
 logger = logging.getLogger(__name__)
@@ -166,8 +170,10 @@ class FormHandlers:
             
     def _threaded_data_refresh(self):
         """
-        Perform data refresh in a thread-like manner using Tkinter's after method
-        with status log feedback
+        Start a data refresh on a worker thread with status log feedback
+        
+        Widget state is read here on the main thread; the API calls run in
+        _fetch_form_data and results come back through the shared executor.
         """
         try:
             # Initialize status log window if not already created
@@ -234,146 +240,23 @@ class FormHandlers:
                 form_length_value = 5
                 self.status_log.log(f"Using default form length: {form_length_value}")
             
-            # Temporarily disable auto-fetch
-            original_auto_fetch = self.api.disable_auto_fetch
-            self.api.disable_auto_fetch = False
+            # Drop a refresh that is still running for a previous selection
+            if getattr(self, 'refresh_task', None) is not None and not self.refresh_task.done:
+                self.refresh_task.cancel()
+                self.status_log.log("Cancelled previous refresh", "WARNING")
             
-            try:
-                # Fetch team data
-                all_form_data = []
-                
-                if all_leagues_selected:
-                    # Special handling for "All Leagues" selection
-                    self.status_log.log("Using special handling for All Leagues selection")
-                    
-                    # In ALL_LEAGUES case, we need to process each league individually
-                    # rather than passing -1 to the API
-                    for idx, league_id in enumerate(league_ids):
-                        try:
-                            # Update progress bar based on how many leagues we've processed
-                            progress = 0.1 + 0.7 * (idx / len(league_ids))
-                            self.status_log.set_progress(progress)
-                            
-                            # Prepare league data dictionary for this specific league
-                            league_data = {league_id: {
-                                "name": LEAGUE_NAMES.get(league_id, {}).get('name', ''),
-                                "flag": LEAGUE_NAMES.get(league_id, {}).get('flag', '')
-                            }}
-                            
-                            self.status_log.log(f"Fetching data for league {league_id} ({league_data[league_id]['name']})")
-                            
-                            # Fetch data for this specific league
-                            try:
-                                # Fetch standings for this league
-                                self.status_log.log(f"Fetching standings for league {league_id}")
-                                standings = self.api.fetch_standings(league_id)
-                                if not standings or not standings.get('response'):
-                                    self.status_log.log(f"No standings available for league {league_id}", "WARNING")
-                                    continue
-                                    
-                                # Fetch fixtures for this league
-                                self.status_log.log(f"Fetching fixtures for league {league_id}")
-                                fixtures = self.api.fetch_fixtures(league_id)
-                                
-                                # Now get team form data
-                                self.status_log.log(f"Analyzing form data for league {league_id}")
-                                league_form_data = self.api.fetch_all_teams(league_data, form_length_value)
-                                
-                                # Add the league name and ID to each team's data
-                                for team in league_form_data:
-                                    team['league'] = league_data[league_id]['name']
-                                    team['league_id'] = league_id
-                                
-                                all_form_data.extend(league_form_data)
-                                
-                                self.status_log.log(f"Processed {len(league_form_data)} teams for league {league_id}")
-                            except Exception as league_process_error:
-                                self.status_log.log(f"Error processing league {league_id}: {league_process_error}", "ERROR")
-                                continue
-                        except Exception as league_error:
-                            self.status_log.log(f"Error handling league {league_id}: {league_error}", "ERROR")
-                            continue
-                else:
-                    # Handle single league selection (normal case)
-                    for league_id in league_ids:
-                        try:
-                            # Prepare league data dictionary
-                            league_data = {league_id: {
-                                "name": LEAGUE_NAMES.get(league_id, {}).get('name', ''),
-                                "flag": LEAGUE_NAMES.get(league_id, {}).get('flag', '')
-                            }}
-                            self.status_log.log(f"Fetching team data for league {league_id}")
-                            
-                            # Fetch data for this specific league
-                            league_form_data = self.api.fetch_all_teams(league_data, form_length_value)
-                            
-                            # Add the league name to each team's data
-                            for team in league_form_data:
-                                team['league'] = league_data[league_id]['name']
-                                team['league_id'] = league_id
-                            
-                            all_form_data.extend(league_form_data)
-                            
-                            self.status_log.log(f"Fetched {len(league_form_data)} teams for league {league_id}")
-                        except Exception as league_fetch_error:
-                            self.status_log.log(f"Error fetching data for league {league_id}: {league_fetch_error}", "ERROR")
-                            continue
-                
-                # Update form data
-                self.form_data = all_form_data
-                
-                # Print fetched data details
-                self.status_log.log(f"Total teams with significant performance differences: {len(self.form_data)}")
-                self.status_log.set_progress(0.85)
-                
-                if not self.form_data:
-                    self.status_log.log("WARNING: No form data returned", "WARNING")
-                    # Update UI on main thread
-                    if hasattr(self, '_handle_no_data'):
-                        self._handle_no_data()
-                    self.status_log.set_progress(1.0)
-                    self.status_log.log("Processing complete with no data")
-                    self.status_log.enable_close_button()
-                    return
-                
-                # Log top teams
-                self.status_log.log("Top teams by performance difference:")
-                for i, team in enumerate(sorted(self.form_data, key=lambda x: abs(x.get('performance_diff', 0)), reverse=True)[:5], 1):
-                    perf_diff = team.get('performance_diff', 0)
-                    self.status_log.log(f"{i}. {team.get('team', 'Unknown')} ({team.get('league', 'Unknown')}): {perf_diff:+.2f}")
-                
-                # Update tables on main thread
-                self.status_log.log("Updating UI tables with form data")
-                self.status_log.set_progress(0.9)
-                if hasattr(self, '_update_tables'):
-                    self._update_tables()
-                
-                self.status_log.log("Data refresh completed successfully")
-                self.status_log.set_progress(1.0)
-                
-            except Exception as e:
-                self.status_log.log(f"CRITICAL ERROR in data fetch: {e}", "ERROR")
-                import traceback
-                error_traceback = traceback.format_exc()
-                self.status_log.log(error_traceback, "ERROR")
-                
-                # Show error on main thread
-                if hasattr(self, '_handle_fetch_error'):
-                    self._handle_fetch_error()
-            finally:
-                # Restore original auto-fetch setting
-                self.api.disable_auto_fetch = original_auto_fetch
-                
-                # Hide loading indicator (safely)
-                try:
-                    if hasattr(self, 'hide_loading_indicator'):
-                        self.hide_loading_indicator()
-                        self.status_log.log("Loading indicator hidden")
-                except Exception as hide_error:
-                    self.status_log.log(f"Error hiding loading indicator: {hide_error}", "ERROR")
-                
-                # Enable close button on status log
-                self.status_log.enable_close_button()
+            # Fetch on a worker thread
+            self.refresh_task = get_shared_executor(self.parent).submit(
+                self._fetch_form_data,
+                league_ids,
+                all_leagues_selected,
+                form_length_value,
+                name="form.data_refresh",
+                on_progress=self._on_refresh_progress,
+                on_success=self._on_form_data_fetched,
+                on_error=self._on_refresh_failed,
+                on_done=self._on_refresh_done
+            )
         
         except Exception as e:
             # Final safety net
@@ -397,7 +280,147 @@ class FormHandlers:
                     self.hide_loading_indicator()
             except Exception as hide_error:
                 print(f"Error hiding loading indicator: {hide_error}")
+    
+    @profiled("form_refresh")
+    @timed("form_tab.fetch_form_data")
+    def _fetch_form_data(self, task, league_ids, all_leagues_selected, form_length_value):
+        """
+        Fetch form data for the given leagues (runs on a worker thread)
+        
+        Status log updates are posted back to the main thread through the task.
+        
+        Returns:
+            list: Team form data for all leagues
+        """
+        def log(message, level="INFO"):
+            task.post(self.status_log.log, message, level)
+        
+        # Fetch team data; API calls pass force_fetch rather than flipping the shared
+        # disable_auto_fetch flag, which other refreshes may be relying on
+        all_form_data = []
+        
+        if all_leagues_selected:
+            # Special handling for "All Leagues" selection
+            log("Using special handling for All Leagues selection")
+        
+        for idx, league_id in enumerate(league_ids):
+            # Stop early if a newer refresh replaced this one
+            task.check_cancelled()
+            
+            # Update progress bar based on how many leagues we've processed
+            task.report_progress(0.1 + 0.7 * (idx / len(league_ids)))
+            
+            # Prepare league data dictionary for this specific league
+            league_data = {league_id: {
+                "name": LEAGUE_NAMES.get(league_id, {}).get('name', ''),
+                "flag": LEAGUE_NAMES.get(league_id, {}).get('flag', '')
+            }}
+            
+            try:
+                if all_leagues_selected:
+                    # In ALL_LEAGUES case, we need to process each league individually
+                    # rather than passing -1 to the API
+                    log(f"Fetching data for league {league_id} ({league_data[league_id]['name']})")
+                    
+                    # Fetch standings for this league
+                    log(f"Fetching standings for league {league_id}")
+                    standings = self.api.fetch_standings(league_id, force_fetch=True)
+                    if not standings or not standings.get('response'):
+                        log(f"No standings available for league {league_id}", "WARNING")
+                        continue
+                else:
+                    log(f"Fetching team data for league {league_id}")
+                
+                # Fetch fixtures here as well so the table update on the
+                # main thread is served from the API cache
+                log(f"Fetching fixtures for league {league_id}")
+                self.api.fetch_fixtures(league_id, force_fetch=True)
+                
+                # Now get team form data
+                log(f"Analyzing form data for league {league_id}")
+                league_form_data = self.api.fetch_all_teams(league_data, form_length_value, force_fetch=True)
+                
+                # Add the league name and ID to each team's data
+                for team in league_form_data:
+                    team['league'] = league_data[league_id]['name']
+                    team['league_id'] = league_id
+                
+                all_form_data.extend(league_form_data)
+                
+                log(f"Processed {len(league_form_data)} teams for league {league_id}")
+            except Exception as league_process_error:
+                log(f"Error processing league {league_id}: {league_process_error}", "ERROR")
+                continue
+        
+        # Warm the standings cache used by the form table
+        for league_id in league_ids:
+            task.check_cancelled()
+            if not all_leagues_selected:
+                try:
+                    self.api.fetch_standings(league_id, force_fetch=True)
+                except Exception as standings_error:
+                    log(f"Error fetching standings for league {league_id}: {standings_error}", "WARNING")
+        
+        return all_form_data
 
+    def _on_refresh_progress(self, value, message):
+        """Show refresh progress in the status log (runs on the main thread)"""
+        if value is not None:
+            self.status_log.set_progress(value)
+        if message:
+            self.status_log.log(message)
+    
+    def _on_form_data_fetched(self, all_form_data):
+        """Show fetched form data (runs on the main thread)"""
+        # Update form data
+        self.form_data = all_form_data
+        
+        # Print fetched data details
+        self.status_log.log(f"Total teams with significant performance differences: {len(self.form_data)}")
+        self.status_log.set_progress(0.85)
+        
+        if not self.form_data:
+            self.status_log.log("WARNING: No form data returned", "WARNING")
+            self._handle_no_data()
+            self.status_log.set_progress(1.0)
+            self.status_log.log("Processing complete with no data")
+            return
+        
+        # Log top teams
+        self.status_log.log("Top teams by performance difference:")
+        for i, team in enumerate(sorted(self.form_data, key=lambda x: abs(x.get('performance_diff', 0)), reverse=True)[:5], 1):
+            perf_diff = team.get('performance_diff', 0)
+            self.status_log.log(f"{i}. {team.get('team', 'Unknown')} ({team.get('league', 'Unknown')}): {perf_diff:+.2f}")
+        
+        # Update tables on main thread
+        self.status_log.log("Updating UI tables with form data")
+        self.status_log.set_progress(0.9)
+        self._update_tables()
+        
+        self.status_log.log("Data refresh completed successfully")
+        self.status_log.set_progress(1.0)
+    
+    def _on_refresh_failed(self, error):
+        """Report a failed refresh (runs on the main thread)"""
+        self.status_log.log(f"CRITICAL ERROR in data fetch: {error}", "ERROR")
+        
+        # Show error on main thread
+        self._handle_fetch_error()
+    
+    def _on_refresh_done(self):
+        """Finish a refresh after success or failure (runs on the main thread)"""
+        # Hide loading indicator (safely)
+        try:
+            if hasattr(self, 'hide_loading_indicator'):
+                self.hide_loading_indicator()
+                self.status_log.log("Loading indicator hidden")
+        except Exception as hide_error:
+            self.status_log.log(f"Error hiding loading indicator: {hide_error}", "ERROR")
+        
+        # Enable close button on status log
+        self.status_log.enable_close_button()
+
+    @timed("form_tab.update_tables")
     def _update_tables(self):
         """Update tables on the main thread"""
         try:
@@ -432,10 +455,6 @@ class FormHandlers:
             
     def _update_fixtures_table(self):
         """Update the upcoming fixtures table"""
-        # Clear table
-        for item in self.ui_elements["fixtures_table"].get_children():
-            self.ui_elements["fixtures_table"].delete(item)
-        
         # Filter out past matches
         try:
             current_date = datetime.now().strftime('%Y-%m-%d')
@@ -460,17 +479,25 @@ class FormHandlers:
             future_fixtures.sort(key=lambda x: abs(x.get('performance_diff', 0)), reverse=True)
             
             # Add data
+            rows = []
             for fixture in future_fixtures:
-                self.ui_elements["fixtures_table"].insert("", "end", values=(
-                    fixture.get('team', ''),
-                    fixture.get('performance_diff', ''),
-                    fixture.get('prediction', ''),
-                    fixture.get('opponent', ''),
-                    fixture.get('date', ''),
-                    fixture.get('time', ''),
-                    fixture.get('venue', ''),
-                    fixture.get('status', '')
-                ), tags=('positive' if fixture.get('performance_diff', 0) > 0 else 'negative',))
+                rows.append({
+                    "key": (fixture.get('fixture_id'), fixture.get('team_id', fixture.get('team'))),
+                    "values": (
+                        fixture.get('team', ''),
+                        fixture.get('performance_diff', ''),
+                        fixture.get('prediction', ''),
+                        fixture.get('opponent', ''),
+                        fixture.get('date', ''),
+                        fixture.get('time', ''),
+                        fixture.get('venue', ''),
+                        fixture.get('status', '')
+                    ),
+                    "tags": ('positive' if fixture.get('performance_diff', 0) > 0 else 'negative',)
+                })
+            
+            # Apply only the changes since the last refresh, keeping the ranking unless the user sorted
+            TableUtils.update_rows(self.ui_elements["fixtures_table"], rows)
             
             # Configure tags
             self.ui_elements["fixtures_table"].tag_configure('positive', foreground='green')
@@ -482,8 +509,7 @@ class FormHandlers:
     def _update_detailed_upcoming_matches_table(self):
         """Update the detailed upcoming matches table"""
         # Clear table
-        for item in self.ui_elements["upcoming_matches_table"].get_children():
-            self.ui_elements["upcoming_matches_table"].delete(item)
+        TableUtils.clear_table(self.ui_elements["upcoming_matches_table"])
         
         # Get all upcoming matches from form_analyzer
         try:
@@ -527,8 +553,8 @@ class FormHandlers:
             all_upcoming_matches.sort(key=lambda x: x['date'] if x['date'] != 'TBD' else '9999-99-99')
             
             # Add data
-            for match in all_upcoming_matches:
-                self.ui_elements["upcoming_matches_table"].insert("", "end", values=(
+            rows = [
+                (
                     match.get('team', ''),
                     match.get('opponent', ''),
                     match.get('league', ''),
@@ -537,7 +563,10 @@ class FormHandlers:
                     match.get('venue', ''),
                     match.get('round', ''),
                     match.get('status', '')
-                ))
+                )
+                for match in all_upcoming_matches
+            ]
+            TableUtils.set_rows(self.ui_elements["upcoming_matches_table"], rows)
             
         except Exception as e:
             logger.error(f"Error updating detailed upcoming matches table: {str(e)}")
@@ -548,75 +577,6 @@ class FormHandlers:
         # In a real implementation, we would use custom cell rendering
         return form_str
 
-    def _sort_fixtures_table(self, col_idx):
-        """Sort the fixtures table by the specified column"""
-        try:
-            # Store current sort column and order
-            if hasattr(self, 'sort_col') and self.sort_col == col_idx:
-                # If already sorting by this column, reverse the order
-                self.sort_reverse = not self.sort_reverse
-            else:
-                # New sort column
-                self.sort_col = col_idx
-                self.sort_reverse = False
-                
-            # Get all date separators
-            date_separators = []
-            for item_id in self.ui_elements["fixtures_table"].get_children():
-                if self.ui_elements["fixtures_table"].item(item_id, 'tags') and 'date_separator' in self.ui_elements["fixtures_table"].item(item_id, 'tags'):
-                    date_separators.append(item_id)
-                    
-            # If no date separators, sort the entire table
-            if not date_separators:
-                # Get all items
-                items = []
-                for item_id in self.ui_elements["fixtures_table"].get_children():
-                    values = self.ui_elements["fixtures_table"].item(item_id, 'values')
-                    tags = self.ui_elements["fixtures_table"].item(item_id, 'tags')
-                    items.append((values, tags, item_id))
-                    
-                # Sort items by the selected column
-                items.sort(key=lambda x: x[0][col_idx] if x[0][col_idx] else "", reverse=self.sort_reverse)
-                
-                # Reorder items in the treeview
-                for idx, (values, tags, item_id) in enumerate(items):
-                    self.ui_elements["fixtures_table"].move(item_id, "", idx)
-            else:
-                # Sort each date group separately
-                for separator_id in date_separators:
-                    # Get all children of this separator
-                    children = self.ui_elements["fixtures_table"].get_children(separator_id)
-                    if not children:
-                        continue
-                        
-                    # Get values for each child
-                    items = []
-                    for child_id in children:
-                        values = self.ui_elements["fixtures_table"].item(child_id, 'values')
-                        tags = self.ui_elements["fixtures_table"].item(child_id, 'tags')
-                        items.append((values, tags, child_id))
-                        
-                    # Sort items by the selected column
-                    items.sort(key=lambda x: x[0][col_idx] if x[0][col_idx] else "", reverse=self.sort_reverse)
-                    
-                    # Reorder items in the treeview
-                    for idx, (values, tags, item_id) in enumerate(items):
-                        self.ui_elements["fixtures_table"].move(item_id, separator_id, idx)
-                    
-            # Update column headers to show sort direction
-            for i in range(8):  # 8 columns
-                if i == col_idx:
-                    # Add arrow to indicate sort direction
-                    arrow = "▼" if self.sort_reverse else "▲"
-                    text = self.ui_elements["fixtures_table"].heading(f"col{i}")["text"].rstrip("▲▼ ")
-                    self.ui_elements["fixtures_table"].heading(f"col{i}", text=f"{text} {arrow}")
-                else:
-                    # Remove arrow from other columns
-                    text = self.ui_elements["fixtures_table"].heading(f"col{i}")["text"].rstrip("▲▼ ")
-                    self.ui_elements["fixtures_table"].heading(f"col{i}", text=text)
-        except Exception as e:
-            logger.error(f"Error sorting fixtures table: {str(e)}")
-
     def save_predictions(self):
         """Save predictions to database"""
         self.predictions.save_predictions(self.upcoming_fixtures_data)
@@ -707,14 +667,11 @@ class FormHandlers:
             # Log start of table update
             logger.info("Starting to update form analysis table")
             
-            # Clear existing table
-            for item in self.ui_elements["form_analysis_table"].get_children():
-                self.ui_elements["form_analysis_table"].delete(item)
-            
             # Log form data details
             logger.info(f"Form data length: {len(self.form_data)}")
             if not self.form_data:
                 logger.warning("No form data available to populate table")
+                TableUtils.clear_table(self.ui_elements["form_analysis_table"])
                 return
             
             # Fetch fixtures with multiple fallback strategies
@@ -867,6 +824,7 @@ class FormHandlers:
                     }
             
             # Add data to table
+            rows = []
             for team in self.form_data:
                 # Get basic team information
                 team_id = team.get('team_id')
@@ -1100,29 +1058,19 @@ class FormHandlers:
                 # Log row values for debugging
                 logger.debug(f"Row values for {team_name}: {row_values}")
                 
-                # Insert row into table
+                # Queue row for the table
                 performance_diff = team.get('performance_diff', 0)
                 tag = 'positive' if performance_diff > 0 else 'negative'
-                
-                try:
-                    self.ui_elements["form_analysis_table"].insert(
-                        "", "end",
-                        values=row_values,
-                        tags=(tag,)
-                    )
-                except Exception as insert_error:
-                    logger.error(f"Error inserting row for team {team_name}: {str(insert_error)}")
+                rows.append({"key": team_id or team_name, "values": row_values, "tags": (tag,)})
+            
+            # Apply only the changes since the last refresh, sorting by
+            # performance difference (column 8) on first load
+            TableUtils.update_rows(self.ui_elements["form_analysis_table"], rows, initial_sort=("8", True))
             
             # Configure tags
             self.ui_elements["form_analysis_table"].tag_configure('positive', foreground='green')
             self.ui_elements["form_analysis_table"].tag_configure('negative', foreground='red')
             
-            # Apply default sorting
-            if hasattr(self.ui_elements["form_analysis_table"], 'sorter'):
-                # Assuming performance difference is column 8
-                logger.info("Applying default sort to form analysis table")
-                self.ui_elements["form_analysis_table"].sorter.apply_initial_sort("8", reverse=True)
-            
             logger.info("Form analysis table update completed successfully")
         
         except Exception as e:
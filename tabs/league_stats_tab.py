@@ -2,19 +2,23 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
 import logging
-import requests
 from typing import Dict, List, Any, Optional, Callable
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from modules.api_client import FootballAPI
 from modules.db_manager import DatabaseManager
+from modules.lazy_imports import lazy_import
 from modules.settings_manager import SettingsManager
 from modules.league_names import get_league_options, get_league_display_name
 from tabs.base_tab.base_tab import BaseTab
+from tabs.base_tab.charts import BarChart
+from tabs.base_tab.table_utils import TableUtils
 
 logger = logging.getLogger(__name__)
 
+# matplotlib is imported the first time a chart is created
+plt = lazy_import("matplotlib.pyplot")
+backend_tkagg = lazy_import("matplotlib.backends.backend_tkagg")
+
 class LeagueStatsTab(BaseTab):
     def __init__(self, parent, api: FootballAPI, db_manager: DatabaseManager, settings_manager: SettingsManager):
         super().__init__(parent, api, db_manager, settings_manager)
@@ -22,6 +26,11 @@ class LeagueStatsTab(BaseTab):
         # Initialize variables
         self.standings_data = []
         
+        # Chart values per stat type for the loaded standings
+        self.chart_series = {}
+        # League the shown standings belong to, which keys the chart renders
+        self.standings_league = None
+        
         # Get leagues from settings, use default if empty
         leagues = self.settings_manager.get_leagues()
         default_league = 39  # Premier League
@@ -171,9 +180,12 @@ class LeagueStatsTab(BaseTab):
         
         # Create matplotlib figure for chart
         self.chart_fig = plt.Figure(figsize=(10, 6), dpi=100)
-        self.chart_canvas = FigureCanvasTkAgg(self.chart_fig, master=self.charts_container)
+        self.chart_canvas = backend_tkagg.FigureCanvasTkAgg(self.chart_fig, master=self.charts_container)
         self.chart_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
         
+        # Bars are updated in place; each league's Points/Goals/Form render is cached
+        self.chart = BarChart(self.chart_fig, self.chart_canvas, horizontal=True)
+        
         # Stats Tab
         self.stats_frame = ctk.CTkFrame(self.notebook)
         self.notebook.add(self.stats_frame, text="League Stats")
@@ -258,70 +270,71 @@ class LeagueStatsTab(BaseTab):
         # Show loading animation
         self._show_loading_animation(self.refresh_button, "Refresh Data")
         
-        # Get data in a separate thread
-        self.parent.after(100, self._fetch_data)
+        # Get data on a worker thread
+        league_id = self.selected_league.get()
+        self.run_in_background(
+            self._fetch_data,
+            league_id,
+            on_success=self._on_data_fetched,
+            on_error=self._on_fetch_failed
+        )
             
-    def _fetch_data(self):
-        """Fetch data from API"""
+    def _fetch_data(self, task, league_id):
+        """
+        Fetch standings from API (runs on a worker thread)
+        
+        Returns:
+            tuple: (league id, standings data, error text); error text is None on success
+        """
+        # Use  season  of 2025 (the request bypasses the client, so disable_auto_fetch does not apply)
+        url = f"{self.api.base_url}/standings"
+        params = {"league": league_id, "season": 2025}
+        
+        # Make direct request to ensure we get fresh data
+        try:
+            logger.info(f"Fetching standings for league {league_id} with season 2025")
+            self.api._wait_for_rate_limit()
+            response = self.api.transport.get(url, headers=self.api.headers, params=params, timeout=10)
+        except Exception as e:
+            logger.error(f"Error fetching standings: {str(e)}")
+            return league_id, None, "API Error"
+        
+        if response.status_code != 200:
+            logger.warning(f"API request failed with status {response.status_code}")
+            return league_id, None, f"API Error: {response.status_code}"
+        
+        data = response.json()
+        
+        # Cache the data
+        cache_key = f'standings_{league_id}'
+        self.api._set_cache(cache_key, data, 'medium')
+        
+        # Check if we have valid data
+        if not data or not data.get('response'):
+            logger.warning(f"No standings for league {league_id}")
+            return league_id, None, "No Data Found"
+        
+        # Get standings data
+        return league_id, data['response'][0]['league']['standings'][0], None
+    
+    def _on_data_fetched(self, result):
+        """Show fetched standings (runs on the main thread)"""
+        league_id, standings_data, error_text = result
+        
+        if error_text:
+            self.refresh_button.configure(text=error_text, state="normal")
+            self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
+            return
+        
         try:
-            # Get league ID
-            league_id = self.selected_league.get()
-            
-
-            # Temporarily enable API fetching if it was disabled
-            original_auto_fetch = self.api.disable_auto_fetch
-            self.api.disable_auto_fetch = False
-            
-            # Use  season  of 2025
-            url = f"{self.api.base_url}/standings"
-            params = {"league": league_id, "season": 2025}
-            
-            # Make direct request to ensure we get fresh data
-            try:
-                logger.info(f"Fetching standings for league {league_id} with season 2025")
-                response = requests.get(url, headers=self.api.headers, params=params, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Cache the data
-                    cache_key = f'standings_{league_id}'
-                    self.api._set_cache(cache_key, data, 'medium')
-                    
-                    # Check if we have valid data
-                    if not data or not data.get('response'):
-                        logger.warning(f"No standings for league {league_id}")
-                        self.refresh_button.configure(text="No Data Found", state="normal")
-                        self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-                        
-                        # Restore original auto-fetch setting
-                        self.api.disable_auto_fetch = original_auto_fetch
-                        return
-                    
-                    # Get standings data
-                    standings_data = data['response'][0]['league']['standings'][0]
-                else:
-                    logger.warning(f"API request failed with status {response.status_code}")
-                    self.refresh_button.configure(text=f"API Error: {response.status_code}", state="normal")
-                    self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-                    
-                    # Restore original auto-fetch setting
-                    self.api.disable_auto_fetch = original_auto_fetch
-                    return
-            except Exception as e:
-                logger.error(f"Error fetching standings: {str(e)}")
-                self.refresh_button.configure(text="API Error", state="normal")
-                self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-                
-                # Restore original auto-fetch setting
-                self.api.disable_auto_fetch = original_auto_fetch
-                return
-                
-            # Restore original auto-fetch setting
-            self.api.disable_auto_fetch = original_auto_fetch
-            
             # Store standings data
             self.standings_data = standings_data
+            self.standings_league = league_id
+            
+            # Compute every stat type once and drop the fetched league's stale renders;
+            # the selection may have changed while fetching
+            self.chart_series = self._chart_series(standings_data)
+            self.chart.invalidate(lambda key: key[0] == league_id)
             
             # Update standings table
             self._update_standings_table()
@@ -336,17 +349,18 @@ class LeagueStatsTab(BaseTab):
             self.refresh_button.configure(text="Refresh Data", state="normal")
             
         except Exception as e:
-            logger.error(f"Error fetching data: {str(e)}")
-            self.refresh_button.configure(text="Refresh Failed", state="normal")
-            self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data"))
+            self._on_fetch_failed(e)
+    
+    def _on_fetch_failed(self, error):
+        """Handle a failed refresh (runs on the main thread)"""
+        logger.error(f"Error fetching data: {str(error)}")
+        self.refresh_button.configure(text="Refresh Failed", state="normal")
+        self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data"))
             
     def _update_standings_table(self):
         """Update the standings table"""
-        # Clear table
-        for item in self.standings_table.get_children():
-            self.standings_table.delete(item)
-            
-        # Add data
+        # Build rows
+        rows = []
         for team in self.standings_data:
             # Get team data
             position = team['rank']
@@ -362,9 +376,9 @@ class LeagueStatsTab(BaseTab):
             form = team.get('form', '')
             
             # Add row
-            self.standings_table.insert(
-                "", "end",
-                values=(
+            rows.append({
+                "key": team['team']['id'],
+                "values": (
                     position,
                     team_name,
                     played,
@@ -377,8 +391,12 @@ class LeagueStatsTab(BaseTab):
                     points,
                     form
                 ),
-                tags=(position,)
-            )
+                "tags": (position,)
+            })
+        
+        # Apply only the changes since the last refresh,
+        # sorting by position (column 0) on first load
+        TableUtils.update_rows(self.standings_table, rows, initial_sort=("0", False))
             
         # Configure tags for top, middle, and bottom teams
         num_teams = len(self.standings_data)
@@ -389,78 +407,44 @@ class LeagueStatsTab(BaseTab):
                 
             # Bottom 3 teams (Relegation)
             for i in range(max(1, num_teams - 2), num_teams + 1):
-                self.standings_table.tag_configure(i, background='#FFCCCC')     
-           # Apply default sorting by position (column 0)
-        # Apply default sorting by position (column 0)
-        if hasattr(self.standings_table, 'sorter'):
-            # Sort by position (ascending)
-            self.standings_table.sorter.apply_initial_sort("0", reverse=False)
+                self.standings_table.tag_configure(i, background='#FFCCCC')
                 
+    def _chart_series(self, standings_data):
+        """
+        Compute the chart values of every stat type
+        
+        Returns:
+            dict: Stat type -> (values, title, color)
+        """
+        # Calculate form points (W=3, D=1, L=0) with proper None handling
+        form_values = []
+        for team in standings_data:
+            form = team.get('form') or ''
+            form_values.append(sum(3 if char == 'W' else 1 if char == 'D' else 0 for char in form))
+        
+        return {
+            "Points": ([team['points'] for team in standings_data], "Points by Team", 'blue'),
+            "Goals": ([team['all']['goals']['for'] for team in standings_data], "Goals Scored by Team", 'green'),
+            "Form": (form_values, "Recent Form Points by Team", 'orange')
+        }
+        
     def _update_chart(self):
-            """Update the chart based on selected stat type"""
-            # Clear figure
-            self.chart_fig.clear()
-            
-            # Get stat type
-            stat_type = self.stat_var.get()
-            
-            # Create subplot
-            ax = self.chart_fig.add_subplot(111)
-            
-            if not self.standings_data:
-                ax.text(0.5, 0.5, "No data available", ha='center', va='center')
-                self.chart_canvas.draw()
-                return
-                
-            # Prepare data
-            team_names = [team['team']['name'] for team in self.standings_data]
-            
-            if stat_type == "Points":
-                values = [team['points'] for team in self.standings_data]
-                title = "Points by Team"
-                color = 'blue'
-            elif stat_type == "Goals":
-                values = [team['all']['goals']['for'] for team in self.standings_data]
-                title = "Goals Scored by Team"
-                color = 'green'
-            else:  # Form
-                # Calculate form points (W=3, D=1, L=0) with proper None handling
-                values = []
-                for team in self.standings_data:
-                    form = team.get('form', '')
-                    # Check if form is None and use empty string instead
-                    if form is None:
-                        form = ''
-                        
-                    form_points = 0
-                    for char in form:
-                        if char == 'W':
-                            form_points += 3
-                        elif char == 'D':
-                            form_points += 1
-                    values.append(form_points)
-                title = "Recent Form Points by Team"
-                color = 'orange'
-                
-            # Create horizontal bar chart
-            bars = ax.barh(team_names, values, color=color)
-            
-            # Add value labels
-            for bar in bars:
-                width = bar.get_width()
-                ax.text(width + 0.5, bar.get_y() + bar.get_height()/2, f'{width}',
-                        ha='left', va='center')
-            
-            # Set title and labels
-            ax.set_title(title)
-            ax.set_xlabel('Value')
-            ax.set_ylabel('Team')
-            
-            # Adjust layout
-            self.chart_fig.tight_layout()
-            
-            # Draw canvas
-            self.chart_canvas.draw()
+        """Update the chart based on selected stat type"""
+        if not self.standings_data:
+            self.chart.show_message("No data available")
+            return
+        
+        # Get stat type
+        stat_type = self.stat_var.get()
+        values, title, color = self.chart_series.get(stat_type, self.chart_series["Form"])
+        
+        # Same teams as before, so only bar lengths and labels change
+        team_names = [team['team']['name'] for team in self.standings_data]
+        self.chart.update(
+            team_names, values,
+            key=(self.standings_league, stat_type),
+            color=color, title=title, xlabel='Value', ylabel='Team'
+        )
         
     def _update_stats(self):
         """Update the league stats"""
@@ -2,6 +2,7 @@
 Main login tab module that integrates all login components.
 """
 import logging
+import queue
 import tkinter as tk
 import customtkinter as ctk
 
@@ -50,6 +51,9 @@ class LoginTab(BaseTab):
         self.ui_initialized = False
         self.admin_panel_initialized = False
         
+        # Writes the outbox gave up on, handed over from its writer thread
+        self.failed_writes = None
+        
         # Initialize auth manager first
         self.auth_manager = AuthManager(
             self.firebase_auth,
@@ -158,6 +162,9 @@ class LoginTab(BaseTab):
             # Check if we need to show default admin credentials
             self.parent.after(100, self._check_show_admin_credentials)
             
+            # Report license and permission changes that never reach Firestore
+            self._watch_failed_writes()
+            
             # Auto-login after successful initialization
             self.auth_manager.auto_login()
             
@@ -167,6 +174,39 @@ class LoginTab(BaseTab):
             # Show error message and retry option
             self._show_firebase_error()
             
+    def _watch_failed_writes(self):
+        """Start reporting queued writes that the outbox gave up on"""
+        if self.failed_writes is not None:
+            return
+        self.failed_writes = queue.Queue()
+        if self.firebase_auth.add_write_failure_listener(lambda entry, error: self.failed_writes.put((entry, error))):
+            self._check_failed_writes()
+            
+    def _check_failed_writes(self):
+        """Show writes given up on since the last check (polled on the main thread)"""
+        while True:
+            try:
+                entry, error = self.failed_writes.get_nowait()
+            except queue.Empty:
+                break
+            self._show_failed_write(entry, error)
+        self.parent.after(1000, self._check_failed_writes)
+        
+    def _show_failed_write(self, entry, error):
+        """Tell the admin that a license or permission change was not saved"""
+        if entry["collection"] != "users" or not self.admin_panel_initialized:
+            return
+        fields = entry["data"]
+        if "has_license" in fields:
+            self.admin_panel.user_management.show_error(
+                f"License change for user {entry['document']} could not be saved: {str(error)}"
+            )
+            self._refresh_users()
+        elif any(key.startswith("tab_permissions.") for key in fields):
+            self.admin_panel.permissions_management.show_error(
+                f"Permission changes for user {entry['document']} could not be saved: {str(error)}"
+            )
+            
     def _show_firebase_error(self):
         """Show Firebase connection error message"""
         self.firebase_integration.show_connection_error(self._retry_firebase_connection)
@@ -248,7 +288,8 @@ class LoginTab(BaseTab):
         
         # Refresh users list only if admin panel is initialized
         if self.admin_panel_initialized:
-            self._refresh_users()
+            # The user list was prefetched during sign in
+            self._refresh_users(force_refresh=False)
         else:
             logger.warning("Admin panel not initialized yet, skipping user refresh")
         
@@ -321,7 +362,7 @@ class LoginTab(BaseTab):
                 text_color="orange"
             )
             
-    def _refresh_users(self):
+    def _refresh_users(self, force_refresh=True):
         """Refresh users list in admin panel"""
         # Check if admin_panel exists
         if not hasattr(self, 'admin_panel'):
@@ -336,13 +377,13 @@ class LoginTab(BaseTab):
         self.admin_panel.user_management.show_loading_refresh(self.button_manager)
         
         # Refresh in a separate thread
-        self.parent.after(100, self._perform_refresh_users)
+        self.parent.after(100, lambda: self._perform_refresh_users(force_refresh))
         
-    def _perform_refresh_users(self):
+    def _perform_refresh_users(self, force_refresh=True):
         """Perform users refresh"""
         try:
             # Get all users
-            success, users = self.firebase_auth.get_all_users()
+            success, users = self.firebase_auth.get_all_users(force_refresh)
             
             if success:
                 # Update users table
@@ -7,6 +7,8 @@ import customtkinter as ctk
 from typing import Callable, Dict, Any, List, Optional
 from tkinter import messagebox
 
+from tabs.base_tab.table_utils import TableUtils
+
 logger = logging.getLogger(__name__)
 
 class UserManagement:
@@ -171,12 +173,9 @@ class UserManagement:
         # Store users list
         self.users = users
         
-        # Clear table
-        for item in self.users_table.get_children():
-            self.users_table.delete(item)
-            
-        # Add users to table
-        for i, user in enumerate(users):
+        # Build table rows
+        rows = []
+        for user in users:
             # Format last login date
             last_login = user.get("last_login", "")
             if last_login:
@@ -192,19 +191,17 @@ class UserManagement:
             is_admin = "Yes" if user.get("is_admin", False) else "No"
             has_license = "Yes" if user.get("has_license", False) else "No"
             
-            # Add to table
-            self.users_table.insert(
-                "",
-                "end",
-                text=str(i+1),
-                values=(
-                    user.get("email", ""),
-                    is_admin,
-                    has_license,
-                    last_login,
-                    user.get("id", "")  # Store user ID as the last value (hidden)
-                )
-            )
+            # Add row
+            rows.append((
+                user.get("email", ""),
+                is_admin,
+                has_license,
+                last_login,
+                user.get("id", "")  # Store user ID as the last value (hidden)
+            ))
+        
+        # Add users to table
+        TableUtils.set_rows(self.users_table, rows)
             
     def get_selected_user(self) -> Optional[Dict]:
         """
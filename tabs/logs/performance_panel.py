@@ -0,0 +1,165 @@
+"""
+Performance panel for the Logs tab.
+Shows the timers, histograms and counters collected by modules.instrumentation.
+"""
+
+import customtkinter as ctk
+import logging
+from datetime import datetime
+from tkinter import ttk, filedialog
+
+from modules import instrumentation
+from modules.translations import translate
+from tabs.base_tab.table_utils import TableUtils
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds between refreshes while the panel is visible
+REFRESH_INTERVAL = 2000
+
+COLUMNS = ("metric", "kind", "count", "total", "mean", "p50", "p95", "max")
+
+
+class PerformancePanel(ctk.CTkFrame):
+    """Table of collected metrics with reset and export controls."""
+
+    def __init__(self, parent, create_button):
+        """
+        Initialize the panel.
+
+        Args:
+            parent: Parent widget
+            create_button: The owning tab's _create_button, for consistent styling
+        """
+        super().__init__(parent)
+        self.refresh_job = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Controls
+        controls = ctk.CTkFrame(self)
+        controls.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="ew")
+        controls.grid_columnconfigure(0, weight=1)
+
+        self.summary_label = ctk.CTkLabel(controls, text="", font=ctk.CTkFont(size=14))
+        self.summary_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
+
+        self.reset_button = create_button(controls, "Reset", self._reset, width=120, height=32,
+                                          tooltip_text="Clear all collected metrics")
+        self.reset_button.grid(row=0, column=1, padx=5, pady=5)
+        self.export_json_button = create_button(controls, "Export JSON", self._export_json, width=150, height=32,
+                                                tooltip_text="Save the metric summary as JSON")
+        self.export_json_button.grid(row=0, column=2, padx=5, pady=5)
+        self.export_trace_button = create_button(controls, "Export Trace", self._export_trace, width=150, height=32,
+                                                 tooltip_text="Save timed spans for chrome://tracing or Perfetto")
+        self.export_trace_button.grid(row=0, column=3, padx=(5, 10), pady=5)
+
+        # Metrics table
+        table_frame = ctk.CTkFrame(self)
+        table_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
+        table_frame.grid_columnconfigure(0, weight=1)
+        table_frame.grid_rowconfigure(0, weight=1)
+
+        self.table = ttk.Treeview(table_frame, columns=COLUMNS, show="headings", height=20)
+        headings = {
+            "metric": "Metric", "kind": "Type", "count": "Count", "total": "Total (ms)",
+            "mean": "Mean (ms)", "p50": "p50 (ms)", "p95": "p95 (ms)", "max": "Max (ms)"
+        }
+        for column in COLUMNS:
+            self.table.heading(column, text=translate(headings[column]))
+            self.table.column(column, width=320 if column == "metric" else 110, anchor="w" if column == "metric" else "e")
+
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.table.yview)
+        self.table.configure(yscrollcommand=scrollbar.set)
+        self.table.grid(row=0, column=0, sticky="nsew")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.table.tag_configure("counter", foreground="gray")
+
+    def show(self):
+        """Refresh now and keep refreshing while visible"""
+        self.hide()
+        self.refresh()
+
+    def hide(self):
+        """Stop the periodic refresh"""
+        if self.refresh_job is not None:
+            self.after_cancel(self.refresh_job)
+            self.refresh_job = None
+
+    def refresh(self):
+        """Update the table from the current metric snapshot"""
+        self.refresh_job = None
+        if not self.winfo_manager():
+            return
+        # Keep polling while gridded, but skip the work while the tab is hidden
+        self.refresh_job = self.after(REFRESH_INTERVAL, self.refresh)
+        if not self.winfo_ismapped() and self.table.get_children():
+            return
+        try:
+            summary = instrumentation.snapshot()
+            rows = []
+            for kind in ("timers", "histograms"):
+                for name, stats in summary[kind].items():
+                    rows.append({
+                        "key": f"{kind}:{name}",
+                        "values": (name, translate(kind[:-1].capitalize()), stats["count"],
+                                   f"{stats['total']:.1f}", f"{stats['mean']:.2f}", f"{stats['p50']:.2f}",
+                                   f"{stats['p95']:.2f}", f"{stats['max']:.2f}")
+                    })
+            for name, value in sorted(summary["counters"].items()):
+                rows.append({
+                    "key": f"counter:{name}",
+                    "values": (name, translate("Counter"), f"{value:g}", "", "", "", "", ""),
+                    "tags": ("counter",)
+                })
+
+            # Slowest totals first; counters at the end
+            rows.sort(key=lambda row: -float(row["values"][3] or -1))
+            TableUtils.update_rows(self.table, rows)
+
+            self.summary_label.configure(
+                text=f"{len(summary['timers'])} {translate('timers')}, {len(summary['counters'])} "
+                     f"{translate('counters')} - {translate('updated')} {datetime.now().strftime('%H:%M:%S')}"
+            )
+        except Exception as e:
+            logger.error(f"Error refreshing performance panel: {str(e)}")
+
+    def _reset(self):
+        """Clear all metrics"""
+        instrumentation.reset()
+        self.hide()
+        self.refresh()
+
+    def _export_json(self):
+        """Save the metric summary as JSON"""
+        try:
+            file_path = filedialog.asksaveasfilename(
+                defaultextension=".json",
+                filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
+                initialfile=f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                title=translate("Export JSON")
+            )
+            if not file_path:
+                return
+            instrumentation.export_json(file_path)
+            self.summary_label.configure(text=f"{translate('Exported to')} {file_path}")
+        except Exception as e:
+            logger.error(f"Error exporting metrics: {str(e)}")
+
+    def _export_trace(self):
+        """Save recorded spans in Chrome trace format"""
+        try:
+            file_path = filedialog.asksaveasfilename(
+                defaultextension=".json",
+                filetypes=[("Chrome Trace", "*.json"), ("All Files", "*.*")],
+                initialfile=f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                title=translate("Export Trace")
+            )
+            if not file_path:
+                return
+            spans = instrumentation.export_chrome_trace(file_path)
+            self.summary_label.configure(text=f"{translate('Exported')} {spans} {translate('spans to')} {file_path}")
+        except Exception as e:
+            logger.error(f"Error exporting trace: {str(e)}")
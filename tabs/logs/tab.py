@@ -7,7 +7,6 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk
 import logging
-import queue
 import threading
 import time
 from datetime import datetime
@@ -15,32 +14,27 @@ from typing import Dict, List, Any, Optional, Callable
 from tabs.base_tab.base_tab import BaseTab
 
 from modules.api_client import FootballAPI
+from modules.config import LOG_TREE_LIMIT, LOG_DRAIN_INTERVAL_MS, LOG_PAGE_SIZE
 from modules.db_manager import DatabaseManager
+from modules.db.logs import get_log_store
+from modules.log_buffer import get_log_buffer
 from modules.settings_manager import SettingsManager
 from modules.translations import translate
+from tabs.logs.performance_panel import PerformancePanel
 
 # Create a custom logger for this tab
 logger = logging.getLogger(__name__)
 
-# Create a queue for log messages
-log_queue = queue.Queue()
+# Capture logs in a bounded ring buffer from import on; the tab drains it
+log_buffer = get_log_buffer()
 
-# Create a custom handler that puts logs into the queue
-class QueueHandler(logging.Handler):
-    def __init__(self, log_queue):
-        super().__init__()
-        self.log_queue = log_queue
-        
-    def emit(self, record):
-        self.log_queue.put(record)
-
-# Add the queue handler to the root logger
-root_logger = logging.getLogger()
-queue_handler = QueueHandler(log_queue)
-queue_handler.setLevel(logging.DEBUG)  # Set to DEBUG to show all logs
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-queue_handler.setFormatter(formatter)
-root_logger.addHandler(queue_handler)
+# Time range choices for searching stored logs, in seconds
+SEARCH_TIME_RANGES = {
+    "All time": None,
+    "Last hour": 3600,
+    "Last 24 hours": 86400,
+    "Last 7 days": 7 * 86400
+}
 
 class LogsTab(BaseTab):
     def __init__(self, parent, api: FootballAPI, db_manager: DatabaseManager, settings_manager: SettingsManager):
@@ -51,6 +45,19 @@ class LogsTab(BaseTab):
         self.firebase_auth = None  # Will be set in _create_ui if available
         self.firebase_logs = []  # Will store Firebase logs
         self.firebase_logs_loaded = False  # Flag to track if Firebase logs have been loaded
+        self.last_shown_sequence = 0  # Newest buffered record shown in the table
+        self.last_shipped_sequence = log_buffer.sequence  # Newest record sent to Firebase
+        # Lowest level shown and shipped
+        self.min_level = logging.DEBUG
+        self.drain_job = None
+        
+        # Searching the persistent log store pauses the live view
+        self.log_store = get_log_store()
+        self.log_store.start_capture(log_buffer)
+        self._update_buffer_level()
+        self.search_mode = False
+        self.search_filters = None
+        self.search_page = []  # Records on the current search page
         
         # Create UI elements
         self._create_ui()
@@ -64,8 +71,11 @@ class LogsTab(BaseTab):
         logger.warning("LogsTab: Warning test message")
         logger.error("LogsTab: Error test message")
         
-        # Start log consumer thread for local logs
+        # Add buffered logs to the table at a fixed rate
         self.running = True
+        self._drain_logs()
+        
+        # Forward logs to Firebase in the background
         self.log_thread = threading.Thread(target=self._consume_logs)
         self.log_thread.daemon = True
         self.log_thread.start()
@@ -93,7 +103,7 @@ class LogsTab(BaseTab):
         self.control_frame.grid_columnconfigure(1, weight=0)  # Level option
         self.control_frame.grid_columnconfigure(2, weight=0)  # Source label
         self.control_frame.grid_columnconfigure(3, weight=0)  # Source option
-        self.control_frame.grid_columnconfigure(4, weight=1)  # Spacer
+        self.control_frame.grid_columnconfigure(4, weight=1)  # Spacer / view switch
         self.control_frame.grid_columnconfigure(5, weight=0)  # Refresh button
         self.control_frame.grid_columnconfigure(6, weight=0)  # Clear button
         
@@ -165,6 +175,17 @@ class LogsTab(BaseTab):
             )
             self.source_label.grid(row=0, column=3, padx=5, pady=10, sticky="w")
         
+        # Switch between logs and performance metrics
+        self.view_var = tk.StringVar(value=translate("Logs"))
+        self.view_switch = ctk.CTkSegmentedButton(
+            self.control_frame,
+            values=[translate("Logs"), translate("Performance")],
+            variable=self.view_var,
+            command=self._set_view,
+            font=ctk.CTkFont(size=18)
+        )
+        self.view_switch.grid(row=0, column=4, padx=10, pady=10, sticky="e")
+        
         # Refresh button (for Firebase logs)
         self.refresh_button = self._create_button(
             self.control_frame,
@@ -187,6 +208,58 @@ class LogsTab(BaseTab):
         )
         self.clear_button.grid(row=0, column=6, padx=10, pady=10, sticky="e")
         
+        # Search bar for the persistent log store
+        self.search_frame = ctk.CTkFrame(self.control_frame, fg_color="transparent")
+        self.search_frame.grid(row=1, column=0, columnspan=7, padx=5, pady=(0, 10), sticky="ew")
+        self.search_frame.grid_columnconfigure(0, weight=1)
+        
+        self.search_entry = ctk.CTkEntry(
+            self.search_frame,
+            placeholder_text=translate("Search messages..."),
+            font=ctk.CTkFont(size=16)
+        )
+        self.search_entry.grid(row=0, column=0, padx=5, sticky="ew")
+        self.search_entry.bind("<Return>", lambda event: self._search_logs())
+        
+        self.source_filter_entry = ctk.CTkEntry(
+            self.search_frame,
+            placeholder_text=translate("Source"),
+            width=200,
+            font=ctk.CTkFont(size=16)
+        )
+        self.source_filter_entry.grid(row=0, column=1, padx=5)
+        self.source_filter_entry.bind("<Return>", lambda event: self._search_logs())
+        
+        self.time_range_var = tk.StringVar(value="All time")
+        self.time_range_option = ctk.CTkOptionMenu(
+            self.search_frame,
+            values=list(SEARCH_TIME_RANGES.keys()),
+            variable=self.time_range_var,
+            font=ctk.CTkFont(size=16)
+        )
+        self.time_range_option.grid(row=0, column=2, padx=5)
+        
+        self.search_button = self._create_button(
+            self.search_frame, "Search", self._search_logs, width=110, height=32,
+            tooltip_text="Search stored logs, including earlier sessions"
+        )
+        self.search_button.grid(row=0, column=3, padx=5)
+        self.newer_button = self._create_button(
+            self.search_frame, "Newer", lambda: self._load_search_page(newer=True), width=90, height=32,
+            tooltip_text="Show newer matching logs"
+        )
+        self.newer_button.grid(row=0, column=4, padx=5)
+        self.older_button = self._create_button(
+            self.search_frame, "Older", lambda: self._load_search_page(newer=False), width=90, height=32,
+            tooltip_text="Show older matching logs"
+        )
+        self.older_button.grid(row=0, column=5, padx=5)
+        self.live_button = self._create_button(
+            self.search_frame, "Live", self._show_live_logs, width=90, height=32,
+            tooltip_text="Return to the live log view"
+        )
+        self.live_button.grid(row=0, column=6, padx=5)
+        
         # Create log text area
         self.log_frame = ctk.CTkFrame(self.content_frame)
         self.log_frame.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
@@ -211,7 +284,7 @@ class LogsTab(BaseTab):
         self.log_tree.heading("source", text=translate("Source"))
         self.log_tree.heading("message", text=translate("Message"))
         
-        self.log_tree.column("time", width=150)
+        self.log_tree.column("time", width=220)
         self.log_tree.column("level", width=80)
         self.log_tree.column("source", width=150)
         self.log_tree.column("message", width=500)
@@ -237,6 +310,9 @@ class LogsTab(BaseTab):
         self.log_tree.tag_configure("ERROR", foreground="red")
         self.log_tree.tag_configure("CRITICAL", foreground="red", background="yellow")
         
+        # Performance metrics, shown in place of the log table
+        self.performance_panel = PerformancePanel(self.content_frame, self._create_button)
+        
         # Add a status label in the footer
         self.status_label = ctk.CTkLabel(
             self.footer_frame,
@@ -248,10 +324,14 @@ class LogsTab(BaseTab):
         # Log a test message
         logger.info("Logs tab initialized")
         
+    def _update_buffer_level(self):
+        """Buffer only what the tab or the log store needs; each filters its own level on read"""
+        log_buffer.setLevel(min(self.min_level, self.log_store.min_level))
+        
     def _set_log_level(self, level):
         """Set the log level filter"""
-        # Update the queue handler level
-        queue_handler.setLevel(getattr(logging, level))
+        self.min_level = getattr(logging, level)
+        self._update_buffer_level()
         
         # Update status
         self.status_label.configure(text=f"{translate('Log level set to')} {level}")
@@ -259,10 +339,22 @@ class LogsTab(BaseTab):
         # Log the change
         logger.info(f"Log level changed to {level}")
         
+    def _set_view(self, view):
+        """Show either the log table or the performance panel"""
+        if view == translate("Performance"):
+            self.log_frame.grid_remove()
+            self.performance_panel.grid(row=2, column=0, padx=10, pady=10, sticky="nsew")
+            self.performance_panel.show()
+        else:
+            self.performance_panel.hide()
+            self.performance_panel.grid_remove()
+            self.log_frame.grid()
+        
     def _set_log_source(self, source):
         """Set the log source filter"""
         # Update the log source
         self.log_source.set(source)
+        self.search_mode = False
         
         # Clear the log tree
         self._clear_logs()
@@ -372,66 +464,142 @@ class LogsTab(BaseTab):
         logger.info("Logs cleared")
         
     def _consume_logs(self):
-        """Consume logs from the queue and add them to the treeview"""
+        """Forward buffered logs to Firebase while a user is signed in (runs on a worker thread)"""
         while self.running:
             try:
-                # Check if there are any logs in the queue
-                if not log_queue.empty():
-                    # Get the log record
-                    record = log_queue.get(block=False)
-                    
-                    # Format the time
-                    time_str = time.strftime("%H:%M:%S", time.localtime(record.created))
-                    
-                    try:
-                        # Add to treeview - use try/except to handle case where main thread is not ready
-                        self.parent.after(0, self._add_log_to_tree, time_str, record)
-                        
-                        # If Firebase is available and user is signed in, log to Firebase
-                        if self.firebase_auth and self.firebase_auth.is_initialized() and self.firebase_auth.is_signed_in():
-                            user_id = self.firebase_auth.get_current_user().get('localId')
-                            self.firebase_auth.log_console_message(
-                                user_id,
-                                record.levelname,
-                                record.name,
-                                record.getMessage()
-                            )
-                    except RuntimeError:
-                        # If main thread is not in main loop yet, just discard the log
-                        pass
-                    
+                entries, self.last_shipped_sequence = log_buffer.read_since(self.last_shipped_sequence)
+                entries = [entry for entry in entries if entry[2] >= self.min_level]
+                
+                # If Firebase is available and user is signed in, log to Firebase
+                if entries and self.firebase_auth and self.firebase_auth.is_initialized() and self.firebase_auth.is_signed_in():
+                    user_id = self.firebase_auth.get_current_user().get('localId')
+                    for _, _, _, levelname, name, message in entries:
+                        if not self.running:
+                            break
+                        self.firebase_auth.log_console_message(user_id, levelname, name, message)
+                
                 # Sleep a bit to avoid high CPU usage
-                time.sleep(0.1)
-            except queue.Empty:
-                # Queue is empty, just continue
-                time.sleep(0.1)
+                time.sleep(1.0)
             except Exception as e:
                 # Catch and print other exceptions but don't crash the thread
                 print(f"Error in log consumer: {str(e)}")
                 time.sleep(1.0)  # Sleep longer on error to avoid spamming
                 
-    def _add_log_to_tree(self, time_str, record):
-        """Add a log record to the treeview (called from main thread)"""
+    def _drain_logs(self):
+        """Add new buffered logs to the treeview in one batch (runs on the main thread)"""
+        if not self.running:
+            return
         try:
-            # Only add to tree if local logs are selected
-            if self.log_source.get() == "Local":
-                # Insert at the beginning
-                self.log_tree.insert(
-                    "", 0,
-                    values=(
-                        time_str,
-                        record.levelname,
-                        record.name,
-                        record.getMessage()
-                    ),
-                    tags=(record.levelname,)
-                )
-                
-                # Update status
-                self.status_label.configure(text=f"{translate('Last log')}: {time_str}")
+            # Skip the work while searching, hidden or showing Firebase logs; the buffer keeps the records
+            if not self.search_mode and self.log_source.get() == "Local" and self.log_frame.winfo_ismapped():
+                entries, self.last_shown_sequence = log_buffer.read_since(self.last_shown_sequence, LOG_TREE_LIMIT)
+                entries = [entry for entry in entries if entry[2] >= self.min_level]
+                if entries:
+                    self._add_logs_to_tree(entries)
         except Exception as e:
-            print(f"Error adding log to tree: {e}")
+            print(f"Error draining logs: {e}")
+        self.drain_job = self.parent.after(LOG_DRAIN_INTERVAL_MS, self._drain_logs)
+            
+    def _add_logs_to_tree(self, entries):
+        """Insert log entries at the top of the treeview and trim the oldest rows"""
+        time_str = ""
+        for _, created, _, levelname, name, message in entries:
+            time_str = time.strftime("%H:%M:%S", time.localtime(created))
+            self.log_tree.insert("", 0, values=(time_str, levelname, name, message), tags=(levelname,))
+        
+        # Keep the table bounded
+        children = self.log_tree.get_children()
+        if len(children) > LOG_TREE_LIMIT:
+            self.log_tree.delete(*children[LOG_TREE_LIMIT:])
+        
+        # Update status
+        self.status_label.configure(text=f"{translate('Last log')}: {time_str}")
             
+    def _search_logs(self):
+        """Search the persistent log store with the current filters"""
+        if self.log_source.get() != "Local":
+            self.status_label.configure(text=translate("Search is available for local logs"))
+            return
+        
+        time_range = SEARCH_TIME_RANGES.get(self.time_range_var.get())
+        self.search_filters = {
+            "min_level": getattr(logging, self.level_var.get()),
+            "source": self.source_filter_entry.get().strip() or None,
+            "text": self.search_entry.get().strip() or None,
+            "start": time.time() - time_range if time_range else None
+        }
+        self.search_mode = True
+        self.search_page = []
+        self.status_label.configure(text=translate("Searching logs..."))
+        self.run_in_background(self._query_log_store, None, True, on_success=self._on_search_results)
+        
+    def _load_search_page(self, newer):
+        """Show the next newer or older page of search results"""
+        if not self.search_mode or not self.search_page:
+            return
+        anchor = self.search_page[0]["id"] if newer else self.search_page[-1]["id"]
+        self.run_in_background(
+            self._query_log_store, anchor, not newer,
+            on_success=lambda result: self._on_search_results(result, newer)
+        )
+        
+    def _query_log_store(self, task, anchor_id, older):
+        """
+        Run a log store search (runs on a worker thread)
+        
+        Args:
+            anchor_id: Record id to page from, or None for the first page
+            older: Page to records older than the anchor, otherwise newer
+        
+        Returns:
+            tuple: (records newest first, total matches on the first page, else None)
+        """
+        filters = dict(self.search_filters)
+        if anchor_id is None:
+            return self.log_store.search(limit=LOG_PAGE_SIZE, **filters), self.log_store.count(**filters)
+        if older:
+            return self.log_store.search(before_id=anchor_id, limit=LOG_PAGE_SIZE, **filters), None
+        return self.log_store.search(after_id=anchor_id, limit=LOG_PAGE_SIZE, **filters), None
+        
+    def _on_search_results(self, result, newer=None):
+        """Show a page of search results (runs on the main thread)"""
+        records, total = result
+        if not self.search_mode:
+            return
+        if not records and newer is not None:
+            # Already at the first or last page
+            self.status_label.configure(
+                text=translate("No newer logs") if newer else translate("No older logs")
+            )
+            return
+        
+        self.search_page = records
+        for item in self.log_tree.get_children():
+            self.log_tree.delete(item)
+        for record in records:
+            time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record["created"]))
+            self.log_tree.insert(
+                "", "end",
+                values=(time_str, record["level_name"], record["source"], record["message"]),
+                tags=(record["level_name"],)
+            )
+        
+        if total is not None:
+            self.status_label.configure(text=f"{translate('Found')} {total} {translate('matching logs')}")
+        else:
+            self.status_label.configure(text=f"{translate('Showing')} {len(records)} {translate('matching logs')}")
+        
+    def _show_live_logs(self):
+        """Leave search results and resume the live log view"""
+        self.search_mode = False
+        self.search_page = []
+        for item in self.log_tree.get_children():
+            self.log_tree.delete(item)
+        
+        # Show the newest buffered records again
+        self.last_shown_sequence = 0
+        self.status_label.configure(text=translate("Showing live logs"))
+        
     def update_settings(self):
         """Update settings from settings manager"""
         # Update theme from parent class
@@ -450,5 +618,8 @@ class LogsTab(BaseTab):
     def on_close(self):
         """Called when the tab is closed or the application is exiting"""
         self.running = False
+        if self.drain_job is not None:
+            self.parent.after_cancel(self.drain_job)
+            self.drain_job = None
         if self.log_thread.is_alive():
             self.log_thread.join(1.0)  # Wait for thread to finish with timeout
@@ -10,6 +10,7 @@ from modules.db_manager import DatabaseManager
 from modules.settings_manager import SettingsManager
 from modules.league_names import get_league_options, get_league_display_name
 from tabs.base_tab.base_tab import BaseTab
+from tabs.base_tab.table_utils import TableUtils
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,7 @@ class NextRoundTab(BaseTab):
         
         # Initialize variables
         self.fixtures_data = []
+        self.team_stats = {}
         
         # Get leagues from settings, use default if empty
         leagues = self.settings_manager.get_leagues()
@@ -169,94 +171,96 @@ class NextRoundTab(BaseTab):
         # Refresh data
         self._refresh_data()
         
-    def _refresh_data_thread(self, original_auto_fetch):
-        """Override the base class method to fetch data from API"""
-        try:
-            # Show loading indicator overlay
-            self.show_loading_indicator()
-            
-            # Fetch data
-            self._fetch_data()
-            
-            # Restore auto-fetch flag
-            self.api.disable_auto_fetch = original_auto_fetch
-        except Exception as e:
-            logger.error(f"Error in refresh data thread: {str(e)}")
-            
-            # Restore auto-fetch flag
-            self.api.disable_auto_fetch = original_auto_fetch
-            
-            # Hide loading indicator
-            self.hide_loading_indicator()
+    def _refresh_data(self):
+        """Refresh data from API"""
+        # Show loading indicator overlay
+        self.show_loading_indicator()
+        self.refresh_button.configure(text="Fetching fixtures...", state="disabled")
+        
+        # Fetch the round and its team statistics on a worker thread
+        league_id = self.selected_league.get()
+        self.run_in_background(
+            self._fetch_data,
+            league_id,
+            on_success=self._on_data_fetched,
+            on_error=self._on_fetch_failed,
+            on_done=self.hide_loading_indicator
+        )
             
-    def _fetch_data(self):
-        """Fetch data from API"""
+    def _fetch_data(self, task, league_id):
+        """
+        Fetch the next round and prefetch its team statistics (runs on a worker thread)
+        
+        Returns:
+            tuple: (fixtures, team statistics by (league_id, team_id), error text);
+                error text is None on success
+        """
         try:
-            # Get league ID
-            league_id = self.selected_league.get()
-            
-            # Show status message
-            self.refresh_button.configure(text="Fetching fixtures...", state="disabled")
-            
+            fixtures = self.api.fetch_next_fixtures(league_id, force_fetch=True)
+        except Exception as e:
+            logger.error(f"Error fetching fixtures: {str(e)}")
+            return [], {}, "Fixtures Error"
+        
+        if not fixtures:
+            logger.warning(f"No fixtures for league {league_id}")
+            return [], {}, "No Fixtures Found"
+        
+        task.check_cancelled()
+        
+        # Collect every (league, team) pair of the round and fetch them in one parallel wave
+        pairs = []
+        for fixture in fixtures:
             try:
-                # Fetch next fixtures with timeout handling
-                fixtures = self.api.fetch_next_fixtures(league_id)
-                
-                if not fixtures:
-                    logger.warning(f"No fixtures for league {league_id}")
-                    self.refresh_button.configure(text="No Fixtures Found", state="normal")
-                    self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-                    return
-            except KeyboardInterrupt:
-                logger.warning("Fixtures fetch interrupted by user")
-                self.refresh_button.configure(text="Fetch Interrupted", state="normal")
-                self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-                return
-            except Exception as e:
-                logger.error(f"Error fetching fixtures: {str(e)}")
-                self.refresh_button.configure(text="Fixtures Error", state="normal")
-                self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-                return
-                
-            # Store fixtures data
+                fixture_league_id = fixture['league']['id']
+                pairs.append((fixture_league_id, fixture['teams']['home']['id']))
+                pairs.append((fixture_league_id, fixture['teams']['away']['id']))
+            except (KeyError, TypeError) as e:
+                logger.error(f"Error reading fixture teams: {str(e)}")
+        team_stats = self.api.fetch_team_statistics_batch(pairs, force_fetch=True)
+        
+        return fixtures, team_stats, None
+    
+    def _on_data_fetched(self, result):
+        """Show the fetched round (runs on the main thread)"""
+        fixtures, team_stats, error_text = result
+        
+        if error_text:
+            self.refresh_button.configure(text=error_text, state="normal")
+            self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
+            return
+        
+        try:
+            # Store fixtures data and the prefetched statistics
             self.fixtures_data = fixtures
+            self.team_stats = team_stats
             
             # Get round info
             round_name = fixtures[0]['league']['round'] if fixtures else "Unknown"
             self.round_label.configure(text=f"Round: {round_name}")
             
-            # Update status
-            self.refresh_button.configure(text="Updating table...", state="disabled")
-            
             # Update fixtures table
             self._update_fixtures_table()
             
             # Reset refresh button
             self.refresh_button.configure(text="Refresh Data", state="normal")
             
-            # Hide loading indicator
-            self.hide_loading_indicator()
-            
-        except KeyboardInterrupt:
-            logger.warning("Data fetch interrupted by user")
-            self.refresh_button.configure(text="Interrupted", state="normal")
-            self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-            # Hide loading indicator
-            self.hide_loading_indicator()
         except Exception as e:
-            logger.error(f"Error fetching data: {str(e)}")
-            self.refresh_button.configure(text="Refresh Failed", state="normal")
-            self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
-            # Hide loading indicator
-            self.hide_loading_indicator()
+            self._on_fetch_failed(e)
+    
+    def _on_fetch_failed(self, error):
+        """Handle a failed refresh (runs on the main thread)"""
+        logger.error(f"Error fetching data: {str(error)}")
+        self.refresh_button.configure(text="Refresh Failed", state="normal")
+        self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data", state="normal"))
+    
+    def _get_team_stats(self, league_id, team_id):
+        """Get the team statistics prefetched with the current round"""
+        return self.team_stats.get((league_id, team_id)) or {}
             
     def _update_fixtures_table(self):
-        """Update the fixtures table"""
-        # Clear table
-        for item in self.fixtures_table.get_children():
-            self.fixtures_table.delete(item)
-            
-        # Add data
+        """Update the fixtures table from the prefetched statistics"""
+        # Build rows
+        rows = []
         for fixture in self.fixtures_data:
             try:
                 # Get fixture data
@@ -265,54 +269,28 @@ class NextRoundTab(BaseTab):
                 home_team = fixture['teams']['home']['name']
                 away_team = fixture['teams']['away']['name']
                 venue = fixture['fixture']['venue']['name'] if fixture['fixture']['venue']['name'] else "Unknown"
-                
-                # Get real form data from API
-                home_team_id = fixture['teams']['home']['id']
-                away_team_id = fixture['teams']['away']['id']
                 league_id = fixture['league']['id']
                 
-                # Default values in case API calls fail
-                home_form = 'N/A'
-                away_form = 'N/A'
-                prediction = "Unknown"
+                # Get form data; the API returns null form for teams without matches
+                home_stats = self._get_team_stats(league_id, fixture['teams']['home']['id'])
+                away_stats = self._get_team_stats(league_id, fixture['teams']['away']['id'])
+                home_form = home_stats.get('form') or 'N/A'
+                away_form = away_stats.get('form') or 'N/A'
                 
-                try:
-                    # Temporarily disable auto-fetch flag
-                    original_auto_fetch = self.api.disable_auto_fetch
-                    self.api.disable_auto_fetch = False
-                    
-                    # Fetch team statistics with error handling
-                    home_stats = self.api.fetch_team_statistics(league_id, home_team_id)
-                    away_stats = self.api.fetch_team_statistics(league_id, away_team_id)
-                    
-                    # Restore auto-fetch flag
-                    self.api.disable_auto_fetch = original_auto_fetch
-                    
-                    # Extract form data
-                    home_form = home_stats.get('form', 'N/A')
-                    away_form = away_stats.get('form', 'N/A')
-                    
-                    # Generate prediction based on form
-                    home_wins = home_form.count('W')
-                    away_wins = away_form.count('W')
-                    
-                    if home_wins > away_wins:
-                        prediction = "Home Win"
-                    elif away_wins > home_wins:
-                        prediction = "Away Win"
-                    else:
-                        prediction = "Draw"
-                except KeyboardInterrupt:
-                    logger.warning("Team statistics fetch interrupted by user")
-                    # Use default values
-                except Exception as e:
-                    logger.error(f"Error fetching team statistics: {str(e)}")
-                    # Use default values
+                # Generate prediction based on form
+                home_wins = home_form.count('W')
+                away_wins = away_form.count('W')
+                
+                if home_wins > away_wins:
+                    prediction = "Home Win"
+                elif away_wins > home_wins:
+                    prediction = "Away Win"
+                else:
+                    prediction = "Draw"
                 
                 # Add row
-                self.fixtures_table.insert(
-                    "", "end",
-                    values=(
+                rows.append({
+                    "values": (
                         date,
                         time,
                         home_team,
@@ -322,16 +300,20 @@ class NextRoundTab(BaseTab):
                         away_form,
                         prediction
                     ),
-                    tags=(fixture['fixture']['id'],)
-                )
-                
-                # Apply default sorting by date and time
-                if hasattr(self.fixtures_table, 'sorter'):
-                    # Sort by date (column 0) first
-                    self.fixtures_table.sorter.apply_initial_sort("0", reverse=False)
+                    "tags": (fixture['fixture']['id'],),
+                    "fixture": fixture
+                })
             except Exception as e:
                 logger.error(f"Error processing fixture: {str(e)}")
                 continue
+        
+        # Replace table contents
+        TableUtils.set_rows(self.fixtures_table, rows)
+        
+        # Apply default sorting by date and time
+        if hasattr(self.fixtures_table, 'sorter'):
+            # Sort by date (column 0) first
+            self.fixtures_table.sorter.apply_initial_sort("0", reverse=False)
             
     def _on_fixture_selected(self, event):
         """Handle fixture selection"""
@@ -340,16 +322,9 @@ class NextRoundTab(BaseTab):
         if not selection:
             return
             
-        # Get fixture ID from tags
-        fixture_id = self.fixtures_table.item(selection[0], "tags")[0]
-        
-        # Find fixture data
-        fixture_data = None
-        for fixture in self.fixtures_data:
-            if fixture['fixture']['id'] == fixture_id:
-                fixture_data = fixture
-                break
-                
+        # Get the fixture stored on the selected row
+        row = TableUtils.get_row_data(self.fixtures_table, selection[0])
+        fixture_data = row.get("fixture") if row else None
         if not fixture_data:
             return
             
@@ -362,21 +337,14 @@ class NextRoundTab(BaseTab):
         away_team_id = fixture_data['teams']['away']['id']
         league_id = fixture_data['league']['id']
         
-        # Fetch team statistics
+        # Use the statistics prefetched with the round
         try:
-            # Temporarily disable auto-fetch flag
-            original_auto_fetch = self.api.disable_auto_fetch
-            self.api.disable_auto_fetch = False
-            
-            home_stats = self.api.fetch_team_statistics(league_id, home_team_id)
-            away_stats = self.api.fetch_team_statistics(league_id, away_team_id)
-            
-            # Restore auto-fetch flag
-            self.api.disable_auto_fetch = original_auto_fetch
+            home_stats = self._get_team_stats(league_id, home_team_id)
+            away_stats = self._get_team_stats(league_id, away_team_id)
             
             # Extract form data
-            home_form = home_stats.get('form', 'N/A')
-            away_form = away_stats.get('form', 'N/A')
+            home_form = home_stats.get('form') or 'N/A'
+            away_form = away_stats.get('form') or 'N/A'
             
             # Extract home/away records
             home_record = f"{home_stats.get('fixtures', {}).get('wins', {}).get('home', 0)}W "
@@ -5,6 +5,7 @@ Data settings section for the settings tab.
 import customtkinter as ctk
 import tkinter as tk
 import logging
+import os
 from typing import Dict, Any, Callable
 
 from tabs.settings.base_section import BaseSettingsSection
@@ -20,6 +21,7 @@ class DataSettings(BaseSettingsSection):
         self.threshold_var = None
         self.auto_refresh_var = None
         self.refresh_interval_var = None
+        self.profiling_var = None
         self.form_length_value_label = None
         self.threshold_value_label = None
         self.refresh_interval_value_label = None
@@ -158,6 +160,36 @@ class DataSettings(BaseSettingsSection):
             )
         )
         
+        # Profiling
+        self.profiling_frame = ctk.CTkFrame(self.frame)
+        self.profiling_frame.pack(fill="x", padx=20, pady=20)
+        
+        self.profiling_label = ctk.CTkLabel(
+            self.profiling_frame,
+            text="Performance Profiling:",
+            font=ctk.CTkFont(size=14, weight="bold")
+        )
+        self.profiling_label.pack(anchor="w", padx=10, pady=(10, 5))
+        
+        self.profiling_var = tk.BooleanVar(value=self.settings_manager.get_profiling())
+        
+        self.profiling_switch = ctk.CTkSwitch(
+            self.profiling_frame,
+            text="Profile data refreshes",
+            variable=self.profiling_var,
+            onvalue=True,
+            offvalue=False
+        )
+        self.profiling_switch.pack(anchor="w", padx=10, pady=5)
+        
+        from modules.profiler import get_profile_dir
+        self.profiling_hint_label = ctk.CTkLabel(
+            self.profiling_frame,
+            text=f"Profiles are saved to: {os.path.abspath(get_profile_dir())}",
+            font=ctk.CTkFont(size=10)
+        )
+        self.profiling_hint_label.pack(anchor="w", padx=10, pady=5)
+        
         return self.frame
     
     def save_settings(self):
@@ -167,6 +199,7 @@ class DataSettings(BaseSettingsSection):
             self.settings_manager.set_setting("threshold", float(self.threshold_var.get()))
             self.settings_manager.set_setting("auto_refresh", bool(self.auto_refresh_var.get()))
             self.settings_manager.set_setting("refresh_interval", int(self.refresh_interval_var.get()))
+            self.settings_manager.set_setting("profiling", bool(self.profiling_var.get()))
             return True
         except Exception as e:
             logger.error(f"Error saving data settings: {str(e)}")
@@ -181,6 +214,7 @@ class DataSettings(BaseSettingsSection):
             self.threshold_var.set(DEFAULT_SETTINGS["threshold"])
             self.auto_refresh_var.set(DEFAULT_SETTINGS["auto_refresh"])
             self.refresh_interval_var.set(DEFAULT_SETTINGS["refresh_interval"])
+            self.profiling_var.set(DEFAULT_SETTINGS["profiling"])
             
             # Update labels
             self.form_length_value_label.configure(text=f"Current value: {self.form_length_var.get()} matches")
@@ -4,12 +4,16 @@ Chart components for the Stats tab.
 
 import logging
 import customtkinter as ctk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
+
+from modules.lazy_imports import lazy_import
+from tabs.base_tab.charts import BarChart, LineChart, PieChart
 
 logger = logging.getLogger(__name__)
 
+# matplotlib is imported the first time a chart is created
+plt = lazy_import("matplotlib.pyplot")
+backend_tkagg = lazy_import("matplotlib.backends.backend_tkagg")
+
 class StatsCharts:
     """Chart component manager for the Stats tab."""
     
@@ -46,7 +50,7 @@ class StatsCharts:
         
         # Create matplotlib figure for accuracy chart
         self.accuracy_fig = plt.Figure(figsize=(4, 3), dpi=100)
-        self.accuracy_canvas = FigureCanvasTkAgg(self.accuracy_fig, master=self.accuracy_chart_frame)
+        self.accuracy_canvas = backend_tkagg.FigureCanvasTkAgg(self.accuracy_fig, master=self.accuracy_chart_frame)
         self.accuracy_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
         
         # Predictions by Level Chart
@@ -62,7 +66,7 @@ class StatsCharts:
         
         # Create matplotlib figure for level chart
         self.level_fig = plt.Figure(figsize=(4, 3), dpi=100)
-        self.level_canvas = FigureCanvasTkAgg(self.level_fig, master=self.level_chart_frame)
+        self.level_canvas = backend_tkagg.FigureCanvasTkAgg(self.level_fig, master=self.level_chart_frame)
         self.level_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
         
         # Accuracy Over Time Chart
@@ -78,72 +82,78 @@ class StatsCharts:
         
         # Create matplotlib figure for time chart
         self.time_fig = plt.Figure(figsize=(8, 3), dpi=100)
-        self.time_canvas = FigureCanvasTkAgg(self.time_fig, master=self.time_chart_frame)
+        self.time_canvas = backend_tkagg.FigureCanvasTkAgg(self.time_fig, master=self.time_chart_frame)
         self.time_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
         
+        # Charts keep their artists and are updated in place
+        self.accuracy_chart = PieChart(
+            self.accuracy_fig, self.accuracy_canvas,
+            labels=["Correct", "Incorrect"], colors=['#4CAF50', '#F44336']
+        )
+        self.level_chart = BarChart(self.level_fig, self.level_canvas)
+        self.time_chart = LineChart(self.time_fig, self.time_canvas)
+        
         # Add to UI elements
         self.ui_elements["charts"] = self
         
     def update_charts(self, stats):
         """Update charts with stats data"""
         # Accuracy Pie Chart
-        self.accuracy_fig.clear()
-        ax = self.accuracy_fig.add_subplot(111)
-        
         if stats["completed"] > 0:
             correct = stats["correct"]
-            incorrect = stats["completed"] - correct
-            
-            ax.pie(
-                [correct, incorrect],
-                labels=["Correct", "Incorrect"],
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=['#4CAF50', '#F44336']
-            )
-            ax.axis('equal')
+            self.accuracy_chart.update([correct, stats["completed"] - correct])
         else:
-            ax.text(0.5, 0.5, "No completed predictions", ha='center', va='center')
-            ax.axis('off')
-            
-        self.accuracy_canvas.draw()
+            self.accuracy_chart.show_message("No completed predictions")
         
         # Predictions by Level Chart
-        self.level_fig.clear()
-        ax = self.level_fig.add_subplot(111)
-        
         if stats["total"] > 0 and "by_level" in stats:
             levels = stats["by_level"]["counts"]
-            level_labels = [f"Level {level}" for level in sorted(levels.keys())]
-            level_counts = [levels[level] for level in sorted(levels.keys())]
+            accuracy = stats["by_level"].get("accuracy", {})
             
-            ax.bar(level_labels, level_counts, color='#3498DB')
-            ax.set_ylabel('Count')
-            ax.set_title('Predictions by Level')
-            
-            # Add accuracy as text on bars
-            if "accuracy" in stats["by_level"]:
-                for i, level in enumerate(sorted(levels.keys())):
-                    accuracy = stats["by_level"]["accuracy"].get(level, 0)
-                    if accuracy > 0:
-                        ax.text(
-                            i, level_counts[i] + 0.1,
-                            f"{accuracy:.1f}%",
-                            ha='center', va='bottom'
-                        )
+            # Show accuracy as text on bars
+            self.level_chart.update(
+                [f"Level {level}" for level in sorted(levels.keys())],
+                [levels[level] for level in sorted(levels.keys())],
+                color='#3498DB',
+                title='Predictions by Level',
+                ylabel='Count',
+                value_labels=[
+                    f"{accuracy.get(level, 0):.1f}%" if accuracy.get(level, 0) > 0 else ""
+                    for level in sorted(levels.keys())
+                ]
+            )
         else:
-            ax.text(0.5, 0.5, "No predictions", ha='center', va='center')
-            ax.axis('off')
-            
-        self.level_canvas.draw()
-        
-        # Accuracy Over Time Chart (placeholder)
-        self.time_fig.clear()
-        ax = self.time_fig.add_subplot(111)
-        
-        # This would require more complex data processing
-        # For now, just show a placeholder
-        ax.text(0.5, 0.5, "Accuracy Over Time (Coming Soon)", ha='center', va='center')
-        ax.axis('off')
-            
-        self.time_canvas.draw()
\ No newline at end of file
+            self.level_chart.show_message("No predictions")
+    
+    def update_time_chart(self, overall, by_level):
+        """
+        Update the accuracy over time chart
+        
+        Args:
+            overall: Accuracy buckets of all predictions from get_accuracy_over_time
+            by_level: Accuracy buckets per prediction level
+        """
+        if not overall:
+            self.time_chart.show_message("No completed predictions")
+            return
+        
+        buckets = [point["bucket"] for point in overall]
+        positions = {bucket: index for index, bucket in enumerate(buckets)}
+        
+        # One line for all predictions and one per level, with gaps where a level has no results
+        levels = {}
+        for point in by_level:
+            values = levels.setdefault(point["prediction_level"], [None] * len(buckets))
+            values[positions[point["bucket"]]] = point["accuracy"]
+        series = {"All": [point["accuracy"] for point in overall]}
+        for level in sorted(levels):
+            series[f"Level {level}"] = levels[level]
+        
+        self.time_chart.update(
+            buckets,
+            series,
+            colors={"All": '#3498DB'},
+            title='Accuracy Over Time',
+            ylabel='Accuracy (%)',
+            ylim=(0, 100)
+        )
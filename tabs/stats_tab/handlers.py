@@ -6,6 +6,9 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 
+from modules.config import ACCURACY_CHART_BUCKET
+from tabs.base_tab.table_utils import TableUtils
+
 logger = logging.getLogger(__name__)
 
 class StatsTabHandlers:
@@ -48,6 +51,11 @@ class StatsTabHandlers:
             # Update charts (assuming it's initialized)
             if "update_charts" in dir(self.ui_elements.get("charts", {})):
                 self.ui_elements["charts"].update_charts(stats)
+                
+                # Accuracy over time comes from the precomputed aggregates, so it stays cheap
+                overall = self.db_manager.get_accuracy_over_time(ACCURACY_CHART_BUCKET)
+                by_level = self.db_manager.get_accuracy_over_time(ACCURACY_CHART_BUCKET, by_level=True)
+                self.ui_elements["charts"].update_time_chart(overall, by_level)
             
             # Update status
             if "status_label" in self.ui_elements:
@@ -69,10 +77,6 @@ class StatsTabHandlers:
         status_var = predictions_widgets["status_var"]
         result_var = predictions_widgets["result_var"]
         
-        # Clear table
-        for item in predictions_table.get_children():
-            predictions_table.delete(item)
-            
         # Apply filters
         status_filter = status_var.get()
         result_filter = result_var.get()
@@ -88,7 +92,8 @@ class StatsTabHandlers:
             elif result_filter == "Incorrect":
                 filtered_predictions = [p for p in filtered_predictions if p["correct"] == 0 and p["status"] == "COMPLETED"]
         
-        # Add data to table
+        # Build table rows
+        rows = []
         for prediction in filtered_predictions:
             # Determine tag
             if prediction["status"] == "WAITING":
@@ -99,9 +104,8 @@ class StatsTabHandlers:
                 tag = "incorrect"
                 
             # Add row
-            predictions_table.insert(
-                "", "end",
-                values=(
+            rows.append({
+                "values": (
                     prediction["team_name"],
                     prediction["league_name"],
                     prediction["opponent_name"],
@@ -112,8 +116,11 @@ class StatsTabHandlers:
                     prediction["result"] or "",
                     "Yes" if prediction["correct"] == 1 else "No" if prediction["status"] == "COMPLETED" else ""
                 ),
-                tags=(tag,)
-            )
+                "tags": (tag,)
+            })
+        
+        # Replace table contents
+        TableUtils.set_rows(predictions_table, rows)
             
         # Apply default sorting by date if the table has a sorter
         if hasattr(predictions_table, 'sorter'):
@@ -215,9 +215,9 @@ class StatsTabUI:
                 {"text": "Team", "width": 150},
                 {"text": "League", "width": 150},
                 {"text": "Opponent", "width": 150},
-                {"text": "Date", "width": 100},
+                {"text": "Date", "width": 100, "type": "date"},
                 {"text": "Prediction", "width": 100},
-                {"text": "Perf. Diff", "width": 80},
+                {"text": "Perf. Diff", "width": 80, "type": "number"},
                 {"text": "Status", "width": 80},
                 {"text": "Result", "width": 80},
                 {"text": "Correct", "width": 80}
@@ -9,6 +9,7 @@ from modules.db_manager import DatabaseManager
 from modules.settings_manager import SettingsManager
 from modules.league_names import get_league_options, get_league_display_name
 from tabs.base_tab.base_tab import BaseTab
+from tabs.base_tab.table_utils import TableUtils
 
 logger = logging.getLogger(__name__)
 
@@ -398,11 +399,8 @@ class TeamTab(BaseTab):
             
     def _update_fixtures_table(self, fixtures):
         """Update the fixtures table"""
-        # Clear table
-        for item in self.fixtures_table.get_children():
-            self.fixtures_table.delete(item)
-            
-        # Add data
+        # Build rows
+        rows = []
         for fixture in fixtures:
             # Get fixture data
             date = fixture['fixture']['date'].split('T')[0]
@@ -419,17 +417,17 @@ class TeamTab(BaseTab):
             venue = fixture['fixture']['venue']['name'] if fixture['fixture']['venue']['name'] else "Unknown"
             
             # Add row
-            self.fixtures_table.insert(
-                "", "end",
-                values=(
-                    date,
-                    home_team,
-                    away_team,
-                    score,
-                    status,
-                    venue
-                )
-            )
+            rows.append((
+                date,
+                home_team,
+                away_team,
+                score,
+                status,
+                venue
+            ))
+        
+        # Replace table contents
+        TableUtils.set_rows(self.fixtures_table, rows)
             
         # Apply default sorting by date (column 0)
         if hasattr(self.fixtures_table, 'sorter'):
@@ -439,8 +437,7 @@ class TeamTab(BaseTab):
     def _update_squad_table(self, team_id):
         """Update the squad table with real squad data from API"""
         # Clear table
-        for item in self.squad_table.get_children():
-            self.squad_table.delete(item)
+        TableUtils.clear_table(self.squad_table)
             
         try:
             # Fetch squad data from API
@@ -451,25 +448,19 @@ class TeamTab(BaseTab):
                 logger.warning(f"No squad data for team {team_id}")
                 
                 # Add a message row
-                self.squad_table.insert(
-                    "", "end",
-                    values=(
-                        "No squad data available",
-                        "", "", "", "", "", "", "", ""
-                    )
-                )
+                TableUtils.add_row(self.squad_table, (
+                    "No squad data available",
+                    "", "", "", "", "", "", "", ""
+                ))
                 return
                 
             # Process squad data
             if len(squad_data['response']) == 0:
                 # No squad data
-                self.squad_table.insert(
-                    "", "end",
-                    values=(
-                        "No squad data available",
-                        "", "", "", "", "", "", "", ""
-                    )
-                )
+                TableUtils.add_row(self.squad_table, (
+                    "No squad data available",
+                    "", "", "", "", "", "", "", ""
+                ))
                 return
                 
             # Get the first response (should be the only one)
@@ -478,16 +469,14 @@ class TeamTab(BaseTab):
             # Check if squad has players
             if 'players' not in squad or not squad['players']:
                 # No players in squad
-                self.squad_table.insert(
-                    "", "end",
-                    values=(
-                        "No players in squad data",
-                        "", "", "", "", "", "", "", ""
-                    )
-                )
+                TableUtils.add_row(self.squad_table, (
+                    "No players in squad data",
+                    "", "", "", "", "", "", "", ""
+                ))
                 return
                 
             # Add players to table
+            rows = []
             for player in squad['players']:
                 # Get player data
                 name = player.get('name', 'Unknown')
@@ -497,20 +486,19 @@ class TeamTab(BaseTab):
                 
                 # Add row with available data and placeholders for stats
                 # (API doesn't provide appearance/goals/cards data in squad endpoint)
-                self.squad_table.insert(
-                    "", "end",
-                    values=(
-                        name,
-                        position,
-                        age,
-                        nationality,
-                        "-",  # Appearances
-                        "-",  # Goals
-                        "-",  # Assists
-                        "-",  # Yellow Cards
-                        "-"   # Red Cards
-                    )
-                )
+                rows.append((
+                    name,
+                    position,
+                    age,
+                    nationality,
+                    "-",  # Appearances
+                    "-",  # Goals
+                    "-",  # Assists
+                    "-",  # Yellow Cards
+                    "-"   # Red Cards
+                ))
+            TableUtils.set_rows(self.squad_table, rows)
+            
             # Apply default sorting by player name (column 0)
             if hasattr(self.squad_table, 'sorter'):
                 # Sort by player name alphabetically
@@ -520,13 +508,10 @@ class TeamTab(BaseTab):
             logger.error(f"Error updating squad table: {str(e)}")
             
             # Add an error message row
-            self.squad_table.insert(
-                "", "end",
-                values=(
-                    f"Error fetching squad data: {str(e)}",
-                    "", "", "", "", "", "", "", ""
-                )
-            )
+            TableUtils.add_row(self.squad_table, (
+                f"Error fetching squad data: {str(e)}",
+                "", "", "", "", "", "", "", ""
+            ))
     
     def update_settings(self):
         """Update settings from settings manager"""
@@ -7,9 +7,12 @@ from typing import Dict, List, Any, Optional, Callable
 
 from modules.api_client import FootballAPI
 from modules.db_manager import DatabaseManager
+from modules.profiler import profiled
 from modules.settings_manager import SettingsManager
-from modules.league_names import get_league_options, get_league_display_name
+from modules.streak_engine import StreakEngine, STREAK_TYPES, STREAK_BREAKS
+from modules.league_names import ALL_LEAGUES, LEAGUE_NAMES, get_league_options, get_league_display_name
 from tabs.base_tab.base_tab import BaseTab
+from tabs.base_tab.table_utils import TableUtils
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,7 @@ class WinlessTab(BaseTab):
         
         # Initialize variables
         self.winless_data = []
+        self.streak_engine = StreakEngine(api)
         
         # Get leagues from settings, use default if empty
         leagues = self.settings_manager.get_leagues()
@@ -98,7 +102,7 @@ class WinlessTab(BaseTab):
         
         self.streak_segment = ctk.CTkSegmentedButton(
             self.streak_frame,
-            values=["Winless", "Lossless"],
+            values=STREAK_TYPES,
             command=self._on_streak_changed,
             variable=self.streak_var,
             font=ctk.CTkFont(size=12)
@@ -151,57 +155,70 @@ class WinlessTab(BaseTab):
                 self.selected_league.set(option["id"])
                 break
         
-        # Save to settings
-        self.settings_manager.set_setting("leagues", [self.selected_league.get()])
+        # Save to settings; All Leagues keeps the configured leagues it scans
+        if self.selected_league.get() != ALL_LEAGUES:
+            self.settings_manager.set_setting("leagues", [self.selected_league.get()])
         
-        # Refresh data
-        self._refresh_data()
+        # Show cached streaks, or compute them for the new league
+        if not self._show_cached_streaks():
+            self._refresh_data()
         
     def _on_streak_changed(self, selection):
         """Handle streak type selection change"""
-        # Refresh data
-        self._refresh_data()
+        # Every streak type is computed together, so this is usually a lookup
+        if not self._show_cached_streaks():
+            self._refresh_data()
+    
+    def _scanned_league_ids(self, league_id):
+        """Leagues covered by a selection: the configured leagues for All Leagues, else None"""
+        if league_id != ALL_LEAGUES:
+            return None
+        leagues = [lid for lid in (self.settings_manager.get_leagues() or []) if lid != ALL_LEAGUES]
+        # No configured leagues means all of them, as in the Settings tab
+        return leagues or [lid for lid in LEAGUE_NAMES if isinstance(lid, int) and lid != ALL_LEAGUES]
+    
+    def _show_cached_streaks(self):
+        """Show cached streaks for the selected league and type; returns False if not cached"""
+        league_id = self.selected_league.get()
+        rows = self.streak_engine.get_streaks(league_id, self.streak_var.get(), self._scanned_league_ids(league_id))
+        if rows is None:
+            return False
+        self.winless_data = rows
+        self._update_table()
+        return True
         
-    def _refresh_data_thread(self, original_auto_fetch):
-        """Override the base class method to fetch data from API"""
+    def _refresh_data(self):
+        """Refresh data from API"""
+        # Show loading indicator overlay
+        self._show_loading_animation(self.refresh_button, "Refresh Data")
+        self.show_loading_indicator()
+        
+        # Compute streaks on a worker thread
+        league_id = self.selected_league.get()
+        self.run_in_background(
+            self._fetch_data,
+            league_id,
+            self._scanned_league_ids(league_id),
+            on_success=self._on_data_fetched,
+            on_error=self._on_fetch_failed,
+            on_done=self.hide_loading_indicator
+        )
+    
+    @profiled("winless_refresh")
+    def _fetch_data(self, task, league_id, league_ids):
+        """
+        Fetch fixtures and compute every streak type (runs on a worker thread)
+        
+        Returns:
+            dict: Streak rows per streak type; empty if there are no fixtures
+        """
+        return self.streak_engine.compute_league(league_id, refresh=True, force_fetch=True, league_ids=league_ids)
+    
+    def _on_data_fetched(self, streaks):
+        """Show computed streaks (runs on the main thread)"""
         try:
-            # Show loading indicator overlay
-            self.show_loading_indicator()
-            
-            # Get league ID
-            league_id = self.selected_league.get()
-            
-            # Get streak type
-            streak_type = self.streak_var.get()
-            
-            # Fetch standings
-            standings = self.api.fetch_standings(league_id)
-            
-            if not standings or not isinstance(standings, dict) or 'response' not in standings:
-                logger.warning(f"No standings or invalid response format for league {league_id}")
-                self.refresh_button.configure(text="Refresh Data", state="normal")
-                self.hide_loading_indicator()
-                return
-                
-            standings_data = standings['response'][0]['league']['standings'][0]
-            
-            # Fetch fixtures
-            fixtures_response = self.api.fetch_fixtures(league_id)
-            
-            # Log the fixtures response for debugging
-            logger.debug(f"Fixtures response type: {type(fixtures_response)}")
-            if isinstance(fixtures_response, dict) and 'response' in fixtures_response:
-                logger.debug(f"Fixtures response keys: {fixtures_response.keys()}")
-                fixtures = fixtures_response['response']
-            elif isinstance(fixtures_response, list):
-                logger.debug(f"Fixtures response is a list with {len(fixtures_response)} items")
-                fixtures = fixtures_response
-            else:
-                fixtures = None
-            
-            # Check if fixtures is valid
-            if not fixtures:
-                logger.warning(f"No fixtures or invalid response format for league {league_id}")
+            if not streaks:
+                logger.warning(f"No fixtures found for league {self.selected_league.get()}")
                 
                 # Show a message in the table
                 self.winless_data = [{
@@ -212,224 +229,33 @@ class WinlessTab(BaseTab):
                     'next_opponent': 'Please try another league',
                     'match_date': ''
                 }]
-                
-                # Update the table with the message
-                self._update_table()
-                
-                # Reset UI
-                self.refresh_button.configure(text="Refresh Data", state="normal")
-                self.hide_loading_indicator()
-                return
-                
-            # Check if fixtures is empty
-            if len(fixtures) == 0:
-                logger.warning(f"No fixtures found for league {league_id}")
-                
-                # Show a message in the table
-                self.winless_data = [{
-                    'team': 'No fixtures found',
-                    'streak': '',
-                    'last_win': '',
-                    'days_since_win': '',
-                    'next_opponent': 'Please try another league',
-                    'match_date': ''
-                }]
-                
-                # Update the table with the message
-                self._update_table()
-                
-                # Reset UI
-                self.refresh_button.configure(text="Refresh Data", state="normal")
-                self.hide_loading_indicator()
-                return
-            
-            # Process data to find streaks
-            self.winless_data = []
-            
-            # Create a dictionary of teams
-            teams = {}
-            for team in standings_data:
-                team_id = team['team']['id']
-                team_name = team['team']['name']
-                teams[team_id] = {
-                    'team_id': team_id,
-                    'team': team_name,
-                    'league': get_league_display_name(league_id),
-                    'fixtures': [],
-                    'next_fixture': None
-                }
-            
-            # Get current date
-            from datetime import datetime, timedelta
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            
-            # Process fixtures
-            for fixture in fixtures:
-                # Get basic fixture info
-                fixture_id = fixture['fixture']['id']
-                fixture_date = fixture['fixture']['date'].split('T')[0]  # YYYY-MM-DD
-                home_team_id = fixture['teams']['home']['id']
-                away_team_id = fixture['teams']['away']['id']
-                home_team_name = fixture['teams']['home']['name']
-                away_team_name = fixture['teams']['away']['name']
-                home_score = fixture['goals']['home']
-                away_score = fixture['goals']['away']
-                status = fixture['fixture']['status']['short']
-                
-                # Skip fixtures that haven't been played yet
-                if status != 'FT' or home_score is None or away_score is None:
-                    # But save as next fixture if it's in the future
-                    if fixture_date >= current_date:
-                        # For home team
-                        if home_team_id in teams and (teams[home_team_id]['next_fixture'] is None or 
-                                                     fixture_date < teams[home_team_id]['next_fixture']['date']):
-                            teams[home_team_id]['next_fixture'] = {
-                                'fixture_id': fixture_id,
-                                'date': fixture_date,
-                                'opponent': away_team_name,
-                                'venue': 'Home'
-                            }
-                        
-                        # For away team
-                        if away_team_id in teams and (teams[away_team_id]['next_fixture'] is None or 
-                                                     fixture_date < teams[away_team_id]['next_fixture']['date']):
-                            teams[away_team_id]['next_fixture'] = {
-                                'fixture_id': fixture_id,
-                                'date': fixture_date,
-                                'opponent': home_team_name,
-                                'venue': 'Away'
-                            }
-                    continue
-                
-                # Add to home team fixtures
-                if home_team_id in teams:
-                    teams[home_team_id]['fixtures'].append({
-                        'fixture_id': fixture_id,
-                        'date': fixture_date,
-                        'opponent': away_team_name,
-                        'home': True,
-                        'result': 'W' if home_score > away_score else ('D' if home_score == away_score else 'L')
-                    })
-                
-                # Add to away team fixtures
-                if away_team_id in teams:
-                    teams[away_team_id]['fixtures'].append({
-                        'fixture_id': fixture_id,
-                        'date': fixture_date,
-                        'opponent': home_team_name,
-                        'home': False,
-                        'result': 'W' if away_score > home_score else ('D' if home_score == away_score else 'L')
-                    })
-            
-            # Sort fixtures by date (newest first)
-            for team_id in teams:
-                teams[team_id]['fixtures'].sort(key=lambda x: x['date'], reverse=True)
-            
-            # Calculate streaks
-            for team_id, team_data in teams.items():
-                # Skip teams with no fixtures
-                if not team_data['fixtures']:
-                    continue
-                
-                streak = 0
-                last_win_date = None
-                last_loss_date = None
-                
-                # Check each fixture from newest to oldest
-                for fixture in team_data['fixtures']:
-                    if streak_type == 'Winless':
-                        # For winless streak, we're looking for matches without a win
-                        if fixture['result'] != 'W':
-                            streak += 1
-                        else:
-                            # Found a win, this is the end of the streak
-                            last_win_date = fixture['date']
-                            break
-                    else:  # Lossless
-                        # For lossless streak, we're looking for matches without a loss
-                        if fixture['result'] != 'L':
-                            streak += 1
-                        else:
-                            # Found a loss, this is the end of the streak
-                            last_loss_date = fixture['date']
-                            break
-                
-                # Only include teams with a streak
-                if streak > 0:
-                    # Calculate days since last win/loss
-                    days_since = 0
-                    if streak_type == 'Winless' and last_win_date:
-                        last_win_datetime = datetime.strptime(last_win_date, '%Y-%m-%d')
-                        days_since = (datetime.now() - last_win_datetime).days
-                    elif streak_type == 'Lossless' and last_loss_date:
-                        last_loss_datetime = datetime.strptime(last_loss_date, '%Y-%m-%d')
-                        days_since = (datetime.now() - last_loss_datetime).days
-                    
-                    # Add to winless data
-                    streak_data = {
-                        'team': team_data['team'],
-                        'team_id': team_id,
-                        'league': team_data['league'],
-                        'streak': streak,
-                        'days_since_win': days_since if streak_type == 'Winless' else days_since,
-                    }
-                    
-                    # Add last win/loss date
-                    if streak_type == 'Winless':
-                        streak_data['last_win'] = last_win_date or 'Never'
-                    else:
-                        streak_data['last_win'] = last_loss_date or 'Never'  # Actually last loss
-                    
-                    # Add next opponent
-                    if team_data['next_fixture']:
-                        streak_data['next_opponent'] = team_data['next_fixture']['opponent']
-                        streak_data['match_date'] = team_data['next_fixture']['date']
-                        streak_data['venue'] = team_data['next_fixture']['venue']
-                    else:
-                        streak_data['next_opponent'] = 'None scheduled'
-                        streak_data['match_date'] = 'N/A'
-                        streak_data['venue'] = 'N/A'
-                    
-                    self.winless_data.append(streak_data)
-            
-            # Sort by streak length (descending)
-            self.winless_data.sort(key=lambda x: x['streak'], reverse=True)
+            else:
+                # Read the streak type now, it may have changed while computing
+                self.winless_data = streaks.get(self.streak_var.get(), [])
             
             # Update table
             self._update_table()
             
-            # Restore auto-fetch flag
-            self.api.disable_auto_fetch = original_auto_fetch
-            
             # Reset refresh button
             self.refresh_button.configure(text="Refresh Data", state="normal")
             
-            # Hide loading indicator
-            self.hide_loading_indicator()
-            
         except Exception as e:
-            logger.error(f"Error fetching data: {str(e)}")
-            self.refresh_button.configure(text="Refresh Failed", state="normal")
-            self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data"))
-            
-            # Restore auto-fetch flag
-            self.api.disable_auto_fetch = original_auto_fetch
-            
-            # Hide loading indicator
-            self.hide_loading_indicator()
+            self._on_fetch_failed(e)
+    
+    def _on_fetch_failed(self, error):
+        """Handle a failed refresh (runs on the main thread)"""
+        logger.error(f"Error fetching data: {str(error)}")
+        self.refresh_button.configure(text="Refresh Failed", state="normal")
+        self.parent.after(2000, lambda: self.refresh_button.configure(text="Refresh Data"))
             
     def _update_table(self):
         """Update the winless streaks table"""
-        # Clear table
-        for item in self.winless_table.get_children():
-            self.winless_table.delete(item)
-            
-        # Add data
-        for i, team in enumerate(self.winless_data):
-            # Add row with the new column structure (6 columns instead of 8)
-            self.winless_table.insert(
-                "", "end",
-                values=(
+        # Build rows with the new column structure (6 columns instead of 8)
+        rows = []
+        for team in self.winless_data:
+            rows.append({
+                "key": (team.get('league_id'), team.get('team_id', team.get('team'))),
+                "values": (
                     team.get('team', ''),
                     team.get('streak', ''),
                     team.get('last_win', ''),
@@ -437,15 +263,21 @@ class WinlessTab(BaseTab):
                     team.get('next_opponent', ''),
                     team.get('match_date', '')
                 ),
-                tags=('streak',)
-            )
+                "tags": ('streak',)
+            })
+        
+        # Name the break columns after the result that ends this streak type
+        streak_break = STREAK_BREAKS.get(self.streak_var.get(), "Win")
+        if hasattr(self.winless_table, 'sorter'):
+            self.winless_table.sorter.set_heading("Last Win", f"Last {streak_break}")
+            self.winless_table.sorter.set_heading("Days Since Win", f"Days Since {streak_break}")
+        
+        # Apply only the changes since the last refresh,
+        # sorting by streak (column 1) in descending order on first load
+        TableUtils.update_rows(self.winless_table, rows, initial_sort=("1", True))
             
         # Configure tags
         self.winless_table.tag_configure('streak', foreground='red')
-        
-        if hasattr(self.winless_table, 'sorter'):
-            # Sort by streak (column 1) in descending order
-            self.winless_table.sorter.apply_initial_sort("1", reverse=True)
     
     def update_settings(self):
         """Update settings from settings manager"""
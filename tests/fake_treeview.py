@@ -0,0 +1,106 @@
+"""
+In-memory stand-in for ttk.Treeview, so table code can be tested without a display.
+"""
+
+import itertools
+
+
+class FakeTreeview:
+    """Implements the part of the ttk.Treeview API used by VirtualTable, TableSorter and TableUtils."""
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        self.headings = {column: column for column in self.columns}
+        self.items = {}  # item -> {"values": ..., "tags": ...}
+        self.order = []
+        self.selected = ()
+        self.focused = ""
+        self.bindings = {}
+        self._tags = ("Treeview", ".", "all")
+        self._ids = itertools.count(1)
+
+    def __getitem__(self, option):
+        if option == "columns":
+            return self.columns
+        raise KeyError(option)
+
+    def configure(self, **kwargs):
+        pass
+
+    def bindtags(self, tags=None):
+        if tags is None:
+            return self._tags
+        self._tags = tuple(tags)
+
+    def bind(self, sequence, func=None, add=None):
+        self.bindings[sequence] = func
+
+    def bind_class(self, class_name, sequence, func=None, add=None):
+        self.bindings[(class_name, sequence)] = func
+
+    def heading(self, column, option=None, **kwargs):
+        if "text" in kwargs:
+            self.headings[column] = kwargs["text"]
+        if option == "text":
+            return self.headings[column]
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        item = iid if iid is not None else f"I{next(self._ids):03d}"
+        self.items[item] = {"values": tuple(values), "tags": tuple(tags)}
+        if index == "end":
+            self.order.append(item)
+        else:
+            self.order.insert(index, item)
+        return item
+
+    def delete(self, *items):
+        for item in items:
+            self.items.pop(item, None)
+            if item in self.order:
+                self.order.remove(item)
+
+    def item(self, item, option=None, **kwargs):
+        entry = self.items[item]
+        for name in ("values", "tags"):
+            if name in kwargs:
+                entry[name] = tuple(kwargs[name])
+        if option is not None:
+            return entry[option]
+
+    def exists(self, item):
+        return item in self.items
+
+    def move(self, item, parent, index):
+        self.order.remove(item)
+        self.order.insert(index, item)
+
+    def get_children(self, item=""):
+        return tuple(self.order)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, items):
+        self.selected = tuple(items)
+
+    def focus(self, item=None):
+        if item is None:
+            return self.focused
+        self.focused = item
+
+    def identify_region(self, x, y):
+        # Column n spans x == n; the heading row is y < 20
+        return "heading" if y < 20 else "cell"
+
+    def identify_column(self, x):
+        return f"#{x}"
+
+    def winfo_height(self):
+        return 1
+
+    def tag_configure(self, tag, **kwargs):
+        pass
+
+    def displayed_values(self):
+        """Values of the rendered items, top to bottom"""
+        return [self.items[item]["values"] for item in self.order]
@@ -0,0 +1,132 @@
+"""
+Tests for the Firebase outbox against an in-process fake of the Firestore client.
+"""
+
+import unittest
+from unittest import mock
+
+from modules.config import OUTBOX_RETRY_MAX_SECONDS
+from modules.firebase.outbox import FirebaseOutbox
+
+
+class FakeBatch:
+    """Batch with the Firestore set()/update()/commit() API"""
+
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def set(self, doc_ref, data):
+        self.writes.append(("set", doc_ref, data))
+
+    def update(self, doc_ref, data):
+        self.writes.append(("update", doc_ref, data))
+
+    def commit(self):
+        self.db.commits += 1
+        if self.db.offline:
+            raise ConnectionError("Firestore unreachable")
+        for operation, doc_ref, data in self.writes:
+            if operation == "update":
+                self.db.documents.setdefault(doc_ref, {}).update(data)
+            else:
+                self.db.documents[doc_ref] = dict(data)
+
+
+class FakeCollection:
+    """Collection that names its documents by (collection, id)"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def document(self, document_id):
+        return (self.name, document_id)
+
+
+class FakeFirestore:
+    """Stores committed documents in a dict and can be switched offline"""
+
+    def __init__(self):
+        self.documents = {}
+        self.commits = 0
+        self.offline = False
+
+    def collection(self, name):
+        return FakeCollection(name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+class FirebaseOutboxTest(unittest.TestCase):
+    """Enqueue, flush, back off and give up"""
+
+    def setUp(self):
+        self.db = FakeFirestore()
+        self.outbox = FirebaseOutbox(self.db, db_path=":memory:")
+        self.now = 1000.0
+        clock = mock.patch("modules.firebase.outbox.time.time", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_flush_writes_queued_documents(self):
+        document_id = self.outbox.add("activity_logs", {"activity_type": "LOGIN"})
+        self.assertTrue(self.outbox.update("users", "u1", {"has_license": True}))
+        self.assertEqual(self.outbox.pending_count(), 2)
+
+        self.assertEqual(self.outbox.flush(), 2)
+
+        self.assertEqual(self.db.commits, 1)
+        self.assertEqual(self.db.documents[("activity_logs", document_id)], {"activity_type": "LOGIN"})
+        self.assertEqual(self.db.documents[("users", "u1")], {"has_license": True})
+        self.assertEqual(self.outbox.pending_count(), 0)
+
+    def test_failed_write_backs_off_until_due(self):
+        self.outbox.update("users", "u1", {"has_license": True})
+        self.db.offline = True
+
+        self.assertEqual(self.outbox.flush(), 0)
+        self.assertEqual(self.db.commits, 1)
+        self.assertEqual(self.outbox.pending_count(), 1)
+
+        # Not due yet, so nothing is attempted
+        self.db.offline = False
+        self.assertEqual(self.outbox.flush(), 0)
+        self.assertEqual(self.db.commits, 1)
+
+        # Once the backoff has passed the write goes through
+        self.now += OUTBOX_RETRY_MAX_SECONDS
+        self.assertEqual(self.outbox.flush(), 1)
+        self.assertEqual(self.db.documents[("users", "u1")], {"has_license": True})
+        self.assertEqual(self.outbox.pending_count(), 0)
+
+    def test_gives_up_after_max_attempts_and_notifies(self):
+        given_up = []
+        self.outbox.add_give_up_listener(lambda entry, error: given_up.append((entry, error)))
+        self.outbox.update("users", "u1", {"tab_permissions.form": False})
+        self.db.offline = True
+
+        with mock.patch("modules.firebase.outbox.OUTBOX_MAX_ATTEMPTS", 3):
+            for _ in range(3):
+                self.outbox.flush()
+                self.now += OUTBOX_RETRY_MAX_SECONDS
+
+        self.assertEqual(self.db.commits, 3)
+        self.assertEqual(self.outbox.pending_count(), 0)
+        self.assertEqual(self.outbox.failed_count(), 1)
+        self.assertEqual(len(given_up), 1)
+        entry, error = given_up[0]
+        self.assertEqual((entry["collection"], entry["document"]), ("users", "u1"))
+        self.assertEqual(entry["data"], {"tab_permissions.form": False})
+        self.assertIsInstance(error, ConnectionError)
+
+        # A given-up write is kept and can be queued again
+        self.db.offline = False
+        self.assertEqual(self.outbox.flush(), 0)
+        self.assertEqual(self.outbox.retry_failed(), 1)
+        self.assertEqual(self.outbox.flush(), 1)
+        self.assertEqual(self.outbox.failed_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Tests for streak lengths, break dates and the per-league streak cache.
+"""
+
+from datetime import date
+
+from modules.config import ALL_LEAGUES
+from modules.streak_engine import StreakEngine, STREAK_TYPES
+
+TODAY = date(2026, 3, 15)
+
+
+def fixture(league_id, day, home, away, home_goals=None, away_goals=None, status="FT"):
+    """Build a fixture in API-Football format"""
+    return {
+        "fixture": {"date": f"{day}T15:00:00+00:00", "status": {"short": status}},
+        "league": {"id": league_id},
+        "teams": {"home": {"id": home, "name": f"Team {home}"}, "away": {"id": away, "name": f"Team {away}"}},
+        "goals": {"home": home_goals, "away": away_goals}
+    }
+
+
+def league_fixtures(league_id=39, offset=0):
+    """Team 1: win, loss, draw (newest last), then an away game against team 2"""
+    return [
+        fixture(league_id, "2026-03-01", 1 + offset, 2 + offset, 2, 0),
+        fixture(league_id, "2026-03-05", 3 + offset, 1 + offset, 1, 0),
+        fixture(league_id, "2026-03-10", 1 + offset, 2 + offset, 0, 0),
+        fixture(league_id, "2026-03-20", 2 + offset, 1 + offset, status="NS")
+    ]
+
+
+def row_for(rows, team_id):
+    """Find a team's row, or None if it has no current streak"""
+    return next((row for row in rows if row["team_id"] == team_id), None)
+
+
+class FakeAPI:
+    """Serves fixtures per league and counts the fetches"""
+
+    def __init__(self, fixtures_by_league):
+        self.fixtures_by_league = fixtures_by_league
+        self.fetches = []
+
+    def fetch_fixtures(self, league_id, force_fetch=False):
+        self.fetches.append(league_id)
+        return self.fixtures_by_league.get(league_id, [])
+
+
+def test_streak_lengths_and_break_dates():
+    streaks = StreakEngine.compute_streaks(league_fixtures(), today=TODAY)
+
+    winless = row_for(streaks["Winless"], 1)
+    assert winless["streak"] == 2
+    assert winless["last_win"] == "2026-03-01"
+    assert winless["days_since_win"] == 14
+
+    clean_sheet = row_for(streaks["Clean Sheet"], 1)
+    assert clean_sheet["streak"] == 1
+    assert clean_sheet["last_win"] == "2026-03-05"
+
+    # The latest match was a goalless draw, so team 1 has no scoring streak
+    assert row_for(streaks["Scoring"], 1) is None
+
+
+def test_unbroken_streak_and_next_fixture():
+    streaks = StreakEngine.compute_streaks(league_fixtures(), today=TODAY)
+
+    # Team 3 won its only match: lossless since the start of the data
+    lossless = row_for(streaks["Lossless"], 3)
+    assert lossless["streak"] == 1
+    assert lossless["last_win"] == "Never"
+    assert lossless["days_since_win"] == 0
+
+    winless = row_for(streaks["Winless"], 1)
+    assert winless["next_opponent"] == "Team 2"
+    assert winless["match_date"] == "2026-03-20"
+    assert winless["venue"] == "Away"
+
+
+def test_rows_sorted_longest_first():
+    streaks = StreakEngine.compute_streaks(league_fixtures(), today=TODAY)
+    for streak_type in STREAK_TYPES:
+        lengths = [row["streak"] for row in streaks[streak_type]]
+        assert lengths == sorted(lengths, reverse=True)
+
+
+def test_all_leagues_scan_fills_each_league_cache():
+    api = FakeAPI({39: league_fixtures(39), 140: league_fixtures(140, offset=100)})
+    engine = StreakEngine(api)
+
+    streaks = engine.compute_league(ALL_LEAGUES, league_ids=[140, 39])
+    assert sorted(api.fetches) == [39, 140]
+    assert {row["league_id"] for row in streaks["Winless"]} == {39, 140}
+
+    # Each covered league is now served from the cache without fetching
+    assert row_for(engine.get_streaks(39, "Winless"), 1)["streak"] == 2
+    assert row_for(engine.get_streaks(140, "Winless"), 101)["streak"] == 2
+    assert engine.get_streaks(ALL_LEAGUES, "Winless", [39, 140]) == streaks["Winless"]
+
+    # The same league set, in any order, is a cache hit
+    engine.compute_league(ALL_LEAGUES, league_ids=[39, 140])
+    assert len(api.fetches) == 2
+
+
+def test_all_leagues_cache_depends_on_league_set():
+    api = FakeAPI({39: league_fixtures(39), 140: league_fixtures(140, offset=100)})
+    engine = StreakEngine(api)
+    engine.compute_league(ALL_LEAGUES, league_ids=[39, 140])
+
+    assert engine.get_streaks(ALL_LEAGUES, "Winless", [39]) is None
+
+    streaks = engine.compute_league(ALL_LEAGUES, league_ids=[39])
+    assert api.fetches[2:] == [39]
+    assert {row["league_id"] for row in streaks["Winless"]} == {39}
+
+
+def test_refresh_and_invalidate_refetch():
+    api = FakeAPI({39: league_fixtures(39)})
+    engine = StreakEngine(api)
+
+    engine.compute_league(39)
+    engine.compute_league(39)
+    assert api.fetches == [39]
+
+    engine.compute_league(39, refresh=True)
+    assert api.fetches == [39, 39]
+
+    engine.invalidate(39)
+    assert engine.get_streaks(39, "Winless") is None
+
+
+def test_no_fixtures_is_not_cached():
+    engine = StreakEngine(FakeAPI({}))
+    assert engine.compute_league(39) == {}
+    assert engine.get_streaks(39, "Winless") is None
@@ -0,0 +1,123 @@
+"""
+Tests for TableSorter: column types, precomputed sort keys and user_sorted.
+"""
+
+from types import SimpleNamespace
+
+from modules.table_sorter import TableSorter
+from tabs.base_tab.virtual_table import VirtualTable
+from tests.fake_treeview import FakeTreeview
+
+COLUMNS = ("team", "points", "date")
+
+
+def make_table(rows, column_types=None):
+    """Virtual table with a sorter, loaded with rows of (team, points, date)"""
+    tree = FakeTreeview(COLUMNS)
+    tree.virtual = VirtualTable(tree)
+    tree.virtual.set_rows([{"values": values} for values in rows])
+    tree.sorter = TableSorter(tree, column_types)
+    return tree
+
+
+def column(tree, index):
+    """Values of one column in model order"""
+    return [row["values"][index] for row in tree.virtual.get_rows()]
+
+
+def click_heading(tree, column_number):
+    """Simulate a click on a column heading (1-based)"""
+    tree.sorter._header_click(SimpleNamespace(x=column_number, y=5))
+
+
+def test_numeric_schema_alias_sorts_numbers():
+    tree = make_table([("A", "9.5", ""), ("B", "2", ""), ("C", "10.2", ""), ("D", "-3", "")],
+                      column_types={"points": "numeric"})
+    tree.sorter.sort_by_column("points", reverse=True)
+    assert column(tree, 1) == ["10.2", "9.5", "2", "-3"]
+
+
+def test_unknown_schema_type_falls_back_to_inference():
+    tree = make_table([("A", "9.5", ""), ("B", "2", ""), ("C", "10.2", "")],
+                      column_types={"points": "decimal"})
+    assert "points" not in tree.sorter.column_schema
+    tree.sorter.sort_by_column("points")
+    assert column(tree, 1) == ["2", "9.5", "10.2"]
+
+
+def test_inferred_numbers_with_placeholders_sort_first():
+    tree = make_table([("A", "12%", ""), ("B", "-", ""), ("C", "3%", "")])
+    tree.sorter.sort_by_column("points")
+    assert column(tree, 1) == ["-", "3%", "12%"]
+
+
+def test_dates_with_and_without_offsets_sort_together():
+    tree = make_table([
+        ("A", "1", "2026-03-01 09:00"),
+        ("B", "1", "2026-03-01T10:00:00+02:00"),  # 08:00 UTC
+        ("C", "1", "01/03/2026 08:30")
+    ])
+    tree.sorter.sort_by_column("date")
+    assert column(tree, 0) == ["B", "C", "A"]
+
+
+def test_strings_sort_case_insensitively():
+    tree = make_table([("b", "1", ""), ("C", "1", ""), ("a", "1", "")])
+    tree.sorter.sort_by_column("0")
+    assert column(tree, 0) == ["a", "b", "C"]
+
+
+def test_sort_keys_are_computed_once_per_row(monkeypatch):
+    tree = make_table([("A", "3", ""), ("B", "1", ""), ("C", "2", "")])
+    calls = []
+    original = tree.sorter._make_sort_key
+    monkeypatch.setattr(tree.sorter, "_make_sort_key",
+                        lambda *args: calls.append(args) or original(*args))
+
+    tree.sorter.sort_by_column("points")
+    tree.sorter.sort_by_column("points", reverse=True)
+    tree.sorter.sort_by_column("points")
+
+    assert len(calls) == 3
+    assert column(tree, 1) == ["1", "2", "3"]
+    assert all(("points", "number") in row["sort_keys"] for row in tree.virtual.get_rows())
+
+
+def test_new_data_version_re_infers_column_types():
+    tree = make_table([("A", "3", ""), ("B", "1", "")])
+    tree.sorter.sort_by_column("points")
+    assert tree.sorter._column_types["points"] == "number"
+
+    tree.virtual.set_rows([{"values": ("A", "x", "")}, {"values": ("B", "10", "")}])
+    tree.sorter.sort_by_column("points")
+    assert tree.sorter._column_types["points"] == "string"
+
+
+def test_sort_indicator_on_heading():
+    tree = make_table([("A", "3", ""), ("B", "1", "")])
+    tree.sorter.sort_by_column("points", reverse=True)
+    assert tree.headings["points"] == "points ▼"
+    assert tree.headings["team"] == "team"
+
+    tree.sorter.set_heading("points", "Pts")
+    assert tree.headings["points"] == "Pts ▼"
+
+
+def test_header_click_sets_user_sorted_and_toggles():
+    tree = make_table([("A", "3", ""), ("B", "1", ""), ("C", "2", "")])
+    tree.sorter.apply_initial_sort("team")
+    assert not tree.sorter.user_sorted
+
+    click_heading(tree, 2)
+    assert tree.sorter.user_sorted
+    assert (tree.sorter.sort_column, tree.sorter.sort_reverse) == ("points", False)
+    assert column(tree, 1) == ["1", "2", "3"]
+
+    click_heading(tree, 2)
+    assert tree.sorter.sort_reverse
+    assert column(tree, 1) == ["3", "2", "1"]
+
+    tree.sorter.reset_sort()
+    assert not tree.sorter.user_sorted
+    assert tree.sorter.sort_column is None
+    assert tree.headings["points"] == "points"
@@ -0,0 +1,102 @@
+"""
+Tests for TableUtils.update_rows: keyed inserts, updates, deletes and reorders.
+"""
+
+from types import SimpleNamespace
+
+from modules.table_sorter import TableSorter
+from tabs.base_tab.table_utils import TableUtils
+from tabs.base_tab.virtual_table import VirtualTable
+from tests.fake_treeview import FakeTreeview
+
+COLUMNS = ("team", "points")
+
+
+def make_table(virtual=True, sort_column=None):
+    """Table as create_table builds it, optionally with a creation-time sort column"""
+    tree = FakeTreeview(COLUMNS)
+    if virtual:
+        tree.virtual = VirtualTable(tree)
+    tree.sorter = TableSorter(tree)
+    tree.sorter.sort_column = sort_column
+    return tree
+
+
+def rows(*pairs):
+    """Rows keyed by team name"""
+    return [{"key": team, "values": (team, points)} for team, points in pairs]
+
+
+def model(tree):
+    """Values in display order, including rows that are not rendered"""
+    return TableUtils.get_rows(tree)
+
+
+def test_insert_update_delete_stats():
+    tree = make_table()
+    stats = TableUtils.update_rows(tree, rows(("A", 1), ("B", 2), ("C", 3)))
+    assert stats == {"inserted": 3, "updated": 0, "deleted": 0, "unchanged": 0}
+
+    stats = TableUtils.update_rows(tree, rows(("A", 1), ("B", 5), ("D", 4)))
+    assert stats == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+    assert model(tree) == [("A", 1), ("B", 5), ("D", 4)]
+    assert tree.displayed_values() == [("A", 1), ("B", 5), ("D", 4)]
+
+
+def test_unchanged_rows_keep_their_row_objects():
+    tree = make_table()
+    TableUtils.update_rows(tree, rows(("A", 1), ("B", 2)))
+    first = tree.virtual.get_rows()[0]
+
+    TableUtils.update_rows(tree, rows(("A", 1), ("B", 3)))
+    assert tree.virtual.get_rows()[0] is first
+
+
+def test_reorder_follows_caller_order_without_a_chosen_sort():
+    # create_table sets a default sort column the user never picked
+    tree = make_table(sort_column="team")
+    TableUtils.update_rows(tree, rows(("A", 1), ("B", 2), ("C", 3)))
+
+    stats = TableUtils.update_rows(tree, rows(("C", 3), ("A", 1), ("B", 2)))
+    assert stats["unchanged"] == 3
+    assert model(tree) == [("C", 3), ("A", 1), ("B", 2)]
+    assert tree.sorter.sort_column is None
+
+
+def test_initial_sort_applies_on_first_load_and_is_kept():
+    tree = make_table()
+    TableUtils.update_rows(tree, rows(("A", 1), ("B", 3), ("C", 2)), initial_sort=("1", True))
+    assert model(tree) == [("B", 3), ("C", 2), ("A", 1)]
+
+    TableUtils.update_rows(tree, rows(("A", 4), ("B", 3), ("C", 2)), initial_sort=("1", True))
+    assert model(tree) == [("A", 4), ("B", 3), ("C", 2)]
+
+
+def test_user_sort_is_reapplied_after_update():
+    tree = make_table()
+    TableUtils.update_rows(tree, rows(("A", 1), ("B", 2), ("C", 3)))
+    tree.sorter._header_click(SimpleNamespace(x=2, y=5))  # Points, ascending
+    assert tree.sorter.user_sorted
+
+    TableUtils.update_rows(tree, rows(("A", 9), ("B", 2), ("C", 3), ("D", 0)))
+    assert model(tree) == [("D", 0), ("B", 2), ("C", 3), ("A", 9)]
+
+
+def test_selection_follows_row_keys():
+    tree = make_table()
+    TableUtils.update_rows(tree, rows(("A", 1), ("B", 2), ("C", 3)))
+    tree.virtual.selected_indices = {1}
+
+    TableUtils.update_rows(tree, rows(("B", 2), ("C", 3)))
+    assert [row["key"] for row in tree.virtual.selected_rows()] == ["B"]
+
+
+def test_plain_treeview_insert_update_delete_reorder():
+    tree = make_table(virtual=False)
+    TableUtils.update_rows(tree, rows(("A", 1), ("B", 2), ("C", 3)))
+    assert tree.get_children() == ("A", "B", "C")
+
+    stats = TableUtils.update_rows(tree, rows(("C", 3), ("A", 7), ("D", 4)))
+    assert stats == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+    assert tree.get_children() == ("C", "A", "D")
+    assert tree.displayed_values() == [("C", 3), ("A", 7), ("D", 4)]